@@ -0,0 +1,59 @@
+"""Gunicorn settings for the Patriot Center backend.
+
+The app is loaded in the master process and its caches and indexes are
+preloaded there, so every worker shares one copy of them (see
+`patriot_center_backend.cache.preload`). Each worker then warms up the rest
+(e.g. its response cache) before `/ready` reports it ready.
+
+Updated cache files go live without a restart on SIGHUP: the caches are
+reloaded in the master before the new workers are forked, and the old
+workers finish their requests on the old version. The master sends itself
+SIGHUP when a cache update is published (see
+`patriot_center_backend.cache.cache_watcher`), and `systemctl reload` sends
+it too.
+"""
+
+import signal
+
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+
+preload_app = True
+
+
+def when_ready(server: Arbiter) -> None:
+    """Preload the caches before the first workers are forked.
+
+    The master then watches for cache updates, and reloads on SIGHUP.
+
+    Args:
+        server: The gunicorn master.
+    """
+    from patriot_center_backend.cache.cache_watcher import CACHE_WATCHER
+    from patriot_center_backend.cache.preload import preload_caches
+
+    preload_caches()
+    CACHE_WATCHER.start(reload_signal=signal.SIGHUP)
+
+
+def on_reload(server: Arbiter) -> None:
+    """Reload the caches before the new workers are forked.
+
+    Args:
+        server: The gunicorn master.
+    """
+    from patriot_center_backend.cache.preload import preload_caches
+
+    preload_caches(reload=True)
+
+
+def post_fork(server: Arbiter, worker: Worker) -> None:
+    """Warm up a new worker in the background.
+
+    Args:
+        server: The gunicorn master.
+        worker: The new worker.
+    """
+    from patriot_center_backend.utils.warmup import WARMUP
+
+    WARMUP.start(worker.app.wsgi())
@@ -5,7 +5,7 @@ football analytics platform. It provides endpoints for:
 - Fetching starter data filtered by season, week, and manager
 - Aggregating player and manager statistics
 - Listing available players and valid filter options
-- Health and liveness checks
+- Health, liveness and readiness checks, and metrics for Prometheus
 
 All endpoints support flexible positional arguments that are automatically
 parsed to determine whether they represent years, weeks, managers, or players.
@@ -13,6 +13,12 @@ parsed to determine whether they represent years, weeks, managers, or players.
 The API supports two response formats:
 - Default: Flattened record list suitable for tabular display
 - format=json: Nested hierarchical structure preserving original cache shape
+
+Cache updates published while running go live without a restart (see
+`patriot_center_backend.cache.cache_watcher`).
+
+Responses are serialized with orjson and compressed with brotli when those
+packages are installed, falling back to the standard library's json and gzip.
 """
 
 import logging
@@ -21,6 +27,12 @@ from flask import Flask
 from flask_cors import CORS
 
 from patriot_center_backend.routes import register_blueprints
+from patriot_center_backend.utils.compression import compress_response
+from patriot_center_backend.utils.json_provider import FastJSONProvider
+from patriot_center_backend.utils.metrics import (
+    record_request,
+    start_request_timer,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,8 +41,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 register_blueprints(app)
 
+# Record every request's latency and size (registered before compression,
+# as after_request hooks run in reverse, so the size is the one sent)
+app.before_request(start_request_timer)
+app.after_request(record_request)
+
+# Compress responses not already served precompressed from the response cache
+app.after_request(compress_response)
+
 # Configure CORS for production (Netlify frontend)
 CORS(
     app,
@@ -43,6 +64,7 @@ CORS(
             "origins": ["https://patriotcenter.netlify.app"]
         },
         r"/options/list": {"origins": ["https://patriotcenter.netlify.app"]},
+        r"/options/search": {"origins": ["https://patriotcenter.netlify.app"]},
         r"/dynamic_filtering*": {
             "origins": ["https://patriotcenter.netlify.app"]
         },
@@ -53,6 +75,7 @@ CORS(
             "origins": ["https://patriotcenter.netlify.app"]
         },
         r"/api/managers/*": {"origins": ["https://patriotcenter.netlify.app"]},
+        r"/api/batch": {"origins": ["https://patriotcenter.netlify.app"]},
     },
 )
 CORS(app)  # Enable CORS for all routes during development
@@ -61,5 +84,12 @@ CORS(app)  # Enable CORS for all routes during development
 if __name__ == "__main__":
     from os import getenv
 
+    from patriot_center_backend.cache.cache_watcher import CACHE_WATCHER
+    from patriot_center_backend.utils.warmup import WARMUP
+
+    # Reload cache updates in this process (under Gunicorn, in the master)
+    CACHE_WATCHER.start()
+    WARMUP.start(app)
+
     # Run app
     app.run(host="0.0.0.0", port=int(getenv("PORT", "8080")))
@@ -0,0 +1 @@
+"""Benchmarks for the Patriot Center backend."""
@@ -0,0 +1,258 @@
+"""Startup benchmark of the Patriot Center API.
+
+Cold starts (a new worker, a serverless instance) pay for importing the app
+and for serving the first request, before any cache is loaded. Both are
+measured in fresh interpreters, taking the median of several runs:
+- `import_ms`: Importing the app, as reported by `python -X importtime`.
+- `first_response_ms`: Starting an interpreter, importing the app and
+    serving a first response (through the WSGI test client, so no network).
+
+Serving must not import update-only modules (the cache updaters and the
+Sleeper API client's `requests`). Any found are listed under
+`update_only_imports`, and fail the benchmark with `--check`.
+
+Usage:
+    python -m patriot_center_backend.benchmarks.startup --json startup.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+APP_MODULE = "patriot_center_backend.app"
+
+# A response needing the caches, like most first requests after a deploy
+FIRST_RESPONSE_PATH = "/options/list"
+
+# Modules only needed to update the caches, never to serve them
+UPDATE_ONLY_MODULES = (
+    "requests",
+    "patriot_center_backend.cache.cache_updater",
+    "patriot_center_backend.cache.updaters.processors",
+    "patriot_center_backend.players.player_scores_fetcher",
+    "patriot_center_backend.playoffs.playoff_tracker",
+)
+
+# Imports reported as the slowest
+_SLOWEST_COUNT = 10
+
+_FIRST_RESPONSE_SCRIPT = """
+import sys
+from {module} import app
+response = app.test_client().get({path!r})
+sys.exit(response.status_code != 200)
+"""
+
+_MODULES_SCRIPT = """
+import json, sys
+import {module}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """Parse the report of `python -X importtime`.
+
+    Args:
+        output: The report, written by the interpreter on stderr.
+
+    Returns:
+        Cumulative microseconds spent importing each module (including the
+        modules it imported).
+    """
+    cumulative_us = {}
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue  # The header
+
+        cumulative_us[name.strip()] = int(cumulative)
+
+    return cumulative_us
+
+
+def measure_imports(module: str = APP_MODULE) -> dict[str, int]:
+    """Import a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        Cumulative microseconds spent importing each module.
+
+    Raises:
+        RuntimeError: If the module fails to import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    return parse_importtime(result.stderr)
+
+
+def measure_first_response(
+    module: str = APP_MODULE, path: str = FIRST_RESPONSE_PATH
+) -> float:
+    """Time a fresh interpreter serving its first response.
+
+    Args:
+        module: The module holding the Flask `app`.
+        path: The path requested.
+
+    Returns:
+        Milliseconds from starting the interpreter to its exit after the
+        response.
+
+    Raises:
+        RuntimeError: If the response isn't a 200.
+    """
+    script = _FIRST_RESPONSE_SCRIPT.format(module=module, path=path)
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Requesting {path} failed:\n{result.stderr}")
+
+    return elapsed * 1000
+
+
+def find_update_only_imports(module: str = APP_MODULE) -> list[str]:
+    """List the update-only modules imported with a module.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        The update-only modules imported (directly or via a submodule).
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _MODULES_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = json.loads(result.stdout)
+
+    return [
+        update_only
+        for update_only in UPDATE_ONLY_MODULES
+        if any(
+            name == update_only or name.startswith(f"{update_only}.")
+            for name in imported
+        )
+    ]
+
+
+def run_benchmark(
+    runs: int = 5,
+    module: str = APP_MODULE,
+    path: str = FIRST_RESPONSE_PATH,
+) -> dict[str, Any]:
+    """Measure the app's startup.
+
+    Args:
+        runs: Fresh interpreters started per measurement.
+        module: The module holding the Flask `app`.
+        path: The path requested for the first response.
+
+    Returns:
+        The median import and first response times in milliseconds, the
+        slowest imports of the median run, and the update-only modules
+        imported.
+    """
+    import_runs = sorted(
+        (measure_imports(module) for _ in range(runs)),
+        key=lambda imports: imports[module],
+    )
+    imports = import_runs[len(import_runs) // 2]
+
+    slowest = sorted(
+        (
+            (name, cumulative)
+            for name, cumulative in imports.items()
+            if name != module
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:_SLOWEST_COUNT]
+
+    return {
+        "runs": runs,
+        "import_ms": round(imports[module] / 1000, 1),
+        "first_response_ms": round(
+            median(measure_first_response(module, path) for _ in range(runs)),
+            1,
+        ),
+        "modules_imported": len(imports),
+        "slowest_imports": {
+            name: round(cumulative / 1000, 1) for name, cumulative in slowest
+        },
+        "update_only_imports": find_update_only_imports(module),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: The command line arguments (defaults to `sys.argv`).
+
+    Returns:
+        The exit code, 1 if `--check` found update-only imports.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default=FIRST_RESPONSE_PATH)
+    parser.add_argument("--json", type=Path, help="Also write results here.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if serving imports update-only modules.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(runs=args.runs, path=args.path)
+
+    print(f"Import: {results['import_ms']} ms")
+    print(f"First response: {results['first_response_ms']} ms")
+    print(f"Modules imported: {results['modules_imported']}")
+    for name, ms in results["slowest_imports"].items():
+        print(f"  {ms:>8} ms  {name}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    if results["update_only_imports"]:
+        print(
+            "Update-only modules imported: "
+            f"{', '.join(results['update_only_imports'])}"
+        )
+        if args.check:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
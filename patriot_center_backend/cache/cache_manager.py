@@ -1,12 +1,50 @@
-"""Centralized cache manager for all cache files."""
+"""Centralized cache manager for all cache files.
+
+The manager is shared by every thread of a threaded server. Each cache is
+loaded once, however many threads ask for it at the same time, and saved
+or replaced by one thread at a time. Caches read by request threads are
+never mutated in place: `update_cache` replaces them with an updated copy,
+so a reader (or a save) iterating over a cache never sees it change.
+
+An update writing several cache files publishes them together by writing
+the version manifest last (see `write_manifest`), so other processes only
+reload once every file of the update is written.
+"""
 
 import json
+import logging
 import os
 import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from patriot_center_backend.cache.snapshot import ReadOnlyDict
+from patriot_center_backend.cache.valid_options_codec import (
+    compact_valid_options,
+    expand_valid_options,
+)
+from patriot_center_backend.utils.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+_CACHE_LOAD_DURATION = METRICS.histogram(
+    "cache_load_duration_seconds",
+    "Time spent loading cache files, by cache.",
+    ("cache",),
+)
+_CACHE_SAVE_DURATION = METRICS.histogram(
+    "cache_save_duration_seconds",
+    "Time spent saving cache files, by cache.",
+    ("cache",),
+)
+
 module = sys.modules[__name__]
 
 _CACHE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -50,6 +88,44 @@ _PLAYERS_DATA_CACHE_FILE = os.path.join(
     _CACHE_DIR, "cached_data", "player_data_cache.json"
 )
 
+# ===== STEP 5: DERIVED DATA =====
+_AGGREGATION_ROLLUPS_CACHE_FILE = os.path.join(
+    _CACHE_DIR, "cached_data", "aggregation_rollups_cache.json"
+)
+
+# ===== VERSION MANIFEST =====
+# Written after every cache file of an update (see write_manifest)
+_MANIFEST_FILE = os.path.join(_CACHE_DIR, "cached_data", "manifest.json")
+
+_CACHE_NAMES = (
+    "manager",
+    "transaction_ids",
+    "players",
+    "player_ids",
+    "starters",
+    "player_data",
+    "replacement_score",
+    "valid_options",
+    "image_urls",
+    "weekly_data_progress_tracker",
+    "aggregation_rollups",
+)
+
+# Files of the caches read by the API, reloaded when changed on disk (see
+# reload_changed_caches)
+_SERVED_CACHE_FILES = {
+    "manager": _MANAGER_METADATA_CACHE_FILE,
+    "transaction_ids": _TRANSACTION_IDS_FILE,
+    "players": _PLAYERS_CACHE_FILE,
+    "player_ids": _PLAYER_IDS_CACHE_FILE,
+    "starters": _STARTERS_CACHE_FILE,
+    "player_data": _PLAYERS_DATA_CACHE_FILE,
+    "replacement_score": _REPLACEMENT_SCORE_CACHE_FILE,
+    "valid_options": _VALID_OPTIONS_CACHE_FILE,
+    "image_urls": _IMAGE_URLS_CACHE_FILE,
+    "aggregation_rollups": _AGGREGATION_ROLLUPS_CACHE_FILE,
+}
+
 
 class CacheManager:
     """Centralized cache manager for all cache files.
@@ -88,6 +164,25 @@ class CacheManager:
         self._valid_options_cache: dict | None = None
         self._image_urls_cache: dict | None = None
         self._weekly_data_progress_tracker: dict | None = None
+        self._aggregation_rollups_cache: dict | None = None
+
+        # Bumped every time a cache is loaded or saved (see get_cache_version)
+        self._cache_versions: dict[str, int] = {}
+
+        # Bumped every time any cache is saved or reloaded (see
+        # get_data_version)
+        self._data_version = 0
+
+        # Held while a cache is loaded, saved or replaced (reentrant, as
+        # update_cache saves through the public savers)
+        self._locks = {name: threading.RLock() for name in _CACHE_NAMES}
+        self._version_lock = threading.Lock()
+
+        # Modification time of each cache file when last loaded or saved
+        self._file_mtimes: dict[str, float] = {}
+
+        # Version in the manifest when the loaded caches were first read
+        self._manifest_version: str | None = None
 
     # ===== LOADER AND SAVER =====
     def _load_cache(self, file_path: str) -> dict[str, Any]:
@@ -102,23 +197,88 @@ class CacheManager:
             Existing cache or empty dictionary.
         """
         if os.path.exists(file_path):
+            start = time.perf_counter()
+
+            # Read before loading, so a change made meanwhile isn't missed
+            mtime = os.path.getmtime(file_path)
             with open(file_path) as file:
-                return json.load(file)
+                cache = json.load(file)
+
+            self._file_mtimes[file_path] = mtime
+            _CACHE_LOAD_DURATION.observe(
+                time.perf_counter() - start, cache=Path(file_path).stem
+            )
+            return cache
         else:
             # Return an empty dictionary if the file does not exist
             return {}
 
-    def _save_cache(self, file_path: str, data: dict[str, Any]) -> None:
+    def _save_cache(
+        self, file_path: str, data: dict[str, Any], indent: int | None = 4
+    ) -> None:
         """Persist cache to disk using pretty formatting.
 
+        The cache is written to a temporary file then renamed over the target,
+        so other processes never read a partially written cache.
+
         Args:
             file_path: Target path.
             data: Cache content.
+            indent: JSON indentation, or None to write on a single line.
         """
+        start = time.perf_counter()
+
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w") as file:
-            json.dump(data, file, indent=4)
+
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as file:
+            json.dump(data, file, indent=indent)
+        os.replace(temp_path, path)
+
+        self._file_mtimes[file_path] = os.path.getmtime(file_path)
+        _CACHE_SAVE_DURATION.observe(
+            time.perf_counter() - start, cache=path.stem
+        )
+
+    def _get_cache(
+        self,
+        cache_name: str,
+        attribute: str,
+        load: Callable[[], dict[str, Any]],
+        force_reload: bool,
+    ) -> Any:
+        """Get an in-memory cache, loading it on first access.
+
+        Threads asking for a cache while it is being loaded wait for that
+        load instead of loading it again.
+
+        Args:
+            cache_name: Name of the cache
+            attribute: Attribute holding the in-memory cache
+            load: Loads the cache from disk
+            force_reload: If True, reload from disk
+
+        Returns:
+            The cache
+        """
+        cache = getattr(self, attribute)
+        if cache is not None and not force_reload:
+            return cache
+
+        with self._locks[cache_name]:
+            cache = getattr(self, attribute)
+            if cache is None or force_reload:
+                # Read before loading, so a version published meanwhile
+                # isn't missed
+                if self._manifest_version is None:
+                    self._manifest_version = self.get_manifest_version()
+
+                cache = load()
+                setattr(self, attribute, cache)
+                self._bump_cache_version(cache_name)
+
+        return cache
 
     # ===== MANAGER METADATA CACHE =====
     def get_manager_cache(
@@ -132,10 +292,12 @@ class CacheManager:
         Returns:
             Manager metadata cache dictionary
         """
-        if self._manager_cache is None or force_reload:
-            self._manager_cache = self._load_cache(_MANAGER_METADATA_CACHE_FILE)
-
-        return self._manager_cache
+        return self._get_cache(
+            "manager",
+            "_manager_cache",
+            partial(self._load_cache, _MANAGER_METADATA_CACHE_FILE),
+            force_reload,
+        )
 
     def save_manager_cache(
         self, cache: dict[str, dict[str, Any]] | None = None
@@ -153,8 +315,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No manager cache data to save")
 
-        self._save_cache(_MANAGER_METADATA_CACHE_FILE, data_to_save)
-        self._manager_cache = data_to_save
+        with self._locks["manager"]:
+            self._save_cache(_MANAGER_METADATA_CACHE_FILE, data_to_save)
+            self._manager_cache = data_to_save
+            self._bump_cache_version("manager")
+        self._bump_data_version()
 
     # ===== TRANSACTION IDS CACHE =====
     def get_transaction_ids_cache(
@@ -168,12 +333,12 @@ class CacheManager:
         Returns:
             Transaction IDs cache dictionary
         """
-        if self._transaction_ids_cache is None or force_reload:
-            self._transaction_ids_cache = self._load_cache(
-                _TRANSACTION_IDS_FILE
-            )
-
-        return self._transaction_ids_cache
+        return self._get_cache(
+            "transaction_ids",
+            "_transaction_ids_cache",
+            partial(self._load_cache, _TRANSACTION_IDS_FILE),
+            force_reload,
+        )
 
     def save_transaction_ids_cache(
         self, cache: dict[str, dict[str, Any]] | None = None
@@ -193,8 +358,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No transaction IDs cache data to save")
 
-        self._save_cache(_TRANSACTION_IDS_FILE, data_to_save)
-        self._transaction_ids_cache = data_to_save
+        with self._locks["transaction_ids"]:
+            self._save_cache(_TRANSACTION_IDS_FILE, data_to_save)
+            self._transaction_ids_cache = data_to_save
+            self._bump_cache_version("transaction_ids")
+        self._bump_data_version()
 
     # ===== PLAYERS CACHE =====
     def get_players_cache(
@@ -208,10 +376,12 @@ class CacheManager:
         Returns:
             Players cache dictionary
         """
-        if self._players_cache is None or force_reload:
-            self._players_cache = self._load_cache(_PLAYERS_CACHE_FILE)
-
-        return self._players_cache
+        return self._get_cache(
+            "players",
+            "_players_cache",
+            partial(self._load_cache, _PLAYERS_CACHE_FILE),
+            force_reload,
+        )
 
     def save_players_cache(
         self, cache: dict[str, dict[str, str | None]] | None = None
@@ -229,8 +399,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No players cache data to save")
 
-        self._save_cache(_PLAYERS_CACHE_FILE, data_to_save)
-        self._players_cache = data_to_save
+        with self._locks["players"]:
+            self._save_cache(_PLAYERS_CACHE_FILE, data_to_save)
+            self._players_cache = data_to_save
+            self._bump_cache_version("players")
+        self._bump_data_version()
 
     # ===== PLAYER IDS CACHE =====
     def get_player_ids_cache(
@@ -244,10 +417,12 @@ class CacheManager:
         Returns:
             Player IDs cache dictionary
         """
-        if self._player_ids_cache is None or force_reload:
-            self._player_ids_cache = self._load_cache(_PLAYER_IDS_CACHE_FILE)
-
-        return self._player_ids_cache
+        return self._get_cache(
+            "player_ids",
+            "_player_ids_cache",
+            partial(self._load_cache, _PLAYER_IDS_CACHE_FILE),
+            force_reload,
+        )
 
     def save_player_ids_cache(
         self, cache: dict[str, dict[str, Any]] | None = None
@@ -265,8 +440,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No player IDs cache data to save")
 
-        self._save_cache(_PLAYER_IDS_CACHE_FILE, data_to_save)
-        self._player_ids_cache = data_to_save
+        with self._locks["player_ids"]:
+            self._save_cache(_PLAYER_IDS_CACHE_FILE, data_to_save)
+            self._player_ids_cache = data_to_save
+            self._bump_cache_version("player_ids")
+        self._bump_data_version()
 
     # ===== STARTERS CACHE =====
     def get_starters_cache(self, force_reload: bool = False) -> dict[str, Any]:
@@ -278,10 +456,12 @@ class CacheManager:
         Returns:
             Starters cache dictionary
         """
-        if self._starters_cache is None or force_reload:
-            self._starters_cache = self._load_cache(_STARTERS_CACHE_FILE)
-
-        return self._starters_cache
+        return self._get_cache(
+            "starters",
+            "_starters_cache",
+            partial(self._load_cache, _STARTERS_CACHE_FILE),
+            force_reload,
+        )
 
     def save_starters_cache(self, cache: dict[str, Any] | None = None) -> None:
         """Save starters cache to disk.
@@ -297,8 +477,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No starters cache data to save")
 
-        self._save_cache(_STARTERS_CACHE_FILE, data_to_save)
-        self._starters_cache = data_to_save
+        with self._locks["starters"]:
+            self._save_cache(_STARTERS_CACHE_FILE, data_to_save)
+            self._starters_cache = data_to_save
+            self._bump_cache_version("starters")
+        self._bump_data_version()
 
     # ===== PLAYER DATA CACHE (ffWAR) =====
     def get_player_data_cache(
@@ -312,10 +495,12 @@ class CacheManager:
         Returns:
             Player data cache dictionary
         """
-        if self._player_data_cache is None or force_reload:
-            self._player_data_cache = self._load_cache(_PLAYERS_DATA_CACHE_FILE)
-
-        return self._player_data_cache
+        return self._get_cache(
+            "player_data",
+            "_player_data_cache",
+            partial(self._load_cache, _PLAYERS_DATA_CACHE_FILE),
+            force_reload,
+        )
 
     def save_player_data_cache(
         self, cache: dict[str, Any] | None = None
@@ -333,8 +518,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No player data cache to save")
 
-        self._save_cache(_PLAYERS_DATA_CACHE_FILE, data_to_save)
-        self._player_data_cache = data_to_save
+        with self._locks["player_data"]:
+            self._save_cache(_PLAYERS_DATA_CACHE_FILE, data_to_save)
+            self._player_data_cache = data_to_save
+            self._bump_cache_version("player_data")
+        self._bump_data_version()
 
     # ===== REPLACEMENT SCORE CACHE =====
     def get_replacement_score_cache(
@@ -348,12 +536,12 @@ class CacheManager:
         Returns:
             Replacement score cache dictionary
         """
-        if self._replacement_score_cache is None or force_reload:
-            self._replacement_score_cache = self._load_cache(
-                _REPLACEMENT_SCORE_CACHE_FILE
-            )
-
-        return self._replacement_score_cache
+        return self._get_cache(
+            "replacement_score",
+            "_replacement_score_cache",
+            partial(self._load_cache, _REPLACEMENT_SCORE_CACHE_FILE),
+            force_reload,
+        )
 
     def save_replacement_score_cache(
         self, cache: dict[str, Any] | None = None
@@ -373,8 +561,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No replacement score cache to save")
 
-        self._save_cache(_REPLACEMENT_SCORE_CACHE_FILE, data_to_save)
-        self._replacement_score_cache = data_to_save
+        with self._locks["replacement_score"]:
+            self._save_cache(_REPLACEMENT_SCORE_CACHE_FILE, data_to_save)
+            self._replacement_score_cache = data_to_save
+            self._bump_cache_version("replacement_score")
+        self._bump_data_version()
 
     # ===== VALID OPTIONS CACHE =====
     def get_valid_options_cache(
@@ -388,12 +579,14 @@ class CacheManager:
         Returns:
             Valid options cache dictionary
         """
-        if self._valid_options_cache is None or force_reload:
-            self._valid_options_cache = self._load_cache(
-                _VALID_OPTIONS_CACHE_FILE
-            )
-
-        return self._valid_options_cache
+        return self._get_cache(
+            "valid_options",
+            "_valid_options_cache",
+            lambda: expand_valid_options(
+                self._load_cache(_VALID_OPTIONS_CACHE_FILE)
+            ),
+            force_reload,
+        )
 
     def save_valid_options_cache(
         self, cache: dict[str, dict[str, Any]] | None = None
@@ -411,8 +604,16 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No valid options cache to save")
 
-        self._save_cache(_VALID_OPTIONS_CACHE_FILE, data_to_save)
-        self._valid_options_cache = data_to_save
+        with self._locks["valid_options"]:
+            # Stored as a names table and ID lists (see valid_options_codec)
+            self._save_cache(
+                _VALID_OPTIONS_CACHE_FILE,
+                compact_valid_options(data_to_save),
+                indent=None,
+            )
+            self._valid_options_cache = data_to_save
+            self._bump_cache_version("valid_options")
+        self._bump_data_version()
 
     def get_image_urls_cache(
         self, force_reload: bool = False
@@ -425,10 +626,12 @@ class CacheManager:
         Returns:
             Image urls cache dictionary
         """
-        if self._image_urls_cache is None or force_reload:
-            self._image_urls_cache = self._load_cache(_IMAGE_URLS_CACHE_FILE)
-
-        return self._image_urls_cache
+        return self._get_cache(
+            "image_urls",
+            "_image_urls_cache",
+            partial(self._load_cache, _IMAGE_URLS_CACHE_FILE),
+            force_reload,
+        )
 
     def save_image_urls_cache(
         self, cache: dict[str, dict[str, Any]] | None = None
@@ -446,8 +649,11 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No image urls cache to save")
 
-        self._save_cache(_IMAGE_URLS_CACHE_FILE, data_to_save)
-        self._image_urls_cache = data_to_save
+        with self._locks["image_urls"]:
+            self._save_cache(_IMAGE_URLS_CACHE_FILE, data_to_save)
+            self._image_urls_cache = data_to_save
+            self._bump_cache_version("image_urls")
+        self._bump_data_version()
 
     def get_weekly_data_progress_tracker(
         self, force_reload: bool = False
@@ -460,12 +666,12 @@ class CacheManager:
         Returns:
             Weekly data progress tracker dictionary
         """
-        if self._weekly_data_progress_tracker is None or force_reload:
-            self._weekly_data_progress_tracker = self._load_cache(
-                _WEEKLY_DATA_PROGRESS_TRACKER_FILE
-            )
-
-        return self._weekly_data_progress_tracker
+        return self._get_cache(
+            "weekly_data_progress_tracker",
+            "_weekly_data_progress_tracker",
+            partial(self._load_cache, _WEEKLY_DATA_PROGRESS_TRACKER_FILE),
+            force_reload,
+        )
 
     def save_weekly_data_progress_tracker(
         self, cache: dict[str, Any] | None = None
@@ -485,8 +691,91 @@ class CacheManager:
         if data_to_save is None:
             raise ValueError("No weekly data progress tracker to save")
 
-        self._save_cache(_WEEKLY_DATA_PROGRESS_TRACKER_FILE, data_to_save)
-        self._weekly_data_progress_tracker = data_to_save
+        with self._locks["weekly_data_progress_tracker"]:
+            self._save_cache(_WEEKLY_DATA_PROGRESS_TRACKER_FILE, data_to_save)
+            self._weekly_data_progress_tracker = data_to_save
+            self._bump_cache_version("weekly_data_progress_tracker")
+        self._bump_data_version()
+
+    # ===== AGGREGATION ROLLUPS CACHE =====
+    def get_aggregation_rollups_cache(
+        self, force_reload: bool = False
+    ) -> dict[str, Any]:
+        """Get aggregation rollups cache (player x manager x season totals).
+
+        Args:
+            force_reload: If True, reload from disk
+
+        Returns:
+            Aggregation rollups cache dictionary
+        """
+        return self._get_cache(
+            "aggregation_rollups",
+            "_aggregation_rollups_cache",
+            partial(self._load_cache, _AGGREGATION_ROLLUPS_CACHE_FILE),
+            force_reload,
+        )
+
+    def save_aggregation_rollups_cache(
+        self, cache: dict[str, Any] | None = None
+    ) -> None:
+        """Save aggregation rollups cache to disk.
+
+        Args:
+            cache: Cache to save (uses in-memory cache if not provided)
+
+        Raises:
+            ValueError: If no aggregation rollups cache to save
+        """
+        data_to_save = (
+            cache if cache is not None else self._aggregation_rollups_cache
+        )
+
+        if data_to_save is None:
+            raise ValueError("No aggregation rollups cache to save")
+
+        with self._locks["aggregation_rollups"]:
+            self._save_cache(_AGGREGATION_ROLLUPS_CACHE_FILE, data_to_save)
+            self._aggregation_rollups_cache = data_to_save
+            self._bump_cache_version("aggregation_rollups")
+        self._bump_data_version()
+
+    # ===== VERSION MANIFEST =====
+    def write_manifest(self) -> None:
+        """Publish the cache files saved so far as a new version.
+
+        An update writes its cache files one after another, then the
+        manifest, so a process reloading on a new manifest (see
+        `reload_changed_caches`) never mixes files of two versions.
+        """
+        version = uuid.uuid4().hex
+
+        self._save_cache(
+            _MANIFEST_FILE,
+            {"version": version, "published_at": datetime.now().isoformat()},
+        )
+        self._manifest_version = version
+
+    def get_manifest_version(self) -> str | None:
+        """Read the version of the caches last published on disk.
+
+        Returns:
+            Version in the manifest, or None if there is no readable one
+        """
+        try:
+            with open(_MANIFEST_FILE) as file:
+                return json.load(file).get("version")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def get_loaded_manifest_version(self) -> str | None:
+        """Get the version published when the loaded caches were read.
+
+        Returns:
+            Version in the manifest, or None if none was published then (or
+            no cache is loaded)
+        """
+        return self._manifest_version
 
     # ===== UTILITY METHODS =====
     def is_cache_stale(
@@ -521,6 +810,194 @@ class CacheManager:
         # If file was modified within the last week, reuse it
         return file_age > max_age
 
+    def update_cache(
+        self, cache_name: str, entries: Mapping[str, Any], save: bool = False
+    ) -> dict[str, Any]:
+        """Add or replace entries of a cache without mutating it in place.
+
+        The cache is replaced by an updated copy, so threads still reading or
+        saving the current cache are unaffected. Updates to the same cache
+        are applied one at a time, so none of them is lost.
+
+        Args:
+            cache_name: Name of the cache (e.g. "image_urls")
+            entries: Entries to add or replace
+            save: If True, also save the updated cache to disk
+
+        Returns:
+            The updated cache
+
+        Raises:
+            ValueError: If the cache name is unknown
+        """
+        getter = getattr(self, f"get_{cache_name}_cache", None)
+
+        if getter is None:
+            raise ValueError(f"Unknown cache name: {cache_name}")
+
+        with self._locks[cache_name]:
+            updated = {**getter(), **entries}
+
+            if save:
+                getattr(self, f"save_{cache_name}_cache")(updated)
+            else:
+                setattr(self, f"_{cache_name}_cache", updated)
+                self._bump_cache_version(cache_name)
+
+        return updated
+
+    def get_cache_version(self, cache_name: str) -> int:
+        """Get the version counter of a cache.
+
+        The counter is bumped every time the cache is loaded from or saved to
+        disk, so indexes derived from a cache can tell when to rebuild.
+
+        Args:
+            cache_name: Name of the cache (e.g. "starters", "player_data")
+
+        Returns:
+            Current version of the cache (0 if never loaded or saved)
+        """
+        return self._cache_versions.get(cache_name, 0)
+
+    def get_cache_snapshot(self, cache_name: str) -> Mapping[str, Any]:
+        """Get a read-only view of a cache.
+
+        The view wraps the in-memory cache without copying it, so callers
+        that only read from a cache should prefer it over deep-copying the
+        mutable cache.
+
+        Args:
+            cache_name: Name of the cache (e.g. "manager", "transaction_ids")
+
+        Returns:
+            Read-only view of the cache
+
+        Raises:
+            ValueError: If the cache name is unknown
+        """
+        getter = getattr(self, f"get_{cache_name}_cache", None)
+
+        if getter is None:
+            raise ValueError(f"Unknown cache name: {cache_name}")
+
+        return ReadOnlyDict(getter())
+
+    def get_data_version(self) -> int:
+        """Get the version counter of the data as a whole.
+
+        The counter is bumped every time any cache is saved or all caches are
+        reloaded, so anything computed from the caches (e.g. a rendered
+        response) can tell when it may be out of date. Loading a cache for
+        the first time does not bump it, as the data on disk is unchanged.
+
+        Returns:
+            Current data version (0 if nothing was saved or reloaded)
+        """
+        return self._data_version
+
+    def _bump_cache_version(self, cache_name: str) -> None:
+        """Increment the version counter of a cache.
+
+        Args:
+            cache_name: Name of the cache
+        """
+        with self._version_lock:
+            self._cache_versions[cache_name] = (
+                self._cache_versions.get(cache_name, 0) + 1
+            )
+
+    def _bump_data_version(self) -> None:
+        """Increment the version counter of the data as a whole."""
+        with self._version_lock:
+            self._data_version += 1
+
+    def load_all_caches(self, max_workers: int = 1) -> None:
+        """Load every cache not yet in memory.
+
+        A pre-forking server calls this before forking its workers, so they
+        share the parent's copy of the caches (see `preload_caches`).
+
+        Args:
+            max_workers: Number of caches to load at the same time, each on
+                its own thread
+        """
+        getters = (
+            self.get_manager_cache,
+            self.get_transaction_ids_cache,
+            self.get_players_cache,
+            self.get_player_ids_cache,
+            self.get_starters_cache,
+            self.get_player_data_cache,
+            self.get_replacement_score_cache,
+            self.get_valid_options_cache,
+            self.get_image_urls_cache,
+            self.get_weekly_data_progress_tracker,
+            self.get_aggregation_rollups_cache,
+        )
+
+        if max_workers <= 1:
+            for getter in getters:
+                getter()
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so errors are raised here
+            for _ in executor.map(lambda getter: getter(), getters):
+                pass
+
+    def reload_changed_caches(self) -> list[str]:
+        """Reload the loaded caches whose files changed on disk.
+
+        Nothing is reloaded until a new version is published in the
+        manifest, as the files of an update still being written would mix
+        two versions (see `write_manifest`).
+
+        Each changed cache is loaded into a new dict, then swapped in with a
+        single assignment, so request threads keep reading the old version
+        until then and never see a partial one. The version bumps invalidate
+        the derived indexes and cached responses built from the old data.
+
+        A file that can't be parsed keeps its loaded version, and is retried
+        on the next call.
+
+        Returns:
+            Names of the reloaded caches
+        """
+        # Read before the files, so a version published meanwhile is
+        # reloaded on the next call
+        manifest_version = self.get_manifest_version()
+        if manifest_version == self._manifest_version:
+            return []
+
+        reloaded = []
+        failed = False
+
+        for cache_name, file_path in _SERVED_CACHE_FILES.items():
+            loaded_mtime = self._file_mtimes.get(file_path)
+            if loaded_mtime is None:
+                # Never loaded, so it will be read fresh on first access
+                continue
+
+            try:
+                if os.path.getmtime(file_path) == loaded_mtime:
+                    continue
+                getattr(self, f"get_{cache_name}_cache")(force_reload=True)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not reload {cache_name} cache: {e}")
+                failed = True
+                continue
+
+            reloaded.append(cache_name)
+
+        if not failed:
+            self._manifest_version = manifest_version
+
+        if reloaded:
+            self._bump_data_version()
+
+        return reloaded
+
     def reload_all_caches(self) -> None:
         """Clear all in-memory caches.
 
@@ -536,29 +1013,46 @@ class CacheManager:
         self._valid_options_cache = None
         self._image_urls_cache = None
         self._weekly_data_progress_tracker = None
+        self._aggregation_rollups_cache = None
+        self._manifest_version = None
+        self._bump_data_version()
+
+    def save_all_caches(self, publish: bool = True) -> None:
+        """Save all loaded caches to disk, then publish them together.
+
+        Args:
+            publish: If True, write the manifest last (see `write_manifest`)
+                when a cache was saved. Updates saving more files afterwards
+                publish them all at the end instead.
+        """
+        savers = (
+            (self._manager_cache, self.save_manager_cache),
+            (self._transaction_ids_cache, self.save_transaction_ids_cache),
+            (self._players_cache, self.save_players_cache),
+            (self._player_ids_cache, self.save_player_ids_cache),
+            (self._starters_cache, self.save_starters_cache),
+            (self._player_data_cache, self.save_player_data_cache),
+            (self._replacement_score_cache, self.save_replacement_score_cache),
+            (self._valid_options_cache, self.save_valid_options_cache),
+            (self._image_urls_cache, self.save_image_urls_cache),
+            (
+                self._weekly_data_progress_tracker,
+                self.save_weekly_data_progress_tracker,
+            ),
+            (
+                self._aggregation_rollups_cache,
+                self.save_aggregation_rollups_cache,
+            ),
+        )
+
+        saved = False
+        for cache, save in savers:
+            if cache is not None:
+                save()
+                saved = True
 
-    def save_all_caches(self) -> None:
-        """Save all loaded caches to disk."""
-        if self._manager_cache is not None:
-            self.save_manager_cache()
-        if self._transaction_ids_cache is not None:
-            self.save_transaction_ids_cache()
-        if self._players_cache is not None:
-            self.save_players_cache()
-        if self._player_ids_cache is not None:
-            self.save_player_ids_cache()
-        if self._starters_cache is not None:
-            self.save_starters_cache()
-        if self._player_data_cache is not None:
-            self.save_player_data_cache()
-        if self._replacement_score_cache is not None:
-            self.save_replacement_score_cache()
-        if self._valid_options_cache is not None:
-            self.save_valid_options_cache()
-        if self._image_urls_cache is not None:
-            self.save_image_urls_cache()
-        if self._weekly_data_progress_tracker is not None:
-            self.save_weekly_data_progress_tracker()
+        if saved and publish:
+            self.write_manifest()
 
 
 # ===== SINGLETON INSTANCE =====
@@ -0,0 +1,131 @@
+"""Hot reload of cache files updated while the API is running.
+
+A background thread polls the version manifest written by every cache
+update (see `CacheManager.write_manifest`), so new data goes live without a
+restart, and never as a mix of two versions.
+
+A single process serving every request (e.g. `python -m
+patriot_center_backend.app`) reloads the changed caches in place, while
+requests keep being served from the previous version.
+
+Under Gunicorn, only the master watches: it sends itself SIGHUP, which
+reloads the caches in the master and forks new workers sharing them (see
+`gunicorn.conf.py`). Workers never reload on their own, as each would then
+hold its own copy of the caches.
+
+Usage:
+    CACHE_WATCHER.start()  # reload in this process
+    CACHE_WATCHER.start(reload_signal=signal.SIGHUP)  # in the master
+"""
+
+import logging
+import os
+import signal
+import threading
+import time
+
+from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import build_all_indexes
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two checks of the manifest
+_POLL_INTERVAL = 30.0
+
+
+class CacheWatcher:
+    """Reloads the caches on a background thread when a version is published.
+
+    Usage:
+        CACHE_WATCHER.start()
+    """
+
+    def __init__(self, poll_interval: float = _POLL_INTERVAL) -> None:
+        """Initialize the watcher (the thread starts on `start`).
+
+        Args:
+            poll_interval: Seconds between two checks of the manifest.
+        """
+        self._poll_interval = poll_interval
+        self._reload_signal: signal.Signals | None = None
+
+        # Last version a reload was signalled for
+        self._signalled_version: str | None = None
+
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, reload_signal: signal.Signals | None = None) -> None:
+        """Start the watcher thread, unless it is already running.
+
+        Args:
+            reload_signal: If given, send this signal to the process when a
+                version is published, instead of reloading in place (e.g.
+                SIGHUP for the Gunicorn master).
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._reload_signal = reload_signal
+            self._thread = threading.Thread(
+                target=self._run, name="cache-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def check(self) -> list[str]:
+        """Reload the caches whose files changed since they were loaded.
+
+        The indexes derived from the caches are rebuilt here too, so the
+        first requests after a reload don't pay for them.
+
+        With a reload signal, the signal is sent instead, and the caches are
+        reloaded by its handler.
+
+        Returns:
+            Names of the reloaded caches (none when signalling).
+        """
+        if self._reload_signal is not None:
+            self._signal_new_version()
+            return []
+
+        reloaded = CACHE_MANAGER.reload_changed_caches()
+
+        if reloaded:
+            index_count = build_all_indexes()
+            logger.info(
+                f"Reloaded changed caches: {', '.join(reloaded)} (and "
+                f"{index_count} indexes)"
+            )
+
+        return reloaded
+
+    def _signal_new_version(self) -> None:
+        """Send the reload signal once per newly published version."""
+        version = CACHE_MANAGER.get_manifest_version()
+
+        if version is None or version in (
+            CACHE_MANAGER.get_loaded_manifest_version(),
+            self._signalled_version,
+        ):
+            return
+
+        self._signalled_version = version
+        logger.info(f"Cache version {version} published, reloading")
+        os.kill(os.getpid(), self._reload_signal)
+
+    def _run(self) -> None:
+        """Check the manifest for the life of the process."""
+        while True:
+            time.sleep(self._poll_interval)
+
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning(f"Cache reload failed: {e}")
+
+
+CACHE_WATCHER = CacheWatcher()
@@ -0,0 +1,100 @@
+"""Memoized indexes derived from cached data.
+
+Indexes are built lazily from one or more caches held by the CacheManager and
+rebuilt whenever one of their source caches is reloaded, saved, or replaced.
+
+Usage:
+    @derived_index("player_data")
+    def _get_ffwar_index(player_data_cache):
+        return {...}
+
+    ffwar_index = _get_ffwar_index()
+
+Every index can also be built ahead of its first use with
+`build_all_indexes` (e.g. while warming up a server).
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from patriot_center_backend.cache import CACHE_MANAGER
+
+T = TypeVar("T")
+
+# Every index getter defined, in definition order (see build_all_indexes)
+_INDEX_GETTERS: list[Callable[[], Any]] = []
+
+
+def derived_index(
+    *cache_names: str,
+) -> Callable[[Callable[..., T]], Callable[[], T]]:
+    """Memoize an index builder against the caches it is derived from.
+
+    The builder receives the source caches positionally, in the order given
+    by `cache_names`. The built index is reused until one of the sources is
+    reloaded or saved (its version changes) or replaced by another object.
+
+    The wrapped function exposes `cache_clear()` to drop the memoized index.
+
+    Args:
+        *cache_names: Names of the source caches (e.g. "starters" for
+            `CACHE_MANAGER.get_starters_cache()`).
+
+    Returns:
+        Decorator wrapping the index builder.
+    """
+
+    def decorator(builder: Callable[..., T]) -> Callable[[], T]:
+        memo: dict[str, Any] = {}
+
+        @wraps(builder)
+        def wrapper() -> T:
+            sources = tuple(
+                getattr(CACHE_MANAGER, f"get_{name}_cache")()
+                for name in cache_names
+            )
+            versions = tuple(
+                CACHE_MANAGER.get_cache_version(name) for name in cache_names
+            )
+
+            # Sources are held by the memo, so identity checks are safe
+            entry = memo.get("entry")
+            if (
+                entry is None
+                or entry[1] != versions
+                or any(
+                    new is not old
+                    for new, old in zip(sources, entry[0], strict=True)
+                )
+            ):
+                # Swap in one assignment so readers never see a partial entry
+                entry = (sources, versions, builder(*sources))
+                memo["entry"] = entry
+
+            return entry[2]
+
+        def cache_clear() -> None:
+            """Drop the memoized index so the next call rebuilds it."""
+            memo.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        _INDEX_GETTERS.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def build_all_indexes() -> int:
+    """Build every index not yet built for the current caches.
+
+    Only indexes whose modules have been imported are known, so the app
+    should be imported first.
+
+    Returns:
+        Number of indexes.
+    """
+    for get_index in _INDEX_GETTERS:
+        get_index()
+
+    return len(_INDEX_GETTERS)
@@ -0,0 +1,249 @@
+"""Entity resolution index over the player IDs, players and manager caches.
+
+Resolves between player IDs, names, slugs and positions, manager user IDs and
+item types without probing each cache in turn or scanning any of them.
+
+The index is rebuilt as a whole whenever one of its source caches is
+reloaded, saved or replaced, and kept in sync with in-memory updates through
+`add_player` and `add_user_id`.
+
+Usage:
+    entity_index = get_entity_index()
+    player_id = entity_index.get_player_id("Patrick Mahomes")
+"""
+
+from typing import Any, Literal
+
+from patriot_center_backend.cache.derived_index import derived_index
+from patriot_center_backend.constants import NAME_TO_MANAGER_USERNAME
+from patriot_center_backend.utils.metrics import METRICS
+
+ItemType = Literal[
+    "manager", "draft_pick", "faab", "player", "player_id", "unknown"
+]
+
+_LOOKUPS = METRICS.counter(
+    "entity_index_lookups_total",
+    "Entity index lookups, by lookup and whether the entity was found.",
+    ("lookup", "result"),
+)
+
+
+class EntityIndex:
+    """Lookups between entity IDs, names, slugs, positions and types."""
+
+    __slots__ = (
+        "_name_to_player_id",
+        "_name_to_slug",
+        "_player_id_to_name",
+        "_player_id_to_position",
+        "_players",
+        "_slug_to_name",
+        "_user_ids",
+    )
+
+    def __init__(
+        self,
+        player_ids_cache: dict[str, Any],
+        players_cache: dict[str, Any],
+        manager_cache: dict[str, Any],
+    ) -> None:
+        """Build the index from its source caches.
+
+        Args:
+            player_ids_cache: The player IDs cache.
+            players_cache: The players cache.
+            manager_cache: The manager metadata cache.
+        """
+        self._name_to_player_id: dict[str, str] = {}
+        self._player_id_to_name: dict[str, str | None] = {}
+        self._player_id_to_position: dict[str, str | None] = {}
+        for player_id, player_info in player_ids_cache.items():
+            self._name_to_player_id[player_info["full_name"]] = player_id
+            self._player_id_to_name[player_id] = player_info.get("full_name")
+            self._player_id_to_position[player_id] = player_info.get(
+                "position"
+            )
+
+        self._players: set[str] = set()
+        self._slug_to_name: dict[str, str] = {}
+        self._name_to_slug: dict[str, str] = {}
+        for player, player_data in players_cache.items():
+            self.add_player(player, player_data["slug"])
+
+        self._user_ids: dict[str, str] = {}
+        for manager, manager_data in manager_cache.items():
+            user_id = manager_data.get("summary", {}).get("user_id")
+            if user_id:
+                self._user_ids[manager] = user_id
+
+    def get_player_id(self, player_name: str) -> str | None:
+        """Get the player ID for a full player name.
+
+        Args:
+            player_name: The full name of the player.
+
+        Returns:
+            The player ID if found, otherwise None.
+        """
+        player_id = self._name_to_player_id.get(player_name)
+        _record_lookup("player_id", player_id is not None)
+        return player_id
+
+    def get_player_name(self, player_id: str) -> str | None:
+        """Get the full player name for a player ID.
+
+        Args:
+            player_id: The ID of the player.
+
+        Returns:
+            The player name if found, otherwise None.
+        """
+        player_name = self._player_id_to_name.get(player_id)
+        _record_lookup("player_name", player_name is not None)
+        return player_name
+
+    def get_player_position(self, player_id: str) -> str | None:
+        """Get the position for a player ID.
+
+        Args:
+            player_id: The ID of the player.
+
+        Returns:
+            The player position if found, otherwise None.
+        """
+        player_position = self._player_id_to_position.get(player_id)
+        _record_lookup("player_position", player_position is not None)
+        return player_position
+
+    def get_name_from_slug(self, slug: str) -> str | None:
+        """Get the player name for a slug in the players cache.
+
+        Args:
+            slug: The URL-friendly slug.
+
+        Returns:
+            The player name if found, otherwise None. When two players
+            share a slug the first one in the cache keeps it.
+        """
+        player_name = self._slug_to_name.get(slug)
+        _record_lookup("name_from_slug", player_name is not None)
+        return player_name
+
+    def get_slug(self, player_name: str) -> str | None:
+        """Get the slug for a player in the players cache.
+
+        Args:
+            player_name: The player name.
+
+        Returns:
+            The player's slug if found, otherwise None.
+        """
+        slug = self._name_to_slug.get(player_name)
+        _record_lookup("slug", slug is not None)
+        return slug
+
+    def get_user_id(self, manager: str) -> str | None:
+        """Get the Sleeper user ID for a manager.
+
+        Args:
+            manager: The name of the manager.
+
+        Returns:
+            The user ID if found, otherwise None.
+        """
+        user_id = self._user_ids.get(manager)
+        _record_lookup("user_id", user_id is not None)
+        return user_id
+
+    def get_item_type(self, item: str) -> ItemType:
+        """Detect the type of an item based on its name.
+
+        Args:
+            item: Item to detect type for
+
+        Returns:
+            Type of item
+        """
+        item_type = self._detect_item_type(item)
+        _record_lookup("item_type", item_type != "unknown")
+        return item_type
+
+    def _detect_item_type(self, item: str) -> ItemType:
+        """Detect the type of an item based on its name.
+
+        Args:
+            item: Item to detect type for
+
+        Returns:
+            Type of item
+        """
+        # Manager: identified by presence in manager username mapping
+        if item in NAME_TO_MANAGER_USERNAME:
+            return "manager"
+
+        # Draft Pick: identified by "Draft Pick" in name
+        if "Draft Pick" in item:
+            return "draft_pick"
+
+        # FAAB: identified by "$" in name
+        if "$" in item:
+            return "faab"
+
+        # Player: identified by presence in players cache
+        if item in self._players:
+            return "player"
+
+        if item in self._player_id_to_name:
+            return "player_id"
+
+        return "unknown"
+
+    def add_player(self, player: str, slug: str) -> None:
+        """Record a player added to the players cache.
+
+        Args:
+            player: Player name.
+            slug: The player's slug.
+        """
+        self._players.add(player)
+        self._slug_to_name.setdefault(slug, player)
+        self._name_to_slug.setdefault(player, slug)
+
+    def add_user_id(self, manager: str, user_id: str) -> None:
+        """Record a user ID added to the manager cache.
+
+        Args:
+            manager: The name of the manager.
+            user_id: The manager's Sleeper user ID.
+        """
+        self._user_ids[manager] = user_id
+
+
+def _record_lookup(lookup: str, found: bool) -> None:
+    """Count a lookup as a hit or a miss.
+
+    Args:
+        lookup: The name of the lookup.
+        found: Whether the lookup found the entity.
+    """
+    _LOOKUPS.inc(lookup=lookup, result="hit" if found else "miss")
+
+
+@derived_index("player_ids", "players", "manager")
+def get_entity_index(
+    player_ids_cache: dict[str, Any],
+    players_cache: dict[str, Any],
+    manager_cache: dict[str, Any],
+) -> EntityIndex:
+    """Get the entity index for the current caches.
+
+    Args:
+        player_ids_cache: The player IDs cache.
+        players_cache: The players cache.
+        manager_cache: The manager metadata cache.
+
+    Returns:
+        The entity index.
+    """
+    return EntityIndex(player_ids_cache, players_cache, manager_cache)
@@ -0,0 +1,51 @@
+"""Cache preloading for pre-forking servers.
+
+Every worker of a pre-forking server (e.g. gunicorn) otherwise loads its
+own copy of every cache. Preloading loads them once in the parent process
+instead, along with the indexes derived from them, before the workers are
+forked, so all workers share the parent's memory pages (copy-on-write).
+
+The preloaded objects are moved to the garbage collector's permanent
+generation, as a collection in a worker would otherwise write to (and so
+copy) every page holding them.
+
+A new version of the caches is published by loading it in the parent
+before forking new workers (see `gunicorn.conf.py`). Each worker serves
+either the old or the new version as a whole, never a mix of both.
+
+Usage:
+    preload_caches()  # in the parent, before forking
+"""
+
+import gc
+import logging
+
+from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import build_all_indexes
+
+logger = logging.getLogger(__name__)
+
+
+def preload_caches(reload: bool = False) -> None:
+    """Load every cache and index for the workers forked next to share.
+
+    Args:
+        reload: If True, reload every cache from disk (e.g. after the cache
+            files were updated) instead of keeping the loaded ones.
+    """
+    # Let the collector free the previous version once it is unreferenced
+    gc.unfreeze()
+
+    if reload:
+        CACHE_MANAGER.reload_all_caches()
+    CACHE_MANAGER.load_all_caches()
+    index_count = build_all_indexes()
+
+    gc.collect()
+    gc.freeze()
+
+    logger.info(
+        f"Preloaded caches and {index_count} indexes (data version "
+        f"{CACHE_MANAGER.get_data_version()}, {gc.get_freeze_count()} objects "
+        f"frozen)"
+    )
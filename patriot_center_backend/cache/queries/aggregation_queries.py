@@ -1,40 +1,113 @@
 """Cache query helpers for reading aggregated data."""
 
-from functools import lru_cache
+from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
-from patriot_center_backend.utils.helpers import get_player_id
+from patriot_center_backend.cache.derived_index import derived_index
+from patriot_center_backend.utils.metrics import METRICS
+
+_FFWAR_LOOKUPS = METRICS.counter(
+    "ffwar_lookups_total",
+    "ffWAR index lookups, by whether the player's week was found.",
+    ("result",),
+)
+_FFWAR_HITS = _FFWAR_LOOKUPS.labels(result="hit")
+_FFWAR_MISSES = _FFWAR_LOOKUPS.labels(result="miss")
+
+
+@derived_index("player_data")
+def get_ffwar_index(
+    player_data_cache: dict[str, Any],
+) -> dict[tuple[str, str, str], float]:
+    """Build the (season, week, player_id) -> ffWAR index.
+
+    Rebuilt whenever the player data cache is loaded or saved.
+
+    Args:
+        player_data_cache: Player data cache (ffWAR by season/week/player ID).
+
+    Returns:
+        Flat dictionary mapping (season, week, player_id) to ffWAR.
+    """
+    return {
+        (season, week, player_id): player_data["ffWAR"]
+        for season, weeks in player_data_cache.items()
+        for week, week_data in weeks.items()
+        for player_id, player_data in week_data.items()
+    }
 
 
-@lru_cache(maxsize=10000)
 def get_ffwar_from_cache(
-    player: str, season: str | None = None, week: str | None = None
+    player_id: str | None, season: str | None = None, week: str | None = None
 ) -> float:
     """Lookup ffWAR for a player at a specific season/week granularity.
 
     Returns zero if season/week not provided or absent from cache.
 
     Args:
-        player: Player identifier.
+        player_id: Player ID (as stored on each starter).
         season: Season for lookup.
         week: Week for lookup.
 
     Returns:
         ffWAR value (0.0 if unavailable).
     """
-    if season is None or week is None:
+    if player_id is None or season is None or week is None:
+        return 0.0
+
+    ffwar = get_ffwar_index().get((season, week, player_id))
+    if ffwar is None:
+        _FFWAR_MISSES.inc()
         return 0.0
 
-    player_data_cache = CACHE_MANAGER.get_player_data_cache()
+    _FFWAR_HITS.inc()
+    return ffwar
+
+
+def get_rollup_rows_from_cache(
+    manager: str | None = None,
+    season: int | None = None,
+    player: str | None = None,
+) -> list[tuple[str, str, str, dict[str, Any]]] | None:
+    """Collect precomputed player x manager x season rollup rows.
+
+    Args:
+        manager: Optional manager restriction.
+        season: Optional season restriction.
+        player: Optional player restriction.
+
+    Returns:
+        List of (season, manager, player, rollup) rows matching the filters,
+        or None if the rollups cache has not been built yet.
+    """
+    rollups_cache = CACHE_MANAGER.get_aggregation_rollups_cache()
+
+    if not rollups_cache:
+        return None
+
+    seasons = [str(season)] if season is not None else list(rollups_cache)
+
+    rows = []
+    for season_key in seasons:
+        season_rollups = rollups_cache.get(season_key, {})
+
+        managers = [manager] if manager is not None else list(season_rollups)
+        for mgr in managers:
+            manager_rollups = season_rollups.get(mgr, {})
 
-    if week in player_data_cache.get(season, {}):
-        week_data = player_data_cache[season][week]
-        player_id = get_player_id(player)
+            if player is not None:
+                if player in manager_rollups:
+                    rows.append(
+                        (season_key, mgr, player, manager_rollups[player])
+                    )
+                continue
 
-        if player_id in week_data:
-            return week_data[player_id]["ffWAR"]
+            rows.extend(
+                (season_key, mgr, plyr, rollup)
+                for plyr, rollup in manager_rollups.items()
+            )
 
-    return 0.0
+    return rows
 
 
 def get_team(player: str) -> str | None:
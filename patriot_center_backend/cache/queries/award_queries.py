@@ -1,16 +1,39 @@
 """Cache query helpers for reading award related manager metadata."""
 
-from copy import deepcopy
+import logging
+from bisect import bisect_right
 from decimal import Decimal
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import derived_index
 from patriot_center_backend.cache.updaters._validators import (
     validate_matchup_data,
 )
 from patriot_center_backend.utils.formatters import get_matchup_card
 from patriot_center_backend.utils.image_url_handler import get_image_url
 
+logger = logging.getLogger(__name__)
+
+LEAGUE_RECORDS_LIMIT = 25
+
+_MANAGER_SCORE_AWARDS = (
+    "highest_weekly_score",
+    "lowest_weekly_score",
+    "biggest_blowout_win",
+    "biggest_blowout_loss",
+)
+_LEAGUE_SCORE_RECORDS = (
+    "highest_weekly_score",
+    "lowest_weekly_score",
+    "biggest_blowout",
+)
+_BLOWOUT_AWARDS = (
+    "biggest_blowout_win",
+    "biggest_blowout_loss",
+    "biggest_blowout",
+)
+
 
 def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
     """Get manager career achievements and awards.
@@ -27,13 +50,11 @@ def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
     Returns:
         Dictionary with all awards and achievements
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
+    manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
 
     awards = {}
 
-    cached_overall_data = deepcopy(
-        manager_cache[manager]["summary"]["overall_data"]
-    )
+    cached_overall_data = manager_cache[manager]["summary"]["overall_data"]
 
     # First/Second/Third Place Finishes
     placement_counts = {"first_place": 0, "second_place": 0, "third_place": 0}
@@ -45,7 +66,7 @@ def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
             placement_counts["second_place"] += 1
         elif placement == 3:
             placement_counts["third_place"] += 1
-    awards.update(deepcopy(placement_counts))
+    awards.update(placement_counts)
 
     # Playoff Appearances
     awards["playoff_appearances"] = len(
@@ -62,7 +83,7 @@ def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
         if num_trades > most_trades_in_year["count"]:
             most_trades_in_year["count"] = num_trades
             most_trades_in_year["year"] = year
-    awards["most_trades_in_year"] = deepcopy(most_trades_in_year)
+    awards["most_trades_in_year"] = most_trades_in_year
 
     # Biggest FAAB Bid
     biggest_faab_bid = {"player": "", "amount": 0, "year": ""}
@@ -73,10 +94,10 @@ def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
         and mgr_summary["transactions"]["faab"]
     ):
         for year in list(manager_cache[manager].get("years", {})):
-            weeks = deepcopy(manager_cache[manager]["years"][year]["weeks"])
+            weeks = manager_cache[manager]["years"][year]["weeks"]
             for week in weeks:
                 weekly_trans = weeks.get(week, {}).get("transactions", {})
-                weekly_faab_bids = deepcopy(
+                weekly_faab_bids = (
                     weekly_trans.get("faab", {}).get("players", {})
                 )
                 for player in weekly_faab_bids:
@@ -88,9 +109,9 @@ def get_manager_awards_from_cache(manager: str) -> dict[str, Any]:
                         biggest_faab_bid["amount"] = bid_amount
                         biggest_faab_bid["year"] = year
 
-    awards["biggest_faab_bid"] = deepcopy(biggest_faab_bid)
+    awards["biggest_faab_bid"] = biggest_faab_bid
 
-    return deepcopy(awards)
+    return awards
 
 
 def get_manager_score_awards_from_cache(
@@ -98,13 +119,14 @@ def get_manager_score_awards_from_cache(
 ) -> dict[str, dict[str, Any]]:
     """Get manager scoring records and extremes.
 
-    Iterates through all matchups to find:
+    Reads the manager's records from the score records index:
     - Highest weekly score
     - Lowest weekly score
     - Biggest blowout win
     - Biggest blowout loss
 
-    Each record includes full matchup card with top/lowest scorers.
+    Each record includes full matchup card with top/lowest scorers. Cards
+    are only rendered for the records themselves.
 
     Args:
         manager: Manager name
@@ -112,80 +134,230 @@ def get_manager_score_awards_from_cache(
     Returns:
         Dictionary with all scoring records
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
+    manager_records = get_score_records_index()["managers"].get(manager, {})
 
     score_awards = {}
+    for award in _MANAGER_SCORE_AWARDS:
+        score_awards[award] = _get_record_card(
+            manager_records.get(award), differential=award in _BLOWOUT_AWARDS
+        )
 
-    highest_weekly_score = {}
-    lowest_weekly_score = {}
-    biggest_blowout_win = {}
-    biggest_blowout_loss = {}
+    return score_awards
 
-    for year in list(manager_cache[manager].get("years", {})):
-        weeks = deepcopy(manager_cache[manager]["years"][year]["weeks"])
-        for week in weeks:
-            matchup_data = deepcopy(weeks.get(week, {}).get("matchup_data", {}))
-
-            validation = validate_matchup_data(matchup_data)
-            if "Warning" in validation:
-                print(f"{validation} {manager}, year {year}, week {week}")
-                continue
-            if validation == "Empty":
-                continue
-
-            points_for = matchup_data.get("points_for", 0.0)
-            points_against = matchup_data.get("points_against", 0.0)
-            point_differential = float(
-                Decimal(points_for - points_against).quantize(Decimal("0.01"))
-            )
-
-            # Highest Weekly Score
-            if points_for > highest_weekly_score.get("manager_1_score", 0.0):
-                highest_weekly_score = get_matchup_card(
-                    manager,
-                    matchup_data.get("opponent_manager", ""),
-                    year,
-                    week,
-                )
 
-            # Lowest Weekly Score
-            if points_for < lowest_weekly_score.get(
-                "manager_1_score", float("inf")
-            ):
-                lowest_weekly_score = get_matchup_card(
-                    manager,
-                    matchup_data.get("opponent_manager", ""),
-                    year,
-                    week,
-                )
+def get_league_score_records_from_cache(
+    top_n: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Get the league-wide top scoring records.
 
-            # Biggest Blowout Win
-            if point_differential > biggest_blowout_win.get(
-                "differential", 0.0
-            ):
-                biggest_blowout_win = get_matchup_card(
-                    manager,
-                    matchup_data.get("opponent_manager", ""),
-                    year,
-                    week,
-                )
-                biggest_blowout_win["differential"] = point_differential
+    Args:
+        top_n: Number of records to return per category
+
+    Returns:
+        Dictionary of category to matchup cards, best record first
+
+    Raises:
+        ValueError: If top_n is out of range
+    """
+    if not 1 <= top_n <= LEAGUE_RECORDS_LIMIT:
+        raise ValueError(
+            f"Number of records must be between 1 and {LEAGUE_RECORDS_LIMIT}."
+        )
+
+    league_records = get_score_records_index()["league"]
+
+    return {
+        category: [
+            _get_record_card(record, differential=category in _BLOWOUT_AWARDS)
+            for record in league_records[category][:top_n]
+        ]
+        for category in _LEAGUE_SCORE_RECORDS
+    }
+
+
+@derived_index("manager")
+def get_score_records_index(manager_cache: dict[str, Any]) -> dict[str, Any]:
+    """Index every manager's and the league's scoring extremes.
 
-            # Biggest Blowout Loss
-            if point_differential < biggest_blowout_loss.get(
-                "differential", 0.0
-            ):
-                biggest_blowout_loss = get_matchup_card(
+    Built on first use after the manager cache is loaded or saved, and kept
+    in sync with in-memory updates through `add_to_score_records`.
+
+    Records point at a matchup rather than holding a rendered card:
+    `{"manager", "opponent", "year", "week", "value"}`, where `value` is the
+    points scored or the point differential.
+
+    Args:
+        manager_cache: The manager metadata cache.
+
+    Returns:
+        Dict with `managers` (manager to award to record or None) and
+        `league` (category to records sorted best first, capped at
+        LEAGUE_RECORDS_LIMIT).
+    """
+    score_records: dict[str, Any] = {
+        "managers": {},
+        "league": {category: [] for category in _LEAGUE_SCORE_RECORDS},
+    }
+
+    for manager, manager_data in manager_cache.items():
+        for year, year_data in manager_data.get("years", {}).items():
+            for week, week_data in year_data.get("weeks", {}).items():
+                _add_matchup_to_records(
+                    score_records,
                     manager,
-                    matchup_data.get("opponent_manager", ""),
                     year,
                     week,
+                    week_data.get("matchup_data", {}),
                 )
-                biggest_blowout_loss["differential"] = point_differential
 
-    score_awards["highest_weekly_score"] = deepcopy(highest_weekly_score)
-    score_awards["lowest_weekly_score"] = deepcopy(lowest_weekly_score)
-    score_awards["biggest_blowout_win"] = deepcopy(biggest_blowout_win)
-    score_awards["biggest_blowout_loss"] = deepcopy(biggest_blowout_loss)
+    return score_records
+
+
+def add_to_score_records(
+    manager: str, year: str, week: str, matchup_data: dict[str, Any]
+) -> None:
+    """Record a manager's matchup in the score records index.
+
+    Args:
+        manager: Manager name.
+        year: Season year as string.
+        week: Week number as string.
+        matchup_data: The week's matchup data from the manager cache.
+    """
+    _add_matchup_to_records(
+        get_score_records_index(), manager, year, week, matchup_data
+    )
+
+
+def _add_matchup_to_records(
+    score_records: dict[str, Any],
+    manager: str,
+    year: str,
+    week: str,
+    matchup_data: dict[str, Any],
+) -> None:
+    """Update the manager and league records with one matchup.
+
+    Ties keep the earlier record, so adding a matchup twice has no effect.
+
+    Args:
+        score_records: The score records index (modified in-place).
+        manager: Manager name.
+        year: Season year as string.
+        week: Week number as string.
+        matchup_data: The week's matchup data from the manager cache.
+    """
+    validation = validate_matchup_data(matchup_data)
+    if "Warning" in validation:
+        logger.warning(f"{validation} {manager}, year {year}, week {week}")
+        return
+    if validation == "Empty":
+        return
+
+    points_for = matchup_data.get("points_for", 0.0)
+    points_against = matchup_data.get("points_against", 0.0)
+    point_differential = float(
+        Decimal(points_for - points_against).quantize(Decimal("0.01"))
+    )
+
+    def new_record(value: float) -> dict[str, Any]:
+        return {
+            "manager": manager,
+            "opponent": matchup_data.get("opponent_manager", ""),
+            "year": year,
+            "week": week,
+            "value": value,
+        }
+
+    records = score_records["managers"].setdefault(
+        manager, dict.fromkeys(_MANAGER_SCORE_AWARDS)
+    )
+
+    highest = records["highest_weekly_score"]
+    if points_for > (highest["value"] if highest else 0.0):
+        records["highest_weekly_score"] = new_record(points_for)
+
+    lowest = records["lowest_weekly_score"]
+    if points_for < (lowest["value"] if lowest else float("inf")):
+        records["lowest_weekly_score"] = new_record(points_for)
+
+    blowout_win = records["biggest_blowout_win"]
+    if point_differential > (blowout_win["value"] if blowout_win else 0.0):
+        records["biggest_blowout_win"] = new_record(point_differential)
+
+    blowout_loss = records["biggest_blowout_loss"]
+    if point_differential < (blowout_loss["value"] if blowout_loss else 0.0):
+        records["biggest_blowout_loss"] = new_record(point_differential)
+
+    league_records = score_records["league"]
+    _insert_league_record(
+        league_records["highest_weekly_score"],
+        new_record(points_for),
+        descending=True,
+    )
+    _insert_league_record(
+        league_records["lowest_weekly_score"],
+        new_record(points_for),
+        descending=False,
+    )
+    # Each blowout is listed once, from the winner's side
+    if point_differential > 0.0:
+        _insert_league_record(
+            league_records["biggest_blowout"],
+            new_record(point_differential),
+            descending=True,
+        )
+
+
+def _insert_league_record(
+    records: list[dict[str, Any]], record: dict[str, Any], descending: bool
+) -> None:
+    """Insert a record into a capped league-wide list.
+
+    Args:
+        records: Records sorted best first (modified in-place).
+        record: Record to insert.
+        descending: If True, higher values are better.
+    """
+    for existing in records:
+        if (
+            existing["manager"] == record["manager"]
+            and existing["year"] == record["year"]
+            and existing["week"] == record["week"]
+        ):
+            return
+
+    def sort_key(r: dict[str, Any]) -> float:
+        return -r["value"] if descending else r["value"]
+
+    # Ties keep the earlier record first
+    position = bisect_right(records, sort_key(record), key=sort_key)
+    if position >= LEAGUE_RECORDS_LIMIT:
+        return
+
+    records.insert(position, record)
+    del records[LEAGUE_RECORDS_LIMIT:]
+
+
+def _get_record_card(
+    record: dict[str, Any] | None, differential: bool
+) -> dict[str, Any]:
+    """Render the matchup card a record points at.
+
+    Args:
+        record: Record from the score records index, or None
+        differential: If True, add the record's point differential
+
+    Returns:
+        The matchup card, or an empty dict if there is no record
+    """
+    if not record:
+        return {}
+
+    card = get_matchup_card(
+        record["manager"], record["opponent"], record["year"], record["week"]
+    )
+    if differential:
+        card["differential"] = record["value"]
 
-    return deepcopy(score_awards)
+    return card
@@ -1,11 +1,11 @@
 """Cache query helpers for reading head to head related manager metadata."""
 
 import logging
-from copy import deepcopy
 from decimal import Decimal
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import derived_index
 from patriot_center_backend.cache.updaters._validators import (
     validate_matchup_data,
 )
@@ -35,27 +35,18 @@ def get_head_to_head_details_from_cache(
         Single opponent dict if opponent specified,
             otherwise list of all opponent dicts
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_data = deepcopy(main_manager_cache[manager])
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_data = main_manager_cache[manager]
 
     head_to_head_data = []
 
-    matchup_data = deepcopy(
-        manager_data["summary"]["matchup_data"]["overall"]
-    )
-    trade_data = deepcopy(
-        manager_data["summary"]["transactions"]["trades"]
-    )
+    summary = manager_data["summary"]
     if year:
-        year_cache = manager_data["years"][year]
-        matchup_data = deepcopy(
-            year_cache["summary"]["matchup_data"]["overall"]
-        )
-        trade_data = deepcopy(year_cache["summary"]["transactions"]["trades"])
+        summary = manager_data["years"][year]["summary"]
+    matchup_data = summary["matchup_data"]["overall"]
+    trade_data = summary["transactions"]["trades"]
 
-    opponents = list(
-        deepcopy(matchup_data.get("points_for", {}).get("opponents", {})).keys()
-    )
+    opponents = list(matchup_data.get("points_for", {}).get("opponents", {}))
     if opponent:
         opponents = [opponent]
 
@@ -76,12 +67,12 @@ def get_head_to_head_details_from_cache(
             ),
             "num_trades_between": trade_data["trade_partners"].get(opponent, 0),
         }
-        head_to_head_data.append(deepcopy(opponent_data))
+        head_to_head_data.append(opponent_data)
 
     if len(head_to_head_data) == 1:
-        return deepcopy(head_to_head_data[0])
+        return head_to_head_data[0]
 
-    return deepcopy(head_to_head_data)
+    return head_to_head_data
 
 
 def get_head_to_head_overall_from_cache(
@@ -92,12 +83,15 @@ def get_head_to_head_overall_from_cache(
 ) -> list[dict[str, Any]] | dict[str, Any]:
     """Get comprehensive head-to-head analysis between two managers.
 
-    Iterates through all matchups to find:
+    Looks the pair up in the head-to-head matrix to find:
     - Overall win/loss/tie record
     - Average margin of victory for each manager
     - Last win for each manager (most recent)
     - Biggest blowout for each manager
 
+    Only the (at most four) games behind the last wins and biggest
+    blowouts are rendered as matchup cards.
+
     Args:
         manager1: First manager name
         manager2: Second manager name
@@ -114,178 +108,92 @@ def get_head_to_head_overall_from_cache(
         ValueError: If get_head_to_head_details_from_cache fails
             to return expected data type
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
+    manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+
+    years = list(manager_cache[manager1].get("years", {}).keys())
+    if year:
+        years = [year]
+
+    matrix = _get_head_to_head_matrix()
+    pair_seasons = matrix.get(manager1, {}).get(manager2, {})
+    season_entries = [pair_seasons[y] for y in years if y in pair_seasons]
 
     if list_all_matchups:
-        years = list(manager_cache[manager1].get("years", {}).keys())
-        if year:
-            years = [year]
-        matchup_history = []
-    else:
-        head_to_head_overall = {}
-
-        head_to_head_data = get_head_to_head_details_from_cache(
-            manager1, year=year, opponent=manager2
-        )
+        matchup_history = [
+            get_matchup_card(manager1, manager2, y, w)
+            for entry in season_entries
+            for y, w in entry["games"]
+        ]
+        matchup_history.reverse()
+        return matchup_history
 
-        if isinstance(head_to_head_data, list):
-            raise ValueError(
-                f"Unable to get head-to-head data between {manager1} and "
-                f"{manager2} for year {year}, overall data expected as a "
-                f"dict but received all data as a list."
-            )
+    head_to_head_overall = {}
 
-        head_to_head_overall[f"{manager1.lower().replace(' ', '_')}_wins"] = (
-            head_to_head_data.get("wins")
-        )
-        head_to_head_overall[f"{manager2.lower().replace(' ', '_')}_wins"] = (
-            head_to_head_data.get("losses")
+    head_to_head_data = get_head_to_head_details_from_cache(
+        manager1, year=year, opponent=manager2
+    )
+
+    if isinstance(head_to_head_data, list):
+        raise ValueError(
+            f"Unable to get head-to-head data between {manager1} and "
+            f"{manager2} for year {year}, overall data expected as a "
+            f"dict but received all data as a list."
         )
-        head_to_head_overall["ties"] = head_to_head_data.get("ties")
 
-        # Get average margin of victory, last win, biggest blowout
-        years = list(manager_cache[manager1].get("years", {}).keys())
+    head_to_head_overall[f"{manager1.lower().replace(' ', '_')}_wins"] = (
+        head_to_head_data.get("wins")
+    )
+    head_to_head_overall[f"{manager2.lower().replace(' ', '_')}_wins"] = (
+        head_to_head_data.get("losses")
+    )
+    head_to_head_overall["ties"] = head_to_head_data.get("ties")
 
-        manager_1_points_for = (
+    manager_1_summary = manager_cache[manager1].get("summary", {})
+    manager_2_summary = manager_cache[manager2].get("summary", {})
+    if year:
+        manager_1_summary = (
             manager_cache[manager1]
+            .get("years", {})
+            .get(year, {})
             .get("summary", {})
-            .get("matchup_data", {})
-            .get("overall", {})
-            .get("points_for", {})
-            .get("opponents", {})
-            .get(manager2, 0.0)
         )
-        manager_2_points_for = (
+        manager_2_summary = (
             manager_cache[manager2]
+            .get("years", {})
+            .get(year, {})
             .get("summary", {})
-            .get("matchup_data", {})
-            .get("overall", {})
-            .get("points_for", {})
-            .get("opponents", {})
-            .get(manager1, 0.0)
         )
 
-        if year:
-            years = [year]
-            manager_1_points_for = (
-                manager_cache[manager1]
-                .get("years", {})
-                .get(year, {})
-                .get("summary", {})
-                .get("matchup_data", {})
-                .get("overall", {})
-                .get("points_for", {})
-                .get("opponents", {})
-                .get(manager2, 0.0)
-            )
-            manager_2_points_for = (
-                manager_cache[manager2]
-                .get("years", {})
-                .get(year, {})
-                .get("summary", {})
-                .get("matchup_data", {})
-                .get("overall", {})
-                .get("points_for", {})
-                .get("opponents", {})
-                .get(manager1, 0.0)
-            )
-
-        manager_1_victory_margins = []
-        manager_1_last_win = {}
-        manager_1_biggest_blowout = {}
-
-        manager_2_victory_margins = []
-        manager_2_last_win = {}
-        manager_2_biggest_blowout = {}
-
-    # Get average margin of victory
-    for y in years:
-        weeks = deepcopy(manager_cache[manager1]["years"][y]["weeks"])
-
-        for w in weeks:
-            matchup_data = deepcopy(weeks.get(w, {}).get("matchup_data", {}))
-
-            # Manager didn't play that week but had transactions
-            if matchup_data == {}:
-                continue
-
-            validation = validate_matchup_data(matchup_data)
-            if "Warning" in validation:
-                logger.warning(f"{validation} {manager1}, year {y}, week {w}")
-                continue
-            if validation == "Empty":
-                continue
-
-            # Not the matchup we're looking for
-            if manager2 != matchup_data.get("opponent_manager", ""):
-                continue
-
-            matchup_res = matchup_data.get("result", "")
-            if matchup_res not in ["win", "loss", "tie"]:
-                logger.warning(
-                    f"Missing result for matchup between "
-                    f"{manager1} and {manager2} in {y} week {w}"
-                )
-                continue
-
-            matchup_card = get_matchup_card(manager1, manager2, y, w)
-
-            if list_all_matchups:
-                matchup_history.append(matchup_card)
-                continue
-
-            manager_1_score = matchup_data.get("points_for")
-            manager_2_score = matchup_data.get("points_against")
-
-            # Manager 1 won
-            if matchup_res == "win":
-                manager_1_last_win, manager_1_biggest_blowout = (
-                    _evaluate_matchup(
-                        manager_1_biggest_blowout,
-                        manager_1_last_win,
-                        matchup_card,
-                        manager_1_score - manager_2_score,
-                        manager_1_victory_margins,
-                    )
-                )
-            else:
-                manager_2_last_win, manager_2_biggest_blowout = (
-                    _evaluate_matchup(
-                        manager_2_biggest_blowout,
-                        manager_2_last_win,
-                        matchup_card,
-                        manager_2_score - manager_1_score,
-                        manager_2_victory_margins,
-                    )
-                )
-
-    if list_all_matchups:
-        matchup_history.reverse()
-        return deepcopy(matchup_history)
+    manager_1_points_for = (
+        manager_1_summary
+        .get("matchup_data", {})
+        .get("overall", {})
+        .get("points_for", {})
+        .get("opponents", {})
+        .get(manager2, 0.0)
+    )
+    manager_2_points_for = (
+        manager_2_summary
+        .get("matchup_data", {})
+        .get("overall", {})
+        .get("points_for", {})
+        .get("opponents", {})
+        .get(manager1, 0.0)
+    )
 
-    if len(manager_1_victory_margins) == 0:
-        logger.warning(
-            f"No victories found for {manager1} against "
-            f"{manager2}. Cannot compute average margin of victory."
-        )
-        manager_1_average_margin_of_victory = None
-    else:
-        avg = sum(manager_1_victory_margins) / len(manager_1_victory_margins)
-        manager_1_average_margin_of_victory = float(
-            Decimal(avg).quantize(Decimal("0.01"))
-        )
+    manager_1_wins = _merge_win_records(
+        [entry["manager_wins"] for entry in season_entries]
+    )
+    manager_2_wins = _merge_win_records(
+        [entry["opponent_wins"] for entry in season_entries]
+    )
 
-    if len(manager_2_victory_margins) == 0:
-        logger.warning(
-            f"No victories found for {manager2} against {manager1}. "
-            f"Cannot compute average margin of victory."
-        )
-        manager_2_average_margin_of_victory = None
-    else:
-        avg = sum(manager_2_victory_margins) / len(manager_2_victory_margins)
-        manager_2_average_margin_of_victory = float(
-            Decimal(avg).quantize(Decimal("0.01"))
-        )
+    manager_1_average_margin_of_victory = _get_average_margin_of_victory(
+        manager_1_wins, manager1, manager2
+    )
+    manager_2_average_margin_of_victory = _get_average_margin_of_victory(
+        manager_2_wins, manager2, manager1
+    )
 
     m1 = manager1.lower().replace(" ", "_")
     m2 = manager1.lower().replace(" ", "_")
@@ -301,56 +209,248 @@ def get_head_to_head_overall_from_cache(
         manager_2_average_margin_of_victory
     )
 
-    head_to_head_overall[f"{m1}_last_win"] = deepcopy(manager_1_last_win)
-    head_to_head_overall[f"{m2}_last_win"] = deepcopy(manager_2_last_win)
+    # Render each referenced game once, a last win is often the blowout too
+    cards: dict[tuple[str, str], dict[str, Any]] = {}
+
+    head_to_head_overall[f"{m1}_last_win"] = _get_pointer_card(
+        manager1, manager2, manager_1_wins["last_win"], cards
+    )
+    head_to_head_overall[f"{m2}_last_win"] = _get_pointer_card(
+        manager1, manager2, manager_2_wins["last_win"], cards
+    )
 
-    head_to_head_overall[f"{m1}_biggest_blowout"] = deepcopy(
-        manager_1_biggest_blowout
+    head_to_head_overall[f"{m1}_biggest_blowout"] = _get_pointer_card(
+        manager1, manager2, manager_1_wins["biggest_blowout"], cards
     )
-    head_to_head_overall[f"{m2}_biggest_blowout"] = deepcopy(
-        manager_2_biggest_blowout
+    head_to_head_overall[f"{m2}_biggest_blowout"] = _get_pointer_card(
+        manager1, manager2, manager_2_wins["biggest_blowout"], cards
     )
 
-    return deepcopy(head_to_head_overall)
+    return head_to_head_overall
+
+
+@derived_index("manager")
+def _get_head_to_head_matrix(
+    manager_cache: dict[str, Any],
+) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+    """Build the all-pairs head-to-head matrix from the manager cache.
+
+    Every valid matchup in a manager's weeks is recorded under
+    (manager, opponent, season). Each entry holds pointers to the games
+    played and one win record per side:
+        {
+            "games": [(year, week), ...],
+            "manager_wins": win record,
+            "opponent_wins": win record,
+        }
+
+    Losses and ties are credited to the opponent, as the margins of
+    victory always have been.
+
+    Args:
+        manager_cache: The manager metadata cache.
+
+    Returns:
+        Nested dict of manager -> opponent -> season -> entry
+    """
+    matrix: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+
+    for manager, manager_data in manager_cache.items():
+        for y, year_data in manager_data.get("years", {}).items():
+            for w, week_data in year_data.get("weeks", {}).items():
+                matchup_data = week_data.get("matchup_data", {})
+
+                # Manager didn't play that week but had transactions
+                if matchup_data == {}:
+                    continue
+
+                validation = validate_matchup_data(matchup_data)
+                if "Warning" in validation:
+                    logger.warning(
+                        f"{validation} {manager}, year {y}, week {w}"
+                    )
+                    continue
+                if validation == "Empty":
+                    continue
+
+                opponent = matchup_data.get("opponent_manager", "")
+
+                matchup_res = matchup_data.get("result", "")
+                if matchup_res not in ["win", "loss", "tie"]:
+                    logger.warning(
+                        f"Missing result for matchup between "
+                        f"{manager} and {opponent} in {y} week {w}"
+                    )
+                    continue
+
+                entry = (
+                    matrix.setdefault(manager, {})
+                    .setdefault(opponent, {})
+                    .setdefault(
+                        y,
+                        {
+                            "games": [],
+                            "manager_wins": _new_win_record(),
+                            "opponent_wins": _new_win_record(),
+                        },
+                    )
+                )
+                entry["games"].append((y, w))
+
+                manager_score = matchup_data.get("points_for")
+                opponent_score = matchup_data.get("points_against")
+
+                if matchup_res == "win":
+                    _evaluate_matchup(
+                        entry["manager_wins"],
+                        y,
+                        w,
+                        manager_score - opponent_score,
+                    )
+                else:
+                    _evaluate_matchup(
+                        entry["opponent_wins"],
+                        y,
+                        w,
+                        opponent_score - manager_score,
+                    )
+
+    return matrix
+
+
+def _new_win_record() -> dict[str, Any]:
+    """Create an empty win record for one side of a head-to-head pair.
+
+    Returns:
+        Win record with the margins of victory in game order, and game
+        pointers
+    """
+    return {
+        "margins": [],
+        "last_win": None,
+        "biggest_blowout": None,
+        "biggest_margin": 0.0,
+    }
 
 
 def _evaluate_matchup(
-    biggest_blowout: dict[str, Any],
-    last_win: dict[str, Any],
-    matchup_card: dict[str, Any],
+    win_record: dict[str, Any],
+    year: str,
+    week: str,
     victory_margin: float,
-    margins: list[float],
-) -> tuple[dict[str, Any], dict[str, Any]]:
-    """Evaluate a single matchup card.
+) -> None:
+    """Add a single win to a win record.
 
     Args:
-        biggest_blowout: Matchup card of the biggest blowout
-        last_win: Matchup card of the most recent win
-        matchup_card: Current matchup card
+        win_record: Win record to update (modified in-place)
+        year: Season year of the win
+        week: Week of the win
         victory_margin: Margin of victory
-        margins: List of victory margins
+    """
+    win_record["margins"].append(victory_margin)
+
+    # Determine if this is the most recent win
+    last_win = win_record["last_win"]
+    if last_win is None or (int(year), int(week)) > (
+        int(last_win[0]),
+        int(last_win[1]),
+    ):
+        win_record["last_win"] = (year, week)
+
+    # Determine if this is the biggest blowout, later games win ties
+    if (
+        win_record["biggest_blowout"] is None
+        or victory_margin >= win_record["biggest_margin"]
+    ):
+        win_record["biggest_blowout"] = (year, week)
+        win_record["biggest_margin"] = victory_margin
+
+
+def _merge_win_records(win_records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-season win records in season order.
+
+    The margins are joined in game order rather than summed per season, as
+    float sums depend on the order of their terms.
+
+    Args:
+        win_records: Win records, oldest season first
 
     Returns:
-        Updated `last_win` and `biggest_blowout`
+        Win record covering all the seasons
     """
-    margins.append(victory_margin)
+    merged = _new_win_record()
 
-    if not last_win:
-        last_win = deepcopy(matchup_card)
+    for win_record in win_records:
+        if not win_record["margins"]:
+            continue
 
-        if not biggest_blowout:
-            biggest_blowout = deepcopy(matchup_card)
-        return last_win, biggest_blowout
+        merged["margins"].extend(win_record["margins"])
 
-    y = int(matchup_card["year"])
-    w = int(matchup_card["week"])
+        y, w = win_record["last_win"]
+        last_win = merged["last_win"]
+        if last_win is None or (int(y), int(w)) > (
+            int(last_win[0]),
+            int(last_win[1]),
+        ):
+            merged["last_win"] = win_record["last_win"]
 
-    # Determine if this is the most recent win
-    if (y, w) > (int(last_win["year"]), int(last_win["week"])):
-        last_win = deepcopy(matchup_card)
+        if (
+            merged["biggest_blowout"] is None
+            or win_record["biggest_margin"] >= merged["biggest_margin"]
+        ):
+            merged["biggest_blowout"] = win_record["biggest_blowout"]
+            merged["biggest_margin"] = win_record["biggest_margin"]
+
+    return merged
+
+
+def _get_average_margin_of_victory(
+    win_record: dict[str, Any], winner: str, loser: str
+) -> float | None:
+    """Get the average margin of victory from a win record.
+
+    Args:
+        win_record: Merged win record of the winner
+        winner: Manager the win record belongs to
+        loser: Opponent of the winner
+
+    Returns:
+        Average margin rounded to 2 decimals, None if there are no wins
+    """
+    margins = win_record["margins"]
+    if not margins:
+        logger.warning(
+            f"No victories found for {winner} against {loser}. "
+            f"Cannot compute average margin of victory."
+        )
+        return None
+
+    avg = sum(margins) / len(margins)
+    return float(Decimal(avg).quantize(Decimal("0.01")))
+
+
+def _get_pointer_card(
+    manager1: str,
+    manager2: str,
+    pointer: tuple[str, str] | None,
+    cards: dict[tuple[str, str], dict[str, Any]],
+) -> dict[str, Any]:
+    """Render the matchup card a (year, week) pointer refers to.
+
+    Args:
+        manager1: First manager name
+        manager2: Second manager name
+        pointer: (year, week) of the game, or None
+        cards: Cards already rendered for this request, by pointer
+            (modified in-place)
+
+    Returns:
+        Matchup card, empty if there is no game
+    """
+    if pointer is None:
+        return {}
 
-    # Determine if this is the biggest blowout
-    if victory_margin == max(margins):
-        biggest_blowout = deepcopy(matchup_card)
+    if pointer not in cards:
+        cards[pointer] = get_matchup_card(manager1, manager2, *pointer)
 
-    return last_win, biggest_blowout
+    return cards[pointer]
@@ -1,7 +1,7 @@
 """Cache query helpers for manager metadata."""
 
 import logging
-from copy import deepcopy
+from collections.abc import Mapping
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
@@ -10,22 +10,20 @@ from patriot_center_backend.constants import LEAGUE_IDS
 logger = logging.getLogger(__name__)
 
 
-def get_manager_summary_from_cache(manager_name: str) -> dict[str, Any]:
+def get_manager_summary_from_cache(manager_name: str) -> Mapping[str, Any]:
     """Get manager summary from cache.
 
     Args:
         manager_name: The name of the manager.
 
     Returns:
-        Dictionary of manager summary.
+        Read-only view of the manager summary.
 
     Raises:
         ValueError: If the manager is not found in the cache.
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
-    return_summary = deepcopy(
-        manager_cache.get(manager_name, {}).get("summary", {})
-    )
+    manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    return_summary = manager_cache.get(manager_name, {}).get("summary", {})
 
     if not return_summary:
         raise ValueError(f"Manager {manager_name} not found in cache.")
@@ -65,8 +63,8 @@ def get_manager_years_active_from_cache(manager_name: str) -> list[str]:
     Raises:
         ValueError: If the manager is not found in the cache.
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_data = deepcopy(main_manager_cache[manager_name])
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_data = main_manager_cache[manager_name]
 
     if "years" not in manager_data:
         raise ValueError(f"Manager {manager_name} not found in cache.")
@@ -1,7 +1,6 @@
 """Cache query helpers for reading matchup related manager metadata."""
 
 import logging
-from copy import deepcopy
 from decimal import Decimal
 from typing import Any
 
@@ -30,17 +29,15 @@ def get_matchup_details_from_cache(
     Returns:
         Dictionary with matchup stats for overall, regular_season, and playoffs
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_data = deepcopy(main_manager_cache[manager])
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_data = main_manager_cache[manager]
 
     matchup_data = {"overall": {}, "regular_season": {}, "playoffs": {}}
 
     # Get all-time stats by default, or single season stats if year specified
-    cached_matchup_data = deepcopy(
-        manager_data["summary"]["matchup_data"]
-    )
+    cached_matchup_data = manager_data["summary"]["matchup_data"]
     if year:
-        cached_matchup_data = deepcopy(
+        cached_matchup_data = (
             manager_data["years"][year]["summary"]["matchup_data"]
         )
 
@@ -131,7 +128,7 @@ def get_matchup_details_from_cache(
         matchup_data[season_state]["average_points_against"] = avg_pa
         matchup_data[season_state]["average_point_differential"] = avg_pd
 
-    return deepcopy(matchup_data)
+    return matchup_data
 
 
 def get_overall_data_details_from_cache(
@@ -145,8 +142,8 @@ def get_overall_data_details_from_cache(
     Returns:
         Dictionary with playoff_appearances count and list of placements by year
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_data = deepcopy(main_manager_cache[manager])
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_data = main_manager_cache[manager]
 
     cached_overall_data = manager_data["summary"]["overall_data"]
 
@@ -191,4 +188,4 @@ def get_overall_data_details_from_cache(
 
     overall_data["placements"] = placements
 
-    return deepcopy(overall_data)
+    return overall_data
@@ -1,10 +1,13 @@
 """Option queries."""
 
-from copy import deepcopy
+from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import derived_index
 from patriot_center_backend.constants import NAME_TO_MANAGER_USERNAME
 
+SEARCH_RESULTS_LIMIT = 25
+
 
 def get_options_list_from_cache() -> dict[str, dict[str, str | None]]:
     """Public entry point for retrieving options list from cache.
@@ -14,14 +17,134 @@ def get_options_list_from_cache() -> dict[str, dict[str, str | None]]:
     """
     players_cache = CACHE_MANAGER.get_players_cache()
 
-    data = deepcopy(players_cache)
+    data = {player: dict(details) for player, details in players_cache.items()}
 
     for manager in NAME_TO_MANAGER_USERNAME:
-        data[manager] = {
-            "type": "manager",
-            "name": manager,
-            "full_name": manager,
-            "slug": manager,
-        }
+        data[manager] = _get_manager_option(manager)
 
     return data
+
+
+def search_options_from_cache(query: str, limit: int) -> list[dict[str, Any]]:
+    """Find the players and managers whose names start with a query.
+
+    Matches the start of full names, first names, last names, slugs and
+    manager names, case-insensitively. Results are ranked by popularity
+    (weeks started for players, weeks played for managers).
+
+    Args:
+        query: Text typed so far
+        limit: Maximum number of results
+
+    Returns:
+        Option records, most popular first
+
+    Raises:
+        ValueError: If limit is out of range
+    """
+    if not 1 <= limit <= SEARCH_RESULTS_LIMIT:
+        raise ValueError(
+            f"Limit must be between 1 and {SEARCH_RESULTS_LIMIT}."
+        )
+
+    search_index = get_search_index()
+
+    node = search_index["trie"]
+    for char in query.strip().lower():
+        node = node["children"].get(char)
+        if node is None:
+            return []
+
+    return [dict(search_index["options"][i]) for i in node["matches"][:limit]]
+
+
+@derived_index("players", "starters")
+def get_search_index(
+    players_cache: dict[str, Any], starters_cache: dict[str, Any]
+) -> dict[str, Any]:
+    """Build the prefix trie behind the options search.
+
+    Every trie node keeps the options matching its prefix, already ranked
+    and capped at SEARCH_RESULTS_LIMIT, so a search is one walk down the
+    trie. Rebuilt when the players or starters cache is loaded or saved.
+
+    Args:
+        players_cache: The players cache.
+        starters_cache: The starters cache.
+
+    Returns:
+        Dict with `options` (option records) and `trie` (root node, each
+        node holding `children` by character and `matches`, indexes into
+        `options`).
+    """
+    popularity: dict[str, int] = {}
+    for weeks in starters_cache.values():
+        # Skip metadata sentinel fields
+        if not isinstance(weeks, dict):
+            continue
+
+        for managers in weeks.values():
+            for manager, starters in managers.items():
+                popularity[manager] = popularity.get(manager, 0) + 1
+                for player in starters:
+                    if player != "Total_Points":
+                        popularity[player] = popularity.get(player, 0) + 1
+
+    options: list[dict[str, Any]] = []
+    search_terms: list[set[str]] = []
+
+    for player, details in players_cache.items():
+        options.append({"name": player, "type": "player", **details})
+        search_terms.append(
+            {
+                player,
+                details.get("full_name") or "",
+                details.get("first_name") or "",
+                details.get("last_name") or "",
+                details.get("slug") or "",
+            }
+        )
+
+    for manager in NAME_TO_MANAGER_USERNAME:
+        options.append(_get_manager_option(manager))
+        search_terms.append({manager})
+
+    trie: dict[str, Any] = {"children": {}, "matches": set()}
+    for i, terms in enumerate(search_terms):
+        for term in terms:
+            node = trie
+            for char in term.lower():
+                node = node["children"].setdefault(
+                    char, {"children": {}, "matches": set()}
+                )
+                node["matches"].add(i)
+
+    def rank(i: int) -> tuple[int, str]:
+        return -popularity.get(options[i]["name"], 0), options[i]["name"]
+
+    nodes = [trie]
+    while nodes:
+        node = nodes.pop()
+        node["matches"] = sorted(node["matches"], key=rank)[
+            :SEARCH_RESULTS_LIMIT
+        ]
+        nodes.extend(node["children"].values())
+
+    return {"options": options, "trie": trie}
+
+
+def _get_manager_option(manager: str) -> dict[str, str]:
+    """Get the option details for a manager.
+
+    Args:
+        manager: Manager name
+
+    Returns:
+        Option details for the manager
+    """
+    return {
+        "type": "manager",
+        "name": manager,
+        "full_name": manager,
+        "slug": manager,
+    }
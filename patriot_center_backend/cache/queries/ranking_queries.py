@@ -1,13 +1,24 @@
 """Cache query helpers for ranking related manager metadata."""
 
-from copy import deepcopy
 from decimal import Decimal
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import derived_index
 from patriot_center_backend.constants import LEAGUE_IDS
+from patriot_center_backend.utils.request_memo import request_memo
 
+_RANKING_CATEGORIES = (
+    "win_percentage",
+    "average_points_for",
+    "average_points_against",
+    "average_points_differential",
+    "trades",
+    "playoffs",
+)
 
+
+@request_memo
 def get_ranking_details_from_cache(
     manager: str,
     manager_summary_usage: bool = False,
@@ -38,129 +49,185 @@ def get_ranking_details_from_cache(
         Dict of rankings by category
         or dict with 'values' and 'ranks' if manager_summary_usage=True
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
+    valid_options_cache = CACHE_MANAGER.get_cache_snapshot("valid_options")
 
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
+    current_year = year if year else str(max(LEAGUE_IDS.keys()))
 
-    returning_dictionary = {}
+    is_active_manager = manager in valid_options_cache[current_year]["managers"]
 
-    manager_rankings = {
-        "win_percentage": [],
-        "average_points_for": [],
-        "average_points_against": [],
-        "average_points_differential": [],
-        "trades": [],
-        "playoffs": [],
-    }
+    # Inactive managers are always ranked against every manager
+    ranking_table = _get_ranking_table(
+        year, active_only=active_only and is_active_manager
+    )
 
-    eval_manager_values = {
-        "win_percentage": 0.0,
-        "average_points_for": 0.0,
-        "average_points_against": 0.0,
-        "average_points_differential": 0.0,
-        "trades": 0,
-        "playoffs": 0,
+    returning_dictionary: dict[str, Any] = {
+        "is_active_manager": is_active_manager,
+        "worst": ranking_table["worst"],
     }
+    returning_dictionary.update(ranking_table["ranks"].get(manager, {}))
 
-    current_year = year if year else str(max(LEAGUE_IDS.keys()))
+    if manager_summary_usage:
+        return {
+            "values": dict(
+                ranking_table["values"].get(
+                    manager, dict.fromkeys(_RANKING_CATEGORIES, 0)
+                )
+            ),
+            "ranks": returning_dictionary,
+        }
 
-    managers = deepcopy(valid_options_cache[current_year]["managers"])
+    return returning_dictionary
 
-    returning_dictionary["is_active_manager"] = True
-    if manager not in managers:
-        returning_dictionary["is_active_manager"] = False
-        managers = list(manager_cache.keys())
 
-    if not active_only:
-        managers = list(manager_cache.keys())
+@derived_index("manager", "valid_options")
+def _get_ranking_tables(
+    manager_cache: dict[str, Any], valid_options_cache: dict[str, Any]
+) -> dict[tuple[str | None, bool], dict[str, Any]]:
+    """Hold the ranking tables built from the current manager cache.
 
-    returning_dictionary["worst"] = len(managers)
+    Tables are filled in lazily by `_get_ranking_table`, and dropped as a
+    whole whenever the manager or valid options cache changes.
 
-    for m in managers:
-        manager_data = deepcopy(manager_cache.get(m, {}))
+    Args:
+        manager_cache: The manager metadata cache.
+        valid_options_cache: The valid options cache.
 
-        summary_section = manager_data.get("summary", {})
-        if year:
-            summary_section = (
-                manager_data.get("years", {}).get(year, {}).get("summary", {})
-            )
+    Returns:
+        Empty dict keyed by (year, active_only).
+    """
+    return {}
 
-        ovr_matchup_data = summary_section["matchup_data"]["overall"]
 
-        # Extract record components
-        num_wins = ovr_matchup_data["wins"]["total"]
-        num_losses = ovr_matchup_data["losses"]["total"]
-        num_ties = ovr_matchup_data["ties"]["total"]
+def _get_ranking_table(year: str | None, active_only: bool) -> dict[str, Any]:
+    """Get the ranking table for a year (or all-time) and manager pool.
 
-        # Calculate win percentage
-        num_matchups = num_wins + num_losses + num_ties
+    Args:
+        year: Season year, or None for all-time stats
+        active_only: If True, rank only the managers active in the year
+            (the current year for all-time)
 
-        win_pct = 0.0
-        if num_matchups != 0:
-            win_pct = (num_wins / num_matchups) * 100
-            win_pct = float(Decimal(win_pct).quantize(Decimal("0.1")))
+    Returns:
+        Dict with per-manager `values` and `ranks`, and `worst` (the
+        number of managers ranked)
+    """
+    ranking_tables = _get_ranking_tables()
 
-        # Points for/against and averages
-        tot_pf = ovr_matchup_data["points_for"]["total"]
-        tot_pa = ovr_matchup_data["points_against"]["total"]
+    key = (year, active_only)
+    if key not in ranking_tables:
+        ranking_tables[key] = _build_ranking_table(year, active_only)
 
-        avg_pf = 0.0
-        avg_pa = 0.0
-        avg_pd = 0.0
-        if num_matchups != 0:
-            avg_pf = tot_pf / num_matchups
-            avg_pf = float(Decimal(avg_pf).quantize(Decimal("0.01")))
+    return ranking_tables[key]
 
-            avg_pa = tot_pa / num_matchups
-            avg_pa = float(Decimal(avg_pa).quantize(Decimal("0.01")))
 
-            avg_pd = (tot_pf - tot_pa) / num_matchups
-            avg_pd = float(Decimal(avg_pd).quantize(Decimal("0.01")))
+def _build_ranking_table(year: str | None, active_only: bool) -> dict[str, Any]:
+    """Compute every manager's values and ranks for one ranking table.
 
-        num_trades = summary_section["transactions"]["trades"]["total"]
-        num_playoffs = len(
-            manager_data
-            .get("summary", {})
-            .get("overall_data", {})
-            .get("playoff_appearances", [])
-        )
+    Ranks follow the existing tie handling: a manager's rank is one more
+    than the number of managers with a strictly better value, so tied
+    managers share a rank.
+
+    Args:
+        year: Season year, or None for all-time stats
+        active_only: If True, rank only the managers active in the year
+            (the current year for all-time)
+
+    Returns:
+        Dict with per-manager `values` and `ranks`, and `worst`
+    """
+    manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    valid_options_cache = CACHE_MANAGER.get_cache_snapshot("valid_options")
 
-        manager_rankings["win_percentage"].append({m: win_pct})
-        manager_rankings["average_points_for"].append({m: avg_pf})
-        manager_rankings["average_points_against"].append({m: avg_pa})
-        manager_rankings["average_points_differential"].append({m: avg_pd})
-        manager_rankings["trades"].append({m: num_trades})
-        manager_rankings["playoffs"].append({m: num_playoffs})
-
-        if m == manager:
-            eval_manager_values["win_percentage"] = win_pct
-            eval_manager_values["average_points_for"] = avg_pf
-            eval_manager_values["average_points_against"] = avg_pa
-            eval_manager_values["average_points_differential"] = avg_pd
-            eval_manager_values["trades"] = num_trades
-            eval_manager_values["playoffs"] = num_playoffs
-
-    for k in manager_rankings:
-        manager_rankings[k].sort(
-            key=lambda item: next(iter(item.values())), reverse=True
+    current_year = year if year else str(max(LEAGUE_IDS.keys()))
+
+    managers = list(manager_cache.keys())
+    if active_only:
+        managers = list(valid_options_cache[current_year]["managers"])
+
+    values = {
+        m: _get_manager_values(manager_cache.get(m, {}), year)
+        for m in managers
+    }
+
+    ranks: dict[str, dict[str, int]] = {m: {} for m in managers}
+    for category in _RANKING_CATEGORIES:
+        sorted_values = sorted(
+            (values[m][category] for m in managers), reverse=True
         )
 
-        rank = 1
-        manager_value = eval_manager_values[k]
-        for item in manager_rankings[k]:
-            value = item[next(iter(item.keys()))]
-            if value != manager_value:
-                # If the value is different from the
-                # previous one, update the rank
-                rank += 1
-            else:
-                returning_dictionary[k] = rank
-                break
+        # First position of each value is 1 + the number of better values
+        value_ranks: dict[Any, int] = {}
+        for position, value in enumerate(sorted_values, start=1):
+            value_ranks.setdefault(value, position)
 
-    if manager_summary_usage:
-        return {
-            "values": deepcopy(eval_manager_values),
-            "ranks": deepcopy(returning_dictionary),
-        }
+        for m in managers:
+            ranks[m][category] = value_ranks[values[m][category]]
+
+    return {"values": values, "ranks": ranks, "worst": len(managers)}
 
-    return deepcopy(returning_dictionary)
+
+def _get_manager_values(
+    manager_data: Any, year: str | None
+) -> dict[str, float | int]:
+    """Compute a manager's value in each ranking category.
+
+    Args:
+        manager_data: Read-only view of the manager's cache entry
+        year: Season year, or None for all-time stats
+
+    Returns:
+        Dict of category to value
+    """
+    summary_section = manager_data.get("summary", {})
+    if year:
+        summary_section = (
+            manager_data.get("years", {}).get(year, {}).get("summary", {})
+        )
+
+    ovr_matchup_data = summary_section["matchup_data"]["overall"]
+
+    # Extract record components
+    num_wins = ovr_matchup_data["wins"]["total"]
+    num_losses = ovr_matchup_data["losses"]["total"]
+    num_ties = ovr_matchup_data["ties"]["total"]
+
+    # Calculate win percentage
+    num_matchups = num_wins + num_losses + num_ties
+
+    win_pct = 0.0
+    if num_matchups != 0:
+        win_pct = (num_wins / num_matchups) * 100
+        win_pct = float(Decimal(win_pct).quantize(Decimal("0.1")))
+
+    # Points for/against and averages
+    tot_pf = ovr_matchup_data["points_for"]["total"]
+    tot_pa = ovr_matchup_data["points_against"]["total"]
+
+    avg_pf = 0.0
+    avg_pa = 0.0
+    avg_pd = 0.0
+    if num_matchups != 0:
+        avg_pf = tot_pf / num_matchups
+        avg_pf = float(Decimal(avg_pf).quantize(Decimal("0.01")))
+
+        avg_pa = tot_pa / num_matchups
+        avg_pa = float(Decimal(avg_pa).quantize(Decimal("0.01")))
+
+        avg_pd = (tot_pf - tot_pa) / num_matchups
+        avg_pd = float(Decimal(avg_pd).quantize(Decimal("0.01")))
+
+    num_trades = summary_section["transactions"]["trades"]["total"]
+    num_playoffs = len(
+        manager_data
+        .get("summary", {})
+        .get("overall_data", {})
+        .get("playoff_appearances", [])
+    )
+
+    return {
+        "win_percentage": win_pct,
+        "average_points_for": avg_pf,
+        "average_points_against": avg_pa,
+        "average_points_differential": avg_pd,
+        "trades": num_trades,
+        "playoffs": num_playoffs,
+    }
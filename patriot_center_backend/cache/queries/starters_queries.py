@@ -3,6 +3,7 @@
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import derived_index
 
 
 def get_starters_from_cache(
@@ -66,7 +67,7 @@ def _filter_by_manager(
 ) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
     """Extract only data for one manager, optionally restricted by season/week.
 
-    Iterates through cache (skipping metadata keys) and collects matches.
+    Only visits the weeks the manager appears in, via the manager index.
 
     Args:
         manager: Manager name.
@@ -80,21 +81,63 @@ def _filter_by_manager(
 
     filtered_data = {}
 
+    for season_key, week_key in get_manager_index().get(manager, []):
+        if season is not None and str(season) != season_key:
+            continue
+        if week is not None and str(week) != week_key:
+            continue
+
+        # Initialize nested containers only when needed
+        filtered_data.setdefault(season_key, {}).setdefault(week_key, {})
+        filtered_data[season_key][week_key][manager] = starters_cache[
+            season_key
+        ][week_key][manager]
+
+    return filtered_data
+
+
+@derived_index("starters")
+def get_manager_index(
+    starters_cache: dict[str, Any],
+) -> dict[str, list[tuple[str, str]]]:
+    """Index the (season, week) references each manager appears in.
+
+    Built on first use after the starters cache is loaded or saved, and
+    kept in sync with in-memory updates through `add_to_manager_index`.
+
+    Args:
+        starters_cache: The starters cache.
+
+    Returns:
+        Dict mapping manager name to its (season, week) references, in
+        cache order.
+    """
+    manager_index: dict[str, list[tuple[str, str]]] = {}
+
     for season_key, weeks in starters_cache.items():
         # Skip metadata sentinel fields
-        if season_key in ["Last_Updated_Season", "Last_Updated_Week"]:
-            continue
-        if season is not None and str(season) != season_key:
+        if not isinstance(weeks, dict):
             continue
 
         for week_key, starters in weeks.items():
-            if week is not None and str(week) != week_key:
-                continue
-            if manager in starters:
-                # Initialize nested containers only when needed
-                filtered_data.setdefault(season_key, {}).setdefault(
-                    week_key, {}
+            for manager in starters:
+                manager_index.setdefault(manager, []).append(
+                    (season_key, week_key)
                 )
-                filtered_data[season_key][week_key][manager] = starters[manager]
 
-    return filtered_data
+    return manager_index
+
+
+def add_to_manager_index(manager: str, season: str, week: str) -> None:
+    """Record a manager's week in the manager index.
+
+    Args:
+        manager: Manager name.
+        season: Season as string.
+        week: Week number as string.
+    """
+    references = get_manager_index().setdefault(manager, [])
+
+    # The index may already have been built from the updated cache
+    if (season, week) not in references:
+        references.append((season, week))
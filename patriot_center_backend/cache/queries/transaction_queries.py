@@ -1,6 +1,6 @@
 """Cache query helpers for reading transaction related manager metadata."""
 
-from copy import deepcopy
+from collections.abc import Mapping
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
@@ -29,8 +29,8 @@ def get_transaction_details_from_cache(
     Returns:
         Dictionary with trades, adds, drops, and faab summaries
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_data = deepcopy(main_manager_cache[manager])
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_data = main_manager_cache[manager]
 
     transaction_summary = {"trades": {}, "adds": {}, "drops": {}, "faab": {}}
 
@@ -39,36 +39,30 @@ def get_transaction_details_from_cache(
     if year:
         trans_cache = manager_data["years"][year]["summary"]["transactions"]
 
-    # Flatten FAAB player data to just total spent (if FAAB exists)
-    if "faab" in trans_cache:
-        players = trans_cache["faab"]["players"]
-        for player in list(players):
-            players[player] = players[player]["total_faab_spent"]
-
     trades = {
         "total": trans_cache["trades"]["total"],
         "top_trade_partners": extract_dict_data(
-            deepcopy(trans_cache["trades"]["trade_partners"])
+            trans_cache["trades"]["trade_partners"]
         ),
     }
 
     # ---- Trades Summary ----
     # Most Aquired Players
     trade_players_acquired = trans_cache["trades"]["trade_players_acquired"]
-    most_acquired_players = extract_dict_data(deepcopy(trade_players_acquired))
+    most_acquired_players = extract_dict_data(trade_players_acquired)
     for player in most_acquired_players:
-        player_details = deepcopy(trade_players_acquired[player["name"]])
+        player_details = trade_players_acquired[player["name"]]
         player["from"] = extract_dict_data(
-            deepcopy(player_details.get("trade_partners", {})),
+            player_details.get("trade_partners", {}),
             cutoff=0,
         )
     trades["most_acquired_players"] = most_acquired_players
 
     # Most Sent Players
     trade_players_sent = trans_cache["trades"]["trade_players_sent"]
-    most_sent_players = extract_dict_data(deepcopy(trade_players_sent))
+    most_sent_players = extract_dict_data(trade_players_sent)
     for player in most_sent_players:
-        player_details = deepcopy(trade_players_sent.get(player["name"], {}))
+        player_details = trade_players_sent.get(player["name"], {})
         player["to"] = extract_dict_data(
             player_details.get("trade_partners", {}), cutoff=0
         )
@@ -79,9 +73,7 @@ def get_transaction_details_from_cache(
     # ---- Adds Summary ----
     adds = {
         "total": trans_cache["adds"]["total"],
-        "top_players_added": extract_dict_data(
-            deepcopy(trans_cache["adds"]["players"])
-        ),
+        "top_players_added": extract_dict_data(trans_cache["adds"]["players"]),
     }
     transaction_summary["adds"] = adds
 
@@ -89,7 +81,7 @@ def get_transaction_details_from_cache(
     drops = {
         "total": trans_cache["drops"]["total"],
         "top_players_dropped": extract_dict_data(
-            deepcopy(trans_cache["drops"]["players"])
+            trans_cache["drops"]["players"]
         ),
     }
     transaction_summary["drops"] = drops
@@ -98,11 +90,17 @@ def get_transaction_details_from_cache(
     # Handle cases where FAAB doesn't exist
     # (e.g., older years before FAAB was implemented)
     if trans_cache.get("faab"):
+        # Flatten FAAB player data to just total spent
+        faab_players = trans_cache["faab"]["players"]
+        faab_spent = {
+            player: faab_players[player]["total_faab_spent"]
+            for player in faab_players
+        }
+
         faab = {
             "total_spent": abs(trans_cache["faab"]["total_lost_or_gained"]),
             "biggest_acquisitions": extract_dict_data(
-                deepcopy(trans_cache["faab"]["players"]),
-                value_name="amount",
+                faab_spent, value_name="amount"
             ),
         }
 
@@ -121,7 +119,7 @@ def get_transaction_details_from_cache(
     transaction_summary["faab"] = faab
 
     # Return final transaction summary
-    return deepcopy(transaction_summary)
+    return transaction_summary
 
 
 def get_trade_history_between_two_managers(
@@ -141,10 +139,10 @@ def get_trade_history_between_two_managers(
     Returns:
         List of trade cards in reverse chronological order (newest first)
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
-    manager_1_data = deepcopy(main_manager_cache.get(manager1, {}))
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    manager_1_data = main_manager_cache.get(manager1, {})
 
-    transaction_ids_cache = CACHE_MANAGER.get_transaction_ids_cache()
+    transaction_ids_cache = CACHE_MANAGER.get_cache_snapshot("transaction_ids")
 
     years = list(manager_1_data.get("years", {}).keys())
     if year:
@@ -164,11 +162,12 @@ def get_trade_history_between_two_managers(
             transaction_ids.extend(weekly_trade_transaction_ids)
 
     # Filter to only those involving both managers
-    for tid in deepcopy(transaction_ids):
-        if manager2 not in (
-            transaction_ids_cache.get(tid, {}).get("managers_involved", [])
-        ):
-            transaction_ids.remove(tid)
+    transaction_ids = [
+        tid
+        for tid in transaction_ids
+        if manager2
+        in transaction_ids_cache.get(tid, {}).get("managers_involved", [])
+    ]
 
     trades_between = []
 
@@ -189,17 +188,18 @@ def get_manager_transaction_history_from_cache(
         year: Optional year to filter transactions. Defaults to all-time.
 
     Returns:
-        Dictionary of transaction history.
+        Dictionary of transaction history, holding read-only views of the
+        weekly transactions.
 
     Raises:
         ValueError: If the manager or year is not found in the cache.
     """
-    main_manager_cache = CACHE_MANAGER.get_manager_cache()
+    main_manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
 
     if manager_name not in main_manager_cache:
         raise ValueError(f"Manager {manager_name} not found in cache.")
 
-    manager_data = deepcopy(main_manager_cache[manager_name])
+    manager_data = main_manager_cache[manager_name]
 
     if year and year not in main_manager_cache[manager_name]["years"]:
         raise ValueError(
@@ -228,18 +228,18 @@ def get_manager_transaction_history_from_cache(
                 )
             }
 
-    return deepcopy(return_data)
+    return return_data
 
 
-def get_transaction_from_ids_cache(transaction_id: str) -> dict[str, Any]:
+def get_transaction_from_ids_cache(transaction_id: str) -> Mapping[str, Any]:
     """Get transaction from transaction ID.
 
     Args:
         transaction_id: The ID of the transaction.
 
     Returns:
-        Dictionary of transaction data.
+        Read-only view of the transaction data.
     """
-    transaction_ids_cache = CACHE_MANAGER.get_transaction_ids_cache()
+    transaction_ids_cache = CACHE_MANAGER.get_cache_snapshot("transaction_ids")
 
-    return deepcopy(transaction_ids_cache.get(transaction_id, {}))
+    return transaction_ids_cache.get(transaction_id, {})
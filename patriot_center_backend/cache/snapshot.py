@@ -0,0 +1,119 @@
+"""Read-only snapshot views over cached data.
+
+Views wrap the in-memory caches without copying them. Nested dicts and lists
+are wrapped lazily as they are accessed, so reading a handful of values out
+of a large cache only allocates the handful of small wrappers on the path to
+them. Any attempt to modify a view raises `TypeError`.
+
+Views are not JSON serializable. Query functions read from views and build
+fresh output dicts.
+
+Usage:
+    manager_cache = CACHE_MANAGER.get_cache_snapshot("manager")
+    wins = manager_cache["Tommy"]["summary"]["matchup_data"]["overall"]
+"""
+
+from collections.abc import Iterator, KeysView, Mapping, Sequence
+from typing import Any
+
+
+class ReadOnlyDict(Mapping[str, Any]):
+    """Read-only view of a dict whose nested containers are also read-only."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Wrap a dict without copying it.
+
+        Args:
+            data: The dict to expose read-only.
+        """
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a value, wrapping nested containers."""
+        return read_only(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Check key membership without wrapping the value."""
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value or default, wrapping nested containers."""
+        return read_only(self._data.get(key, default))
+
+    def keys(self) -> KeysView[str]:
+        """Get the keys of the wrapped dict."""
+        return self._data.keys()
+
+    def __repr__(self) -> str:
+        """Represent the view like the dict it wraps."""
+        return f"ReadOnlyDict({self._data!r})"
+
+
+class ReadOnlyList(Sequence[Any]):
+    """Read-only view of a list whose nested containers are also read-only."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list[Any]) -> None:
+        """Wrap a list without copying it.
+
+        Args:
+            data: The list to expose read-only.
+        """
+        self._data = data
+
+    def __getitem__(self, index: Any) -> Any:
+        """Get an item or slice, wrapping nested containers."""
+        return read_only(self._data[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, wrapping nested containers."""
+        return (read_only(item) for item in self._data)
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return len(self._data)
+
+    def __contains__(self, item: object) -> bool:
+        """Check item membership against the wrapped list."""
+        return item in self._data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to lists and views holding the same items."""
+        if isinstance(other, ReadOnlyList):
+            return self._data == other._data
+        if isinstance(other, list):
+            return self._data == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent the view like the list it wraps."""
+        return f"ReadOnlyList({self._data!r})"
+
+
+def read_only(value: Any) -> Any:
+    """Wrap a cached value in a read-only view.
+
+    Args:
+        value: Any value from a cache.
+
+    Returns:
+        A view for dicts and lists, the value itself otherwise.
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
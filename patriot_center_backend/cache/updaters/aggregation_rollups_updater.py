@@ -0,0 +1,103 @@
+"""Build the aggregation rollups cache from the starters cache.
+
+Rollups hold per (season, manager, player) totals so the aggregation
+endpoints can merge a handful of precomputed rows instead of walking every
+week of the starters cache on each request.
+
+Totals are stored unrounded, so totals summed over several seasons match
+the raw starters aggregation exactly; they are rounded when exported.
+
+Shape:
+    {season: {manager: {player: {
+        "total_points": float,
+        "num_games_started": int,
+        "ffWAR": float,
+        "position": str,
+        "player_id": str,
+        "placement": int,  # Only present for playoff finishes
+    }}}}
+"""
+
+import logging
+from typing import Any
+
+from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.queries.aggregation_queries import (
+    get_ffwar_from_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def update_aggregation_rollups_cache() -> None:
+    """Rebuild and save the aggregation rollups cache.
+
+    Rollups are rebuilt from scratch from the starters and player data
+    caches, so playoff placements assigned retroactively and renamed players
+    are always reflected.
+    """
+    starters_cache = CACHE_MANAGER.get_starters_cache()
+
+    rollups: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+
+    for season, weeks in starters_cache.items():
+        # Skip metadata sentinel fields
+        if not isinstance(weeks, dict):
+            continue
+
+        season_rollups = rollups.setdefault(season, {})
+        for week, managers in weeks.items():
+            for manager, manager_data in managers.items():
+                manager_rollups = season_rollups.setdefault(manager, {})
+                for player, player_data in manager_data.items():
+                    if player == "Total_Points":
+                        continue
+                    _add_to_rollup(
+                        manager_rollups, player, player_data, season, week
+                    )
+
+    CACHE_MANAGER.save_aggregation_rollups_cache(rollups)
+
+    # Last file of the weekly update, so publish the whole update
+    CACHE_MANAGER.write_manifest()
+
+    logger.info("Aggregation Rollups Cache Updated.")
+
+
+def _add_to_rollup(
+    manager_rollups: dict[str, dict[str, Any]],
+    player: str,
+    player_data: dict[str, Any],
+    season: str,
+    week: str,
+) -> None:
+    """Add a single starter appearance to a manager's season rollup.
+
+    Args:
+        manager_rollups: Rollups for one manager in one season (modified
+            in-place).
+        player: Player name.
+        player_data: Starter entry from the starters cache.
+        season: Season year as string.
+        week: Week number as string.
+    """
+    player_id = player_data.get("player_id")
+
+    rollup = manager_rollups.setdefault(
+        player,
+        {
+            "total_points": 0.0,
+            "num_games_started": 0,
+            "ffWAR": 0.0,
+            "position": player_data["position"],
+            "player_id": player_id,
+        },
+    )
+
+    rollup["total_points"] += player_data["points"]
+    rollup["num_games_started"] += 1
+    rollup["ffWAR"] += get_ffwar_from_cache(player_id, season=season, week=week)
+
+    # Playoff placement is only recorded on the final playoff week
+    if "placement" in player_data and "placement" not in rollup:
+        rollup["placement"] = player_data["placement"]
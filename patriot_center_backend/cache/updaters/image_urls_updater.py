@@ -1,9 +1,20 @@
 """This module provides utility functions for updating the image URLs cache."""
 
+import logging
+import threading
+import time
+from collections.abc import Mapping
+
 from patriot_center_backend.cache import CACHE_MANAGER
 from patriot_center_backend.cache.updaters._url_builders import build_url
 from patriot_center_backend.utils.item_type_detector import detect_item_type
 
+logger = logging.getLogger(__name__)
+
+# Seconds the worker waits after the first queued item, so refreshes
+# queued by the same page load are fetched and saved together
+_REFRESH_BATCH_DELAY = 1.0
+
 
 def update_image_urls_cache(item: str,) -> dict[str, str]:
     """Update the image URLs cache.
@@ -17,10 +28,124 @@ def update_image_urls_cache(item: str,) -> dict[str, str]:
     item_type = detect_item_type(item)
     url_dict = build_url(item, item_type)
 
-    image_urls_cache = CACHE_MANAGER.get_image_urls_cache()
-    image_urls_cache[item] = url_dict
-
-    if item_type == "manager":
-        CACHE_MANAGER.save_image_urls_cache()
+    CACHE_MANAGER.update_cache(
+        "image_urls", {item: url_dict}, save=item_type == "manager"
+    )
 
     return url_dict
+
+
+def update_image_urls(
+    item_types: Mapping[str, str],
+) -> dict[str, dict[str, str]]:
+    """Update the image URLs cache for several items at once.
+
+    The cache is saved at most once, when any of the items is a manager.
+
+    Args:
+        item_types: The type of each item to update.
+
+    Returns:
+        The new image URLs cache entry for each item.
+    """
+    url_dicts = {
+        item: build_url(item, item_type)
+        for item, item_type in item_types.items()
+    }
+
+    CACHE_MANAGER.update_cache(
+        "image_urls", url_dicts, save="manager" in item_types.values()
+    )
+
+    return url_dicts
+
+
+class ImageUrlRefresher:
+    """Refreshes stale image URLs on a background worker thread.
+
+    Request handlers queue stale items and keep serving the cached entry.
+    The worker fetches every queued item in one batch and saves the cache
+    once, so neither the Sleeper API nor the disk write is on the request
+    path.
+
+    Usage:
+        IMAGE_URL_REFRESHER.queue("Tommy")
+    """
+
+    def __init__(self, batch_delay: float = _REFRESH_BATCH_DELAY) -> None:
+        """Initialize the refresher (the worker starts on first use).
+
+        Args:
+            batch_delay: Seconds to collect queued items before refreshing.
+        """
+        self._batch_delay = batch_delay
+
+        # Queued or in-flight items, in queue order
+        self._pending: dict[str, None] = {}
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    def queue(self, item: str) -> None:
+        """Queue an item to be refreshed by the worker.
+
+        Items already queued or being refreshed are not queued again.
+
+        Args:
+            item: The item whose image URL is stale.
+        """
+        with self._condition:
+            if item in self._pending:
+                return
+
+            self._pending[item] = None
+
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="image-url-refresher", daemon=True
+                )
+                self._worker.start()
+
+            self._condition.notify()
+
+    def refresh_pending(self) -> None:
+        """Refresh every queued item and save the cache once.
+
+        Items whose URL can't be built keep their stale entry.
+        """
+        with self._condition:
+            items = list(self._pending)
+
+        refreshed: dict[str, dict[str, str]] = {}
+        for item in items:
+            try:
+                url_dict = build_url(item, detect_item_type(item))
+            except Exception as e:
+                logger.warning(f"Could not refresh image URL for {item}: {e}")
+                continue
+
+            if url_dict:
+                refreshed[item] = url_dict
+
+        if refreshed:
+            CACHE_MANAGER.update_cache("image_urls", refreshed, save=True)
+
+        with self._condition:
+            for item in items:
+                self._pending.pop(item, None)
+
+    def _run(self) -> None:
+        """Refresh queued items in batches for the life of the process."""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+
+            time.sleep(self._batch_delay)
+
+            try:
+                self.refresh_pending()
+            except Exception as e:
+                logger.warning(f"Image URL refresh failed: {e}")
+
+
+IMAGE_URL_REFRESHER = ImageUrlRefresher()
@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.entity_index import get_entity_index
 from patriot_center_backend.cache.updaters._templates import (
     initialize_faab_template,
     initialize_summary_templates,
@@ -267,6 +268,7 @@ class ManagerMetadataManager:
 
         # Add user_id to manager cache
         manager_cache[manager]["summary"]["user_id"] = user_payload["user_id"]
+        get_entity_index().add_user_id(manager, user_payload["user_id"])
 
         update_image_urls_cache(manager)
 
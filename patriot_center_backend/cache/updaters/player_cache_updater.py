@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.entity_index import get_entity_index
 from patriot_center_backend.cache.updaters.image_urls_updater import (
     update_image_urls_cache,
 )
@@ -33,15 +34,17 @@ def update_players_cache(player_id: str) -> None:
     if player_name not in players_cache:
         player_meta = player_ids_cache.get(player_id, {})
 
+        slug = slugify(player_meta.get("full_name", ""))
         players_cache[player_meta["full_name"]] = {
             "full_name": player_meta.get("full_name", ""),
             "first_name": player_meta.get("first_name", ""),
             "last_name": player_meta.get("last_name", ""),
             "position": player_meta.get("position", ""),
             "team": player_meta.get("team", ""),
-            "slug": slugify(player_meta.get("full_name", "")),
+            "slug": slug,
             "player_id": player_id,
         }
+        get_entity_index().add_player(player_meta["full_name"], slug)
 
         update_image_urls_cache(player_meta["full_name"])
         update_image_urls_cache(player_id)
@@ -4,6 +4,9 @@ from decimal import Decimal
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.queries.award_queries import (
+    add_to_score_records,
+)
 from patriot_center_backend.cache.updaters.player_cache_updater import (
     update_players_cache_with_list,
 )
@@ -219,6 +222,8 @@ class MatchupProcessor:
         - Total matchups count
         - Wins/losses/ties (total and opponent-specific)
 
+        Also records the matchup in the score records index.
+
         Uses Decimal for precise point quantization to 2 decimal places.
 
         Args:
@@ -354,6 +359,10 @@ class MatchupProcessor:
                 summary[result_key]["opponents"][opponent_manager] = 0
             summary[result_key]["opponents"][opponent_manager] += 1
 
+        add_to_score_records(
+            manager, self._year, self._week, week_level["matchup_data"]
+        )
+
     def _cache_matchup_data(
         self, manager: str, matchup: dict[str, Any]
     ) -> None:
@@ -4,6 +4,9 @@ import logging
 from decimal import Decimal
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.queries.starters_queries import (
+    add_to_manager_index,
+)
 from patriot_center_backend.utils.helpers import (
     get_player_name,
     get_player_position,
@@ -33,6 +36,8 @@ def update_starters_cache(
     # Update the cache if needed
     year_data = starters_cache.setdefault(str(year), {})
     week_data = year_data.setdefault(str(week), {})
+    if manager not in week_data:
+        add_to_manager_index(manager, str(year), str(week))
     manager_data = week_data.setdefault(manager, {})
 
     manager_data.setdefault("Total_Points", 0.0)
@@ -1,8 +1,13 @@
 """Update valid options cache."""
 
 import logging
+import sys
+from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    add_to_bitmap_index,
+)
 from patriot_center_backend.utils.helpers import (
     get_player_name,
     get_player_position,
@@ -10,6 +15,8 @@ from patriot_center_backend.utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+_OPTION_LISTS = ("managers", "players", "weeks", "positions")
+
 
 def update_valid_options_cache(
     year: int, week: int, manager: str, player_id: str
@@ -59,6 +66,8 @@ def update_valid_options_cache(
     _update_list(manager_data["players"], player)
     _update_list(manager_data["positions"], position)
 
+    add_to_bitmap_index(str(year), str(week), manager, player, position)
+
 
 def _update_list(list_to_update: list[str], value: str) -> None:
     """Update list if value not already in it.
@@ -69,3 +78,95 @@ def _update_list(list_to_update: list[str], value: str) -> None:
     """
     if value not in list_to_update:
         list_to_update.append(value)
+
+
+def rebuild_valid_options_cache() -> None:
+    """Rebuild and save the valid options cache from the starters cache.
+
+    Rebuilding from scratch keeps the valid options in line with the
+    starters cache after players are renamed or weeks are reprocessed.
+    """
+    starters_cache = CACHE_MANAGER.get_starters_cache()
+
+    CACHE_MANAGER.save_valid_options_cache(
+        build_valid_options_cache(starters_cache)
+    )
+
+    logger.info("Valid Options Cache Rebuilt.")
+
+
+def build_valid_options_cache(
+    starters_cache: dict[str, Any],
+) -> dict[str, dict[str, Any]]:
+    """Build the valid options cache from the starters cache in one pass.
+
+    Each level collects its values in insertion-ordered dicts, so membership
+    checks are O(1), and every name is interned so the repeated strings are
+    shared across levels. The result matches what calling
+    `update_valid_options_cache` for every starter in order would produce.
+
+    Args:
+        starters_cache: The starters cache.
+
+    Returns:
+        The valid options cache.
+    """
+    valid_options: dict[str, dict[str, Any]] = {}
+
+    for year, weeks in starters_cache.items():
+        # Skip metadata sentinel fields
+        if not isinstance(weeks, dict):
+            continue
+
+        for week, managers in weeks.items():
+            for manager, manager_data in managers.items():
+                manager = sys.intern(manager)
+
+                for player, player_data in manager_data.items():
+                    if player == "Total_Points":
+                        continue
+
+                    player = sys.intern(player)
+                    position = sys.intern(player_data["position"])
+
+                    year_data = valid_options.setdefault(
+                        year, {key: {} for key in _OPTION_LISTS}
+                    )
+                    year_data["managers"][manager] = None
+                    year_data["players"][player] = None
+                    year_data["weeks"][week] = None
+                    year_data["positions"][position] = None
+
+                    week_data = year_data.setdefault(
+                        week, {"managers": {}, "players": {}, "positions": {}}
+                    )
+                    week_data["managers"][manager] = None
+                    week_data["players"][player] = None
+                    week_data["positions"][position] = None
+
+                    manager_options = week_data.setdefault(
+                        manager, {"players": {}, "positions": {}}
+                    )
+                    manager_options["players"][player] = None
+                    manager_options["positions"][position] = None
+
+    for year_data in valid_options.values():
+        _to_lists(year_data)
+        for week in year_data["weeks"]:
+            week_data = year_data[week]
+            _to_lists(week_data)
+            for manager in week_data["managers"]:
+                _to_lists(week_data[manager])
+
+    return valid_options
+
+
+def _to_lists(level: dict[str, Any]) -> None:
+    """Turn a level's ordered sets of options into lists.
+
+    Args:
+        level: Year, week or manager level (modified in-place)
+    """
+    for key in _OPTION_LISTS:
+        if key in level:
+            level[key] = list(level[key])
@@ -23,6 +23,9 @@ from patriot_center_backend.cache.updaters._progress_tracker import (
     get_league_status,
     set_last_updated,
 )
+from patriot_center_backend.cache.updaters.aggregation_rollups_updater import (
+    update_aggregation_rollups_cache,
+)
 from patriot_center_backend.cache.updaters.manager_data_updater import (
     ManagerMetadataManager,
 )
@@ -32,6 +35,9 @@ from patriot_center_backend.cache.updaters.player_data_updater import (
 from patriot_center_backend.cache.updaters.replacement_score_updater import (
     ReplacementScoreCacheBuilder,
 )
+from patriot_center_backend.cache.updaters.valid_options_updater import (
+    rebuild_valid_options_cache,
+)
 from patriot_center_backend.constants import LEAGUE_IDS
 from patriot_center_backend.playoffs.playoff_tracker import (
     assign_placements_retroactively,
@@ -48,6 +54,8 @@ def update_weekly_data_caches() -> None:
     - Cap weeks at 17 (include playoffs).
     - Only fetch missing weeks per season; break early if fully current.
     - Strip metadata before returning to callers.
+    - Rebuild the valid options and aggregation rollups from the updated
+      starters.
     """
     manager_updater = ManagerMetadataManager()
 
@@ -76,4 +84,9 @@ def update_weekly_data_caches() -> None:
 
             set_last_updated(year, week)
 
-    CACHE_MANAGER.save_all_caches()
+    # Published with the rollups, the last files of the update
+    CACHE_MANAGER.save_all_caches(publish=False)
+
+    # Derived from the starters and player data caches saved above
+    rebuild_valid_options_cache()
+    update_aggregation_rollups_cache()
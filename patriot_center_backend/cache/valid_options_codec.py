@@ -0,0 +1,93 @@
+"""Compact on-disk form of the valid options cache.
+
+The valid options cache repeats the same manager, player and position names
+at the year, week and manager levels. On disk every name is stored once in a
+names table and each option list holds indices into it, in the same order as
+the in-memory lists.
+
+Compact shape:
+    {
+        "names": [str, ...],
+        "valid_options": {year: {"managers": [int, ...], ...}},
+    }
+
+Usage:
+    data = compact_valid_options(valid_options_cache)
+    valid_options_cache = expand_valid_options(data)
+"""
+
+import sys
+from typing import Any
+
+
+def compact_valid_options(cache: dict[str, Any]) -> dict[str, Any]:
+    """Replace every option name with its index in a names table.
+
+    Args:
+        cache: The valid options cache.
+
+    Returns:
+        The compact form of the cache.
+    """
+    name_ids: dict[str, int] = {}
+    valid_options = _encode(cache, name_ids)
+
+    return {"names": list(name_ids), "valid_options": valid_options}
+
+
+def expand_valid_options(data: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild the valid options cache from its compact form.
+
+    Names are interned, so each one is held in memory once however many
+    levels it appears at. Caches saved before the compact form existed are
+    returned unchanged.
+
+    Args:
+        data: The compact form, or a cache in the original form.
+
+    Returns:
+        The valid options cache.
+    """
+    if "names" not in data:
+        return data
+
+    names = [sys.intern(name) for name in data["names"]]
+
+    return _decode(data["valid_options"], names)
+
+
+def _encode(node: Any, name_ids: dict[str, int]) -> Any:
+    """Replace the names in every list under a node with their IDs.
+
+    Args:
+        node: The node to encode.
+        name_ids: Name to ID mapping, extended with new names in-place.
+
+    Returns:
+        The encoded node.
+    """
+    if isinstance(node, dict):
+        return {key: _encode(value, name_ids) for key, value in node.items()}
+    if isinstance(node, list):
+        return [name_ids.setdefault(name, len(name_ids)) for name in node]
+    return node
+
+
+def _decode(node: Any, names: list[str]) -> Any:
+    """Replace the IDs in every list under a node with their names.
+
+    Args:
+        node: The node to decode.
+        names: The names table.
+
+    Returns:
+        The decoded node.
+    """
+    if isinstance(node, dict):
+        return {
+            sys.intern(key): _decode(value, names)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [names[name_id] for name_id in node]
+    return node
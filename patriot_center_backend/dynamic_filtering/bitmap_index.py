@@ -0,0 +1,303 @@
+"""Bitmap index over the valid options cache.
+
+Every (year, week) in the valid options cache is assigned a bit position, a
+slot. For each manager, position and player, and each (manager, position)
+and (manager, player) pair, the index keeps an int bitset of the slots they
+appear in. Filtering on a combination of them is then a few bitwise ANDs,
+and decoding the result is one AND per year or week label.
+
+Usage:
+    bitmap_index = get_bitmap_index()
+    slots = bitmap_index.get_filter_mask("Tommy", "QB", None)
+    years = bitmap_index.decode_years(slots)
+"""
+
+from typing import Any
+
+from patriot_center_backend.cache.derived_index import derived_index
+
+
+class BitmapIndex:
+    """Bitsets of the (year, week) slots each filter value appears in."""
+
+    __slots__ = (
+        "_all_slots",
+        "_manager_players",
+        "_manager_positions",
+        "_managers",
+        "_players",
+        "_positions",
+        "_slots",
+        "_week_masks",
+        "_year_masks",
+        "_year_weeks",
+    )
+
+    def __init__(self, valid_options_cache: dict[str, Any]) -> None:
+        """Build the index from the valid options cache.
+
+        Args:
+            valid_options_cache: The valid options cache.
+        """
+        self._slots: dict[tuple[str, str], int] = {}
+        self._year_weeks: dict[str, list[str]] = {}
+        self._year_masks: dict[str, int] = {}
+        self._week_masks: dict[str, int] = {}
+        self._all_slots = 0
+
+        self._managers: dict[str, int] = {}
+        self._positions: dict[str, int] = {}
+        self._players: dict[str, int] = {}
+        self._manager_positions: dict[tuple[str, str], int] = {}
+        self._manager_players: dict[tuple[str, str], int] = {}
+
+        for yr, year_data in valid_options_cache.items():
+            self._year_weeks.setdefault(yr, [])
+            self._year_masks.setdefault(yr, 0)
+
+            for wk in year_data.get("weeks", []):
+                week_data = year_data.get(wk, {})
+                bit = self._get_slot_bit(yr, wk)
+
+                for position in week_data.get("positions", []):
+                    _set_bit(self._positions, position, bit)
+                for player in week_data.get("players", []):
+                    _set_bit(self._players, player, bit)
+
+                for mgr in week_data.get("managers", []):
+                    manager_data = week_data.get(mgr, {})
+
+                    _set_bit(self._managers, mgr, bit)
+                    for position in manager_data.get("positions", []):
+                        _set_bit(self._manager_positions, (mgr, position), bit)
+                    for player in manager_data.get("players", []):
+                        _set_bit(self._manager_players, (mgr, player), bit)
+
+    def add(
+        self, year: str, week: str, manager: str, player: str, position: str
+    ) -> None:
+        """Record a starter added to the valid options cache.
+
+        Args:
+            year: Season year as string.
+            week: Week number as string.
+            manager: Manager name.
+            player: Player name.
+            position: Player position.
+        """
+        bit = self._get_slot_bit(year, week)
+
+        _set_bit(self._positions, position, bit)
+        _set_bit(self._players, player, bit)
+        _set_bit(self._managers, manager, bit)
+        _set_bit(self._manager_positions, (manager, position), bit)
+        _set_bit(self._manager_players, (manager, player), bit)
+
+    def get_years(self) -> list[str]:
+        """Get every year in the index, in cache order.
+
+        Returns:
+            The years.
+        """
+        return list(self._year_weeks)
+
+    def get_scope_mask(self, years: list[str], weeks: list[str]) -> int:
+        """Get the slots to check for the given years and weeks.
+
+        Mirrors how the `find_valid_*` functions walk the cache: when no
+        weeks are given, the weeks of the first year that has any are used
+        for every year after it.
+
+        Args:
+            years: Years to check.
+            weeks: Weeks to check, or empty to use the first year's weeks.
+
+        Returns:
+            Bitset of the slots in scope.
+        """
+        mask = 0
+        for yr in years:
+            if not weeks:
+                weeks = self._year_weeks.get(yr, [])
+
+            for wk in weeks:
+                slot = self._slots.get((yr, wk))
+                if slot is not None:
+                    mask |= 1 << slot
+
+        return mask
+
+    def get_filter_mask(
+        self, manager: str | None, position: str | None, player: str | None
+    ) -> int:
+        """Get the slots matching a manager, position and player.
+
+        With a manager, the position and player must have been started by
+        that manager. Without one, by anyone.
+
+        Args:
+            manager: The manager to filter by.
+            position: The position to filter by.
+            player: The player to filter by.
+
+        Returns:
+            Bitset of the matching slots.
+        """
+        if manager:
+            mask = self._managers.get(manager, 0)
+            if position:
+                mask &= self._manager_positions.get((manager, position), 0)
+            if player:
+                mask &= self._manager_players.get((manager, player), 0)
+            return mask
+
+        mask = self._all_slots
+        if position:
+            mask &= self._positions.get(position, 0)
+        if player:
+            mask &= self._players.get(player, 0)
+        return mask
+
+    def decode_years(self, mask: int) -> set[str]:
+        """Get the years with at least one slot in a bitset.
+
+        Args:
+            mask: Bitset of slots.
+
+        Returns:
+            The years.
+        """
+        return {
+            yr for yr, year_mask in self._year_masks.items() if mask & year_mask
+        }
+
+    def decode_weeks(self, mask: int) -> set[str]:
+        """Get the weeks with at least one slot in a bitset.
+
+        Args:
+            mask: Bitset of slots.
+
+        Returns:
+            The weeks.
+        """
+        return {
+            wk for wk, week_mask in self._week_masks.items() if mask & week_mask
+        }
+
+    def get_year_mask(self, year: str) -> int:
+        """Get the slots of a year.
+
+        Args:
+            year: Season year as string.
+
+        Returns:
+            Bitset of the year's slots.
+        """
+        return self._year_masks.get(year, 0)
+
+    def find_managers(
+        self, scope: int, position: str | None, player: str | None
+    ) -> set[str]:
+        """Find managers who started the position and player in scope.
+
+        Args:
+            scope: Bitset of the slots to check.
+            position: The position to filter by.
+            player: The player to filter by.
+
+        Returns:
+            The managers.
+        """
+        return {
+            mgr
+            for mgr in self._managers
+            if scope & self.get_filter_mask(mgr, position, player)
+        }
+
+    def find_positions(self, scope: int, manager: str | None) -> set[str]:
+        """Find positions started in scope, by the manager if given.
+
+        Args:
+            scope: Bitset of the slots to check.
+            manager: The manager to filter by.
+
+        Returns:
+            The positions.
+        """
+        positions = self._positions.keys()
+        if manager:
+            positions = {
+                position
+                for mgr, position in self._manager_positions
+                if mgr == manager
+            }
+
+        return {
+            position
+            for position in positions
+            if scope & self.get_filter_mask(manager, position, None)
+        }
+
+    def _get_slot_bit(self, year: str, week: str) -> int:
+        """Get the bit for a (year, week) slot, assigning a new one if needed.
+
+        Args:
+            year: Season year as string.
+            week: Week number as string.
+
+        Returns:
+            The slot's bit.
+        """
+        slot = self._slots.get((year, week))
+        if slot is None:
+            slot = len(self._slots)
+            self._slots[(year, week)] = slot
+            self._year_weeks.setdefault(year, []).append(week)
+
+        bit = 1 << slot
+        self._all_slots |= bit
+        _set_bit(self._year_masks, year, bit)
+        _set_bit(self._week_masks, week, bit)
+        return bit
+
+
+def _set_bit(bitsets: dict[Any, int], key: Any, bit: int) -> None:
+    """Set a bit in the bitset stored under a key.
+
+    Args:
+        bitsets: Bitsets by key (modified in-place).
+        key: The key whose bitset is updated.
+        bit: The bit to set.
+    """
+    bitsets[key] = bitsets.get(key, 0) | bit
+
+
+@derived_index("valid_options")
+def get_bitmap_index(valid_options_cache: dict[str, Any]) -> BitmapIndex:
+    """Get the bitmap index for the current valid options cache.
+
+    Built on first use after the valid options cache is loaded or saved, and
+    kept in sync with in-memory updates through `add_to_bitmap_index`.
+
+    Args:
+        valid_options_cache: The valid options cache.
+
+    Returns:
+        The bitmap index.
+    """
+    return BitmapIndex(valid_options_cache)
+
+
+def add_to_bitmap_index(
+    year: str, week: str, manager: str, player: str, position: str
+) -> None:
+    """Record a starter added to the valid options cache.
+
+    Args:
+        year: Season year as string.
+        week: Week number as string.
+        manager: Manager name.
+        player: Player name.
+        position: Player position.
+    """
+    get_bitmap_index().add(year, week, manager, player, position)
@@ -3,6 +3,9 @@
 import logging
 
 from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    get_bitmap_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,38 +23,14 @@ def find_valid_years(
     Returns:
         A set of years that match the filters.
     """
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
+    bitmap_index = get_bitmap_index()
 
     if not manager and not position and not player:
-        return set(valid_options_cache.keys())
-
-    valid = set("")
-
-    for yr, year_data in valid_options_cache.items():
-        for wk in year_data.get("weeks", []):
-            week_data = year_data.get(wk, {})
-
-            if manager:
-                if manager not in week_data.get("managers", []):
-                    continue
-
-                manager_data = week_data.get(manager, {})
-                if position and position not in manager_data.get(
-                    "positions", []
-                ):
-                    continue
-                if player and player not in manager_data.get("players", []):
-                    continue
-
-            else:
-                if position and position not in week_data.get("positions", []):
-                    continue
-                if player and player not in week_data.get("players", []):
-                    continue
+        return set(bitmap_index.get_years())
 
-            # Found a valid year, add it and move on to the next year
-            valid.add(yr)
-            break
+    valid = bitmap_index.decode_years(
+        bitmap_index.get_filter_mask(manager, position, player)
+    )
 
     if not valid:
         logger.warning("No valid years found.")
@@ -76,35 +55,13 @@ def find_valid_weeks(
     Returns:
         A set of weeks that match the filters.
     """
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
-
-    valid = set("")
-    years_to_check = [year] if year else valid_options_cache.keys()
-
-    for yr in years_to_check:
-        year_data = valid_options_cache.get(yr, {})
-        for wk in year_data.get("weeks", []):
-            week_data = year_data.get(wk, {})
+    bitmap_index = get_bitmap_index()
 
-            if manager:
-                if manager not in week_data.get("managers", []):
-                    continue
-
-                manager_data = week_data.get(manager, {})
-                if position and position not in manager_data.get(
-                    "positions", []
-                ):
-                    continue
-                if player and player not in manager_data.get("players", []):
-                    continue
-
-            else:
-                if position and position not in week_data.get("positions", []):
-                    continue
-                if player and player not in week_data.get("players", []):
-                    continue
+    mask = bitmap_index.get_filter_mask(manager, position, player)
+    if year:
+        mask &= bitmap_index.get_year_mask(year)
 
-            valid.add(wk)
+    valid = bitmap_index.decode_weeks(mask)
 
     if not valid:
         logger.warning("No valid weeks found.")
@@ -126,34 +83,15 @@ def find_valid_managers(
     Returns:
         A set of managers that match the filters.
     """
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
-
-    valid = set("")
+    bitmap_index = get_bitmap_index()
 
     # Set years to check to year if set, otherwise all
-    years_to_check = [year] if year else valid_options_cache.keys()
+    years_to_check = [year] if year else bitmap_index.get_years()
 
     weeks_to_check = _get_weeks_to_check(year, week)
 
-    for yr in years_to_check:
-        year_data = valid_options_cache.get(yr, {})
-
-        if not weeks_to_check:
-            weeks_to_check = year_data.get("weeks", [])
-
-        for wk in weeks_to_check:
-            week_data = year_data.get(wk, {})
-
-            for mgr in week_data.get("managers", []):
-                manager_data = week_data.get(mgr, {})
-
-                if position and position not in manager_data.get(
-                    "positions", []
-                ):
-                    continue
-                if player and player not in manager_data.get("players", []):
-                    continue
-                valid.add(mgr)
+    scope = bitmap_index.get_scope_mask(years_to_check, weeks_to_check)
+    valid = bitmap_index.find_managers(scope, position, player)
 
     if not valid:
         logger.warning("No valid managers found.")
@@ -174,30 +112,15 @@ def find_valid_positions(
     Returns:
         A set of positions that match the filters.
     """
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
-
-    valid = set("")
+    bitmap_index = get_bitmap_index()
 
     # Set years to check to year if set, otherwise all
-    years_to_check = [year] if year else valid_options_cache.keys()
+    years_to_check = [year] if year else bitmap_index.get_years()
 
     weeks_to_check = _get_weeks_to_check(year, week)
 
-    for yr in years_to_check:
-        year_data = valid_options_cache.get(yr, {})
-
-        if not weeks_to_check:
-            weeks_to_check = year_data.get("weeks", [])
-
-        for wk in weeks_to_check:
-            week_data = year_data.get(wk, {})
-
-            if manager:
-                if manager not in week_data.get("managers", []):
-                    continue
-                valid.update(week_data.get(manager, {}).get("positions", []))
-            else:
-                valid.update(week_data.get("positions", []))
+    scope = bitmap_index.get_scope_mask(years_to_check, weeks_to_check)
+    valid = bitmap_index.find_positions(scope, manager)
 
     if not valid:
         logger.warning("No valid positions found.")
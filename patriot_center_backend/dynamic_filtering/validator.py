@@ -8,6 +8,9 @@ from patriot_center_backend.constants import (
     NAME_TO_MANAGER_USERNAME,
     Position,
 )
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    get_bitmap_index,
+)
 
 
 def validate_dynamic_filter_args(
@@ -224,20 +227,16 @@ def _traverse_for_year_and_manager(
     Raises:
         ValueError: If the item is invalid.
     """
-    valid_options_cache = CACHE_MANAGER.get_valid_options_cache()
-
-    years_to_traverse = valid_options_cache.keys()
-    if year:
-        years_to_traverse = [year]
+    bitmap_index = get_bitmap_index()
 
-    for yr in years_to_traverse:
-        yr_data = valid_options_cache.get(yr, {})
+    if item_type == "position":
+        slots = bitmap_index.get_filter_mask(manager, item, None)
+    else:
+        slots = bitmap_index.get_filter_mask(manager, None, item)
 
-        # Check if item exists in ANY week for this manager
-        for wk in yr_data.get("weeks", []):
-            wk_data = yr_data.get(wk, {})
-            if item in wk_data.get(manager, {}).get(f"{item_type}s", []):
-                return
+    # Check if item exists in ANY week for this manager, in the year if set
+    if year:
+        slots &= bitmap_index.get_year_mask(year)
 
-    # Not found in any year
-    raise ValueError(f"Invalid {item_type}: {item}")
+    if not slots:
+        raise ValueError(f"Invalid {item_type}: {item}")
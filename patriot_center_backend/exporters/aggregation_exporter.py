@@ -6,6 +6,7 @@ Exposes helpers to:
 
 Key features:
 - Fetches ffWAR scores for each player/week and includes them in aggregations
+- Merges precomputed player x manager x season rollups when no week is given
 - Tracks playoff placements for players/managers
 - Generates player image endpoints using Sleeper CDN
 - Rounds financial totals to 2 decimals, ffWAR to 3 decimals
@@ -21,13 +22,14 @@ from typing import Any
 
 from patriot_center_backend.cache.queries.aggregation_queries import (
     get_ffwar_from_cache,
+    get_rollup_rows_from_cache,
     get_team,
 )
 from patriot_center_backend.cache.queries.starters_queries import (
     get_starters_from_cache,
 )
 from patriot_center_backend.utils.image_url_handler import get_image_url
-from patriot_center_backend.utils.slug_utils import slugify
+from patriot_center_backend.utils.slug_utils import name_to_slug
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,12 @@ def get_aggregated_players(
         A dictionary containing player metrics for the given manager or all
         managers if no manager provided.
     """
+    # Whole seasons come straight from the precomputed rollups
+    if week is None:
+        rollup_rows = get_rollup_rows_from_cache(manager=manager, season=season)
+        if rollup_rows is not None:
+            return _aggregate_rollup_rows(rollup_rows, by_manager=False)
+
     raw_dict = get_starters_from_cache(
         manager=manager, season=season, week=week
     )
@@ -102,9 +110,10 @@ def get_aggregated_players(
                         # Skip aggregate row inside source structure
                         continue
                     ffwar_score = get_ffwar_from_cache(
-                        player, season=year, week=wk
+                        player_data.get("player_id"), season=year, week=wk
                     )
-                    player_data["ffWAR"] = ffwar_score
+                    # Copy so the starters cache itself is never mutated
+                    player_data = {**player_data, "ffWAR": ffwar_score}
 
                     if player in players_dict_to_return:
                         _update_player_data(
@@ -139,6 +148,12 @@ def get_aggregated_managers(
     Returns:
         A dictionary containing manager metrics for the given player.
     """
+    # Whole seasons come straight from the precomputed rollups
+    if week is None:
+        rollup_rows = get_rollup_rows_from_cache(season=season, player=player)
+        if rollup_rows is not None:
+            return _aggregate_rollup_rows(rollup_rows, by_manager=True)
+
     raw_dict = get_starters_from_cache(season=season, week=week)
     managers_dict_to_return = {}
 
@@ -149,11 +164,13 @@ def get_aggregated_managers(
         for wk, managers in weeks.items():
             for manager, manager_data in managers.items():
                 if player in manager_data:
-                    raw_item = manager_data[player]
                     ffwar_score = get_ffwar_from_cache(
-                        player, season=year, week=wk
+                        manager_data[player].get("player_id"),
+                        season=year,
+                        week=wk,
                     )
-                    raw_item["ffWAR"] = ffwar_score
+                    # Copy so the starters cache itself is never mutated
+                    raw_item = {**manager_data[player], "ffWAR": ffwar_score}
 
                     if manager in managers_dict_to_return:
                         _update_manager_data(
@@ -175,6 +192,74 @@ def get_aggregated_managers(
     return managers_dict_to_return
 
 
+def _aggregate_rollup_rows(
+    rollup_rows: list[tuple[str, str, str, dict[str, Any]]],
+    by_manager: bool,
+) -> dict[str, dict[str, Any]]:
+    """Merge precomputed rollup rows into aggregated player/manager data.
+
+    Args:
+        rollup_rows: (season, manager, player, rollup) rows to merge.
+        by_manager: If True, key the output by manager (aggregating a
+            player's appearances), otherwise key it by player.
+
+    Returns:
+        Aggregated data shaped like the raw starters aggregation.
+    """
+    aggregation_dict: dict[str, dict[str, Any]] = {}
+
+    for year, manager, player, rollup in rollup_rows:
+        primary_item, secondary_item = (
+            (manager, player) if by_manager else (player, manager)
+        )
+
+        if primary_item not in aggregation_dict:
+            item = {"player": player} if by_manager else {}
+            item.update(
+                {
+                    "total_points": 0.0,
+                    "num_games_started": 0,
+                    "ffWAR": 0.0,
+                    "ffWAR_per_game": 0.0,
+                    "position": rollup["position"],
+                    "player_image_endpoint": get_image_url(player),
+                    "slug": name_to_slug(player),
+                    "team": get_team(player),
+                }
+            )
+            aggregation_dict[primary_item] = item
+
+        item = aggregation_dict[primary_item]
+        item["total_points"] += rollup["total_points"]
+        item["ffWAR"] += rollup["ffWAR"]
+        item["num_games_started"] += rollup["num_games_started"]
+
+        if "placement" in rollup:
+            _handle_playoff_placement(
+                aggregation_dict,
+                primary_item,
+                secondary_item,
+                year,
+                rollup["placement"],
+            )
+
+    # Round once per item instead of once per appearance
+    for item in aggregation_dict.values():
+        item["ffWAR_per_game"] = float(
+            Decimal(item["ffWAR"] / item["num_games_started"])
+            .quantize(Decimal("0.001"))
+            .normalize()
+        )
+        item["total_points"] = float(
+            Decimal(item["total_points"]).quantize(Decimal("0.01")).normalize()
+        )
+        item["ffWAR"] = float(
+            Decimal(item["ffWAR"]).quantize(Decimal("0.001")).normalize()
+        )
+
+    return aggregation_dict
+
+
 def _update_player_data(
     players_dict: dict[str, dict[str, Any]],
     player: str,
@@ -259,7 +344,7 @@ def _initialize_player_data(
         "ffWAR_per_game": player_data["ffWAR"],
         "position": player_data["position"],
         "player_image_endpoint": get_image_url(player),
-        "slug": slugify(player),
+        "slug": name_to_slug(player),
         "team": get_team(player),
     }
 
@@ -356,7 +441,7 @@ def _initialize_manager_data(
         "ffWAR_per_game": raw_item["ffWAR"],
         "position": raw_item["position"],
         "player_image_endpoint": get_image_url(player),
-        "slug": slugify(player),
+        "slug": name_to_slug(player),
         "team": get_team(player),
     }
 
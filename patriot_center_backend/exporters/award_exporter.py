@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any
 
 from patriot_center_backend.cache.queries.award_queries import (
+    get_league_score_records_from_cache,
     get_manager_awards_from_cache,
     get_manager_score_awards_from_cache,
 )
@@ -29,3 +30,16 @@ def get_manager_awards(manager: str) -> dict[str, Any]:
     awards_data["awards"].update(deepcopy(score_awards))
 
     return deepcopy(awards_data)
+
+
+def get_league_records(top_n: int) -> dict[str, list[dict[str, Any]]]:
+    """Get the league-wide top scoring records.
+
+    Args:
+        top_n: Number of records to return per category
+
+    Returns:
+        dictionary of highest/lowest weekly scores and biggest blowouts,
+        each a list of matchup cards with the best record first
+    """
+    return get_league_score_records_from_cache(top_n)
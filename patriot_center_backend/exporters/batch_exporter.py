@@ -0,0 +1,266 @@
+"""Batch exporter running several exporters for one request.
+
+The frontend loads a page from several endpoints at once. A batch sends
+them as sub-requests in one request instead, each naming an operation
+(an exporter) and its keyword arguments:
+
+    {"requests": [
+        {"id": "summary", "op": "manager_summary",
+         "params": {"manager": "Tommy"}},
+        {"id": "awards", "op": "manager_awards",
+         "params": {"manager": "Tommy"}}
+    ]}
+
+Params are parsed as the matching route parses its URL: names are strings,
+`top_n` a non-negative integer, `active_only` a boolean (or "true" /
+"false"), and `year` a string or null ("all" too for transactions, as
+the route maps it to null).
+
+Sub-requests run in order under the batch's request, so the lookups they
+share (rankings, image URLs, entity lookups) are computed once (see
+`request_memo`). Each gets its own result, so one failing doesn't fail the
+others:
+
+    {"responses": [
+        {"id": "summary", "status": 200, "data": {...}},
+        {"id": "awards", "status": 400, "error": "..."}
+    ]}
+"""
+
+from collections.abc import Callable
+from inspect import signature
+from typing import Any
+
+from patriot_center_backend.exporters.award_exporter import (
+    get_league_records,
+    get_manager_awards,
+)
+from patriot_center_backend.exporters.head_to_head_exporter import (
+    get_head_to_head,
+)
+from patriot_center_backend.exporters.manager_list_exporter import (
+    get_managers_list,
+)
+from patriot_center_backend.exporters.options_exporter import (
+    get_options_list,
+)
+from patriot_center_backend.exporters.summary_exporter import (
+    get_manager_summary,
+)
+from patriot_center_backend.exporters.transaction_exporter import (
+    get_manager_transactions,
+)
+
+BATCH_OPERATIONS: dict[str, Callable[..., Any]] = {
+    "head_to_head": get_head_to_head,
+    "league_records": get_league_records,
+    "manager_awards": get_manager_awards,
+    "manager_summary": get_manager_summary,
+    "manager_transactions": get_manager_transactions,
+    "managers_list": get_managers_list,
+    "options_list": get_options_list,
+}
+
+# Bounds the work a single request can ask for
+_MAX_SUB_REQUESTS = 20
+
+
+def _parse_str(value: Any) -> str:
+    """Parse a name param, as a route's `<string:...>` converter does.
+
+    Args:
+        value: The param's JSON value.
+
+    Returns:
+        The string.
+
+    Raises:
+        ValueError: If the value isn't a string.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"expected a string, got {value!r}")
+    return value
+
+
+def _parse_year(value: Any) -> str | None:
+    """Parse an optional year param (a year as a number is accepted too).
+
+    Args:
+        value: The param's JSON value.
+
+    Returns:
+        The year as a string, or None for all-time.
+
+    Raises:
+        ValueError: If the value isn't a year or null.
+    """
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return _parse_str(value)
+
+
+def _parse_year_or_all(value: Any) -> str | None:
+    """Parse an optional year param, mapping "all" to None like its route.
+
+    Args:
+        value: The param's JSON value.
+
+    Returns:
+        The year as a string, or None for all-time.
+
+    Raises:
+        ValueError: If the value isn't a year, "all" or null.
+    """
+    year = _parse_year(value)
+    return None if year == "all" else year
+
+
+def _parse_int(value: Any) -> int:
+    """Parse a count param, as a route's `<int:...>` converter does.
+
+    Args:
+        value: The param's JSON value.
+
+    Returns:
+        The integer.
+
+    Raises:
+        ValueError: If the value isn't a non-negative integer (or a string
+            of digits).
+    """
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"expected a non-negative integer, got {value!r}")
+    return value
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse a flag param, accepting the route's "true" and "false" too.
+
+    Args:
+        value: The param's JSON value.
+
+    Returns:
+        The boolean.
+
+    Raises:
+        ValueError: If the value isn't a boolean, "true" or "false".
+    """
+    if isinstance(value, bool):
+        return value
+    if value in ("true", "false"):
+        return value == "true"
+    raise ValueError(f"expected true or false, got {value!r}")
+
+
+# Parser of each param of each operation
+_PARAM_PARSERS: dict[str, dict[str, Callable[[Any], Any]]] = {
+    "head_to_head": {
+        "manager1": _parse_str,
+        "manager2": _parse_str,
+        "year": _parse_year,
+    },
+    "league_records": {"top_n": _parse_int},
+    "manager_awards": {"manager": _parse_str},
+    "manager_summary": {"manager": _parse_str, "year": _parse_year},
+    "manager_transactions": {
+        "manager_name": _parse_str,
+        "year": _parse_year_or_all,
+    },
+    "managers_list": {"active_only": _parse_bool},
+    "options_list": {},
+}
+
+
+def run_batch(payload: Any) -> dict[str, list[dict[str, Any]]]:
+    """Run every sub-request of a batch.
+
+    Args:
+        payload: The batch's JSON body, holding its sub-requests under
+            `requests`.
+
+    Returns:
+        The result of each sub-request under `responses`, in order.
+
+    Raises:
+        ValueError: If the payload isn't a valid batch.
+    """
+    if not isinstance(payload, dict) or not isinstance(
+        payload.get("requests"), list
+    ):
+        raise ValueError("Batch must be an object with a 'requests' list.")
+
+    sub_requests = payload["requests"]
+    if len(sub_requests) > _MAX_SUB_REQUESTS:
+        raise ValueError(
+            f"Batch has {len(sub_requests)} requests, "
+            f"the maximum is {_MAX_SUB_REQUESTS}."
+        )
+
+    return {
+        "responses": [
+            _run_sub_request(sub_request) for sub_request in sub_requests
+        ]
+    }
+
+
+def _run_sub_request(sub_request: Any) -> dict[str, Any]:
+    """Run one sub-request of a batch.
+
+    Errors are reported as the matching route would: invalid sub-requests
+    (including params of the wrong type) and ValueErrors from the exporter
+    with status 400, and any other exception with status 500.
+
+    Args:
+        sub_request: The sub-request, with its operation under `op`, and
+            optionally its keyword arguments under `params` and an `id`
+            echoed back in its result.
+
+    Returns:
+        The sub-request's result, with its `status` and either its `data`
+        or an `error`.
+    """
+    if not isinstance(sub_request, dict):
+        return {
+            "id": None,
+            "status": 400,
+            "error": "Each request must be an object.",
+        }
+
+    result: dict[str, Any] = {"id": sub_request.get("id")}
+
+    op = sub_request.get("op")
+    params = sub_request.get("params", {})
+    if not isinstance(op, str) or op not in BATCH_OPERATIONS:
+        result.update(status=400, error=f"Unknown op: {op}")
+        return result
+    if not isinstance(params, dict):
+        result.update(status=400, error="Params must be an object.")
+        return result
+
+    operation = BATCH_OPERATIONS[op]
+    try:
+        signature(operation).bind(**params)
+    except TypeError as e:
+        result.update(status=400, error=f"Invalid params: {e}")
+        return result
+
+    parsed_params = {}
+    for name, value in params.items():
+        try:
+            parsed_params[name] = _PARAM_PARSERS[op][name](value)
+        except ValueError as e:
+            result.update(status=400, error=f"Invalid params: {name}: {e}")
+            return result
+
+    try:
+        result.update(status=200, data=operation(**parsed_params))
+    except ValueError as e:
+        result.update(status=400, error=str(e))
+    except Exception as e:
+        result.update(status=500, error=str(e))
+
+    return result
@@ -11,7 +11,7 @@ from patriot_center_backend.cache.queries.manager_queries import (
 from patriot_center_backend.cache.queries.ranking_queries import (
     get_ranking_details_from_cache,
 )
-from patriot_center_backend.utils.image_url_handler import get_image_url
+from patriot_center_backend.utils.image_url_handler import get_image_urls
 
 
 def get_managers_list(active_only: bool) -> dict[str, Any]:
@@ -45,6 +45,7 @@ def get_managers_list(active_only: bool) -> dict[str, Any]:
                 different categories.
     """
     managers_to_traverse = get_list_of_managers_from_cache(active_only)
+    image_urls = get_image_urls(managers_to_traverse)
 
     managers_list = []
 
@@ -64,7 +65,7 @@ def get_managers_list(active_only: bool) -> dict[str, Any]:
 
         manager_item = {
             "name": manager,
-            "image_url": get_image_url(manager),
+            "image_url": image_urls[manager],
             "years_active": get_manager_years_active_from_cache(manager),
             "total_trades": (
                 manager_summary["transactions"]["trades"]["total"]
@@ -1,7 +1,10 @@
 """Options exporters for Patriot Center."""
 
+from typing import Any
+
 from patriot_center_backend.cache.queries.option_queries import (
     get_options_list_from_cache,
+    search_options_from_cache,
 )
 
 
@@ -12,3 +15,16 @@ def get_options_list() -> dict[str, dict[str, str | None]]:
         Nested dict shaped like players_cache subset.
     """
     return get_options_list_from_cache()
+
+
+def search_options(query: str, limit: int) -> list[dict[str, Any]]:
+    """Public entry point for player and manager autocomplete.
+
+    Args:
+        query: Text typed so far.
+        limit: Maximum number of results.
+
+    Returns:
+        Option records matching the query, most popular first.
+    """
+    return search_options_from_cache(query, limit)
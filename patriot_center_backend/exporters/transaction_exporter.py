@@ -1,6 +1,5 @@
 """Transaction exporter for manager metadata."""
 
-from copy import deepcopy
 from typing import Any
 
 from patriot_center_backend.cache.queries.transaction_queries import (
@@ -40,27 +39,23 @@ def get_manager_transactions(
     for yr in years_to_check:
         yearly_data = manager_transactions[manager_name]["years"][yr]
         for week in yearly_data.get("weeks", {}):
-            weekly_transactions = deepcopy(
-                yearly_data["weeks"][week]["transactions"]
-            )
+            weekly_transactions = yearly_data["weeks"][week]["transactions"]
 
             # Trades
             trade_data = weekly_transactions.get("trades", {})
-            transaction_ids = deepcopy(trade_data.get("transaction_ids", []))
+            transaction_ids = trade_data.get("transaction_ids", [])
 
-            transaction_ids.reverse()
-            for transaction_id in transaction_ids:
+            for transaction_id in reversed(transaction_ids):
                 trade_details = get_trade_card(transaction_id)
 
                 trade_details["type"] = "trade"
-                filtered_transactions.append(deepcopy(trade_details))
+                filtered_transactions.append(trade_details)
 
             # Adds
             adds_data = weekly_transactions.get("adds", {})
-            transaction_ids = deepcopy(adds_data.get("transaction_ids", []))
+            transaction_ids = adds_data.get("transaction_ids", [])
 
-            transaction_ids.reverse()
-            for transaction_id in transaction_ids:
+            for transaction_id in reversed(transaction_ids):
                 # Only include adds portion of a
                 #   transaction for "add" filter
                 add_details = get_transaction_from_ids_cache(transaction_id)
@@ -77,14 +72,13 @@ def get_manager_transactions(
                         "faab_spent": add_details.get("faab_spent", None),
                         "transaction_id": transaction_id,
                     }
-                    filtered_transactions.append(deepcopy(transaction_item))
+                    filtered_transactions.append(transaction_item)
 
             # Drops
             drops_data = weekly_transactions.get("drops", {})
-            transaction_ids = deepcopy(drops_data.get("transaction_ids", []))
+            transaction_ids = drops_data.get("transaction_ids", [])
 
-            transaction_ids.reverse()
-            for transaction_id in transaction_ids:
+            for transaction_id in reversed(transaction_ids):
                 drop_details = get_transaction_from_ids_cache(transaction_id)
                 if drop_details and "drop" in drop_details.get("types", []):
                     transaction_item = {
@@ -96,14 +90,13 @@ def get_manager_transactions(
                         ),
                         "transaction_id": transaction_id,
                     }
-                    filtered_transactions.append(deepcopy(transaction_item))
+                    filtered_transactions.append(transaction_item)
 
             # Adds and Drops
             adds_data = weekly_transactions.get("adds", {})
-            transaction_ids = deepcopy(adds_data.get("transaction_ids", []))
+            transaction_ids = adds_data.get("transaction_ids", [])
 
-            transaction_ids.reverse()
-            for transaction_id in transaction_ids:
+            for transaction_id in reversed(transaction_ids):
                 add_drop_details = get_transaction_from_ids_cache(
                     transaction_id
                 )
@@ -128,7 +121,7 @@ def get_manager_transactions(
                         ),
                         "transaction_id": transaction_id,
                     }
-                    filtered_transactions.append(deepcopy(transaction_item))
+                    filtered_transactions.append(transaction_item)
 
     # Set total count
     transaction_history["total_count"] = len(filtered_transactions)
@@ -136,6 +129,6 @@ def get_manager_transactions(
     filtered_transactions.reverse()
 
     # Set transactions in output
-    transaction_history["transactions"] = deepcopy(filtered_transactions)
+    transaction_history["transactions"] = filtered_transactions
 
-    return deepcopy(transaction_history)
+    return transaction_history
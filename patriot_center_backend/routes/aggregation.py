@@ -9,6 +9,8 @@ from patriot_center_backend.exporters.aggregation_exporter import (
 )
 from patriot_center_backend.utils.argument_parser import parse_arguments
 from patriot_center_backend.utils.data_formatters import to_records
+from patriot_center_backend.utils.records_response import records_response
+from patriot_center_backend.utils.response_cache import cached_response
 from patriot_center_backend.utils.slug_utils import slug_to_name
 
 bp = Blueprint("aggregation", __name__)
@@ -33,13 +35,15 @@ bp = Blueprint("aggregation", __name__)
     "/get_aggregated_players/<string:arg1>/<string:arg2>/<string:arg3>",
     methods=["GET"],
 )
+@cached_response
 def get_aggregated_players_route(
     arg1: str | None, arg2: str | None, arg3: str | None
 ) -> tuple[Response, int]:
     """Aggregate player totals (points, games started, ffWAR) for a manager.
 
     Uses same positional inference rules as get_starters. Returns either raw
-    aggregation or flattened record list.
+    aggregation or flattened record list. Records can be paginated,
+    projected and streamed (see `records_response`).
 
     Args:
         arg1 (str | None): Season (year) or week number or manager name.
@@ -62,7 +66,10 @@ def get_aggregated_players_route(
         response.headers["Cache-Control"] = "public, max-age=3600"
         return response, 200
 
-    response = jsonify(to_records(data))
+    try:
+        response = records_response(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Cache for 1 hour
     response.headers["Cache-Control"] = "public, max-age=3600"
@@ -83,6 +90,7 @@ def get_aggregated_players_route(
     "/get_aggregated_managers/<string:player>/<string:arg2>/<string:arg3>",
     methods=["GET"],
 )
+@cached_response
 def get_aggregated_managers_route(
     player: str, arg2: str | None, arg3: str | None
 ) -> tuple[Response, int]:
@@ -92,6 +100,8 @@ def get_aggregated_managers_route(
     interpreted as season and/or week. Underscores are converted to spaces to
     allow URL-friendly player names.
     - If `arg2` or `arg3` are not provided, result is for all seasons and weeks.
+    - Records can be paginated, projected and streamed (see
+    `records_response`).
 
     Args:
         player: The player to filter.
@@ -116,7 +126,10 @@ def get_aggregated_managers_route(
         response.headers["Cache-Control"] = "public, max-age=3600"
         return response, 200
 
-    response = jsonify(to_records(data, key_name="manager"))
+    try:
+        response = records_response(data, key_name="manager")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Cache for 1 hour
     response.headers["Cache-Control"] = "public, max-age=3600"
@@ -139,6 +152,7 @@ def get_aggregated_managers_route(
     "<string:player>/<string:manager>/<string:year>/<string:week>",
     methods=["GET"],
 )
+@cached_response
 def get_player_manager_aggregation_route(
     player: str,
     manager: str,
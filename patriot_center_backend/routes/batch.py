@@ -0,0 +1,27 @@
+"""Batch endpoint for Patriot Center."""
+
+from flask import Blueprint, Response, jsonify, request
+
+from patriot_center_backend.exporters.batch_exporter import run_batch
+
+bp = Blueprint("batch", __name__)
+
+
+@bp.route("/api/batch", methods=["POST"])
+def batch_route() -> tuple[Response, int]:
+    """Endpoint to run several exporters in one request.
+
+    The JSON body lists the sub-requests (see `run_batch`). Each gets its
+    own status in the response, so the batch succeeds even if some of them
+    fail.
+
+    Returns:
+        Flask Response: JSON payload (sub-request results or error) and
+        status code.
+    """
+    try:
+        data = run_batch(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(data), 200
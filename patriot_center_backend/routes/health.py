@@ -1,6 +1,9 @@
-"""Health and liveness checks."""
+"""Health, liveness and readiness checks, and metrics."""
 
-from flask import Blueprint, Response, jsonify
+from flask import Blueprint, Response, current_app, jsonify
+
+from patriot_center_backend.utils.metrics import METRICS
+from patriot_center_backend.utils.warmup import WARMUP
 
 bp = Blueprint("health", __name__)
 
@@ -23,13 +26,18 @@ def index_route() -> tuple[Response, int]:
                 "/get_aggregated_managers/<player>",
                 "/dynamic_filtering",
                 "/options/list",
+                "/options/search",
                 "/get/managers/list/<active_only>",
                 "/api/managers/<manager_name>/summary",
                 "/api/managers/<manager_name>/head-to-head/<opponent_name>",
                 "/api/managers/<manager_name>/transactions",
                 "/api/managers/<manager_name>/awards",
+                "/api/managers/records[/<top_n>]",
+                "/api/batch",
                 "/ping",
                 "/health",
+                "/ready",
+                "/metrics",
             ],
         }
     ), 200
@@ -53,3 +61,32 @@ def health_route() -> tuple[Response, int]:
         Response in JSON format with "status": "healthy" and 200
     """
     return jsonify({"status": "healthy"}), 200
+
+
+@bp.route("/ready")
+def ready_route() -> tuple[Response, int]:
+    """Readiness check endpoint for the load balancer.
+
+    Warming up is started if the server didn't start it (see `Warmup`).
+
+    Returns:
+        Response in JSON format with the warm-up progress, and 200 once
+        warm or 503 while warming up
+    """
+    WARMUP.start(current_app._get_current_object())
+
+    status = WARMUP.get_status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+@bp.route("/metrics")
+def metrics_route() -> Response:
+    """Metrics endpoint for Prometheus to scrape.
+
+    Returns:
+        The process's metrics in the Prometheus text format
+    """
+    return Response(
+        METRICS.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
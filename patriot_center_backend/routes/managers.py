@@ -5,6 +5,7 @@ from typing import Literal
 from flask import Blueprint, Response, jsonify
 
 from patriot_center_backend.exporters.award_exporter import (
+    get_league_records,
     get_manager_awards,
 )
 from patriot_center_backend.exporters.head_to_head_exporter import (
@@ -19,11 +20,13 @@ from patriot_center_backend.exporters.summary_exporter import (
 from patriot_center_backend.exporters.transaction_exporter import (
     get_manager_transactions,
 )
+from patriot_center_backend.utils.response_cache import cached_response
 
 bp = Blueprint("managers", __name__)
 
 
 @bp.route("/get/managers/list/<string:active_only>", methods=["GET"])
+@cached_response
 def get_managers_list_route(
     active_only: Literal["true", "false"],
 ) -> tuple[Response, int]:
@@ -66,6 +69,7 @@ def get_managers_list_route(
 @bp.route(
     "/api/managers/<string:manager_name>/summary/<string:year>", methods=["GET"]
 )
+@cached_response
 def get_manager_summary_route(
     manager_name: str, year: str | None
 ) -> tuple[Response, int]:
@@ -102,6 +106,7 @@ def get_manager_summary_route(
     "<string:manager_name>/head-to-head/<string:opponent_name>/<string:year>",
     methods=["GET"],
 )
+@cached_response
 def get_head_to_head_route(
     manager_name: str, opponent_name: str, year: str | None
 ) -> tuple[Response, int]:
@@ -140,6 +145,7 @@ def get_head_to_head_route(
     "/api/managers/<string:manager_name>/transactions/<string:year>",
     methods=["GET"],
 )
+@cached_response
 def get_manager_transactions_route(
     manager_name: str, year: str | None
 ) -> tuple[Response, int]:
@@ -172,6 +178,7 @@ def get_manager_transactions_route(
 
 
 @bp.route("/api/managers/<string:manager_name>/awards", methods=["GET"])
+@cached_response
 def get_manager_awards_route(manager_name: str) -> tuple[Response, int]:
     """Endpoint to get awards and recognitions for a specific manager.
 
@@ -193,3 +200,29 @@ def get_manager_awards_route(manager_name: str) -> tuple[Response, int]:
     # Cache for 1 hour
     response.headers["Cache-Control"] = "public, max-age=3600"
     return response, 200
+
+
+@bp.route("/api/managers/records", defaults={"top_n": 10}, methods=["GET"])
+@bp.route("/api/managers/records/<int:top_n>", methods=["GET"])
+@cached_response
+def get_league_records_route(top_n: int) -> tuple[Response, int]:
+    """Endpoint to get the league-wide top scoring records.
+
+    Args:
+        top_n: Number of records per category. Defaults to 10.
+
+    Returns:
+        Flask Response: JSON payload (league records or error) and status code.
+    """
+    try:
+        data = get_league_records(top_n)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    response = jsonify(data)
+
+    # Cache for 1 hour
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return response, 200
@@ -7,14 +7,17 @@ from patriot_center_backend.exporters.dynamic_filter_exporter import (
 )
 from patriot_center_backend.exporters.options_exporter import (
     get_options_list,
+    search_options,
 )
 from patriot_center_backend.utils.data_formatters import to_records
+from patriot_center_backend.utils.response_cache import cached_response
 from patriot_center_backend.utils.slug_utils import slug_to_name
 
 bp = Blueprint("options", __name__)
 
 
 @bp.route("/options/list", methods=["GET"])
+@cached_response
 def get_options_list_route() -> tuple[Response, int]:
     """Endpoint to list all players and managers in the cache.
 
@@ -37,7 +40,35 @@ def get_options_list_route() -> tuple[Response, int]:
     return response, 200
 
 
+@bp.route("/options/search", methods=["GET"])
+@cached_response
+def search_options_route() -> tuple[Response, int]:
+    """Endpoint to autocomplete player and manager names.
+
+    Acceptable arguments:
+    - q: Text typed so far
+    - limit: Maximum number of results (defaults to 10)
+
+    Returns:
+        Response in JSON format and status code.
+    """
+    query = request.args.get("q", "")
+
+    try:
+        limit = int(request.args.get("limit", 10))
+        data = search_options(query, limit)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    response = jsonify(data)
+
+    # Cache for 1 hour
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return response, 200
+
+
 @bp.route("/dynamic_filtering", methods=["GET"])
+@cached_response
 def get_dynamic_filter_options_route() -> tuple[Response, int]:
     """Endpoint retreive filtered data for provided input combinations.
 
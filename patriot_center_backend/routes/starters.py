@@ -4,7 +4,8 @@ from flask import Blueprint, Response, jsonify, request
 
 from patriot_center_backend.exporters.starters_exporter import get_starters
 from patriot_center_backend.utils.argument_parser import parse_arguments
-from patriot_center_backend.utils.data_formatters import to_records
+from patriot_center_backend.utils.records_response import records_response
+from patriot_center_backend.utils.response_cache import cached_response
 
 bp = Blueprint("starters", __name__)
 
@@ -28,6 +29,7 @@ bp = Blueprint("starters", __name__)
 @bp.route(
     "/get_starters/<string:arg1>/<string:arg2>/<string:arg3>", methods=["GET"]
 )
+@cached_response
 def get_starters_route(
     arg1: str | None, arg2: str | None, arg3: str | None
 ) -> tuple[Response, int]:
@@ -46,7 +48,10 @@ def get_starters_route(
     Returns:
         Response in JSON format and status code.
             - If format=json, returns nested JSON.
-            - Otherwise, returns flattened records.
+            - Otherwise, returns flattened records, one per season.
+            - If paginated, projected or streamed (see `records_response`),
+              returns one record per starter instead.
+            - If format=columnar, returns a table with one row per starter.
     """
     # Parse positional arguments to determine filter values
     year, week, manager = parse_arguments(arg1, arg2, arg3)
@@ -62,7 +67,12 @@ def get_starters_route(
         response.headers["Cache-Control"] = "public, max-age=3600"
         return response, 200
 
-    response = jsonify(to_records(data))
+    try:
+        response = records_response(
+            data, row_keys=("year", "week", "manager", "player")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Cache for 1 hour
     response.headers["Cache-Control"] = "public, max-age=3600"
@@ -0,0 +1 @@
+"""Test suite for benchmarks module."""
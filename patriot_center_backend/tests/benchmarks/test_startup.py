@@ -0,0 +1,158 @@
+"""Unit tests for startup module."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from patriot_center_backend.benchmarks.startup import (
+    find_update_only_imports,
+    main,
+    parse_importtime,
+    run_benchmark,
+)
+
+MODULE_PATH = "patriot_center_backend.benchmarks.startup"
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |     150000 |   flask
+import time:       500 |        500 |     patriot_center_backend.routes
+import time:      1000 |     200000 | patriot_center_backend.app
+"""
+
+
+class TestParseImporttime:
+    """Test parse_importtime function."""
+
+    def test_cumulative_times(self):
+        """Test each module's cumulative time is parsed, without the header."""
+        assert parse_importtime(IMPORTTIME_OUTPUT) == {
+            "_io": 120,
+            "flask": 150000,
+            "patriot_center_backend.routes": 500,
+            "patriot_center_backend.app": 200000,
+        }
+
+    def test_ignores_other_output(self):
+        """Test lines not reporting an import are ignored."""
+        assert parse_importtime("Traceback\nimport time: 5 | 7 | os") == {
+            "os": 7
+        }
+
+
+class TestFindUpdateOnlyImports:
+    """Test find_update_only_imports function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `subprocess.run`: `mock_run`
+
+        Yields:
+            None
+        """
+        with patch(f"{MODULE_PATH}.subprocess.run") as mock_run:
+            self.mock_run = mock_run
+
+            yield
+
+    def _imported(self, *names: str) -> None:
+        """Set the modules imported by the measured interpreter.
+
+        Args:
+            *names: Names of the imported modules.
+        """
+        self.mock_run.return_value = MagicMock(stdout=json.dumps(names))
+
+    def test_none_imported(self):
+        """Test an empty list when serving imports no update-only module."""
+        self._imported("flask", "requests_toolbelt")
+
+        assert find_update_only_imports() == []
+
+    def test_imported_through_submodules(self):
+        """Test update-only modules are found through their submodules."""
+        self._imported(
+            "requests",
+            "requests.adapters",
+            "patriot_center_backend.cache.updaters.processors.matchups",
+        )
+
+        assert find_update_only_imports() == [
+            "requests",
+            "patriot_center_backend.cache.updaters.processors",
+        ]
+
+
+class TestRunBenchmark:
+    """Test run_benchmark and main functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `measure_imports`: `mock_measure_imports`
+        - `measure_first_response`: `mock_measure_first_response`
+        - `find_update_only_imports`: `mock_find_update_only_imports`
+
+        Yields:
+            None
+        """
+        with (
+            patch(f"{MODULE_PATH}.measure_imports") as mock_measure_imports,
+            patch(
+                f"{MODULE_PATH}.measure_first_response"
+            ) as mock_measure_first_response,
+            patch(
+                f"{MODULE_PATH}.find_update_only_imports"
+            ) as mock_find_update_only_imports,
+        ):
+            self.mock_find_update_only_imports = mock_find_update_only_imports
+
+            mock_measure_imports.side_effect = [
+                {"patriot_center_backend.app": app_us, "flask": app_us // 2}
+                for app_us in (300000, 100000, 200000)
+            ]
+            mock_measure_first_response.side_effect = [450.0, 400.0, 900.0]
+            mock_find_update_only_imports.return_value = []
+
+            yield
+
+    def test_medians(self):
+        """Test the median run of each measurement is reported."""
+        assert run_benchmark(runs=3) == {
+            "runs": 3,
+            "import_ms": 200.0,
+            "first_response_ms": 450.0,
+            "modules_imported": 2,
+            "slowest_imports": {"flask": 100.0},
+            "update_only_imports": [],
+        }
+
+    def test_main_writes_json(self, tmp_path: Path):
+        """Test the results are written to the given JSON file.
+
+        Update-only imports are only reported without --check.
+
+        Args:
+            tmp_path: pytest temporary directory fixture
+        """
+        output = tmp_path / "startup.json"
+        self.mock_find_update_only_imports.return_value = ["requests"]
+
+        assert main(["--runs", "3", "--json", str(output)]) == 0
+        assert json.loads(output.read_text())["import_ms"] == 200.0
+
+    def test_main_check_fails_on_update_only_imports(self):
+        """Test --check fails when serving imports update-only modules."""
+        self.mock_find_update_only_imports.return_value = ["requests"]
+
+        assert main(["--runs", "3", "--check"]) == 1
@@ -6,6 +6,8 @@ import pytest
 
 from patriot_center_backend.cache.queries.aggregation_queries import (
     get_ffwar_from_cache,
+    get_ffwar_index,
+    get_rollup_rows_from_cache,
     get_team,
 )
 
@@ -23,19 +25,17 @@ class TestGetFfwarFromCache:
         set of values when accessed.
         - `CACHE_MANAGER.get_player_data_cache`:
             `mock_get_player_data_cache`
-        - `get_player_id`: `mock_get_player_id`
 
         Yields:
             None
         """
-        # Clear lru_cache between tests
-        get_ffwar_from_cache.cache_clear()
+        # Clear the derived ffWAR index between tests
+        get_ffwar_index.cache_clear()
 
         with (
             patch(
                 f"{MODULE_PATH}.CACHE_MANAGER.get_player_data_cache"
             ) as mock_get_player_data_cache,
-            patch(f"{MODULE_PATH}.get_player_id") as mock_get_player_id,
         ):
             self.mock_get_player_data_cache = mock_get_player_data_cache
             self.mock_get_player_data_cache.return_value = {
@@ -47,68 +47,160 @@ class TestGetFfwarFromCache:
                 }
             }
 
-            self.mock_get_player_id = mock_get_player_id
-            self.mock_get_player_id.return_value = "12345"
-
             yield
 
-        # Clear lru_cache after tests
-        get_ffwar_from_cache.cache_clear()
+        # Clear the derived ffWAR index after tests
+        get_ffwar_index.cache_clear()
 
     def test_returns_ffwar_for_valid_player(self):
         """Test returns ffWAR when player exists in cache."""
-        result = get_ffwar_from_cache("Jayden Daniels", season="2023", week="1")
+        result = get_ffwar_from_cache("12345", season="2023", week="1")
 
         assert result == 1.5
 
     def test_returns_zero_when_season_is_none(self):
         """Test returns 0.0 when season is None."""
-        result = get_ffwar_from_cache("Jayden Daniels", season=None, week="1")
+        result = get_ffwar_from_cache("12345", season=None, week="1")
 
         assert result == 0.0
 
     def test_returns_zero_when_week_is_none(self):
         """Test returns 0.0 when week is None."""
-        result = get_ffwar_from_cache(
-            "Jayden Daniels", season="2023", week=None
-        )
+        result = get_ffwar_from_cache("12345", season="2023", week=None)
 
         assert result == 0.0
 
     def test_returns_zero_when_both_none(self):
         """Test returns 0.0 when both season and week are None."""
-        result = get_ffwar_from_cache("Jayden Daniels", season=None, week=None)
+        result = get_ffwar_from_cache("12345", season=None, week=None)
+
+        assert result == 0.0
+
+    def test_returns_zero_when_player_id_is_none(self):
+        """Test returns 0.0 when the starter has no player ID."""
+        result = get_ffwar_from_cache(None, season="2023", week="1")
 
         assert result == 0.0
 
     def test_returns_zero_when_season_not_in_cache(self):
         """Test returns 0.0 when season not found in cache."""
-        result = get_ffwar_from_cache("Jayden Daniels", season="2020", week="1")
+        result = get_ffwar_from_cache("12345", season="2020", week="1")
 
         assert result == 0.0
 
     def test_returns_zero_when_week_not_in_cache(self):
         """Test returns 0.0 when week not found in cache."""
-        result = get_ffwar_from_cache("Jayden Daniels", season="2023", week="5")
+        result = get_ffwar_from_cache("12345", season="2023", week="5")
 
         assert result == 0.0
 
     def test_returns_zero_when_player_id_not_in_cache(self):
         """Test returns 0.0 when player ID not found in week data."""
-        self.mock_get_player_id.return_value = "99999"
-
-        result = get_ffwar_from_cache("Unknown Player", season="2023", week="1")
+        result = get_ffwar_from_cache("99999", season="2023", week="1")
 
         assert result == 0.0
 
     def test_different_player_returns_different_ffwar(self):
         """Test returns correct ffWAR for different player."""
-        self.mock_get_player_id.return_value = "67890"
-
-        result = get_ffwar_from_cache("Brian Robinson", season="2023", week="1")
+        result = get_ffwar_from_cache("67890", season="2023", week="1")
 
         assert result == 0.8
 
+    def test_rebuilds_index_when_cache_replaced(self):
+        """Test index is rebuilt when the player data cache is replaced."""
+        get_ffwar_from_cache("12345", season="2023", week="1")
+
+        self.mock_get_player_data_cache.return_value = {
+            "2023": {"1": {"12345": {"ffWAR": 2.0}}}
+        }
+
+        result = get_ffwar_from_cache("12345", season="2023", week="1")
+
+        assert result == 2.0
+
+    def test_counts_hits_and_misses(self):
+        """Test index lookups are counted as hits or misses."""
+        with (
+            patch(f"{MODULE_PATH}._FFWAR_HITS") as mock_hits,
+            patch(f"{MODULE_PATH}._FFWAR_MISSES") as mock_misses,
+        ):
+            get_ffwar_from_cache("12345", season="2023", week="1")
+            get_ffwar_from_cache("99999", season="2023", week="1")
+            get_ffwar_from_cache("99999", season="2023", week="2")
+
+        mock_hits.inc.assert_called_once()
+        assert mock_misses.inc.call_count == 2
+
+
+class TestGetRollupRowsFromCache:
+    """Test get_rollup_rows_from_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_aggregation_rollups_cache`:
+            `mock_get_rollups_cache`
+
+        Yields:
+            None
+        """
+        with patch(
+            f"{MODULE_PATH}.CACHE_MANAGER.get_aggregation_rollups_cache"
+        ) as mock_get_rollups_cache:
+            self.mock_rollups_cache = {
+                "2022": {
+                    "Tommy": {"Jayden Daniels": {"total_points": 10.0}},
+                },
+                "2023": {
+                    "Tommy": {"Jayden Daniels": {"total_points": 20.0}},
+                    "Benz": {"Josh Allen": {"total_points": 30.0}},
+                },
+            }
+            mock_get_rollups_cache.return_value = self.mock_rollups_cache
+
+            yield
+
+    def test_returns_none_when_not_built(self):
+        """Test returns None when the rollups cache is empty."""
+        self.mock_rollups_cache.clear()
+
+        assert get_rollup_rows_from_cache() is None
+
+    def test_returns_all_rows(self):
+        """Test returns every row when no filters are given."""
+        result = get_rollup_rows_from_cache()
+
+        assert len(result) == 3
+
+    def test_filters_by_season(self):
+        """Test filters rows by season."""
+        result = get_rollup_rows_from_cache(season=2022)
+
+        assert result == [
+            ("2022", "Tommy", "Jayden Daniels", {"total_points": 10.0})
+        ]
+
+    def test_filters_by_manager(self):
+        """Test filters rows by manager."""
+        result = get_rollup_rows_from_cache(manager="Benz")
+
+        assert result == [
+            ("2023", "Benz", "Josh Allen", {"total_points": 30.0})
+        ]
+
+    def test_filters_by_player(self):
+        """Test filters rows by player."""
+        result = get_rollup_rows_from_cache(player="Jayden Daniels")
+
+        assert [row[0] for row in result] == ["2022", "2023"]
+
+    def test_unknown_season_returns_empty(self):
+        """Test a season without rollups returns no rows."""
+        assert get_rollup_rows_from_cache(season=2019) == []
+
 
 class TestGetTeam:
     """Test get_team function."""
@@ -6,10 +6,15 @@ from unittest.mock import patch
 import pytest
 
 from patriot_center_backend.cache.queries.award_queries import (
+    add_to_score_records,
+    get_league_score_records_from_cache,
     get_manager_awards_from_cache,
     get_manager_score_awards_from_cache,
+    get_score_records_index,
 )
 
+MODULE_PATH = "patriot_center_backend.cache.queries.award_queries"
+
 
 class TestGetManagerAwardsFromCache:
     """Test get_manager_awards_from_cache function."""
@@ -96,8 +101,12 @@ class TestGetManagerScoreAwardsFromCache:
             self.mock_get_matchup_card.return_value = {"data": "data"}
             mock_validate.return_value = ""
 
+            get_score_records_index.cache_clear()
+
             yield
 
+            get_score_records_index.cache_clear()
+
     def test_score_awards(self):
         """Test getting scoring-related awards."""
         result = get_manager_score_awards_from_cache("Manager 1")
@@ -119,3 +128,240 @@ class TestGetManagerScoreAwardsFromCache:
 
         # biggest_blowout_loss doesn't exist, so 3 out of 4 called
         assert self.mock_get_matchup_card.call_count == 3
+
+
+def _week(opponent: str, points_for: float, points_against: float):
+    """Build a manager cache week entry for a played matchup."""
+    return {
+        "matchup_data": {
+            "opponent_manager": opponent,
+            "points_for": points_for,
+            "points_against": points_against,
+        }
+    }
+
+
+class TestGetScoreRecordsIndex:
+    """Test get_score_records_index function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_manager_cache`: `mock_get_manager_cache`
+        - `validate_matchup_data`: `mock_validate`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_manager_cache"
+            ) as mock_get_manager_cache,
+            patch(f"{MODULE_PATH}.validate_matchup_data") as mock_validate,
+        ):
+            self.mock_manager_cache = {
+                "Tommy": {
+                    "years": {
+                        "2023": {
+                            "weeks": {
+                                "1": _week("Benz", 120.5, 100.25),
+                                "2": _week("Benz", 90.0, 130.0),
+                                "3": _week("Benz", 120.5, 80.0),
+                            }
+                        }
+                    }
+                },
+                "Benz": {
+                    "years": {
+                        "2023": {
+                            "weeks": {
+                                "1": _week("Tommy", 100.25, 120.5),
+                                "2": _week("Tommy", 130.0, 90.0),
+                                "3": _week("Tommy", 80.0, 120.5),
+                                "4": {"matchup_data": {}},
+                            }
+                        }
+                    }
+                },
+            }
+            self.mock_get_manager_cache = mock_get_manager_cache
+            self.mock_get_manager_cache.return_value = self.mock_manager_cache
+
+            self.mock_validate = mock_validate
+            self.mock_validate.side_effect = lambda m: "" if m else "Empty"
+
+            get_score_records_index.cache_clear()
+
+            yield
+
+            get_score_records_index.cache_clear()
+
+    def test_manager_records(self):
+        """Test each award points at the manager's extreme week."""
+        records = get_score_records_index()["managers"]["Tommy"]
+
+        assert records["highest_weekly_score"]["week"] == "1"
+        assert records["highest_weekly_score"]["value"] == 120.5
+        assert records["lowest_weekly_score"]["week"] == "2"
+        assert records["biggest_blowout_win"]["week"] == "3"
+        assert records["biggest_blowout_win"]["value"] == 40.5
+        assert records["biggest_blowout_loss"]["week"] == "2"
+        assert records["biggest_blowout_loss"]["value"] == -40.0
+
+    def test_ties_keep_earliest_week(self):
+        """Test a tied score does not replace the earlier record."""
+        records = get_score_records_index()["managers"]["Tommy"]
+
+        assert records["highest_weekly_score"]["week"] == "1"
+
+    def test_record_points_at_opponent(self):
+        """Test records keep the opponent needed to render the card."""
+        record = get_score_records_index()["managers"]["Tommy"][
+            "highest_weekly_score"
+        ]
+
+        assert record == {
+            "manager": "Tommy",
+            "opponent": "Benz",
+            "year": "2023",
+            "week": "1",
+            "value": 120.5,
+        }
+
+    def test_league_records_sorted(self):
+        """Test league records are sorted best first."""
+        league = get_score_records_index()["league"]
+
+        assert [r["value"] for r in league["highest_weekly_score"]] == [
+            130.0,
+            120.5,
+            120.5,
+            100.25,
+            90.0,
+            80.0,
+        ]
+        assert league["lowest_weekly_score"][0]["value"] == 80.0
+        assert [r["value"] for r in league["biggest_blowout"]] == [
+            40.5,
+            40.0,
+            20.25,
+        ]
+
+    def test_league_records_capped(self):
+        """Test league records are capped at the records limit."""
+        with patch(f"{MODULE_PATH}.LEAGUE_RECORDS_LIMIT", 2):
+            league = get_score_records_index()["league"]
+
+        assert [r["value"] for r in league["highest_weekly_score"]] == [
+            130.0,
+            120.5,
+        ]
+
+    def test_skips_invalid_weeks(self):
+        """Test weeks failing validation are not recorded."""
+        self.mock_validate.side_effect = None
+        self.mock_validate.return_value = "Warning, invalid points_for"
+
+        index = get_score_records_index()
+
+        assert index["managers"] == {}
+        assert index["league"]["highest_weekly_score"] == []
+
+    def test_add_to_score_records(self):
+        """Test adding a new week updates the built index."""
+        get_score_records_index()
+
+        add_to_score_records(
+            "Tommy", "2024", "1", _week("Benz", 150.0, 60.0)["matchup_data"]
+        )
+
+        index = get_score_records_index()
+        assert index["managers"]["Tommy"]["highest_weekly_score"]["year"] == (
+            "2024"
+        )
+        assert index["league"]["biggest_blowout"][0]["value"] == 90.0
+
+    def test_add_to_score_records_skips_duplicates(self):
+        """Test adding a week already in the index has no effect."""
+        index = get_score_records_index()
+        num_records = len(index["league"]["highest_weekly_score"])
+
+        add_to_score_records(
+            "Tommy",
+            "2023",
+            "2",
+            self.mock_manager_cache["Tommy"]["years"]["2023"]["weeks"]["2"][
+                "matchup_data"
+            ],
+        )
+
+        assert len(index["league"]["highest_weekly_score"]) == num_records
+
+
+class TestGetLeagueScoreRecordsFromCache:
+    """Test get_league_score_records_from_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `get_score_records_index`: `mock_get_index`
+        - `get_matchup_card`: `mock_get_matchup_card`
+
+        Yields:
+            None
+        """
+        with (
+            patch(f"{MODULE_PATH}.get_score_records_index") as mock_get_index,
+            patch(f"{MODULE_PATH}.get_matchup_card") as mock_get_matchup_card,
+        ):
+            record = {
+                "manager": "Tommy",
+                "opponent": "Benz",
+                "year": "2023",
+                "week": "1",
+                "value": 40.5,
+            }
+            mock_get_index.return_value = {
+                "managers": {},
+                "league": {
+                    "highest_weekly_score": [record, record],
+                    "lowest_weekly_score": [record],
+                    "biggest_blowout": [record],
+                },
+            }
+
+            self.mock_get_matchup_card = mock_get_matchup_card
+            self.mock_get_matchup_card.side_effect = lambda *args: {
+                "args": args
+            }
+
+            yield
+
+    def test_renders_top_n_cards(self):
+        """Test only the top N records are rendered as cards."""
+        result = get_league_score_records_from_cache(1)
+
+        assert len(result["highest_weekly_score"]) == 1
+        assert result["highest_weekly_score"][0] == {
+            "args": ("Tommy", "Benz", "2023", "1")
+        }
+        assert self.mock_get_matchup_card.call_count == 3
+
+    def test_blowouts_include_differential(self):
+        """Test blowout cards carry the point differential."""
+        result = get_league_score_records_from_cache(5)
+
+        assert result["biggest_blowout"][0]["differential"] == 40.5
+        assert "differential" not in result["highest_weekly_score"][0]
+
+    @pytest.mark.parametrize("top_n", [0, 26])
+    def test_invalid_top_n(self, top_n: int):
+        """Test an out of range number of records raises ValueError."""
+        with pytest.raises(ValueError):
+            get_league_score_records_from_cache(top_n)
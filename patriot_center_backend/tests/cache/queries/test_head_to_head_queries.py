@@ -8,6 +8,10 @@ import pytest
 
 from patriot_center_backend.cache.queries.head_to_head_queries import (
     _evaluate_matchup,
+    _get_average_margin_of_victory,
+    _get_head_to_head_matrix,
+    _merge_win_records,
+    _new_win_record,
     get_head_to_head_details_from_cache,
     get_head_to_head_overall_from_cache,
 )
@@ -76,6 +80,8 @@ class TestGetHeadToHeadOverallFromCache:
         set of values when accessed.
         - `CACHE_MANAGER.get_manager_cache`: `mock_get_manager_cache`
         - `get_matchup_card`: `mock_get_matchup_card`
+        - `validate_matchup_data`: `mock_validate`
+        - `get_head_to_head_details_from_cache`: `mock_h2h_details`
 
         Args:
             mock_manager_cache: Sample manager cache
@@ -100,27 +106,49 @@ class TestGetHeadToHeadOverallFromCache:
                 "patriot_center_backend.cache.queries"
                 ".head_to_head_queries.get_head_to_head_details_from_cache",
             ) as mock_h2h_details,
-            patch(
-                "patriot_center_backend.cache.queries"
-                ".head_to_head_queries._evaluate_matchup",
-            ) as mock_evaluate_matchup,
         ):
             self.mock_manager_cache = mock_manager_cache
-            self.mock_matchup_card_value = {"year": "2023", "week": "1"}
             self.mock_h2h_details_value = {"wins": 0, "losses": 0, "ties": 0}
-            self.mock_evaluate_matchup = mock_evaluate_matchup
 
             mock_get_manager_cache.return_value = self.mock_manager_cache
-            mock_get_matchup_card.return_value = self.mock_matchup_card_value
+            self.mock_get_matchup_card = mock_get_matchup_card
+            self.mock_get_matchup_card.side_effect = (
+                lambda manager_1, manager_2, year, week: {
+                    "year": year,
+                    "week": week,
+                }
+            )
             mock_validate.return_value = ""
             mock_h2h_details.return_value = self.mock_h2h_details_value
-            self.mock_evaluate_matchup.return_value = (
-                {"year": "2023", "week": "1"},
-                {"year": "2023", "week": "1"},
-            )
+
+            _get_head_to_head_matrix.cache_clear()
 
             yield
 
+            _get_head_to_head_matrix.cache_clear()
+
+    def _set_weeks(self, *matchups: tuple[str, float, float]) -> None:
+        """Set Manager 1's 2023 weeks against Manager 2.
+
+        Args:
+            *matchups: (result, points_for, points_against) per week,
+                starting at week 1
+        """
+        self.mock_manager_cache["Manager 1"]["years"]["2023"]["weeks"] = {
+            str(week): {
+                "matchup_data": {
+                    "opponent_manager": "Manager 2",
+                    "result": result,
+                    "points_for": points_for,
+                    "points_against": points_against,
+                },
+                "transactions": {},
+            }
+            for week, (result, points_for, points_against) in enumerate(
+                matchups, start=1
+            )
+        }
+
     def test_h2h_overall_stats(self, caplog: pytest.LogCaptureFixture):
         """Test comprehensive H2H stats calculation.
 
@@ -138,8 +166,10 @@ class TestGetHeadToHeadOverallFromCache:
         assert "manager_2_wins" in result
         assert "ties" in result
 
-        # Verify _evaluate_matchup was called for manager 1's win
-        self.mock_evaluate_matchup.assert_called_once()
+        # Manager 1's single win is both the last win and biggest blowout
+        self.mock_get_matchup_card.assert_called_once_with(
+            "Manager 1", "Manager 2", "2023", "1"
+        )
 
     def test_h2h_no_matchups(self, caplog: pytest.LogCaptureFixture):
         """Test H2H when managers never played.
@@ -154,46 +184,26 @@ class TestGetHeadToHeadOverallFromCache:
         assert "Cannot compute average margin of victory" in caplog.text
 
         # Should handle gracefully even with no matchups
-        assert result is not None
         assert isinstance(result, dict)
+        assert result["manager_1_last_win"] == {}
+        assert result["manager_1_biggest_blowout"] == {}
 
-        # Verify _evaluate_matchup was NOT called (no matchups found)
-        self.mock_evaluate_matchup.assert_not_called()
+        # No cards rendered without matchups
+        self.mock_get_matchup_card.assert_not_called()
 
     def test_h2h_list_all_matchups(self):
         """Test H2H with list_all_matchups=True returns matchup history."""
-        # Setup weeks data with matchups
-        self.mock_manager_cache["Manager 1"]["years"]["2023"]["weeks"] = {
-            "1": {
-                "matchup_data": {
-                    "opponent_manager": "Manager 2",
-                    "result": "win",
-                    "points_for": 120.5,
-                    "points_against": 100.0,
-                },
-                "transactions": {},
-            },
-            "2": {
-                "matchup_data": {
-                    "opponent_manager": "Manager 2",
-                    "result": "loss",
-                    "points_for": 90.0,
-                    "points_against": 110.0,
-                },
-                "transactions": {},
-            },
-        }
+        self._set_weeks(("win", 120.5, 100.0), ("loss", 90.0, 110.0))
 
         result = get_head_to_head_overall_from_cache(
             "Manager 1", "Manager 2", list_all_matchups=True
         )
 
-        # Should return a list of matchup cards
-        assert isinstance(result, list)
-        assert len(result) == 2
-
-        # Verify _evaluate_matchup was NOT called (list_all_matchups mode)
-        self.mock_evaluate_matchup.assert_not_called()
+        # Newest first
+        assert result == [
+            {"year": "2023", "week": "2"},
+            {"year": "2023", "week": "1"},
+        ]
 
     def test_h2h_with_specific_year(self, caplog: pytest.LogCaptureFixture):
         """Test H2H stats filtered to specific year.
@@ -201,18 +211,7 @@ class TestGetHeadToHeadOverallFromCache:
         Args:
             caplog: pytest caplog
         """
-        # Setup weeks data
-        self.mock_manager_cache["Manager 1"]["years"]["2023"]["weeks"] = {
-            "1": {
-                "matchup_data": {
-                    "opponent_manager": "Manager 2",
-                    "result": "win",
-                    "points_for": 120.5,
-                    "points_against": 100.0,
-                },
-                "transactions": {},
-            }
-        }
+        self._set_weeks(("win", 120.5, 100.0))
         self.mock_manager_cache["Manager 1"]["years"]["2023"].update(
             {
                 "summary": {
@@ -229,20 +228,6 @@ class TestGetHeadToHeadOverallFromCache:
             self.mock_manager_cache["Manager 1"]
         )
 
-        self.mock_manager_cache["Manager 2"]["years"]["2023"].update(
-            {
-                "summary": {
-                    "matchup_data": {
-                        "overall": {
-                            "points_for": {"opponents": {"Manager 1": 100.0}}
-                        }
-                    }
-                }
-            }
-        )
-
-        self.mock_h2h_details_value = {"wins": 1, "losses": 0, "ties": 0}
-
         result = get_head_to_head_overall_from_cache(
             "Manager 1", "Manager 2", year="2023"
         )
@@ -250,62 +235,70 @@ class TestGetHeadToHeadOverallFromCache:
         assert "No victories found for Manager 2 against " in caplog.text
         assert "Cannot compute average margin of victory" in caplog.text
 
-        # Should return dict with stats
         assert isinstance(result, dict)
         assert "manager_1_wins" in result
 
-        # Verify _evaluate_matchup was called for manager 1's win
-        self.mock_evaluate_matchup.assert_called_once()
-
     def test_h2h_manager2_wins(self, caplog: pytest.LogCaptureFixture):
         """Test H2H when manager2 wins (result='loss' for manager1).
 
         Args:
             caplog: pytest caplog
         """
-        # Setup weeks data where Manager 2 wins
-        self.mock_manager_cache["Manager 1"]["years"]["2023"]["weeks"] = {
-            "1": {
-                "matchup_data": {
-                    "opponent_manager": "Manager 2",
-                    "result": "loss",
-                    "points_for": 90.0,
-                    "points_against": 110.0,
-                },
-                "transactions": {},
-            },
-            "2": {
-                "matchup_data": {
-                    "opponent_manager": "Manager 2",
-                    "result": "loss",
-                    "points_for": 85.0,
-                    "points_against": 115.0,
-                },
-                "transactions": {},
-            },
-        }
+        self._set_weeks(("loss", 90.0, 110.0), ("loss", 85.0, 115.0))
         self.mock_manager_cache["Manager 2"] = deepcopy(
             self.mock_manager_cache["Manager 1"]
         )
 
-        self.mock_h2h_details_value = {"wins": 0, "losses": 2, "ties": 0}
-        self.mock_matchup_card_value = {
-            "year": "2023",
-            "week": "1",
-            "margin": 20.0,
-        }
-
         result = get_head_to_head_overall_from_cache("Manager 1", "Manager 2")
 
         assert "No victories found for Manager 1 against " in caplog.text
         assert "Cannot compute average margin of victory" in caplog.text
 
-        # Should process manager2's wins correctly
         assert isinstance(result, dict)
         assert "manager_2_wins" in result
 
-        # Verify _evaluate_matchup was called for manager 2's wins (2 times)
-        assert self.mock_evaluate_matchup.call_count == 2
+        # Manager 2's side is written last under the shared key
+        assert result["manager_1_average_margin_of_victory"] == 25.0
+        assert result["manager_1_last_win"] == {"year": "2023", "week": "2"}
+        assert result["manager_1_biggest_blowout"] == {
+            "year": "2023",
+            "week": "2",
+        }
+
+    def test_h2h_renders_at_most_four_cards(self):
+        """Test only the last win and blowout cards are rendered."""
+        self._set_weeks(
+            ("win", 120.0, 100.0),
+            ("win", 140.0, 100.0),
+            ("win", 110.0, 100.0),
+            ("loss", 90.0, 110.0),
+            ("loss", 80.0, 120.0),
+            ("loss", 99.0, 100.0),
+        )
+
+        result = get_head_to_head_overall_from_cache("Manager 1", "Manager 2")
+
+        assert self.mock_get_matchup_card.call_count <= 4
+        assert result["manager_1_last_win"] == {"year": "2023", "week": "6"}
+        assert result["manager_1_biggest_blowout"] == {
+            "year": "2023",
+            "week": "5",
+        }
+
+    def test_h2h_matrix_built_once(self):
+        """Test the head-to-head matrix is reused across requests."""
+        self._set_weeks(("win", 120.5, 100.0))
+
+        with patch(
+            "patriot_center_backend.cache.queries"
+            ".head_to_head_queries._evaluate_matchup",
+            wraps=_evaluate_matchup,
+        ) as mock_evaluate_matchup:
+            get_head_to_head_overall_from_cache("Manager 1", "Manager 2")
+            num_evaluated = mock_evaluate_matchup.call_count
+            get_head_to_head_overall_from_cache("Manager 1", "Manager 2")
+
+        assert mock_evaluate_matchup.call_count == num_evaluated
 
 
 class TestEvaluateMatchup:
@@ -313,222 +306,113 @@ class TestEvaluateMatchup:
 
     @pytest.fixture(autouse=True)
     def setup(self):
-        """Setup common test data for all tests.
+        """Setup an empty win record for all tests.
 
         Yields:
             None
         """
-        self.matchup_card = {
-            "year": "2023",
-            "week": "5",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-            "manager_1_score": 120.5,
-            "manager_2_score": 100.0,
-        }
+        self.win_record = _new_win_record()
 
         yield
 
     def test_first_win_sets_last_win_and_biggest_blowout(self):
-        """Test first win sets both last_win and biggest_blowout."""
-        biggest_blowout = {}
-        last_win = {}
-        margins = []
-
-        result_last_win, result_biggest_blowout = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=20.5,
-            margins=margins,
-        )
+        """Test first win sets both pointers."""
+        _evaluate_matchup(self.win_record, "2023", "5", 20.5)
 
-        assert result_last_win == self.matchup_card
-        assert result_biggest_blowout == self.matchup_card
-        assert margins == [20.5]
-
-    def test_first_win_only_sets_last_win_when_biggest_blowout_exists(self):
-        """Test first win only sets last_win when biggest_blowout exists."""
-        existing_blowout = {
-            "year": "2022",
-            "week": "10",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-            "manager_1_score": 150.0,
-            "manager_2_score": 90.0,
-        }
-        biggest_blowout = deepcopy(existing_blowout)
-        last_win = {}
-        margins = []
-
-        result_last_win, result_biggest_blowout = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=20.5,
-            margins=margins,
-        )
-
-        assert result_last_win == self.matchup_card
-        assert result_biggest_blowout == existing_blowout
-        assert margins == [20.5]
+        assert self.win_record["last_win"] == ("2023", "5")
+        assert self.win_record["biggest_blowout"] == ("2023", "5")
+        assert self.win_record["biggest_margin"] == 20.5
 
     def test_more_recent_win_updates_last_win(self):
-        """Test more recent win (later year/week) updates last_win."""
-        existing_last_win = {
-            "year": "2023",
-            "week": "3",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = deepcopy(existing_last_win)
-        biggest_blowout = deepcopy(existing_last_win)
-        margins = [15.0]
-
-        result_last_win, _ = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=10.0,
-            margins=margins,
-        )
+        """Test a more recent week updates the last win."""
+        _evaluate_matchup(self.win_record, "2023", "3", 10.0)
+        _evaluate_matchup(self.win_record, "2023", "10", 5.0)
 
-        # Week 5 > week 3, so should update
-        assert result_last_win == self.matchup_card
-        assert margins == [15.0, 10.0]
+        assert self.win_record["last_win"] == ("2023", "10")
 
     def test_older_win_does_not_update_last_win(self):
-        """Test older win does not update last_win."""
-        existing_last_win = {
-            "year": "2023",
-            "week": "10",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = deepcopy(existing_last_win)
-        biggest_blowout = {"year": "2023", "week": "1"}
-        margins = [15.0]
-
-        result_last_win, _ = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=10.0,
-            margins=margins,
-        )
+        """Test an older week leaves the last win alone."""
+        _evaluate_matchup(self.win_record, "2023", "10", 10.0)
+        _evaluate_matchup(self.win_record, "2023", "3", 5.0)
 
-        # Week 5 < week 10, so should NOT update
-        assert result_last_win == existing_last_win
-        assert margins == [15.0, 10.0]
+        assert self.win_record["last_win"] == ("2023", "10")
 
     def test_more_recent_year_updates_last_win(self):
-        """Test win in more recent year updates last_win."""
-        existing_last_win = {
-            "year": "2022",
-            "week": "15",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = deepcopy(existing_last_win)
-        biggest_blowout = deepcopy(existing_last_win)
-        margins = [30.0]
-
-        result_last_win, _ = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=20.5,
-            margins=margins,
-        )
+        """Test a later year updates the last win despite an earlier week."""
+        _evaluate_matchup(self.win_record, "2022", "14", 10.0)
+        _evaluate_matchup(self.win_record, "2023", "1", 5.0)
 
-        # 2023 > 2022, so should update even though week 5 < week 15
-        assert result_last_win == self.matchup_card
-        assert margins == [30.0, 20.5]
+        assert self.win_record["last_win"] == ("2023", "1")
 
     def test_larger_margin_updates_biggest_blowout(self):
-        """Test larger victory margin updates biggest_blowout."""
-        existing_blowout = {
-            "year": "2023",
-            "week": "1",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = {"year": "2023", "week": "10"}
-        biggest_blowout = deepcopy(existing_blowout)
-        margins = [15.0]
-
-        _, result_biggest_blowout = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=25.0,
-            margins=margins,
-        )
+        """Test a larger margin updates the biggest blowout."""
+        _evaluate_matchup(self.win_record, "2023", "1", 10.0)
+        _evaluate_matchup(self.win_record, "2023", "2", 30.0)
 
-        # 25.0 > 15.0, so should update biggest_blowout
-        assert result_biggest_blowout == self.matchup_card
-        assert margins == [15.0, 25.0]
+        assert self.win_record["biggest_blowout"] == ("2023", "2")
 
     def test_smaller_margin_does_not_update_biggest_blowout(self):
-        """Test smaller victory margin does not update biggest_blowout."""
-        existing_blowout = {
-            "year": "2023",
-            "week": "1",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = {"year": "2023", "week": "10"}
-        biggest_blowout = deepcopy(existing_blowout)
-        margins = [30.0]
-
-        _, result_biggest_blowout = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=10.0,
-            margins=margins,
-        )
+        """Test a smaller margin leaves the biggest blowout alone."""
+        _evaluate_matchup(self.win_record, "2023", "1", 30.0)
+        _evaluate_matchup(self.win_record, "2023", "2", 10.0)
 
-        # 10.0 < 30.0, so should NOT update biggest_blowout
-        assert result_biggest_blowout == existing_blowout
-        assert margins == [30.0, 10.0]
+        assert self.win_record["biggest_blowout"] == ("2023", "1")
 
     def test_equal_margin_updates_biggest_blowout(self):
-        """Test equal victory margin updates biggest_blowout (most recent)."""
-        existing_blowout = {
-            "year": "2023",
-            "week": "1",
-            "manager_1": "Tommy",
-            "manager_2": "Manager 2",
-        }
-        last_win = {"year": "2023", "week": "10"}
-        biggest_blowout = deepcopy(existing_blowout)
-        margins = [20.5]
-
-        _, result_biggest_blowout = _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=20.5,
-            margins=margins,
-        )
+        """Test a later game with an equal margin takes the blowout."""
+        _evaluate_matchup(self.win_record, "2023", "1", 30.0)
+        _evaluate_matchup(self.win_record, "2023", "2", 30.0)
 
-        # Equal margin (20.5 == max([20.5, 20.5])), so updates to most recent
-        assert result_biggest_blowout == self.matchup_card
-        assert margins == [20.5, 20.5]
-
-    def test_margins_list_always_updated(self):
-        """Test victory margin is always appended to margins list."""
-        last_win = {"year": "2024", "week": "1"}
-        biggest_blowout = {"year": "2024", "week": "1"}
-        margins = [5.0, 10.0, 15.0]
-
-        _evaluate_matchup(
-            biggest_blowout=biggest_blowout,
-            last_win=last_win,
-            matchup_card=self.matchup_card,
-            victory_margin=8.0,
-            margins=margins,
-        )
+        assert self.win_record["biggest_blowout"] == ("2023", "2")
+
+    def test_margins_always_recorded(self):
+        """Test every win's margin is recorded in game order."""
+        _evaluate_matchup(self.win_record, "2023", "1", 30.0)
+        _evaluate_matchup(self.win_record, "2023", "2", 10.0)
+
+        assert self.win_record["margins"] == [30.0, 10.0]
+
+
+class TestMergeWinRecords:
+    """Test _merge_win_records function."""
+
+    def test_merges_seasons(self):
+        """Test margins join and pointers pick across seasons."""
+        season_1 = _new_win_record()
+        _evaluate_matchup(season_1, "2022", "3", 30.0)
+        season_2 = _new_win_record()
+        _evaluate_matchup(season_2, "2023", "1", 10.0)
+
+        result = _merge_win_records([season_1, season_2, _new_win_record()])
+
+        assert result["margins"] == [30.0, 10.0]
+        assert result["last_win"] == ("2023", "1")
+        assert result["biggest_blowout"] == ("2022", "3")
+
+    def test_later_season_wins_blowout_ties(self):
+        """Test an equal blowout in a later season takes precedence."""
+        season_1 = _new_win_record()
+        _evaluate_matchup(season_1, "2022", "3", 30.0)
+        season_2 = _new_win_record()
+        _evaluate_matchup(season_2, "2023", "1", 30.0)
+
+        result = _merge_win_records([season_1, season_2])
+
+        assert result["biggest_blowout"] == ("2023", "1")
+
+    def test_average_sums_margins_in_game_order(self):
+        """Test the average sums every margin left to right.
+
+        Adding per-season sums instead rounds these margins to 15.54.
+        """
+        season_1 = _new_win_record()
+        _evaluate_matchup(season_1, "2022", "1", 1.0)
+        _evaluate_matchup(season_1, "2022", "2", 0.87)
+        season_2 = _new_win_record()
+        _evaluate_matchup(season_2, "2023", "1", 45.34)
+        _evaluate_matchup(season_2, "2023", "2", 14.97)
+
+        result = _merge_win_records([season_1, season_2])
 
-        assert margins == [5.0, 10.0, 15.0, 8.0]
+        average = _get_average_margin_of_victory(result, "Tommy", "Jay")
+        assert average == 15.55
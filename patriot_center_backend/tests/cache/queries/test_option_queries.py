@@ -6,6 +6,8 @@ import pytest
 
 from patriot_center_backend.cache.queries.option_queries import (
     get_options_list_from_cache,
+    get_search_index,
+    search_options_from_cache,
 )
 
 MODULE_PATH = "patriot_center_backend.cache.queries.option_queries"
@@ -90,3 +92,147 @@ class TestGetOptionsListFromCache:
         assert "Tommy" in result
         assert "Benz" in result
         assert len(result) == 2
+
+
+class TestSearchOptionsFromCache:
+    """Test search_options_from_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_players_cache`:
+            `mock_get_players_cache`
+        - `CACHE_MANAGER.get_starters_cache`:
+            `mock_get_starters_cache`
+        - `NAME_TO_MANAGER_USERNAME`: mocked constant
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_players_cache"
+            ) as mock_get_players_cache,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+            patch(
+                f"{MODULE_PATH}.NAME_TO_MANAGER_USERNAME",
+                {"Tommy": "tommylowry", "Jay": "Jrazzam"},
+            ),
+        ):
+            self.mock_get_players_cache = mock_get_players_cache
+            self.mock_get_players_cache.return_value = {
+                "Jayden Daniels": {
+                    "full_name": "Jayden Daniels",
+                    "first_name": "Jayden",
+                    "last_name": "Daniels",
+                    "position": "QB",
+                    "slug": "jayden%20daniels",
+                },
+                "Jaylen Waddle": {
+                    "full_name": "Jaylen Waddle",
+                    "first_name": "Jaylen",
+                    "last_name": "Waddle",
+                    "position": "WR",
+                    "slug": "jaylen%20waddle",
+                },
+                "Tony Pollard": {
+                    "full_name": "Tony Pollard",
+                    "first_name": "Tony",
+                    "last_name": "Pollard",
+                    "position": "RB",
+                    "slug": "tony%20pollard",
+                },
+            }
+
+            self.mock_get_starters_cache = mock_get_starters_cache
+            self.mock_get_starters_cache.return_value = {
+                "Last_Updated_Season": "2024",
+                "2024": {
+                    "1": {
+                        "Tommy": {
+                            "Total_Points": 100.0,
+                            "Jaylen Waddle": {},
+                        },
+                    },
+                    "2": {
+                        "Tommy": {
+                            "Total_Points": 90.0,
+                            "Jaylen Waddle": {},
+                            "Tony Pollard": {},
+                        },
+                    },
+                },
+            }
+
+            get_search_index.cache_clear()
+
+            yield
+
+            get_search_index.cache_clear()
+
+    def test_ranks_by_games_started(self):
+        """Test matches are ranked by games started, then name."""
+        result = search_options_from_cache("ja", 10)
+
+        assert [r["name"] for r in result] == [
+            "Jaylen Waddle",
+            "Jay",
+            "Jayden Daniels",
+        ]
+
+    def test_matches_first_and_last_names(self):
+        """Test queries match the start of first and last names."""
+        assert search_options_from_cache("wad", 10)[0]["name"] == (
+            "Jaylen Waddle"
+        )
+        assert search_options_from_cache("tony", 10)[0]["name"] == (
+            "Tony Pollard"
+        )
+
+    def test_matches_slugs_case_insensitively(self):
+        """Test queries match slugs regardless of case."""
+        result = search_options_from_cache("Jayden%20D", 10)
+
+        assert [r["name"] for r in result] == ["Jayden Daniels"]
+
+    def test_returns_option_records(self):
+        """Test results carry the option details and type."""
+        player = search_options_from_cache("jayden", 10)[0]
+        manager = search_options_from_cache("tommy", 10)[0]
+
+        assert player["type"] == "player"
+        assert player["position"] == "QB"
+        assert manager == {
+            "type": "manager",
+            "name": "Tommy",
+            "full_name": "Tommy",
+            "slug": "Tommy",
+        }
+
+    def test_caps_results_at_limit(self):
+        """Test at most limit results are returned."""
+        result = search_options_from_cache("ja", 1)
+
+        assert [r["name"] for r in result] == ["Jaylen Waddle"]
+
+    def test_no_matches(self):
+        """Test an unmatched query returns no results."""
+        assert search_options_from_cache("zz", 10) == []
+        assert search_options_from_cache("", 10) == []
+
+    def test_results_are_copies(self):
+        """Test modifying a result does not affect the index."""
+        search_options_from_cache("tommy", 10)[0]["type"] = "modified"
+
+        assert search_options_from_cache("tommy", 10)[0]["type"] == "manager"
+
+    @pytest.mark.parametrize("limit", [0, 26])
+    def test_invalid_limit(self, limit: int):
+        """Test an out of range limit raises ValueError."""
+        with pytest.raises(ValueError):
+            search_options_from_cache("ja", limit)
@@ -1,14 +1,19 @@
 """Unit tests for ranking_queries module."""
 
+from copy import deepcopy
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from patriot_center_backend.cache.queries.ranking_queries import (
+    _build_ranking_table,
+    _get_ranking_tables,
     get_ranking_details_from_cache,
 )
 
+MODULE_PATH = "patriot_center_backend.cache.queries.ranking_queries"
+
 
 @pytest.fixture
 def mock_valid_options_cache():
@@ -54,11 +59,25 @@ class TestGetRankingDetailsFromCache:
                 ".CACHE_MANAGER.get_valid_options_cache"
             ) as mock_get_valid_options_cache,
         ):
-            mock_get_manager_cache.return_value = mock_manager_cache
+            self.mock_manager_cache = mock_manager_cache
+            self.mock_get_manager_cache = mock_get_manager_cache
+            self.mock_get_manager_cache.return_value = self.mock_manager_cache
+
+            self.mock_valid_options_cache = mock_valid_options_cache
             mock_get_valid_options_cache.return_value = mock_valid_options_cache
 
+            _get_ranking_tables.cache_clear()
+
             yield
 
+            _get_ranking_tables.cache_clear()
+
+    def _set_trades(self, *totals: int) -> None:
+        """Set the all-time trade totals of Manager 1, 2 and 3."""
+        for i, total in enumerate(totals, start=1):
+            summary = self.mock_manager_cache[f"Manager {i}"]["summary"]
+            summary["transactions"]["trades"]["total"] = total
+
     def test_get_rankings(self):
         """Test getting ranking details."""
         result = get_ranking_details_from_cache("Manager 1")
@@ -68,3 +87,66 @@ class TestGetRankingDetailsFromCache:
         assert "is_active_manager" in result
         assert "worst" in result
         assert result["worst"] == 3  # Total number of managers
+
+    def test_tied_managers_share_rank(self):
+        """Test managers with the same value get the same rank."""
+        self._set_trades(5, 5, 3)
+
+        assert get_ranking_details_from_cache("Manager 1")["trades"] == 1
+        assert get_ranking_details_from_cache("Manager 2")["trades"] == 1
+
+    def test_rank_after_tie_skips_tied_positions(self):
+        """Test the rank after a tie counts every better manager."""
+        self._set_trades(5, 5, 3)
+
+        assert get_ranking_details_from_cache("Manager 3")["trades"] == 3
+
+    def test_inactive_manager_ranked_against_all(self):
+        """Test inactive managers are ranked against every manager."""
+        self.mock_valid_options_cache["2025"]["managers"] = [
+            "Manager 1",
+            "Manager 2",
+        ]
+
+        active = get_ranking_details_from_cache("Manager 1")
+        inactive = get_ranking_details_from_cache("Manager 3")
+
+        assert active["is_active_manager"] is True
+        assert active["worst"] == 2
+        assert inactive["is_active_manager"] is False
+        assert inactive["worst"] == 3
+
+    def test_manager_summary_usage_returns_values(self):
+        """Test values are returned alongside ranks for summaries."""
+        self._set_trades(5, 4, 3)
+
+        result = get_ranking_details_from_cache(
+            "Manager 2", manager_summary_usage=True
+        )
+
+        assert result["values"]["trades"] == 4
+        assert result["ranks"]["trades"] == 2
+
+    def test_table_built_once_for_all_managers(self):
+        """Test the ranking table is reused across managers."""
+        with patch(
+            f"{MODULE_PATH}._build_ranking_table",
+            wraps=_build_ranking_table,
+        ) as mock_build:
+            for manager in ["Manager 1", "Manager 2", "Manager 3"]:
+                get_ranking_details_from_cache(manager)
+
+        mock_build.assert_called_once_with(None, True)
+
+    def test_table_rebuilt_when_manager_cache_changes(self):
+        """Test a replaced manager cache rebuilds the ranking table."""
+        self._set_trades(5, 4, 3)
+        assert get_ranking_details_from_cache("Manager 3")["trades"] == 3
+
+        updated_cache = deepcopy(self.mock_manager_cache)
+        updated_cache["Manager 3"]["summary"]["transactions"]["trades"][
+            "total"
+        ] = 6
+        self.mock_get_manager_cache.return_value = updated_cache
+
+        assert get_ranking_details_from_cache("Manager 3")["trades"] == 1
@@ -6,6 +6,8 @@ from unittest.mock import patch
 import pytest
 
 from patriot_center_backend.cache.queries.starters_queries import (
+    add_to_manager_index,
+    get_manager_index,
     get_starters_from_cache,
 )
 
@@ -167,3 +169,61 @@ class TestGetStartersFromCache:
 
         assert "Last_Updated_Season" not in result
         assert "Last_Updated_Week" not in result
+
+
+class TestGetManagerIndex:
+    """Test get_manager_index and add_to_manager_index functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_starters_cache: dict[str, Any]):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_starters_cache`:
+            `mock_get_starters_cache`
+
+        Args:
+            mock_starters_cache: A mock starters cache.
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+        ):
+            self.mock_starters_cache = mock_starters_cache
+
+            mock_get_starters_cache.return_value = self.mock_starters_cache
+            get_manager_index.cache_clear()
+
+            yield
+
+            get_manager_index.cache_clear()
+
+    def test_indexes_manager_weeks(self):
+        """Test maps each manager to the weeks they appear in."""
+        result = get_manager_index()
+
+        assert result == {
+            "Tommy": [("2023", "1"), ("2023", "2"), ("2022", "1")],
+            "Benz": [("2023", "1")],
+        }
+
+    def test_add_to_manager_index_appends_new_week(self):
+        """Test a newly added week is visible to manager filtering."""
+        get_manager_index()
+        self.mock_starters_cache["2023"]["2"]["Benz"] = {"Total_Points": 0.0}
+
+        add_to_manager_index("Benz", "2023", "2")
+
+        result = get_starters_from_cache(manager="Benz", season=2023)
+        assert set(result["2023"]) == {"1", "2"}
+
+    def test_add_to_manager_index_skips_duplicates(self):
+        """Test an already indexed week is not added twice."""
+        add_to_manager_index("Benz", "2023", "1")
+
+        assert get_manager_index()["Benz"] == [("2023", "1")]
@@ -181,3 +181,20 @@ class TestGetTransactionDetailsFromCache:
         get_transaction_details_from_cache("Manager 1")
 
         assert self.mock_manager_cache == original
+
+    def test_faab_flattening_does_not_modify_cache(self):
+        """Test FAAB totals are flattened without touching the cache."""
+        mgr1_summary = self.mock_manager_cache["Manager 1"]["summary"]
+        mgr1_summary["transactions"]["faab"] = {
+            "total_lost_or_gained": -100,
+            "players": {
+                "Player A": {"num_bids_won": 2, "total_faab_spent": 100},
+            },
+            "traded_away": {"total": 0, "trade_partners": {}},
+            "acquired_from": {"total": 0, "trade_partners": {}},
+        }
+        original = deepcopy(self.mock_manager_cache)
+
+        get_transaction_details_from_cache("Manager 1")
+
+        assert self.mock_manager_cache == original
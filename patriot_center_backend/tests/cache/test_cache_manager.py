@@ -2,15 +2,23 @@
 
 import json
 import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import ANY, patch
 
 import pytest
 
+from patriot_center_backend.app import app
+from patriot_center_backend.cache import CACHE_MANAGER
 from patriot_center_backend.cache.cache_manager import (
     CacheManager,
     get_cache_manager,
 )
+from patriot_center_backend.utils.response_cache import ResponseCache
 
 
 class TestLoadCache:
@@ -70,6 +78,21 @@ class TestSaveCache:
 
         assert cache_file.exists()
 
+    def test_replaces_file_without_leaving_temporary_file(self, tmp_path):
+        """Test the file is replaced through a temporary file.
+
+        Args:
+            tmp_path: pytest tmp_path fixture
+        """
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text('{"old": true}')
+
+        manager = CacheManager()
+        manager._save_cache(str(cache_file), {"new": True})
+
+        assert json.loads(cache_file.read_text()) == {"new": True}
+        assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+
 
 class TestGetManagerCache:
     """Test CacheManager.get_manager_cache method."""
@@ -791,6 +814,17 @@ class TestGetValidOptionsCache:
 
         assert self.mock_load_cache.call_count == 2
 
+    def test_expands_compact_form(self):
+        """Test a cache saved in compact form is expanded on load."""
+        self.mock_load_cache.return_value = {
+            "names": ["QB"],
+            "valid_options": {"2024": {"1": {"positions": [0]}}},
+        }
+
+        result = self.manager.get_valid_options_cache()
+
+        assert result == {"2024": {"1": {"positions": ["QB"]}}}
+
 
 class TestSaveValidOptionsCache:
     """Test CacheManager.save_valid_options_cache method."""
@@ -818,6 +852,21 @@ class TestSaveValidOptionsCache:
 
         self.mock_save_cache.assert_called_once()
 
+    def test_saves_compact_form(self):
+        """Test saves the cache as a names table and ID lists."""
+        self.manager.save_valid_options_cache(
+            {"2024": {"1": {"positions": ["QB"]}}}
+        )
+
+        self.mock_save_cache.assert_called_once_with(
+            ANY,
+            {
+                "names": ["QB"],
+                "valid_options": {"2024": {"1": {"positions": [0]}}},
+            },
+            indent=None,
+        )
+
     def test_saves_in_memory_cache(self):
         """Test saves in-memory cache when no arg provided."""
         self.manager._valid_options_cache = {"2024": {}}
@@ -1006,6 +1055,694 @@ class TestSaveWeeklyDataProgressTracker:
         assert "No weekly data progress tracker to save" in str(exc_info.value)
 
 
+class TestGetAggregationRollupsCache:
+    """Test CacheManager.get_aggregation_rollups_cache method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache`
+
+        Yields:
+            None
+        """
+        with patch.object(CacheManager, "_load_cache") as mock_load_cache:
+            self.mock_load_cache = mock_load_cache
+            self.mock_load_cache.return_value = {"2024": {"Tommy": {}}}
+            self.manager = CacheManager()
+
+            yield
+
+    def test_loads_on_first_access(self):
+        """Test loads cache from disk on first access."""
+        result = self.manager.get_aggregation_rollups_cache()
+
+        self.mock_load_cache.assert_called_once()
+        assert "2024" in result
+
+    def test_returns_cached_on_second_access(self):
+        """Test returns in-memory cache on second access."""
+        self.manager.get_aggregation_rollups_cache()
+        self.manager.get_aggregation_rollups_cache()
+
+        self.mock_load_cache.assert_called_once()
+
+    def test_force_reload(self):
+        """Test force_reload reloads from disk."""
+        self.manager.get_aggregation_rollups_cache()
+        self.manager.get_aggregation_rollups_cache(force_reload=True)
+
+        assert self.mock_load_cache.call_count == 2
+
+
+class TestSaveAggregationRollupsCache:
+    """Test CacheManager.save_aggregation_rollups_cache method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._save_cache`: `mock_save_cache`
+
+        Yields:
+            None
+        """
+        with patch.object(CacheManager, "_save_cache") as mock_save_cache:
+            self.mock_save_cache = mock_save_cache
+            self.manager = CacheManager()
+
+            yield
+
+    def test_saves_provided_cache(self):
+        """Test saves explicitly provided cache data."""
+        self.manager.save_aggregation_rollups_cache({"2024": {}})
+
+        self.mock_save_cache.assert_called_once()
+
+    def test_saves_in_memory_cache(self):
+        """Test saves in-memory cache when no arg provided."""
+        self.manager._aggregation_rollups_cache = {"2024": {}}
+
+        self.manager.save_aggregation_rollups_cache()
+
+        self.mock_save_cache.assert_called_once()
+
+    def test_raises_when_no_data(self):
+        """Test raises ValueError when no data to save."""
+        with pytest.raises(ValueError) as exc_info:
+            self.manager.save_aggregation_rollups_cache()
+
+        assert "No aggregation rollups cache to save" in str(exc_info.value)
+
+
+class TestGetCacheVersion:
+    """Test CacheManager.get_cache_version method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache`
+        - `CacheManager._save_cache`: `mock_save_cache`
+
+        Yields:
+            None
+        """
+        with (
+            patch.object(CacheManager, "_load_cache") as mock_load_cache,
+            patch.object(CacheManager, "_save_cache") as mock_save_cache,
+        ):
+            self.mock_load_cache = mock_load_cache
+            self.mock_load_cache.return_value = {"2024": {}}
+            self.mock_save_cache = mock_save_cache
+            self.manager = CacheManager()
+
+            yield
+
+    def test_zero_before_first_access(self):
+        """Test version is 0 before the cache is loaded or saved."""
+        assert self.manager.get_cache_version("starters") == 0
+
+    def test_bumped_on_load(self):
+        """Test version is bumped when the cache is loaded."""
+        self.manager.get_starters_cache()
+
+        assert self.manager.get_cache_version("starters") == 1
+
+    def test_not_bumped_on_cached_access(self):
+        """Test version is unchanged when the in-memory cache is reused."""
+        self.manager.get_starters_cache()
+        self.manager.get_starters_cache()
+
+        assert self.manager.get_cache_version("starters") == 1
+
+    def test_bumped_on_force_reload(self):
+        """Test version is bumped again on force reload."""
+        self.manager.get_starters_cache()
+        self.manager.get_starters_cache(force_reload=True)
+
+        assert self.manager.get_cache_version("starters") == 2
+
+    def test_bumped_on_save(self):
+        """Test version is bumped when the cache is saved."""
+        self.manager.save_player_data_cache({"2024": {}})
+
+        assert self.manager.get_cache_version("player_data") == 1
+
+    def test_versions_are_per_cache(self):
+        """Test bumping one cache leaves the others untouched."""
+        self.manager.get_starters_cache()
+
+        assert self.manager.get_cache_version("player_data") == 0
+
+
+class TestGetDataVersion:
+    """Test CacheManager.get_data_version method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache`
+        - `CacheManager._save_cache`: `mock_save_cache`
+
+        Yields:
+            None
+        """
+        with (
+            patch.object(CacheManager, "_load_cache") as mock_load_cache,
+            patch.object(CacheManager, "_save_cache") as mock_save_cache,
+        ):
+            self.mock_load_cache = mock_load_cache
+            self.mock_load_cache.return_value = {"2024": {}}
+            self.mock_save_cache = mock_save_cache
+            self.manager = CacheManager()
+
+            yield
+
+    def test_not_bumped_on_load(self):
+        """Test loading a cache leaves the data version unchanged."""
+        self.manager.get_starters_cache()
+
+        assert self.manager.get_data_version() == 0
+
+    def test_bumped_on_any_save(self):
+        """Test saving any cache bumps the data version."""
+        self.manager.save_starters_cache({"2024": {}})
+        self.manager.save_image_urls_cache({})
+
+        assert self.manager.get_data_version() == 2
+
+    def test_bumped_on_reload_all_caches(self):
+        """Test reloading all caches bumps the data version."""
+        self.manager.reload_all_caches()
+
+        assert self.manager.get_data_version() == 1
+
+
+class TestUpdateCache:
+    """Test CacheManager.update_cache method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._save_cache`: `mock_save_cache`
+
+        Yields:
+            None
+        """
+        with patch.object(CacheManager, "_save_cache") as mock_save_cache:
+            self.mock_save_cache = mock_save_cache
+            self.manager = CacheManager()
+            self.manager._image_urls_cache = {"Tommy": {"name": "Tommy"}}
+
+            yield
+
+    def test_replaces_cache_with_updated_copy(self):
+        """Test the cache is replaced, leaving the current one unchanged."""
+        current = self.manager.get_image_urls_cache()
+
+        result = self.manager.update_cache(
+            "image_urls", {"Anthony": {"name": "Anthony"}}
+        )
+
+        assert current == {"Tommy": {"name": "Tommy"}}
+        assert result == {
+            "Tommy": {"name": "Tommy"},
+            "Anthony": {"name": "Anthony"},
+        }
+        assert self.manager.get_image_urls_cache() is result
+        assert self.manager.get_cache_version("image_urls") == 1
+        self.mock_save_cache.assert_not_called()
+
+    def test_saves_updated_cache(self):
+        """Test the updated cache is saved when asked to."""
+        result = self.manager.update_cache("image_urls", {}, save=True)
+
+        self.mock_save_cache.assert_called_once_with(ANY, result)
+        assert self.manager.get_data_version() == 1
+
+    def test_raises_for_unknown_cache_name(self):
+        """Test raises ValueError for unknown cache name."""
+        with pytest.raises(ValueError) as exc_info:
+            self.manager.update_cache("nonexistent", {})
+
+        assert "Unknown cache name" in str(exc_info.value)
+
+
+def _run_threads(
+    target: Callable[[int], Any], thread_count: int = 16
+) -> list[Any]:
+    """Run a target from many threads started at the same time.
+
+    Args:
+        target: Called with the index of each thread.
+        thread_count: Number of threads.
+
+    Returns:
+        The result of each thread.
+    """
+    barrier = threading.Barrier(thread_count)
+
+    def run(index: int) -> Any:
+        barrier.wait()
+        return target(index)
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        return list(executor.map(run, range(thread_count)))
+
+
+class TestThreadSafety:
+    """Stress test CacheManager from many threads at once."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache` (slow)
+        - `CacheManager._save_cache`: `mock_save_cache` (iterates the
+            cache, as json.dump does)
+
+        Yields:
+            None
+        """
+
+        def load_cache(_file_path: str) -> dict[str, Any]:
+            time.sleep(0.05)
+            return {"2024": {}}
+
+        def save_cache(
+            _file_path: str, data: dict[str, Any], indent: int | None = 4
+        ) -> None:
+            for _ in data.items():
+                time.sleep(0)
+
+        with (
+            patch.object(
+                CacheManager, "_load_cache", side_effect=load_cache
+            ) as mock_load_cache,
+            patch.object(
+                CacheManager, "_save_cache", side_effect=save_cache
+            ) as mock_save_cache,
+        ):
+            self.mock_load_cache = mock_load_cache
+            self.mock_save_cache = mock_save_cache
+            self.manager = CacheManager()
+
+            yield
+
+    def test_loads_each_cache_once(self):
+        """Test threads asking for an unloaded cache share one load."""
+        results = _run_threads(lambda _: self.manager.get_starters_cache())
+
+        self.mock_load_cache.assert_called_once()
+        assert all(result is results[0] for result in results)
+
+    def test_concurrent_updates_and_saves(self):
+        """Test updates racing saves raise no errors and lose no entries."""
+        self.manager._image_urls_cache = {}
+
+        def update(index: int) -> None:
+            for i in range(50):
+                self.manager.update_cache(
+                    "image_urls",
+                    {f"{index}-{i}": {"name": f"{index}-{i}"}},
+                    save=i % 10 == 0,
+                )
+                list(self.manager.get_image_urls_cache().items())
+
+        _run_threads(update)
+
+        assert len(self.manager.get_image_urls_cache()) == 16 * 50
+        assert self.manager.get_data_version() == 16 * 5
+
+
+def _manager_entry(wins: int, losses: int) -> dict[str, Any]:
+    """Build a manager cache entry with the fields the manager list reads.
+
+    Args:
+        wins: Total wins.
+        losses: Total losses.
+
+    Returns:
+        The manager cache entry.
+    """
+    summary = {
+        "matchup_data": {
+            "overall": {
+                "wins": {"total": wins},
+                "losses": {"total": losses},
+                "ties": {"total": 0},
+                "points_for": {"total": 100.0 * wins},
+                "points_against": {"total": 100.0 * losses},
+            }
+        },
+        "transactions": {
+            "trades": {"total": 1},
+            "adds": {"total": 2},
+            "drops": {"total": 2},
+        },
+        "overall_data": {
+            "placement": {"2024": 1},
+            "playoff_appearances": ["2024"],
+        },
+    }
+    return {"summary": summary, "years": {"2024": {"summary": summary}}}
+
+
+class TestThreadedRoutes:
+    """Stress test routes served from the shared caches on many threads."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER` caches: two managers, one player and no image
+            URLs, so every first lookup is a miss
+        - `CACHE_MANAGER._save_cache`: `mock_save_cache` (iterates the
+            cache, as json.dump does)
+        - `build_url`: `mock_build_url`
+        - `RESPONSE_CACHE`: stores nothing, so every request is served
+
+        Yields:
+            None
+        """
+
+        def save_cache(
+            _file_path: str, data: dict[str, Any], indent: int | None = 4
+        ) -> None:
+            for _ in data.items():
+                time.sleep(0)
+
+        def build_url(item: str, _item_type: str) -> dict[str, Any]:
+            time.sleep(0.01)
+            return {
+                "name": item,
+                "image_url": f"https://example.com/{item}.png",
+                "timestamp": time.time(),
+            }
+
+        with (
+            patch.multiple(
+                CACHE_MANAGER,
+                _manager_cache={
+                    "Tommy": _manager_entry(10, 4),
+                    "Cody": _manager_entry(4, 10),
+                },
+                _players_cache={
+                    "Kenny Stills": {
+                        "full_name": "Kenny Stills",
+                        "first_name": "Kenny",
+                        "last_name": "Stills",
+                        "position": "WR",
+                        "team": None,
+                        "slug": "kenny%20stills",
+                        "player_id": "1555",
+                    }
+                },
+                _player_ids_cache={},
+                _valid_options_cache={"2025": {"managers": ["Tommy", "Cody"]}},
+                _image_urls_cache={},
+            ),
+            patch.object(
+                CACHE_MANAGER, "_save_cache", side_effect=save_cache
+            ) as mock_save_cache,
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".build_url",
+                side_effect=build_url,
+            ) as mock_build_url,
+            patch(
+                "patriot_center_backend.utils.response_cache.RESPONSE_CACHE",
+                ResponseCache(max_bytes=0),
+            ),
+        ):
+            self.mock_save_cache = mock_save_cache
+            self.mock_build_url = mock_build_url
+            self.client = app.test_client()
+
+            yield
+
+    def test_concurrent_requests(self):
+        """Test routes racing image URL updates all serve the same data."""
+        paths = ("/get/managers/list/true", "/options/list")
+
+        def request(index: int) -> tuple[int, Any]:
+            response = self.client.get(paths[index % len(paths)])
+            return response.status_code, response.get_json()
+
+        results = _run_threads(request, thread_count=32)
+
+        assert [status for status, _ in results] == [200] * 32
+        assert all(results[i] == results[i % 2] for i in range(32))
+
+        managers = results[0][1]["managers"]
+        assert [m["name"] for m in managers] == ["Tommy", "Cody"]
+        assert managers[0]["image_url"] == "https://example.com/Tommy.png"
+
+        image_urls_cache = CACHE_MANAGER.get_image_urls_cache()
+        assert set(image_urls_cache) == {"Tommy", "Cody"}
+        self.mock_save_cache.assert_called()
+
+
+class TestGetCacheSnapshot:
+    """Test CacheManager.get_cache_snapshot method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache`
+
+        Yields:
+            None
+        """
+        with patch.object(CacheManager, "_load_cache") as mock_load_cache:
+            self.mock_load_cache = mock_load_cache
+            self.mock_load_cache.return_value = {"Tommy": {"years": {}}}
+            self.manager = CacheManager()
+
+            yield
+
+    def test_returns_view_of_cache(self):
+        """Test the snapshot reads through to the in-memory cache."""
+        result = self.manager.get_cache_snapshot("manager")
+
+        assert result == self.manager.get_manager_cache()
+
+    def test_snapshot_is_read_only(self):
+        """Test the snapshot cannot modify the cache."""
+        result = self.manager.get_cache_snapshot("manager")
+
+        with pytest.raises(TypeError):
+            result["Tommy"]["years"]["2024"] = {}  # type: ignore[index]
+
+        assert self.manager.get_manager_cache()["Tommy"]["years"] == {}
+
+    def test_raises_for_unknown_cache_name(self):
+        """Test raises ValueError for an unknown cache name."""
+        with pytest.raises(ValueError) as exc_info:
+            self.manager.get_cache_snapshot("unknown")
+
+        assert "Unknown cache name: unknown" in str(exc_info.value)
+
+
+class TestLoadAllCaches:
+    """Test CacheManager.load_all_caches method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CacheManager._load_cache`: `mock_load_cache`
+
+        Yields:
+            None
+        """
+        with patch.object(CacheManager, "_load_cache") as mock_load_cache:
+            self.mock_load_cache = mock_load_cache
+            self.mock_load_cache.return_value = {}
+            self.manager = CacheManager()
+
+            yield
+
+    def test_loads_every_cache(self):
+        """Test every cache is loaded from disk."""
+        self.manager.load_all_caches()
+
+        assert self.mock_load_cache.call_count == 11
+        assert self.manager._starters_cache == {}
+        assert self.manager._weekly_data_progress_tracker == {}
+
+    def test_keeps_loaded_caches(self):
+        """Test caches already in memory are not loaded again."""
+        self.manager._starters_cache = {"2024": {}}
+
+        self.manager.load_all_caches()
+
+        assert self.mock_load_cache.call_count == 10
+        assert self.manager._starters_cache == {"2024": {}}
+
+    def test_loads_on_several_threads(self):
+        """Test every cache is loaded once with several threads."""
+        self.manager.load_all_caches(max_workers=4)
+
+        assert self.mock_load_cache.call_count == 11
+        assert self.manager._aggregation_rollups_cache == {}
+
+
+class TestReloadChangedCaches:
+    """Test CacheManager.reload_changed_caches method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `_SERVED_CACHE_FILES`: the starters cache only, in `tmp_path`
+        - `_STARTERS_CACHE_FILE`: the same file
+        - `_MANIFEST_FILE`: a manifest in `tmp_path`
+
+        Args:
+            tmp_path: pytest tmp_path fixture
+
+        Yields:
+            None
+        """
+        self.cache_file = tmp_path / "starters_cache.json"
+        self.cache_file.write_text('{"2024": {}}')
+
+        self.manifest_file = tmp_path / "manifest.json"
+        self.manifest_file.write_text('{"version": "1"}')
+
+        with (
+            patch.dict(
+                "patriot_center_backend.cache.cache_manager"
+                "._SERVED_CACHE_FILES",
+                {"starters": str(self.cache_file)},
+                clear=True,
+            ),
+            patch(
+                "patriot_center_backend.cache.cache_manager"
+                "._STARTERS_CACHE_FILE",
+                str(self.cache_file),
+            ),
+            patch(
+                "patriot_center_backend.cache.cache_manager._MANIFEST_FILE",
+                str(self.manifest_file),
+            ),
+        ):
+            self.manager = CacheManager()
+
+            yield
+
+    def _update_file(self, content: str, version: str | None = "2") -> None:
+        """Rewrite the cache file with a later modification time.
+
+        Args:
+            content: The file's new content.
+            version: Version then published in the manifest, or None to
+                leave the manifest unchanged.
+        """
+        mtime = self.cache_file.stat().st_mtime
+        self.cache_file.write_text(content)
+        os.utime(self.cache_file, (mtime + 1, mtime + 1))
+
+        if version is not None:
+            self.manifest_file.write_text(json.dumps({"version": version}))
+
+    def test_reloads_changed_file(self):
+        """Test a changed file is swapped in and bumps the versions."""
+        old_cache = self.manager.get_starters_cache()
+
+        self._update_file('{"2025": {}}')
+
+        assert self.manager.reload_changed_caches() == ["starters"]
+        assert self.manager.get_starters_cache() == {"2025": {}}
+        assert old_cache == {"2024": {}}
+        assert self.manager.get_cache_version("starters") == 2
+        assert self.manager.get_data_version() == 1
+
+    def test_skips_unchanged_file(self):
+        """Test an unchanged file is not reloaded."""
+        self.manager.get_starters_cache()
+
+        assert self.manager.reload_changed_caches() == []
+        assert self.manager.get_data_version() == 0
+
+    def test_skips_unpublished_change(self):
+        """Test a file changed before the manifest is written is skipped."""
+        self.manager.get_starters_cache()
+
+        self._update_file('{"2025": {}}', version=None)
+
+        assert self.manager.reload_changed_caches() == []
+        assert self.manager.get_starters_cache() == {"2024": {}}
+
+    def test_records_reloaded_version(self):
+        """Test a published version is only reloaded once."""
+        self.manager.get_starters_cache()
+        assert self.manager.get_loaded_manifest_version() == "1"
+
+        self._update_file('{"2025": {}}')
+
+        assert self.manager.reload_changed_caches() == ["starters"]
+        assert self.manager.get_loaded_manifest_version() == "2"
+        assert self.manager.reload_changed_caches() == []
+
+    def test_skips_unloaded_cache(self):
+        """Test a cache never loaded is not loaded by the check."""
+        self._update_file('{"2025": {}}')
+
+        assert self.manager.reload_changed_caches() == []
+        assert self.manager._starters_cache is None
+
+    def test_skips_own_saves(self):
+        """Test a file saved by this manager is not reloaded."""
+        self.manager.get_starters_cache()
+        self.manager.save_starters_cache({"2025": {}})
+
+        assert self.manager.reload_changed_caches() == []
+
+    def test_keeps_loaded_version_of_invalid_file(self):
+        """Test a file that can't be parsed keeps the loaded version."""
+        self.manager.get_starters_cache()
+
+        self._update_file('{"2025": ')
+
+        assert self.manager.reload_changed_caches() == []
+        assert self.manager.get_starters_cache() == {"2024": {}}
+        assert self.manager.get_loaded_manifest_version() == "1"
+
+        # Completed within the same modification time
+        mtime = self.cache_file.stat().st_mtime
+        self.cache_file.write_text('{"2025": {}}')
+        os.utime(self.cache_file, (mtime, mtime))
+
+        assert self.manager.reload_changed_caches() == ["starters"]
+
+
 class TestReloadAllCaches:
     """Test CacheManager.reload_all_caches method."""
 
@@ -1072,7 +1809,7 @@ class TestSaveAllCaches:
 
         self.manager.save_all_caches()
 
-        assert self.mock_save_cache.call_count == 10
+        assert self.mock_save_cache.call_count == 11
 
     def test_saves_only_loaded_caches(self):
         """Test only saves caches that have been loaded (not None)."""
@@ -1081,7 +1818,28 @@ class TestSaveAllCaches:
 
         self.manager.save_all_caches()
 
-        assert self.mock_save_cache.call_count == 2
+        assert self.mock_save_cache.call_count == 3
+
+    def test_writes_manifest_last(self):
+        """Test the saved caches are published after they are all saved."""
+        self.manager._starters_cache = {"2024": {}}
+
+        self.manager.save_all_caches()
+
+        file_path, manifest = self.mock_save_cache.call_args.args
+        assert file_path.endswith("manifest.json")
+        assert manifest["version"] == self.manager.get_loaded_manifest_version()
+
+    def test_saves_without_publishing(self):
+        """Test no manifest is written when publishing is left for later."""
+        self.manager._starters_cache = {"2024": {}}
+
+        self.manager.save_all_caches(publish=False)
+
+        self.mock_save_cache.assert_called_once()
+        assert self.mock_save_cache.call_args.args[0].endswith(
+            "starters_cache.json"
+        )
 
     def test_skips_none_caches(self):
         """Test does not save caches that are None."""
@@ -1090,6 +1848,66 @@ class TestSaveAllCaches:
         self.mock_save_cache.assert_not_called()
 
 
+class TestManifest:
+    """Test CacheManager manifest methods."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `_MANIFEST_FILE`: a manifest in `tmp_path` (not written yet)
+
+        Args:
+            tmp_path: pytest tmp_path fixture
+
+        Yields:
+            None
+        """
+        self.manifest_file = tmp_path / "manifest.json"
+
+        with patch(
+            "patriot_center_backend.cache.cache_manager._MANIFEST_FILE",
+            str(self.manifest_file),
+        ):
+            self.manager = CacheManager()
+
+            yield
+
+    def test_write_publishes_new_version(self):
+        """Test each write publishes a new version, read back from disk."""
+        self.manager.write_manifest()
+        first_version = self.manager.get_manifest_version()
+
+        self.manager.write_manifest()
+
+        assert first_version is not None
+        assert self.manager.get_manifest_version() != first_version
+        assert (
+            self.manager.get_manifest_version()
+            == self.manager.get_loaded_manifest_version()
+        )
+
+    def test_missing_manifest(self):
+        """Test no version is read without a manifest."""
+        assert self.manager.get_manifest_version() is None
+
+    def test_unreadable_manifest(self):
+        """Test no version is read from a partially written manifest."""
+        self.manifest_file.write_text('{"version": ')
+
+        assert self.manager.get_manifest_version() is None
+
+    def test_reload_all_forgets_version(self):
+        """Test the version is read again when the caches are reloaded."""
+        self.manager.write_manifest()
+
+        self.manager.reload_all_caches()
+
+        assert self.manager.get_loaded_manifest_version() is None
+
+
 class TestGetCacheManager:
     """Test get_cache_manager singleton function."""
 
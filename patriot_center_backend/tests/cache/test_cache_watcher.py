@@ -0,0 +1,159 @@
+"""Unit tests for cache_watcher module."""
+
+import signal
+import threading
+from unittest.mock import ANY, patch
+
+import pytest
+
+from patriot_center_backend.cache.cache_watcher import CacheWatcher
+
+MODULE_PATH = "patriot_center_backend.cache.cache_watcher"
+
+
+class TestCacheWatcher:
+    """Test CacheWatcher class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.reload_changed_caches`: `mock_reload_changed`
+        - `build_all_indexes`: `mock_build_all_indexes`
+        - `threading.Thread.start`: `mock_thread_start`
+        - `threading.Thread.is_alive`: `mock_thread_is_alive`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.reload_changed_caches"
+            ) as mock_reload_changed,
+            patch(f"{MODULE_PATH}.build_all_indexes") as mock_build_all_indexes,
+            patch.object(threading.Thread, "start") as mock_thread_start,
+            patch.object(threading.Thread, "is_alive") as mock_thread_is_alive,
+        ):
+            self.mock_reload_changed = mock_reload_changed
+            self.mock_reload_changed.return_value = ["starters"]
+
+            self.mock_build_all_indexes = mock_build_all_indexes
+            self.mock_build_all_indexes.return_value = 3
+
+            self.mock_thread_start = mock_thread_start
+            self.mock_thread_is_alive = mock_thread_is_alive
+            self.mock_thread_is_alive.return_value = True
+
+            self.watcher = CacheWatcher(poll_interval=0.0)
+
+            yield
+
+    def test_start_once(self):
+        """Test the thread is started on the first call only."""
+        self.watcher.start()
+        self.watcher.start()
+
+        self.mock_thread_start.assert_called_once()
+
+    def test_restarts_dead_thread(self):
+        """Test a thread that isn't running (e.g. after a fork) is replaced."""
+        self.watcher.start()
+        self.mock_thread_is_alive.return_value = False
+
+        self.watcher.start()
+
+        assert self.mock_thread_start.call_count == 2
+
+    def test_check_reloads_changed_caches(self):
+        """Test a check reloads the changed caches."""
+        assert self.watcher.check() == ["starters"]
+
+        self.mock_reload_changed.assert_called_once()
+        self.mock_build_all_indexes.assert_called_once()
+
+    def test_check_without_changes(self):
+        """Test a check without changes rebuilds no indexes."""
+        self.mock_reload_changed.return_value = []
+
+        assert self.watcher.check() == []
+
+        self.mock_build_all_indexes.assert_not_called()
+
+
+class TestCacheWatcherReloadSignal:
+    """Test CacheWatcher started with a reload signal."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_manifest_version`: `mock_get_manifest_version`
+        - `CACHE_MANAGER.get_loaded_manifest_version`:
+            `mock_get_loaded_version`
+        - `CACHE_MANAGER.reload_changed_caches`: `mock_reload_changed`
+        - `os.kill`: `mock_kill`
+        - `threading.Thread.start`: `mock_thread_start`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_manifest_version"
+            ) as mock_get_manifest_version,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_loaded_manifest_version"
+            ) as mock_get_loaded_version,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.reload_changed_caches"
+            ) as mock_reload_changed,
+            patch(f"{MODULE_PATH}.os.kill") as mock_kill,
+            patch.object(threading.Thread, "start"),
+        ):
+            self.mock_get_manifest_version = mock_get_manifest_version
+            self.mock_get_manifest_version.return_value = "2"
+
+            self.mock_get_loaded_version = mock_get_loaded_version
+            self.mock_get_loaded_version.return_value = "1"
+
+            self.mock_reload_changed = mock_reload_changed
+            self.mock_kill = mock_kill
+
+            self.watcher = CacheWatcher(poll_interval=0.0)
+            self.watcher.start(reload_signal=signal.SIGHUP)
+
+            yield
+
+    def test_signals_new_version(self):
+        """Test a published version is signalled, not reloaded in place."""
+        assert self.watcher.check() == []
+
+        self.mock_kill.assert_called_once_with(ANY, signal.SIGHUP)
+        self.mock_reload_changed.assert_not_called()
+
+    def test_signals_each_version_once(self):
+        """Test a version is signalled once while the reload is pending."""
+        self.watcher.check()
+        self.watcher.check()
+
+        self.mock_kill.assert_called_once()
+
+    def test_skips_loaded_version(self):
+        """Test the loaded version is not signalled."""
+        self.mock_get_manifest_version.return_value = "1"
+
+        self.watcher.check()
+
+        self.mock_kill.assert_not_called()
+
+    def test_skips_missing_manifest(self):
+        """Test nothing is signalled without a manifest."""
+        self.mock_get_manifest_version.return_value = None
+
+        self.watcher.check()
+
+        self.mock_kill.assert_not_called()
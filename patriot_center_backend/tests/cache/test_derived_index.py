@@ -0,0 +1,139 @@
+"""Unit tests for derived_index module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from patriot_center_backend.cache.derived_index import (
+    build_all_indexes,
+    derived_index,
+)
+
+MODULE_PATH = "patriot_center_backend.cache.derived_index"
+
+
+class TestDerivedIndex:
+    """Test derived_index decorator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
+        - `CACHE_MANAGER.get_cache_version`: `mock_get_cache_version`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_cache_version"
+            ) as mock_get_cache_version,
+        ):
+            self.mock_get_starters_cache = mock_get_starters_cache
+            self.mock_get_starters_cache.return_value = {"2024": {}}
+
+            self.mock_get_cache_version = mock_get_cache_version
+            self.mock_get_cache_version.return_value = 1
+
+            self.builder = MagicMock(side_effect=lambda cache: list(cache))
+            self.index = derived_index("starters")(self.builder)
+
+            yield
+
+    def test_builds_from_source_cache(self):
+        """Test builder receives the source cache."""
+        result = self.index()
+
+        assert result == ["2024"]
+        self.builder.assert_called_once_with({"2024": {}})
+
+    def test_reuses_index_when_unchanged(self):
+        """Test index is built only once while sources are unchanged."""
+        self.index()
+        self.index()
+
+        self.builder.assert_called_once()
+
+    def test_rebuilds_when_version_changes(self):
+        """Test index is rebuilt when the source cache version changes."""
+        self.index()
+        self.mock_get_cache_version.return_value = 2
+        self.index()
+
+        assert self.builder.call_count == 2
+
+    def test_rebuilds_when_source_replaced(self):
+        """Test index is rebuilt when the source cache object changes."""
+        self.index()
+        self.mock_get_starters_cache.return_value = {"2025": {}}
+
+        result = self.index()
+
+        assert result == ["2025"]
+        assert self.builder.call_count == 2
+
+    def test_cache_clear_forces_rebuild(self):
+        """Test cache_clear drops the memoized index."""
+        self.index()
+        self.index.cache_clear()
+        self.index()
+
+        assert self.builder.call_count == 2
+
+
+class TestBuildAllIndexes:
+    """Test build_all_indexes function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `_INDEX_GETTERS`: an empty registry
+        - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
+        - `CACHE_MANAGER.get_cache_version`: `mock_get_cache_version`
+
+        Yields:
+            None
+        """
+        with (
+            patch(f"{MODULE_PATH}._INDEX_GETTERS", []),
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_cache_version"
+            ) as mock_get_cache_version,
+        ):
+            mock_get_starters_cache.return_value = {"2024": {}}
+            mock_get_cache_version.return_value = 1
+
+            self.builders = [MagicMock(), MagicMock()]
+            self.indexes = [
+                derived_index("starters")(builder) for builder in self.builders
+            ]
+
+            yield
+
+    def test_builds_every_index(self):
+        """Test every defined index is built once."""
+        assert build_all_indexes() == 2
+        assert build_all_indexes() == 2
+
+        for builder in self.builders:
+            builder.assert_called_once_with({"2024": {}})
+
+    def test_built_index_is_reused(self):
+        """Test indexes built ahead are reused on first use."""
+        build_all_indexes()
+
+        self.indexes[0]()
+
+        self.builders[0].assert_called_once()
@@ -0,0 +1,187 @@
+"""Unit tests for entity_index module."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from patriot_center_backend.cache.entity_index import (
+    EntityIndex,
+    get_entity_index,
+)
+
+MODULE_PATH = "patriot_center_backend.cache.entity_index"
+
+
+class TestEntityIndex:
+    """Test EntityIndex class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup an entity index for all tests.
+
+        The index is built from pre-defined caches.
+        - `NAME_TO_MANAGER_USERNAME`: mock mapping
+
+        Yields:
+            None
+        """
+        with patch(
+            f"{MODULE_PATH}.NAME_TO_MANAGER_USERNAME",
+            {"Tommy": "tommylowry"},
+        ):
+            self.mock_player_ids_cache: dict[str, Any] = {
+                "4046": {"full_name": "Patrick Mahomes", "position": "QB"},
+                "KC": {"full_name": "Kansas City Chiefs", "position": "DEF"},
+            }
+            self.mock_players_cache: dict[str, Any] = {
+                "Patrick Mahomes": {
+                    "slug": "patrick%20mahomes",
+                    "player_id": "4046",
+                },
+            }
+            self.mock_manager_cache: dict[str, Any] = {
+                "Tommy": {"summary": {"user_id": "123456789"}},
+                "Jay": {"summary": {}},
+            }
+            self.entity_index = EntityIndex(
+                self.mock_player_ids_cache,
+                self.mock_players_cache,
+                self.mock_manager_cache,
+            )
+
+            yield
+
+    def test_player_id_lookups(self):
+        """Test player IDs resolve to names and positions and back."""
+        assert self.entity_index.get_player_id("Patrick Mahomes") == "4046"
+        assert self.entity_index.get_player_name("KC") == "Kansas City Chiefs"
+        assert self.entity_index.get_player_position("4046") == "QB"
+
+    def test_unknown_player_lookups(self):
+        """Test unknown players resolve to None."""
+        assert self.entity_index.get_player_id("Unknown Player") is None
+        assert self.entity_index.get_player_name("9999") is None
+        assert self.entity_index.get_player_position("9999") is None
+
+    def test_slug_lookups(self):
+        """Test slugs resolve to names and names to slugs."""
+        entity_index = self.entity_index
+
+        assert (
+            entity_index.get_name_from_slug("patrick%20mahomes")
+            == "Patrick Mahomes"
+        )
+        assert entity_index.get_slug("Patrick Mahomes") == "patrick%20mahomes"
+        assert entity_index.get_slug("Kansas City Chiefs") is None
+
+    def test_user_id_lookups(self):
+        """Test managers resolve to their user IDs."""
+        assert self.entity_index.get_user_id("Tommy") == "123456789"
+        assert self.entity_index.get_user_id("Jay") is None
+
+    @pytest.mark.parametrize(
+        "item, expected",
+        [
+            ("Tommy", "manager"),
+            ("Tommy's 2024 Round 1 Draft Pick", "draft_pick"),
+            ("$10 FAAB", "faab"),
+            ("Patrick Mahomes", "player"),
+            ("KC", "player_id"),
+            ("Kansas City Chiefs", "unknown"),
+        ],
+    )
+    def test_item_types(self, item: str, expected: str):
+        """Test items are typed from the caches they appear in."""
+        assert self.entity_index.get_item_type(item) == expected
+
+    def test_add_player(self):
+        """Test added players are found by name and slug."""
+        self.entity_index.add_player("Josh Allen", "josh%20allen")
+
+        assert self.entity_index.get_item_type("Josh Allen") == "player"
+        assert (
+            self.entity_index.get_name_from_slug("josh%20allen")
+            == "Josh Allen"
+        )
+
+    def test_first_player_keeps_shared_slug(self):
+        """Test the first player recorded keeps a shared slug."""
+        self.entity_index.add_player("patrick mahomes", "patrick%20mahomes")
+
+        assert (
+            self.entity_index.get_name_from_slug("patrick%20mahomes")
+            == "Patrick Mahomes"
+        )
+
+    def test_add_user_id(self):
+        """Test added user IDs are found by manager."""
+        self.entity_index.add_user_id("Jay", "987654321")
+
+        assert self.entity_index.get_user_id("Jay") == "987654321"
+
+
+class TestGetEntityIndex:
+    """Test get_entity_index function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_player_ids_cache`:
+            `mock_get_player_ids_cache`
+        - `CACHE_MANAGER.get_players_cache`: `mock_get_players_cache`
+        - `CACHE_MANAGER.get_manager_cache`: `mock_get_manager_cache`
+        - `CACHE_MANAGER.get_cache_version`: `mock_get_cache_version`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER"
+                ".get_player_ids_cache"
+            ) as mock_get_player_ids_cache,
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER.get_players_cache"
+            ) as mock_get_players_cache,
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER.get_manager_cache"
+            ) as mock_get_manager_cache,
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER.get_cache_version"
+            ) as mock_get_cache_version,
+        ):
+            self.mock_get_player_ids_cache = mock_get_player_ids_cache
+            self.mock_get_player_ids_cache.return_value = {
+                "4046": {"full_name": "Patrick Mahomes", "position": "QB"},
+            }
+            mock_get_players_cache.return_value = {}
+            mock_get_manager_cache.return_value = {}
+
+            self.mock_get_cache_version = mock_get_cache_version
+            self.mock_get_cache_version.return_value = 1
+
+            get_entity_index.cache_clear()
+
+            yield
+
+            get_entity_index.cache_clear()
+
+    def test_reuses_index(self):
+        """Test the index is built once while the caches are unchanged."""
+        assert get_entity_index() is get_entity_index()
+
+    def test_rebuilt_when_source_saved(self):
+        """Test the index is rebuilt when a source cache version changes."""
+        entity_index = get_entity_index()
+
+        self.mock_get_player_ids_cache.return_value = {
+            "4046": {"full_name": "Pat Mahomes", "position": "QB"},
+        }
+        self.mock_get_cache_version.return_value = 2
+
+        assert get_entity_index() is not entity_index
+        assert get_entity_index().get_player_name("4046") == "Pat Mahomes"
@@ -0,0 +1,60 @@
+"""Unit tests for preload module."""
+
+from unittest.mock import call, patch
+
+import pytest
+
+from patriot_center_backend.cache.preload import preload_caches
+
+MODULE_PATH = "patriot_center_backend.cache.preload"
+
+
+class TestPreloadCaches:
+    """Test preload_caches function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER`: `mock_cache_manager`
+        - `build_all_indexes`: `mock_build_all_indexes`
+        - `gc`: `mock_gc`
+
+        Yields:
+            None
+        """
+        with (
+            patch(f"{MODULE_PATH}.CACHE_MANAGER") as mock_cache_manager,
+            patch(f"{MODULE_PATH}.build_all_indexes") as mock_build_all_indexes,
+            patch(f"{MODULE_PATH}.gc") as mock_gc,
+        ):
+            self.mock_cache_manager = mock_cache_manager
+            self.mock_build_all_indexes = mock_build_all_indexes
+            self.mock_gc = mock_gc
+
+            yield
+
+    def test_loads_and_freezes_caches(self):
+        """Test every cache and index is built, then frozen."""
+        preload_caches()
+
+        self.mock_cache_manager.load_all_caches.assert_called_once()
+        self.mock_build_all_indexes.assert_called_once()
+        self.mock_cache_manager.reload_all_caches.assert_not_called()
+        assert self.mock_gc.mock_calls[:4] == [
+            call.unfreeze(),
+            call.collect(),
+            call.freeze(),
+            call.get_freeze_count(),
+        ]
+
+    def test_reload(self):
+        """Test the caches are reloaded from disk before loading."""
+        preload_caches(reload=True)
+
+        assert self.mock_cache_manager.mock_calls[:2] == [
+            call.reload_all_caches(),
+            call.load_all_caches(),
+        ]
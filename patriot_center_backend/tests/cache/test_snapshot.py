@@ -0,0 +1,67 @@
+"""Unit tests for snapshot module."""
+
+import pytest
+
+from patriot_center_backend.cache.snapshot import (
+    ReadOnlyDict,
+    ReadOnlyList,
+    read_only,
+)
+
+
+class TestReadOnlyDict:
+    """Test ReadOnlyDict view."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a wrapped cache for all tests.
+
+        Yields:
+            None
+        """
+        self.cache = {
+            "Tommy": {
+                "summary": {"wins": 10},
+                "years": ["2023", "2024"],
+            },
+        }
+        self.view = ReadOnlyDict(self.cache)
+
+        yield
+
+    def test_reads_nested_values(self):
+        """Test nested values are readable through the view."""
+        assert self.view["Tommy"]["summary"]["wins"] == 10
+        assert self.view.get("Tommy").get("years")[1] == "2024"
+
+    def test_wraps_nested_containers(self):
+        """Test nested dicts and lists are wrapped as views."""
+        assert isinstance(self.view["Tommy"], ReadOnlyDict)
+        assert isinstance(self.view["Tommy"]["years"], ReadOnlyList)
+
+    def test_rejects_item_assignment(self):
+        """Test views cannot be modified."""
+        with pytest.raises(TypeError):
+            self.view["Tommy"]["summary"]["wins"] = 0  # type: ignore[index]
+
+        assert self.cache["Tommy"]["summary"]["wins"] == 10
+
+    def test_reflects_underlying_cache(self):
+        """Test the view reads through to the cache without copying."""
+        self.cache["Tommy"]["summary"]["wins"] = 11
+
+        assert self.view["Tommy"]["summary"]["wins"] == 11
+
+    def test_compares_equal_to_dict(self):
+        """Test views compare equal to the data they wrap."""
+        assert self.view == self.cache
+        assert self.view["Tommy"]["years"] == ["2023", "2024"]
+
+    def test_get_returns_default(self):
+        """Test get returns the default for missing keys."""
+        assert self.view.get("Benz", {}) == {}
+        assert "Benz" not in self.view
+
+    def test_read_only_passes_through_scalars(self):
+        """Test non-container values are returned as-is."""
+        assert read_only("Tommy") == "Tommy"
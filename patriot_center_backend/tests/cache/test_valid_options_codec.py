@@ -0,0 +1,84 @@
+"""Unit tests for valid_options_codec module."""
+
+import json
+
+import pytest
+
+from patriot_center_backend.cache.valid_options_codec import (
+    compact_valid_options,
+    expand_valid_options,
+)
+
+
+class TestCompactValidOptions:
+    """Test compact_valid_options and expand_valid_options functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a valid options cache for all tests.
+
+        Yields:
+            None
+        """
+        self.valid_options_cache = {
+            "2024": {
+                "managers": ["Tommy", "Anthony"],
+                "players": ["Josh Allen", "Rico Dowdle"],
+                "weeks": ["1"],
+                "positions": ["QB", "RB"],
+                "1": {
+                    "managers": ["Tommy", "Anthony"],
+                    "players": ["Josh Allen", "Rico Dowdle"],
+                    "positions": ["QB", "RB"],
+                    "Tommy": {"players": ["Josh Allen"], "positions": ["QB"]},
+                    "Anthony": {
+                        "players": ["Rico Dowdle"],
+                        "positions": ["RB"],
+                    },
+                },
+            },
+        }
+
+        yield
+
+    def test_stores_each_name_once(self):
+        """Test every name is stored once and lists hold their IDs."""
+        result = compact_valid_options(self.valid_options_cache)
+
+        assert result["names"] == [
+            "Tommy",
+            "Anthony",
+            "Josh Allen",
+            "Rico Dowdle",
+            "1",
+            "QB",
+            "RB",
+        ]
+        assert result["valid_options"]["2024"]["1"]["Anthony"] == {
+            "players": [3],
+            "positions": [6],
+        }
+
+    def test_round_trips_through_json(self):
+        """Test the compact form expands back to the same cache."""
+        data = json.loads(
+            json.dumps(compact_valid_options(self.valid_options_cache))
+        )
+
+        result = expand_valid_options(data)
+
+        assert result == self.valid_options_cache
+        assert list(result["2024"]) == list(self.valid_options_cache["2024"])
+
+    def test_expand_passes_through_original_form(self):
+        """Test caches saved in the original form are returned unchanged."""
+        result = expand_valid_options(self.valid_options_cache)
+
+        assert result is self.valid_options_cache
+
+    def test_empty_cache(self):
+        """Test an empty cache round trips."""
+        data = compact_valid_options({})
+
+        assert data == {"names": [], "valid_options": {}}
+        assert expand_valid_options(data) == {}
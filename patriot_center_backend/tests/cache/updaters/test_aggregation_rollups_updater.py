@@ -0,0 +1,136 @@
+"""Unit tests for aggregation_rollups_updater module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from patriot_center_backend.cache.updaters.aggregation_rollups_updater import (
+    update_aggregation_rollups_cache,
+)
+
+MODULE_PATH = (
+    "patriot_center_backend.cache.updaters.aggregation_rollups_updater"
+)
+
+
+class TestUpdateAggregationRollupsCache:
+    """Test update_aggregation_rollups_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
+        - `CACHE_MANAGER.save_aggregation_rollups_cache`:
+            `mock_save_rollups`
+        - `CACHE_MANAGER.write_manifest`: `mock_write_manifest`
+        - `get_ffwar_from_cache`: `mock_get_ffwar`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.save_aggregation_rollups_cache"
+            ) as mock_save_rollups,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.write_manifest"
+            ) as mock_write_manifest,
+            patch(f"{MODULE_PATH}.get_ffwar_from_cache") as mock_get_ffwar,
+        ):
+            self.mock_starters_cache = {
+                "2023": {
+                    "1": {
+                        "Tommy": {
+                            "Total_Points": 30.2,
+                            "Jayden Daniels": {
+                                "points": 20.1,
+                                "position": "QB",
+                                "player_id": "11566",
+                            },
+                        },
+                    },
+                    "2": {
+                        "Tommy": {
+                            "Total_Points": 25.5,
+                            "Jayden Daniels": {
+                                "points": 10.2,
+                                "position": "QB",
+                                "player_id": "11566",
+                                "placement": 1,
+                            },
+                        },
+                    },
+                },
+            }
+            mock_get_starters_cache.return_value = self.mock_starters_cache
+
+            self.mock_save_rollups = mock_save_rollups
+            self.mock_write_manifest = mock_write_manifest
+
+            self.mock_get_ffwar = mock_get_ffwar
+            self.mock_get_ffwar.return_value = 0.1235
+
+            yield
+
+    def _saved_rollups(self):
+        """Return the rollups passed to the save call."""
+        self.mock_save_rollups.assert_called_once()
+        return self.mock_save_rollups.call_args.args[0]
+
+    def test_sums_player_appearances(self):
+        """Test totals are summed across weeks, unrounded."""
+        update_aggregation_rollups_cache()
+
+        rollup = self._saved_rollups()["2023"]["Tommy"]["Jayden Daniels"]
+        assert rollup["total_points"] == 20.1 + 10.2
+        assert rollup["num_games_started"] == 2
+        assert rollup["ffWAR"] == 0.1235 + 0.1235
+        assert rollup["position"] == "QB"
+        assert rollup["player_id"] == "11566"
+
+    def test_records_placement(self):
+        """Test playoff placement is carried onto the rollup."""
+        update_aggregation_rollups_cache()
+
+        rollup = self._saved_rollups()["2023"]["Tommy"]["Jayden Daniels"]
+        assert rollup["placement"] == 1
+
+    def test_skips_total_points(self):
+        """Test manager Total_Points entries are not rolled up as players."""
+        update_aggregation_rollups_cache()
+
+        assert "Total_Points" not in self._saved_rollups()["2023"]["Tommy"]
+
+    def test_looks_up_ffwar_by_id(self):
+        """Test ffWAR is looked up per appearance by player ID."""
+        update_aggregation_rollups_cache()
+
+        self.mock_get_ffwar.assert_any_call("11566", season="2023", week="1")
+        self.mock_get_ffwar.assert_any_call("11566", season="2023", week="2")
+
+    def test_skips_non_dict_seasons(self):
+        """Test metadata sentinel fields are skipped."""
+        self.mock_starters_cache["Last_Updated_Season"] = "2023"
+
+        update_aggregation_rollups_cache()
+
+        assert set(self._saved_rollups()) == {"2023"}
+
+    def test_publishes_after_saving(self):
+        """Test the manifest is written after the rollups are saved."""
+        calls = Mock()
+        calls.attach_mock(self.mock_save_rollups, "save_rollups")
+        calls.attach_mock(self.mock_write_manifest, "write_manifest")
+
+        update_aggregation_rollups_cache()
+
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "save_rollups",
+            "write_manifest",
+        ]
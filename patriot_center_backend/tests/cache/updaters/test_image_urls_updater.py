@@ -1,10 +1,13 @@
 """Unit tests for image_urls_updater module."""
 
-from unittest.mock import patch
+import threading
+from unittest.mock import ANY, patch
 
 import pytest
 
 from patriot_center_backend.cache.updaters.image_urls_updater import (
+    ImageUrlRefresher,
+    update_image_urls,
     update_image_urls_cache,
 )
 
@@ -20,8 +23,7 @@ class TestUpdateImageUrlsCache:
         set of values when accessed.
         - `detect_item_type`: `mock_detect_item_type`
         - `build_url`: `mock_build_url`
-        - `CACHE_MANAGER.get_image_urls_cache`: `mock_get_image_urls_cache`
-        - `CACHE_MANAGER.save_image_urls_cache`: `mock_save_image_urls_cache`
+        - `CACHE_MANAGER.update_cache`: `mock_update_cache`
 
         Yields:
             None
@@ -37,18 +39,12 @@ class TestUpdateImageUrlsCache:
             ) as mock_build_url,
             patch(
                 "patriot_center_backend.cache.updaters.image_urls_updater"
-                ".CACHE_MANAGER.get_image_urls_cache"
-            ) as mock_get_image_urls_cache,
-            patch(
-                "patriot_center_backend.cache.updaters.image_urls_updater"
-                ".CACHE_MANAGER.save_image_urls_cache"
-            ) as mock_save_image_urls_cache,
+                ".CACHE_MANAGER.update_cache"
+            ) as mock_update_cache,
         ):
             self.mock_detect_item_type = mock_detect_item_type
             self.mock_build_url = mock_build_url
-            self.mock_image_urls_cache = {}
-            mock_get_image_urls_cache.return_value = self.mock_image_urls_cache
-            self.mock_save_image_urls_cache = mock_save_image_urls_cache
+            self.mock_update_cache = mock_update_cache
 
             yield
 
@@ -62,10 +58,18 @@ class TestUpdateImageUrlsCache:
 
         update_image_urls_cache("Patrick Mahomes")
 
-        assert self.mock_image_urls_cache["Patrick Mahomes"] == {
-            "name": "Patrick Mahomes",
-            "image_url": "https://sleepercdn.com/content/nfl/players/4046.jpg",
-        }
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls",
+            {
+                "Patrick Mahomes": {
+                    "name": "Patrick Mahomes",
+                    "image_url": (
+                        "https://sleepercdn.com/content/nfl/players/4046.jpg"
+                    ),
+                }
+            },
+            save=False,
+        )
 
     def test_saves_cache_for_manager_type(self):
         """Test saves image URLs cache when item type is manager."""
@@ -77,7 +81,9 @@ class TestUpdateImageUrlsCache:
 
         update_image_urls_cache("Tommy")
 
-        self.mock_save_image_urls_cache.assert_called_once()
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls", {"Tommy": ANY}, save=True
+        )
 
     def test_does_not_save_cache_for_non_manager_type(self):
         """Test does not save image URLs cache for non-manager types."""
@@ -86,7 +92,9 @@ class TestUpdateImageUrlsCache:
 
         update_image_urls_cache("Patrick Mahomes")
 
-        self.mock_save_image_urls_cache.assert_not_called()
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls", ANY, save=False
+        )
 
     def test_returns_url_dict(self):
         """Test returns the URL dict from build_url."""
@@ -106,3 +114,174 @@ class TestUpdateImageUrlsCache:
         update_image_urls_cache("$10 FAAB")
 
         self.mock_build_url.assert_called_once_with("$10 FAAB", "faab")
+
+
+class TestUpdateImageUrls:
+    """Test update_image_urls function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `build_url`: `mock_build_url`
+        - `CACHE_MANAGER.update_cache`: `mock_update_cache`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".build_url"
+            ) as mock_build_url,
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".CACHE_MANAGER.update_cache"
+            ) as mock_update_cache,
+        ):
+            self.mock_build_url = mock_build_url
+            self.mock_build_url.side_effect = lambda item, item_type: {
+                "name": item,
+                "image_url": f"https://example.com/{item_type}.png",
+            }
+            self.mock_update_cache = mock_update_cache
+
+            yield
+
+    def test_stores_every_item(self):
+        """Test stores and returns the URL dict of every item."""
+        result = update_image_urls({"Josh Allen": "player", "$10 FAAB": "faab"})
+
+        assert result == {
+            "Josh Allen": {
+                "name": "Josh Allen",
+                "image_url": "https://example.com/player.png",
+            },
+            "$10 FAAB": {
+                "name": "$10 FAAB",
+                "image_url": "https://example.com/faab.png",
+            },
+        }
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls", result, save=False
+        )
+
+    def test_saves_once_for_managers(self):
+        """Test saves the cache once when any item is a manager."""
+        update_image_urls({"Tommy": "manager", "Anthony": "manager"})
+
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls", ANY, save=True
+        )
+
+
+class TestImageUrlRefresher:
+    """Test ImageUrlRefresher class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `detect_item_type`: `mock_detect_item_type`
+        - `build_url`: `mock_build_url`
+        - `CACHE_MANAGER.update_cache`: `mock_update_cache`
+        - `threading.Thread.start`: `mock_thread_start`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".detect_item_type"
+            ) as mock_detect_item_type,
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".build_url"
+            ) as mock_build_url,
+            patch(
+                "patriot_center_backend.cache.updaters.image_urls_updater"
+                ".CACHE_MANAGER.update_cache"
+            ) as mock_update_cache,
+            patch.object(threading.Thread, "start") as mock_thread_start,
+        ):
+            mock_detect_item_type.return_value = "manager"
+
+            self.mock_build_url = mock_build_url
+            self.mock_build_url.side_effect = lambda item, _: {
+                "name": item,
+                "image_url": f"https://sleepercdn.com/avatars/{item}",
+                "timestamp": 1.0,
+            }
+
+            self.mock_update_cache = mock_update_cache
+            self.mock_thread_start = mock_thread_start
+
+            self.refresher = ImageUrlRefresher(batch_delay=0.0)
+
+            yield
+
+    def test_queue_starts_worker_once(self):
+        """Test the worker is started on the first queued item only."""
+        self.refresher.queue("Tommy")
+        self.refresher.queue("Anthony")
+
+        self.mock_thread_start.assert_called_once()
+
+    def test_refreshes_batch_and_saves_once(self):
+        """Test every queued item is refreshed and the cache saved once."""
+        self.refresher.queue("Tommy")
+        self.refresher.queue("Anthony")
+        self.refresher.queue("Tommy")
+
+        self.refresher.refresh_pending()
+
+        assert self.mock_build_url.call_count == 2
+        self.mock_update_cache.assert_called_once_with(
+            "image_urls",
+            {
+                "Tommy": {
+                    "name": "Tommy",
+                    "image_url": "https://sleepercdn.com/avatars/Tommy",
+                    "timestamp": 1.0,
+                },
+                "Anthony": {
+                    "name": "Anthony",
+                    "image_url": "https://sleepercdn.com/avatars/Anthony",
+                    "timestamp": 1.0,
+                },
+            },
+            save=True,
+        )
+
+    def test_clears_refreshed_items(self):
+        """Test refreshed items are no longer pending."""
+        self.refresher.queue("Tommy")
+
+        self.refresher.refresh_pending()
+        self.refresher.refresh_pending()
+
+        self.mock_build_url.assert_called_once()
+
+    def test_keeps_stale_entry_when_refresh_fails(self):
+        """Test a failed refresh keeps serving the stale entry."""
+        self.mock_build_url.side_effect = ConnectionAbortedError("down")
+
+        self.refresher.queue("Tommy")
+        self.refresher.refresh_pending()
+
+        self.mock_update_cache.assert_not_called()
+
+    def test_keeps_stale_entry_when_no_url_built(self):
+        """Test an empty build result keeps serving the stale entry."""
+        self.mock_build_url.side_effect = None
+        self.mock_build_url.return_value = {}
+
+        self.refresher.queue("Tommy")
+        self.refresher.refresh_pending()
+
+        self.mock_update_cache.assert_not_called()
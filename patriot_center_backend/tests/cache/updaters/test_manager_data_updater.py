@@ -367,6 +367,7 @@ class TestUpdateUserId:
         - `update_image_urls_cache`:
             `mock_update_image_urls_cache`
         - `NAME_TO_MANAGER_USERNAME`: mock mapping
+        - `get_entity_index`: `mock_get_entity_index`
 
         Yields:
             None
@@ -387,7 +388,12 @@ class TestUpdateUserId:
             ),
             patch(f"{MODULE_PATH}.TransactionProcessor"),
             patch(f"{MODULE_PATH}.MatchupProcessor"),
+            patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index,
         ):
+            self.mock_add_user_id = (
+                mock_get_entity_index.return_value.add_user_id
+            )
+
             self.mock_manager_cache: dict[str, Any] = {
                 "Tommy": {"summary": {}},
             }
@@ -412,6 +418,7 @@ class TestUpdateUserId:
             self.mock_manager_cache["Tommy"]["summary"]["user_id"]
             == "123456789"
         )
+        self.mock_add_user_id.assert_called_once_with("Tommy", "123456789")
 
     def test_calls_update_image_urls_cache(self):
         """Test calls update_image_urls_cache for manager."""
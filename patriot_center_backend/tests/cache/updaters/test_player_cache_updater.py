@@ -23,6 +23,7 @@ class TestUpdatePlayersCache:
         - `CACHE_MANAGER.get_player_ids_cache`: `mock_get_player_ids_cache`
         - `CACHE_MANAGER.get_players_cache`: `mock_get_players_cache`
         - `update_image_urls_cache`: `mock_update_image_urls_cache`
+        - `get_entity_index`: `mock_get_entity_index`
 
         Yields:
             None
@@ -40,6 +41,10 @@ class TestUpdatePlayersCache:
                 "patriot_center_backend.cache.updaters.player_cache_updater"
                 ".update_image_urls_cache"
             ) as mock_update_image_urls_cache,
+            patch(
+                "patriot_center_backend.cache.updaters.player_cache_updater"
+                ".get_entity_index"
+            ) as mock_get_entity_index,
         ):
             self.mock_player_ids_cache = {}
             self.mock_players_cache = {}
@@ -48,6 +53,7 @@ class TestUpdatePlayersCache:
             mock_get_players_cache.return_value = self.mock_players_cache
 
             self.mock_update_image_urls_cache = mock_update_image_urls_cache
+            self.mock_add_player = mock_get_entity_index.return_value.add_player
 
             yield
 
@@ -75,6 +81,10 @@ class TestUpdatePlayersCache:
         assert player_check["position"] == "QB"
         assert player_check["slug"] == "patrick%20mahomes"
 
+        self.mock_add_player.assert_called_once_with(
+            "Patrick Mahomes", "patrick%20mahomes"
+        )
+
     def test_update_with_apostrophe_in_name(self):
         """Updates player cache with player_id of player with apostrophe."""
         self.mock_player_ids_cache.update(
@@ -130,6 +140,7 @@ class TestUpdatePlayersCache:
 
         # Cache should remain unchanged
         assert self.mock_players_cache == original_cache
+        self.mock_add_player.assert_not_called()
 
     def test_player_not_in_player_ids(self, caplog: pytest.LogCaptureFixture):
         """Test update_players_cache gives warning when not in player_ids.
@@ -21,6 +21,7 @@ class TestUpdateStartersCache:
         - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
         - `get_player_name`: `mock_get_player_name`
         - `get_player_position`: `mock_get_player_position`
+        - `add_to_manager_index`: `mock_add_to_manager_index`
 
         Yields:
             None
@@ -38,12 +39,17 @@ class TestUpdateStartersCache:
                 "patriot_center_backend.cache.updaters.starters_updater"
                 ".get_player_position"
             ) as mock_get_player_position,
+            patch(
+                "patriot_center_backend.cache.updaters.starters_updater"
+                ".add_to_manager_index"
+            ) as mock_add_to_manager_index,
         ):
             self.mock_starters_cache: dict = {}
             mock_get_starters_cache.return_value = self.mock_starters_cache
 
             self.mock_get_player_name = mock_get_player_name
             self.mock_get_player_position = mock_get_player_position
+            self.mock_add_to_manager_index = mock_add_to_manager_index
 
             # Default return values for valid player
             self.mock_get_player_name.return_value = "Jayden Daniels"
@@ -62,6 +68,15 @@ class TestUpdateStartersCache:
             "Jayden Daniels" in (self.mock_starters_cache["2024"]["1"]["Tommy"])
         )
 
+    def test_indexes_new_manager_week(self):
+        """Records a new manager week in the manager index once."""
+        update_starters_cache(2024, 1, "Tommy", "12345", 25.5)
+        update_starters_cache(2024, 1, "Tommy", "67890", 10.0)
+
+        self.mock_add_to_manager_index.assert_called_once_with(
+            "Tommy", "2024", "1"
+        )
+
     def test_adds_player_to_existing_manager(self):
         """Adds player to existing manager data."""
         self.mock_starters_cache["2024"] = {
@@ -6,6 +6,8 @@ import pytest
 
 from patriot_center_backend.cache.updaters.valid_options_updater import (
     _update_list,
+    build_valid_options_cache,
+    rebuild_valid_options_cache,
     update_valid_options_cache,
 )
 
@@ -23,6 +25,7 @@ class TestUpdateValidOptionsCache:
             `mock_get_valid_options_cache`
         - `get_player_name`: `mock_get_player_name`
         - `get_player_position`: `mock_get_player_position`
+        - `add_to_bitmap_index`: `mock_add_to_bitmap_index`
 
         Yields:
             None
@@ -40,6 +43,10 @@ class TestUpdateValidOptionsCache:
                 "patriot_center_backend.cache.updaters.valid_options_updater"
                 ".get_player_position"
             ) as mock_get_player_position,
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".add_to_bitmap_index"
+            ) as mock_add_to_bitmap_index,
         ):
             self.mock_valid_options_cache: dict = {}
             mock_get_valid_options_cache.return_value = (
@@ -48,6 +55,7 @@ class TestUpdateValidOptionsCache:
 
             self.mock_get_player_name = mock_get_player_name
             self.mock_get_player_position = mock_get_player_position
+            self.mock_add_to_bitmap_index = mock_add_to_bitmap_index
 
             # Default return values for valid player
             self.mock_get_player_name.return_value = "Jayden Daniels"
@@ -159,6 +167,14 @@ class TestUpdateValidOptionsCache:
         assert "Jayden Daniels" in manager_data["players"]
         assert "Patrick Mahomes" in manager_data["players"]
 
+    def test_syncs_bitmap_index(self):
+        """Records the starter in the bitmap index."""
+        update_valid_options_cache(2024, 1, "Tommy", "12345")
+
+        self.mock_add_to_bitmap_index.assert_called_once_with(
+            "2024", "1", "Tommy", "Jayden Daniels", "QB"
+        )
+
     def test_returns_early_when_player_name_not_found(
         self, caplog: pytest.LogCaptureFixture
     ):
@@ -176,6 +192,7 @@ class TestUpdateValidOptionsCache:
             in caplog.text
         )
         assert self.mock_valid_options_cache == {}
+        self.mock_add_to_bitmap_index.assert_not_called()
 
     def test_returns_early_when_position_not_found(
         self, caplog: pytest.LogCaptureFixture
@@ -299,3 +316,183 @@ class TestUpdateList:
         _update_list(test_list, "first_value")
 
         assert test_list == ["first_value"]
+
+
+class TestBuildValidOptionsCache:
+    """Test build_valid_options_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a starters cache for all tests.
+
+        Yields:
+            None
+        """
+        self.mock_starters_cache = {
+            "2024": {
+                "1": {
+                    "Tommy": {
+                        "Total_Points": 40.0,
+                        "Josh Allen": {"points": 25.0, "position": "QB"},
+                        "James Cook": {"points": 15.0, "position": "RB"},
+                    },
+                    "Anthony": {
+                        "Total_Points": 20.0,
+                        "Rico Dowdle": {"points": 20.0, "position": "RB"},
+                    },
+                },
+                "2": {
+                    "Tommy": {
+                        "Total_Points": 30.0,
+                        "Josh Allen": {"points": 30.0, "position": "QB"},
+                    },
+                },
+            },
+        }
+
+        yield
+
+    def test_builds_all_levels(self):
+        """Builds year, week and manager levels in first-seen order."""
+        result = build_valid_options_cache(self.mock_starters_cache)
+
+        assert result["2024"]["managers"] == ["Tommy", "Anthony"]
+        assert result["2024"]["players"] == [
+            "Josh Allen",
+            "James Cook",
+            "Rico Dowdle",
+        ]
+        assert result["2024"]["weeks"] == ["1", "2"]
+        assert result["2024"]["positions"] == ["QB", "RB"]
+        assert result["2024"]["1"]["managers"] == ["Tommy", "Anthony"]
+        assert result["2024"]["1"]["positions"] == ["QB", "RB"]
+        assert result["2024"]["1"]["Anthony"] == {
+            "players": ["Rico Dowdle"],
+            "positions": ["RB"],
+        }
+        assert result["2024"]["2"] == {
+            "managers": ["Tommy"],
+            "players": ["Josh Allen"],
+            "positions": ["QB"],
+            "Tommy": {"players": ["Josh Allen"], "positions": ["QB"]},
+        }
+
+    def test_matches_incremental_updates(self):
+        """Matches updating the cache one starter at a time."""
+        incremental: dict = {}
+        with (
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".CACHE_MANAGER.get_valid_options_cache",
+                return_value=incremental,
+            ),
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".get_player_name",
+                side_effect=lambda player: player,
+            ),
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".get_player_position",
+            ) as mock_get_player_position,
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".add_to_bitmap_index"
+            ),
+        ):
+            for year, weeks in self.mock_starters_cache.items():
+                for week, managers in weeks.items():
+                    for manager, manager_data in managers.items():
+                        for player, player_data in manager_data.items():
+                            if player == "Total_Points":
+                                continue
+                            mock_get_player_position.return_value = (
+                                player_data["position"]
+                            )
+                            update_valid_options_cache(
+                                int(year), int(week), manager, player
+                            )
+
+        result = build_valid_options_cache(self.mock_starters_cache)
+
+        assert result == incremental
+
+    def test_skips_managers_without_starters(self):
+        """Skips managers whose week only holds their total points."""
+        self.mock_starters_cache["2024"]["2"]["Owen"] = {"Total_Points": 0.0}
+
+        result = build_valid_options_cache(self.mock_starters_cache)
+
+        assert "Owen" not in result["2024"]["managers"]
+        assert "Owen" not in result["2024"]["2"]
+
+    def test_empty_starters_cache(self):
+        """Returns an empty cache for an empty starters cache."""
+        assert build_valid_options_cache({}) == {}
+
+
+class TestRebuildValidOptionsCache:
+    """Test rebuild_valid_options_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined set of values when
+        accessed.
+        - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
+        - `CACHE_MANAGER.save_valid_options_cache`:
+            `mock_save_valid_options_cache`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".CACHE_MANAGER.get_starters_cache"
+            ) as mock_get_starters_cache,
+            patch(
+                "patriot_center_backend.cache.updaters.valid_options_updater"
+                ".CACHE_MANAGER.save_valid_options_cache"
+            ) as mock_save_valid_options_cache,
+        ):
+            self.mock_get_starters_cache = mock_get_starters_cache
+            self.mock_get_starters_cache.return_value = {
+                "2024": {
+                    "1": {
+                        "Tommy": {
+                            "Total_Points": 25.0,
+                            "Josh Allen": {"points": 25.0, "position": "QB"},
+                        },
+                    },
+                },
+            }
+
+            self.mock_save_valid_options_cache = mock_save_valid_options_cache
+
+            yield
+
+    def test_saves_rebuilt_cache(self):
+        """Saves the cache built from the starters cache."""
+        rebuild_valid_options_cache()
+
+        self.mock_save_valid_options_cache.assert_called_once_with(
+            {
+                "2024": {
+                    "managers": ["Tommy"],
+                    "players": ["Josh Allen"],
+                    "weeks": ["1"],
+                    "positions": ["QB"],
+                    "1": {
+                        "managers": ["Tommy"],
+                        "players": ["Josh Allen"],
+                        "positions": ["QB"],
+                        "Tommy": {
+                            "players": ["Josh Allen"],
+                            "positions": ["QB"],
+                        },
+                    },
+                },
+            }
+        )
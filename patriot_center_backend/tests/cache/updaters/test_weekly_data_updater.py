@@ -26,6 +26,8 @@ class TestUpdateWeeklyDataCaches:
         - `log_cache_update`: `mock_log_cache_update`
         - `set_last_updated`: `mock_set_last_updated`
         - `CACHE_MANAGER.save_all_caches`: `mock_save_all_caches`
+        - `update_aggregation_rollups_cache`: `mock_update_rollups`
+        - `rebuild_valid_options_cache`: `mock_rebuild_valid_options`
         - `LEAGUE_IDS`: mock league IDs
 
         Yields:
@@ -64,6 +66,14 @@ class TestUpdateWeeklyDataCaches:
                 "patriot_center_backend.cache.updaters.weekly_data_updater"
                 ".CACHE_MANAGER.save_all_caches"
             ) as mock_save_all_caches,
+            patch(
+                "patriot_center_backend.cache.updaters.weekly_data_updater"
+                ".update_aggregation_rollups_cache"
+            ) as mock_update_rollups,
+            patch(
+                "patriot_center_backend.cache.updaters.weekly_data_updater"
+                ".rebuild_valid_options_cache"
+            ) as mock_rebuild_valid_options,
             patch(
                 "patriot_center_backend.cache.updaters.weekly_data_updater"
                 ".LEAGUE_IDS",
@@ -89,6 +99,8 @@ class TestUpdateWeeklyDataCaches:
             self.mock_log_cache_update = mock_log_cache_update
             self.mock_set_last_updated = mock_set_last_updated
             self.mock_save_all_caches = mock_save_all_caches
+            self.mock_update_rollups = mock_update_rollups
+            self.mock_rebuild_valid_options = mock_rebuild_valid_options
 
             yield
 
@@ -151,7 +163,23 @@ class TestUpdateWeeklyDataCaches:
         """Test saves all caches after processing."""
         update_weekly_data_caches()
 
-        self.mock_save_all_caches.assert_called_once()
+        self.mock_save_all_caches.assert_called_once_with(publish=False)
+
+    def test_rebuilds_rollups_at_end(self):
+        """Test rebuilds aggregation rollups even when no weeks changed."""
+        self.mock_get_league_status.return_value = ([], False)
+
+        update_weekly_data_caches()
+
+        self.mock_update_rollups.assert_called_once()
+
+    def test_rebuilds_valid_options_at_end(self):
+        """Test rebuilds valid options even when no weeks changed."""
+        self.mock_get_league_status.return_value = ([], False)
+
+        update_weekly_data_caches()
+
+        self.mock_rebuild_valid_options.assert_called_once()
 
     def test_does_not_assign_placements_on_non_last_week(self):
         """Test does not assign placements on non-last week even if complete."""
@@ -0,0 +1,213 @@
+"""Unit tests for bitmap_index module."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    BitmapIndex,
+    add_to_bitmap_index,
+    get_bitmap_index,
+)
+
+
+class TestBitmapIndex:
+    """Test BitmapIndex class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a bitmap index for all tests.
+
+        The index is built from a pre-defined valid options cache.
+
+        Yields:
+            None
+        """
+        self.mock_valid_options_cache: dict[str, Any] = {
+            "2024": {
+                "weeks": ["1", "2"],
+                "1": {
+                    "managers": ["Tommy"],
+                    "positions": ["QB"],
+                    "players": ["Josh Allen"],
+                    "Tommy": {"positions": ["QB"], "players": ["Josh Allen"]},
+                },
+                "2": {
+                    "managers": ["Tommy", "Anthony"],
+                    "positions": ["QB", "RB"],
+                    "players": ["Josh Allen", "Rico Dowdle"],
+                    "Tommy": {"positions": ["RB"], "players": ["Rico Dowdle"]},
+                    "Anthony": {
+                        "positions": ["QB"],
+                        "players": ["Josh Allen"],
+                    },
+                },
+            },
+            "2023": {
+                "weeks": ["1", "3"],
+                "1": {
+                    "managers": ["Anthony"],
+                    "positions": ["RB"],
+                    "players": ["Rico Dowdle"],
+                    "Anthony": {
+                        "positions": ["RB"],
+                        "players": ["Rico Dowdle"],
+                    },
+                },
+                "3": {
+                    "managers": ["Tommy"],
+                    "positions": ["QB"],
+                    "players": ["Josh Allen"],
+                    "Tommy": {"positions": ["QB"], "players": ["Josh Allen"]},
+                },
+            },
+        }
+        self.bitmap_index = BitmapIndex(self.mock_valid_options_cache)
+
+        yield
+
+    def test_get_years_in_cache_order(self):
+        """Test years are listed in cache order."""
+        assert self.bitmap_index.get_years() == ["2024", "2023"]
+
+    def test_filter_mask_without_manager(self):
+        """Test position and player filters match any manager."""
+        bitmap_index = self.bitmap_index
+
+        mask = bitmap_index.get_filter_mask(None, "RB", None)
+
+        assert bitmap_index.decode_years(mask) == {"2024", "2023"}
+        assert bitmap_index.decode_weeks(mask) == {"1", "2"}
+
+    def test_filter_mask_with_manager(self):
+        """Test position and player filters are scoped to the manager."""
+        bitmap_index = self.bitmap_index
+
+        mask = bitmap_index.get_filter_mask("Tommy", "QB", "Josh Allen")
+
+        assert bitmap_index.decode_years(mask) == {"2024", "2023"}
+        assert bitmap_index.decode_weeks(mask) == {"1", "3"}
+        assert bitmap_index.get_filter_mask("Tommy", "QB", "Rico Dowdle") == 0
+
+    def test_unknown_values_match_nothing(self):
+        """Test unknown filter values produce an empty mask."""
+        assert self.bitmap_index.get_filter_mask("Benz", None, None) == 0
+        assert self.bitmap_index.get_filter_mask(None, "K", None) == 0
+
+    def test_year_mask(self):
+        """Test a year's mask covers only that year's weeks."""
+        bitmap_index = self.bitmap_index
+
+        mask = bitmap_index.get_year_mask("2023")
+
+        assert bitmap_index.decode_years(mask) == {"2023"}
+        assert bitmap_index.decode_weeks(mask) == {"1", "3"}
+
+    def test_scope_reuses_first_year_weeks(self):
+        """Test later years are scanned with the first year's weeks."""
+        bitmap_index = self.bitmap_index
+
+        scope = bitmap_index.get_scope_mask(["2024", "2023"], [])
+
+        # 2023 week 3 is not among 2024's weeks so it is out of scope
+        assert bitmap_index.decode_weeks(scope) == {"1", "2"}
+        assert bitmap_index.find_managers(scope, "QB", None) == {
+            "Tommy",
+            "Anthony",
+        }
+
+    def test_find_managers(self):
+        """Test managers are found for a position and player in scope."""
+        bitmap_index = self.bitmap_index
+
+        scope = bitmap_index.get_scope_mask(["2023"], ["1", "3"])
+
+        assert bitmap_index.find_managers(scope, None, "Josh Allen") == {
+            "Tommy"
+        }
+
+    def test_find_positions(self):
+        """Test positions are found in scope, by the manager if given."""
+        bitmap_index = self.bitmap_index
+
+        scope = bitmap_index.get_scope_mask(["2024"], ["2"])
+
+        assert bitmap_index.find_positions(scope, None) == {"QB", "RB"}
+        assert bitmap_index.find_positions(scope, "Tommy") == {"RB"}
+
+    def test_add(self):
+        """Test added starters are found by every filter."""
+        bitmap_index = self.bitmap_index
+
+        bitmap_index.add("2025", "1", "Owen", "George Kittle", "TE")
+        mask = bitmap_index.get_filter_mask("Owen", "TE", "George Kittle")
+
+        assert bitmap_index.get_years() == ["2024", "2023", "2025"]
+        assert bitmap_index.decode_years(mask) == {"2025"}
+        assert bitmap_index.decode_weeks(mask) == {"1"}
+
+    def test_add_is_idempotent(self):
+        """Test adding a starter already in the index changes nothing."""
+        bitmap_index = self.bitmap_index
+        mask = bitmap_index.get_filter_mask("Tommy", "QB", None)
+
+        bitmap_index.add("2024", "1", "Tommy", "Josh Allen", "QB")
+
+        assert bitmap_index.get_filter_mask("Tommy", "QB", None) == mask
+
+
+class TestGetBitmapIndex:
+    """Test get_bitmap_index and add_to_bitmap_index functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_valid_options_cache`:
+            `mock_get_valid_options_cache`
+        - `CACHE_MANAGER.get_cache_version`: `mock_get_cache_version`
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER"
+                ".get_valid_options_cache"
+            ) as mock_get_valid_options_cache,
+            patch(
+                "patriot_center_backend.cache.CACHE_MANAGER.get_cache_version"
+            ) as mock_get_cache_version,
+        ):
+            self.mock_get_valid_options_cache = mock_get_valid_options_cache
+            self.mock_get_valid_options_cache.return_value = {}
+
+            self.mock_get_cache_version = mock_get_cache_version
+            self.mock_get_cache_version.return_value = 1
+
+            get_bitmap_index.cache_clear()
+
+            yield
+
+            get_bitmap_index.cache_clear()
+
+    def test_reuses_index(self):
+        """Test the index is built once while the cache is unchanged."""
+        assert get_bitmap_index() is get_bitmap_index()
+
+    def test_add_to_bitmap_index(self):
+        """Test starters added through the helper are in the index."""
+        add_to_bitmap_index("2024", "1", "Tommy", "Josh Allen", "QB")
+
+        assert get_bitmap_index().get_years() == ["2024"]
+
+    def test_rebuilt_when_source_saved(self):
+        """Test the index is rebuilt when the cache version changes."""
+        add_to_bitmap_index("2024", "1", "Tommy", "Josh Allen", "QB")
+
+        self.mock_get_cache_version.return_value = 2
+
+        assert get_bitmap_index().get_years() == []
@@ -5,6 +5,9 @@ from unittest.mock import patch
 
 import pytest
 
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    get_bitmap_index,
+)
 from patriot_center_backend.dynamic_filtering.find_valid_options import (
     _get_weeks_to_check,
     find_valid_managers,
@@ -105,8 +108,12 @@ class TestFindValidYears:
                 self.mock_valid_options_cache
             )
 
+            get_bitmap_index.cache_clear()
+
             yield
 
+            get_bitmap_index.cache_clear()
+
     # ===== No filters =====
     def test_returns_all_years_when_no_filters(self):
         """Returns all years when no filters are provided."""
@@ -230,8 +237,12 @@ class TestFindValidWeeks:
                 self.mock_valid_options_cache
             )
 
+            get_bitmap_index.cache_clear()
+
             yield
 
+            get_bitmap_index.cache_clear()
+
     # ===== No filters (except year) =====
     def test_returns_all_weeks_for_year(self):
         """Returns all weeks for specified year when no other filters."""
@@ -423,8 +434,12 @@ class TestFindValidManagers:
             self.mock_get_weeks_to_check = mock_get_weeks_to_check
             self.mock_get_weeks_to_check.return_value = ["1", "2"]
 
+            get_bitmap_index.cache_clear()
+
             yield
 
+            get_bitmap_index.cache_clear()
+
     # ===== No filters (except year/week) =====
     def test_returns_all_managers_for_year_and_week(self):
         """Returns all managers for specified year and week."""
@@ -561,8 +576,12 @@ class TestFindValidPositions:
             self.mock_get_weeks_to_check = mock_get_weeks_to_check
             self.mock_get_weeks_to_check.return_value = ["1", "2"]
 
+            get_bitmap_index.cache_clear()
+
             yield
 
+            get_bitmap_index.cache_clear()
+
     # ===== No manager filter =====
     def test_returns_all_positions_for_year_and_week(self):
         """Returns all positions for specified year and week."""
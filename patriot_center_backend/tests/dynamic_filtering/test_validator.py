@@ -4,6 +4,9 @@ from unittest.mock import patch
 
 import pytest
 
+from patriot_center_backend.dynamic_filtering.bitmap_index import (
+    get_bitmap_index,
+)
 from patriot_center_backend.dynamic_filtering.validator import (
     _traverse_for_year_and_manager,
     _validate_manager,
@@ -529,6 +532,7 @@ class TestTraverseForYearAndManager:
                 "2024": {
                     "weeks": ["1", "2", "3"],
                     "1": {
+                        "managers": ["Tommy", "Anthony"],
                         "Tommy": {
                             "players": ["Josh Allen", "Stefon Diggs"],
                             "positions": ["QB", "WR"],
@@ -539,6 +543,7 @@ class TestTraverseForYearAndManager:
                         },
                     },
                     "2": {
+                        "managers": ["Tommy", "Anthony"],
                         "Tommy": {
                             "players": ["Josh Allen", "James Cook"],
                             "positions": ["QB", "RB"],
@@ -549,6 +554,7 @@ class TestTraverseForYearAndManager:
                         },
                     },
                     "3": {
+                        "managers": ["Tommy"],
                         "Tommy": {
                             "players": ["Josh Allen"],
                             "positions": ["QB"],
@@ -558,6 +564,7 @@ class TestTraverseForYearAndManager:
                 "2025": {
                     "weeks": ["1"],
                     "1": {
+                        "managers": ["Tommy"],
                         "Tommy": {
                             "players": ["Trey McBride"],
                             "positions": ["TE"],
@@ -571,8 +578,12 @@ class TestTraverseForYearAndManager:
                 self.mock_valid_options_cache
             )
 
+            get_bitmap_index.cache_clear()
+
             yield
 
+            get_bitmap_index.cache_clear()
+
     # ===== Player validation =====
     def test_passes_when_player_found_in_week(self):
         """Does not raise when player found in any week for manager."""
@@ -25,8 +25,9 @@ class TestGetAggregatedPlayers:
         - `get_starters_from_cache`: `mock_get_starters`
         - `get_ffwar_from_cache`: `mock_get_ffwar`
         - `get_image_url`: `mock_get_image_url`
-        - `slugify`: `mock_slugify`
+        - `name_to_slug`: `mock_name_to_slug`
         - `get_team`: `mock_get_team`
+        - `get_rollup_rows_from_cache`: `mock_get_rollup_rows`
 
         Yields:
             None
@@ -37,8 +38,11 @@ class TestGetAggregatedPlayers:
             ) as mock_get_starters,
             patch(f"{MODULE_PATH}.get_ffwar_from_cache") as mock_get_ffwar,
             patch(f"{MODULE_PATH}.get_image_url") as mock_get_image_url,
-            patch(f"{MODULE_PATH}.slugify") as mock_slugify,
+            patch(f"{MODULE_PATH}.name_to_slug") as mock_name_to_slug,
             patch(f"{MODULE_PATH}.get_team") as mock_get_team,
+            patch(
+                f"{MODULE_PATH}.get_rollup_rows_from_cache"
+            ) as mock_get_rollup_rows,
         ):
             self.mock_get_starters = mock_get_starters
             self.mock_get_starters.return_value = {}
@@ -51,14 +55,18 @@ class TestGetAggregatedPlayers:
                 "https://sleepercdn.com/content/abc123"
             )
 
-            self.mock_slugify = mock_slugify
-            self.mock_slugify.side_effect = (
+            self.mock_name_to_slug = mock_name_to_slug
+            self.mock_name_to_slug.side_effect = (
                 lambda name: name.lower().replace(" ", "-")
             )
 
             self.mock_get_team = mock_get_team
             self.mock_get_team.return_value = "WAS"
 
+            # Rollups not built, so the raw starters path is exercised
+            self.mock_get_rollup_rows = mock_get_rollup_rows
+            self.mock_get_rollup_rows.return_value = None
+
             yield
 
     def test_get_aggregated_players_empty(self):
@@ -167,6 +175,21 @@ class TestGetAggregatedPlayers:
             "Tommy": {"2023": 1}
         }
 
+    def test_get_aggregated_players_looks_up_ffwar_by_id(self):
+        """Test ffWAR is looked up by player ID without mutating starters."""
+        starter = {"points": 25.5, "position": "QB", "player_id": "11566"}
+        self.mock_get_starters.return_value = {
+            "2023": {"1": {"Tommy": {"Jayden Daniels": starter}}}
+        }
+        self.mock_get_ffwar.return_value = 1.5
+
+        get_aggregated_players(manager="Tommy")
+
+        self.mock_get_ffwar.assert_called_once_with(
+            "11566", season="2023", week="1"
+        )
+        assert "ffWAR" not in starter
+
     def test_get_aggregated_players_passes_filters(self):
         """Test that season and week filters are passed through."""
         get_aggregated_players(manager="Tommy", season=2023, week=5)
@@ -176,6 +199,59 @@ class TestGetAggregatedPlayers:
         )
 
 
+    def test_get_aggregated_players_merges_rollups(self):
+        """Test whole-season requests merge precomputed rollup rows."""
+        self.mock_get_rollup_rows.return_value = [
+            (
+                "2022",
+                "Tommy",
+                "Jayden Daniels",
+                {
+                    "total_points": 100.25,
+                    "num_games_started": 4,
+                    "ffWAR": 1.0,
+                    "position": "QB",
+                },
+            ),
+            (
+                "2023",
+                "Tommy",
+                "Jayden Daniels",
+                {
+                    "total_points": 50.5,
+                    "num_games_started": 2,
+                    "ffWAR": 0.5,
+                    "position": "QB",
+                    "placement": 1,
+                },
+            ),
+        ]
+
+        result = get_aggregated_players(manager="Tommy")
+
+        self.mock_get_starters.assert_not_called()
+        self.mock_get_rollup_rows.assert_called_once_with(
+            manager="Tommy", season=None
+        )
+        assert result["Jayden Daniels"]["total_points"] == 150.75
+        assert result["Jayden Daniels"]["num_games_started"] == 6
+        assert result["Jayden Daniels"]["ffWAR"] == 1.5
+        assert result["Jayden Daniels"]["ffWAR_per_game"] == 0.25
+        assert result["Jayden Daniels"]["team"] == "WAS"
+        assert result["Jayden Daniels"]["playoff_placement"] == {
+            "Tommy": {"2023": 1}
+        }
+
+    def test_get_aggregated_players_single_week_skips_rollups(self):
+        """Test single-week requests use the raw starters path."""
+        self.mock_get_rollup_rows.return_value = []
+
+        get_aggregated_players(manager="Tommy", season=2023, week=5)
+
+        self.mock_get_rollup_rows.assert_not_called()
+        self.mock_get_starters.assert_called_once()
+
+
 class TestGetAggregatedManagers:
     """Test get_aggregated_managers method."""
 
@@ -188,8 +264,9 @@ class TestGetAggregatedManagers:
         - `get_starters_from_cache`: `mock_get_starters`
         - `get_ffwar_from_cache`: `mock_get_ffwar`
         - `get_image_url`: `mock_get_image_url`
-        - `slugify`: `mock_slugify`
+        - `name_to_slug`: `mock_name_to_slug`
         - `get_team`: `mock_get_team`
+        - `get_rollup_rows_from_cache`: `mock_get_rollup_rows`
 
         Yields:
             None
@@ -200,8 +277,11 @@ class TestGetAggregatedManagers:
             ) as mock_get_starters,
             patch(f"{MODULE_PATH}.get_ffwar_from_cache") as mock_get_ffwar,
             patch(f"{MODULE_PATH}.get_image_url") as mock_get_image_url,
-            patch(f"{MODULE_PATH}.slugify") as mock_slugify,
+            patch(f"{MODULE_PATH}.name_to_slug") as mock_name_to_slug,
             patch(f"{MODULE_PATH}.get_team") as mock_get_team,
+            patch(
+                f"{MODULE_PATH}.get_rollup_rows_from_cache"
+            ) as mock_get_rollup_rows,
         ):
             self.mock_get_starters = mock_get_starters
             self.mock_get_starters.return_value = {}
@@ -214,14 +294,18 @@ class TestGetAggregatedManagers:
                 "https://sleepercdn.com/content/abc123"
             )
 
-            self.mock_slugify = mock_slugify
-            self.mock_slugify.side_effect = (
+            self.mock_name_to_slug = mock_name_to_slug
+            self.mock_name_to_slug.side_effect = (
                 lambda name: name.lower().replace(" ", "-")
             )
 
             self.mock_get_team = mock_get_team
             self.mock_get_team.return_value = "WAS"
 
+            # Rollups not built, so the raw starters path is exercised
+            self.mock_get_rollup_rows = mock_get_rollup_rows
+            self.mock_get_rollup_rows.return_value = None
+
             yield
 
     def test_get_aggregated_managers_empty(self):
@@ -305,6 +389,45 @@ class TestGetAggregatedManagers:
         self.mock_get_starters.assert_called_once_with(season=2023, week=5)
 
 
+    def test_get_aggregated_managers_merges_rollups(self):
+        """Test whole-season requests merge rollup rows per manager."""
+        self.mock_get_rollup_rows.return_value = [
+            (
+                "2023",
+                "Tommy",
+                "Jayden Daniels",
+                {
+                    "total_points": 50.5,
+                    "num_games_started": 2,
+                    "ffWAR": 0.5,
+                    "position": "QB",
+                },
+            ),
+            (
+                "2023",
+                "Benz",
+                "Jayden Daniels",
+                {
+                    "total_points": 20.0,
+                    "num_games_started": 1,
+                    "ffWAR": 0.2,
+                    "position": "QB",
+                },
+            ),
+        ]
+
+        result = get_aggregated_managers(player="Jayden Daniels", season=2023)
+
+        self.mock_get_starters.assert_not_called()
+        self.mock_get_rollup_rows.assert_called_once_with(
+            season=2023, player="Jayden Daniels"
+        )
+        assert set(result) == {"Tommy", "Benz"}
+        assert result["Tommy"]["player"] == "Jayden Daniels"
+        assert result["Tommy"]["total_points"] == 50.5
+        assert result["Benz"]["num_games_started"] == 1
+
+
 class TestGetPlayerManagerAggregation:
     """Test get_player_manager_aggregation method."""
 
@@ -317,8 +440,9 @@ class TestGetPlayerManagerAggregation:
         - `get_starters_from_cache`: `mock_get_starters`
         - `get_ffwar_from_cache`: `mock_get_ffwar`
         - `get_image_url`: `mock_get_image_url`
-        - `slugify`: `mock_slugify`
+        - `name_to_slug`: `mock_name_to_slug`
         - `get_team`: `mock_get_team`
+        - `get_rollup_rows_from_cache`: `mock_get_rollup_rows`
 
         Yields:
             None
@@ -329,8 +453,11 @@ class TestGetPlayerManagerAggregation:
             ) as mock_get_starters,
             patch(f"{MODULE_PATH}.get_ffwar_from_cache") as mock_get_ffwar,
             patch(f"{MODULE_PATH}.get_image_url") as mock_get_image_url,
-            patch(f"{MODULE_PATH}.slugify") as mock_slugify,
+            patch(f"{MODULE_PATH}.name_to_slug") as mock_name_to_slug,
             patch(f"{MODULE_PATH}.get_team") as mock_get_team,
+            patch(
+                f"{MODULE_PATH}.get_rollup_rows_from_cache"
+            ) as mock_get_rollup_rows,
         ):
             self.mock_get_starters = mock_get_starters
             self.mock_get_starters.return_value = {
@@ -354,14 +481,18 @@ class TestGetPlayerManagerAggregation:
                 "https://sleepercdn.com/content/abc123"
             )
 
-            self.mock_slugify = mock_slugify
-            self.mock_slugify.side_effect = (
+            self.mock_name_to_slug = mock_name_to_slug
+            self.mock_name_to_slug.side_effect = (
                 lambda name: name.lower().replace(" ", "-")
             )
 
             self.mock_get_team = mock_get_team
             self.mock_get_team.return_value = "WAS"
 
+            # Rollups not built, so the raw starters path is exercised
+            self.mock_get_rollup_rows = mock_get_rollup_rows
+            self.mock_get_rollup_rows.return_value = None
+
             yield
 
     def test_get_player_manager_aggregation_found(self):
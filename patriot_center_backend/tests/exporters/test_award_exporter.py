@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from patriot_center_backend.exporters.award_exporter import (
+    get_league_records,
     get_manager_awards,
 )
 
@@ -108,3 +109,37 @@ class TestGetManagerAwards:
 
         result["awards"]["first_place"] = 999
         assert awards_data["first_place"] == 2
+
+
+class TestGetLeagueRecords:
+    """Test get_league_records method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `get_league_score_records_from_cache`: `mock_get_records`
+
+        Yields:
+            None
+        """
+        with patch(
+            f"{MODULE_PATH}.get_league_score_records_from_cache"
+        ) as mock_get_records:
+            self.mock_get_records = mock_get_records
+            self.mock_get_records.return_value = {
+                "highest_weekly_score": [{"manager_1_score": 180.5}],
+                "lowest_weekly_score": [],
+                "biggest_blowout": [],
+            }
+
+            yield
+
+    def test_get_league_records(self):
+        """Test league records are read for the requested count."""
+        result = get_league_records(5)
+
+        self.mock_get_records.assert_called_once_with(5)
+        assert result["highest_weekly_score"] == [{"manager_1_score": 180.5}]
@@ -0,0 +1,252 @@
+"""Unit tests for batch_exporter module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from patriot_center_backend.exporters.batch_exporter import run_batch
+
+MODULE_PATH = "patriot_center_backend.exporters.batch_exporter"
+
+
+class TestRunBatch:
+    """Test run_batch function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `BATCH_OPERATIONS`: `mock_get_manager_awards` under
+            "manager_awards"
+
+        Yields:
+            None
+        """
+
+        # A real function, so its params are checked against its signature
+        def get_manager_awards(manager: str) -> dict[str, str]:
+            return self.mock_get_manager_awards(manager)
+
+        self.mock_get_manager_awards = MagicMock()
+        self.mock_get_manager_awards.return_value = {"awards": "data"}
+
+        with patch.dict(
+            f"{MODULE_PATH}.BATCH_OPERATIONS",
+            {"manager_awards": get_manager_awards},
+            clear=True,
+        ):
+            yield
+
+    def test_runs_sub_requests(self):
+        """Test each sub-request gets its exporter's data."""
+        result = run_batch(
+            {
+                "requests": [
+                    {
+                        "id": "awards",
+                        "op": "manager_awards",
+                        "params": {"manager": "Tommy"},
+                    }
+                ]
+            }
+        )
+
+        assert result == {
+            "responses": [
+                {"id": "awards", "status": 200, "data": {"awards": "data"}}
+            ]
+        }
+        self.mock_get_manager_awards.assert_called_once_with("Tommy")
+
+    @pytest.mark.parametrize(
+        "sub_request, error",
+        [
+            ({"op": "unknown"}, "Unknown op"),
+            ({"op": "manager_awards", "params": []}, "Params must be"),
+            ({"op": "manager_awards", "params": {}}, "Invalid params"),
+            ({"op": "manager_awards", "params": {"year": 1}}, "Invalid"),
+            ("manager_awards", "must be an object"),
+        ],
+    )
+    def test_invalid_sub_request(self, sub_request: object, error: str):
+        """Test invalid sub-requests fail alone with status 400.
+
+        Args:
+            sub_request: The invalid sub-request.
+            error: Text expected in the error message.
+        """
+        result = run_batch({"requests": [sub_request]})
+
+        assert result["responses"][0]["status"] == 400
+        assert error in result["responses"][0]["error"]
+        self.mock_get_manager_awards.assert_not_called()
+
+    def test_exporter_errors(self):
+        """Test exporter errors are reported with the route's status."""
+        self.mock_get_manager_awards.side_effect = [
+            ValueError("Manager Tommy not found in cache."),
+            KeyError("awards"),
+            {"awards": "data"},
+        ]
+        sub_request = {"op": "manager_awards", "params": {"manager": "Tommy"}}
+
+        result = run_batch({"requests": [sub_request] * 3})
+
+        assert [r["status"] for r in result["responses"]] == [400, 500, 200]
+        assert result["responses"][0]["error"] == (
+            "Manager Tommy not found in cache."
+        )
+
+    @pytest.mark.parametrize(
+        "params", [{"manager": ["Tommy"]}, {"manager": 5}, {"manager": None}]
+    )
+    def test_invalid_param_types(self, params: dict[str, object]):
+        """Test params of the wrong type fail with status 400.
+
+        Args:
+            params: The sub-request's params.
+        """
+        result = run_batch(
+            {"requests": [{"op": "manager_awards", "params": params}]}
+        )
+
+        assert result["responses"][0]["status"] == 400
+        assert "manager" in result["responses"][0]["error"]
+        self.mock_get_manager_awards.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "payload", [None, [], {"requests": {}}, {"requests": [{}] * 21}]
+    )
+    def test_invalid_batch(self, payload: object):
+        """Test invalid batches raise ValueError.
+
+        Args:
+            payload: The invalid batch.
+        """
+        with pytest.raises(ValueError):
+            run_batch(payload)
+
+
+class TestRunBatchParams:
+    """Test run_batch parses params as the matching routes do."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `BATCH_OPERATIONS`: `mock_operation` under "league_records",
+            "managers_list" and "manager_transactions"
+
+        Yields:
+            None
+        """
+        self.mock_operation = MagicMock()
+        self.mock_operation.return_value = {"data": True}
+
+        # Real functions, so their params are checked against their
+        # signatures
+        def get_league_records(top_n: int) -> dict[str, bool]:
+            return self.mock_operation(top_n)
+
+        def get_managers_list(active_only: bool) -> dict[str, bool]:
+            return self.mock_operation(active_only)
+
+        def get_manager_transactions(
+            manager_name: str, year: str | None = None
+        ) -> dict[str, bool]:
+            return self.mock_operation(manager_name, year)
+
+        with patch.dict(
+            f"{MODULE_PATH}.BATCH_OPERATIONS",
+            {
+                "league_records": get_league_records,
+                "managers_list": get_managers_list,
+                "manager_transactions": get_manager_transactions,
+            },
+            clear=True,
+        ):
+            yield
+
+    def _run(self, op: str, params: dict[str, object]) -> dict[str, object]:
+        """Run a batch of one sub-request.
+
+        Args:
+            op: The sub-request's operation.
+            params: The sub-request's params.
+
+        Returns:
+            The sub-request's result.
+        """
+        return run_batch({"requests": [{"op": op, "params": params}]})[
+            "responses"
+        ][0]
+
+    @pytest.mark.parametrize(
+        "op, params, expected",
+        [
+            ("league_records", {"top_n": 5}, (5,)),
+            ("league_records", {"top_n": "5"}, (5,)),
+            ("managers_list", {"active_only": False}, (False,)),
+            ("managers_list", {"active_only": "false"}, (False,)),
+            ("managers_list", {"active_only": "true"}, (True,)),
+            (
+                "manager_transactions",
+                {"manager_name": "Tommy"},
+                ("Tommy", None),
+            ),
+            (
+                "manager_transactions",
+                {"manager_name": "Tommy", "year": "all"},
+                ("Tommy", None),
+            ),
+            (
+                "manager_transactions",
+                {"manager_name": "Tommy", "year": 2024},
+                ("Tommy", "2024"),
+            ),
+        ],
+    )
+    def test_parses_params(
+        self, op: str, params: dict[str, object], expected: tuple
+    ):
+        """Test params are converted like the route converts its URL.
+
+        Args:
+            op: The sub-request's operation.
+            params: The sub-request's params.
+            expected: Arguments the exporter is expected to get.
+        """
+        assert self._run(op, params)["status"] == 200
+
+        self.mock_operation.assert_called_once_with(*expected)
+
+    @pytest.mark.parametrize(
+        "op, params",
+        [
+            ("league_records", {"top_n": "five"}),
+            ("league_records", {"top_n": -1}),
+            ("league_records", {"top_n": True}),
+            ("league_records", {"top_n": 5.5}),
+            ("managers_list", {"active_only": "yes"}),
+            ("managers_list", {"active_only": 1}),
+            ("manager_transactions", {"manager_name": "Tommy", "year": []}),
+        ],
+    )
+    def test_rejects_mismatched_params(
+        self, op: str, params: dict[str, object]
+    ):
+        """Test params the route would reject fail with status 400.
+
+        Args:
+            op: The sub-request's operation.
+            params: The sub-request's params.
+        """
+        result = self._run(op, params)
+
+        assert result["status"] == 400
+        assert result["error"].startswith("Invalid params")
+        self.mock_operation.assert_not_called()
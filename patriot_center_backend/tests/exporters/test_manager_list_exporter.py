@@ -27,7 +27,7 @@ class TestGetManagersList:
         - `get_list_of_managers_from_cache`: `mock_get_list_of_managers`
         - `get_manager_summary_from_cache`: `mock_get_manager_summary`
         - `get_ranking_details_from_cache`: `mock_get_ranking_details`
-        - `get_image_url`: `mock_get_image_url`
+        - `get_image_urls`: `mock_get_image_urls`
         - `get_manager_years_active_from_cache`: `mock_get_manager_years_active`
 
         Args:
@@ -46,7 +46,7 @@ class TestGetManagersList:
             patch(
                 f"{MODULE_PATH}.get_ranking_details_from_cache"
             ) as mock_get_ranking_details,
-            patch(f"{MODULE_PATH}.get_image_url") as mock_get_image_url,
+            patch(f"{MODULE_PATH}.get_image_urls") as mock_get_image_urls,
             patch(
                 f"{MODULE_PATH}.get_manager_years_active_from_cache"
             ) as mock_get_manager_years_active,
@@ -66,9 +66,9 @@ class TestGetManagersList:
             self.mock_get_ranking_details = mock_get_ranking_details
             self.mock_get_ranking_details.return_value = {}
 
-            self.mock_get_image_url = mock_get_image_url
-            self.mock_get_image_url.return_value = (
-                "http://example.com/manager.jpg"
+            self.mock_get_image_urls = mock_get_image_urls
+            self.mock_get_image_urls.side_effect = lambda items: dict.fromkeys(
+                items, "http://example.com/manager.jpg"
             )
 
             self.mock_get_manager_years_active = mock_get_manager_years_active
@@ -105,6 +105,9 @@ class TestGetManagersList:
         assert len(result["managers"]) == 2
         assert all("name" in m for m in result["managers"])
         assert all("image_url" in m for m in result["managers"])
+        self.mock_get_image_urls.assert_called_once_with(
+            ["Manager 1", "Manager 2"]
+        )
 
     def test_get_all_managers(self):
         """Test getting all managers including inactive."""
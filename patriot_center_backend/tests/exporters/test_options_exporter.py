@@ -6,6 +6,7 @@ import pytest
 
 from patriot_center_backend.exporters.options_exporter import (
     get_options_list,
+    search_options,
 )
 
 MODULE_PATH = "patriot_center_backend.exporters.options_exporter"
@@ -70,3 +71,37 @@ class TestGetOptionsList:
         get_options_list()
 
         self.mock_get_options_list_from_cache.assert_called_once()
+
+
+class TestSearchOptions:
+    """Test search_options method."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `search_options_from_cache`: `mock_search_options_from_cache`
+
+        Yields:
+            None
+        """
+        with patch(
+            f"{MODULE_PATH}.search_options_from_cache"
+        ) as mock_search_options_from_cache:
+            self.mock_search_options_from_cache = (
+                mock_search_options_from_cache
+            )
+            self.mock_search_options_from_cache.return_value = [
+                {"name": "Tommy", "type": "manager"},
+            ]
+
+            yield
+
+    def test_search_options(self):
+        """Test search passes the query and limit to the cache query."""
+        result = search_options("tom", 5)
+
+        self.mock_search_options_from_cache.assert_called_once_with("tom", 5)
+        assert result == [{"name": "Tommy", "type": "manager"}]
@@ -0,0 +1,191 @@
+"""Unit tests for compression module."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, Response
+from werkzeug.datastructures import Accept
+
+from patriot_center_backend.utils.compression import (
+    choose_encoding,
+    compress,
+    compress_all,
+    compress_response,
+)
+
+MODULE_PATH = "patriot_center_backend.utils.compression"
+
+
+class TestChooseEncoding:
+    """Test choose_encoding function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `brotli`: `mock_brotli`
+
+        Yields:
+            None
+        """
+        with patch(f"{MODULE_PATH}.brotli") as mock_brotli:
+            self.mock_brotli = mock_brotli
+
+            yield
+
+    def test_prefers_brotli(self):
+        """Test brotli is chosen when the client accepts both."""
+        accept = Accept([("gzip", 1), ("br", 1)])
+
+        assert choose_encoding(accept) == "br"
+
+    def test_gzip_without_brotli_package(self):
+        """Test gzip is chosen when brotli isn't installed."""
+        accept = Accept([("gzip", 1), ("br", 1)])
+
+        with patch(f"{MODULE_PATH}.brotli", None):
+            assert choose_encoding(accept) == "gzip"
+
+    def test_no_accepted_encoding(self):
+        """Test no encoding is chosen when the client accepts none."""
+        assert choose_encoding(Accept([("deflate", 1)])) is None
+        assert choose_encoding(Accept()) is None
+
+
+class TestCompress:
+    """Test compress and compress_all functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `brotli`: `mock_brotli`
+
+        Yields:
+            None
+        """
+        with patch(f"{MODULE_PATH}.brotli") as mock_brotli:
+            self.mock_brotli = mock_brotli
+            self.mock_brotli.compress.return_value = b"brotli body"
+
+            self.body = b'{"players": []}' * 100
+
+            yield
+
+    def test_gzip_round_trips(self):
+        """Test gzip output decompresses to the body."""
+        assert gzip.decompress(compress(self.body, "gzip")) == self.body
+
+    def test_unsupported_encoding(self):
+        """Test unsupported encodings raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            compress(self.body, "deflate")
+
+        assert "Unsupported content encoding" in str(exc_info.value)
+
+    def test_compress_all(self):
+        """Test the body is compressed with every supported encoding."""
+        result = compress_all(self.body, "application/json")
+
+        assert set(result) == {"br", "gzip"}
+        assert result["br"] == b"brotli body"
+
+    def test_compress_all_skips_small_bodies(self):
+        """Test bodies under the size threshold aren't compressed."""
+        assert compress_all(b"{}", "application/json") == {}
+
+    def test_compress_all_skips_binary_bodies(self):
+        """Test bodies that aren't text aren't compressed."""
+        assert compress_all(self.body, "image/png") == {}
+
+
+class TestCompressResponse:
+    """Test compress_response function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `brotli`: None (not installed)
+
+        Yields:
+            None
+        """
+        with patch(f"{MODULE_PATH}.brotli", None):
+            self.app = Flask(__name__)
+            self.body = b'{"players": []}' * 100
+
+            yield
+
+    def _compress(
+        self, response: Response, accept_encoding: str = "gzip"
+    ) -> Response:
+        """Compress a response for a request with an Accept-Encoding.
+
+        Args:
+            response: The response to compress.
+            accept_encoding: The request's Accept-Encoding header.
+
+        Returns:
+            The compressed response.
+        """
+        with self.app.test_request_context(
+            headers={"Accept-Encoding": accept_encoding}
+        ):
+            return compress_response(response)
+
+    def test_compresses_large_json(self):
+        """Test large JSON responses are gzipped."""
+        response = Response(self.body, mimetype="application/json")
+        response.set_etag("abc")
+
+        result = self._compress(response)
+
+        assert result.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in result.vary
+        assert result.get_etag() == ("abc-gzip", False)
+        assert gzip.decompress(result.get_data()) == self.body
+
+    def test_client_without_gzip(self):
+        """Test the body is sent as is if the client accepts no encoding."""
+        response = Response(self.body, mimetype="application/json")
+
+        result = self._compress(response, accept_encoding="identity")
+
+        assert "Content-Encoding" not in result.headers
+        assert "Accept-Encoding" in result.vary
+        assert result.get_data() == self.body
+
+    def test_leaves_small_responses(self):
+        """Test responses under the size threshold are sent as is."""
+        response = Response(b"{}", mimetype="application/json")
+
+        result = self._compress(response)
+
+        assert "Content-Encoding" not in result.headers
+        assert result.get_data() == b"{}"
+
+    def test_leaves_encoded_responses(self):
+        """Test responses already encoded are sent as is."""
+        response = Response(b"brotli body", mimetype="application/json")
+        response.headers["Content-Encoding"] = "br"
+
+        result = self._compress(response)
+
+        assert result.headers["Content-Encoding"] == "br"
+        assert result.get_data() == b"brotli body"
+
+    def test_leaves_errors(self):
+        """Test error responses are sent as is."""
+        response = Response(self.body, status=500, mimetype="application/json")
+
+        result = self._compress(response)
+
+        assert "Content-Encoding" not in result.headers
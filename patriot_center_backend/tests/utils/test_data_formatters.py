@@ -2,6 +2,11 @@
 
 from patriot_center_backend.utils.data_formatters import (
     flatten_dict,
+    iter_records,
+    iter_rows,
+    project_record,
+    select_fields,
+    to_columnar,
     to_records,
 )
 
@@ -156,3 +161,147 @@ class TestToRecords:
 
         # Empty list has no items to iterate
         assert result is not None
+
+
+class TestIterRecords:
+    """Test iter_records function."""
+
+    def test_matches_to_records(self):
+        """Test the same records are yielded in the same order."""
+        data = {
+            "c": 3,
+            "a": {"wins": 10, "losses": {"total": 5}},
+            "b": [{"week": 1}, "bye"],
+        }
+
+        result = iter_records(data, key_name="manager")
+
+        assert list(result) == to_records(data, key_name="manager")
+
+    def test_yields_lazily(self):
+        """Test records are flattened as they are requested."""
+        data = {"a": {"wins": 1}, "b": {"wins": 2}}
+        result = iter_records(data)
+
+        assert next(result) == {"key": "a", "wins": 1}
+        data["b"]["wins"] = 3
+        assert next(result) == {"key": "b", "wins": 3}
+
+    def test_non_dict_input(self):
+        """Test non-dict inputs yield the records of to_records."""
+        assert list(iter_records(42)) == [{"value": 42}]
+
+
+class TestProjectRecord:
+    """Test project_record function."""
+
+    def test_keeps_given_fields(self):
+        """Test only the given fields are kept."""
+        record = {"key": "Tommy", "wins": 10, "losses": 5}
+
+        result = project_record(record, {"key", "wins"})
+
+        assert result == {"key": "Tommy", "wins": 10}
+
+    def test_keeps_fields_flattened_under_a_field(self):
+        """Test a field keeps the fields flattened from under it."""
+        record = {
+            "key": "2024",
+            "1.Tommy.Josh Allen.points": 25.5,
+            "1.Tommy.Josh Allen.position": "QB",
+            "1.Tommyboy.Rico Dowdle.points": 10.0,
+        }
+
+        result = project_record(record, {"1.Tommy"})
+
+        assert result == {
+            "1.Tommy.Josh Allen.points": 25.5,
+            "1.Tommy.Josh Allen.position": "QB",
+        }
+
+    def test_unknown_fields(self):
+        """Test unknown fields produce an empty record."""
+        assert project_record({"key": "Tommy"}, {"wins"}) == {}
+
+
+class TestSelectFields:
+    """Test select_fields function."""
+
+    def test_keeps_given_fields_in_order(self):
+        """Test the pairs of the given fields are kept in order."""
+        items = [("key", "Tommy"), ("wins", 10), ("stats.points", 99.5)]
+
+        result = select_fields(items, {"stats", "key"})
+
+        assert list(result) == [("key", "Tommy"), ("stats.points", 99.5)]
+
+
+class TestIterRows:
+    """Test iter_rows function."""
+
+    def test_one_row_per_key_at_last_level(self):
+        """Test each level becomes a key column and leaves are flattened."""
+        data = {
+            "2024": {
+                "1": {
+                    "Tommy": {
+                        "Josh Allen": {"points": 25.5, "position": "QB"},
+                        "Total_Points": 25.5,
+                    }
+                }
+            }
+        }
+
+        result = iter_rows(data, ("year", "week", "manager", "player"))
+
+        assert list(result) == [
+            [
+                ("year", "2024"),
+                ("week", "1"),
+                ("manager", "Tommy"),
+                ("player", "Josh Allen"),
+                ("points", 25.5),
+                ("position", "QB"),
+            ],
+            [
+                ("year", "2024"),
+                ("week", "1"),
+                ("manager", "Tommy"),
+                ("player", "Total_Points"),
+                ("value", 25.5),
+            ],
+        ]
+
+    def test_single_level_matches_to_records(self):
+        """Test one row key gives the records of to_records, in order."""
+        data = {"b": [{"week": 1}, "bye"], "a": {"wins": {"total": 10}}}
+
+        result = [dict(row) for row in iter_rows(data, ("manager",))]
+
+        assert result == to_records(data, key_name="manager")
+
+    def test_non_dict_input(self):
+        """Test non-dict inputs give the rows of to_records."""
+        assert list(iter_rows(42, ("key",))) == [[("value", 42)]]
+
+
+class TestToColumnar:
+    """Test to_columnar function."""
+
+    def test_packs_rows(self):
+        """Test rows are packed under columns in first-seen order."""
+        rows = [
+            [("key", "Tommy"), ("wins", 10)],
+            [("key", "Anthony"), ("losses", 7), ("wins", 8)],
+        ]
+
+        result = to_columnar(rows)
+
+        assert result == {
+            "columns": ["key", "wins", "losses"],
+            "rows": [["Tommy", 10, None], ["Anthony", 8, 7]],
+        }
+
+    def test_empty(self):
+        """Test no rows give an empty table."""
+        assert to_columnar([]) == {"columns": [], "rows": []}
@@ -160,7 +160,8 @@ class TestGetTop3ScorersFromMatchupData:
         - `CACHE_MANAGER.get_player_ids_cache`: `mock_get_player_ids`
         - `CACHE_MANAGER.get_players_cache`: `mock_get_players_cache`
         - `CACHE_MANAGER.get_starters_cache`: `mock_get_starters_cache`
-        - `get_image_url`: `mock_get_image_url`
+        - `get_image_urls`: `mock_get_image_urls`, returning
+            `self.image_url` for every item
 
         Yields:
             None
@@ -179,8 +180,8 @@ class TestGetTop3ScorersFromMatchupData:
                 ".CACHE_MANAGER.get_starters_cache"
             ) as mock_get_starters_cache,
             patch(
-                "patriot_center_backend.utils.formatters.get_image_url"
-            ) as mock_get_image_url,
+                "patriot_center_backend.utils.formatters.get_image_urls"
+            ) as mock_get_image_urls,
         ):
             self.mock_get_player_ids = mock_get_player_ids
             self.mock_get_player_ids.return_value = {}
@@ -191,13 +192,19 @@ class TestGetTop3ScorersFromMatchupData:
             self.mock_get_starters_cache = mock_get_starters_cache
             self.mock_get_starters_cache.return_value = {}
 
-            self.mock_get_image_url = mock_get_image_url
+            self.image_url = "http://example.com/image.jpg"
+            self.mock_get_image_urls = mock_get_image_urls
+            self.mock_get_image_urls.side_effect = (
+                lambda items, *args, **kwargs: dict.fromkeys(
+                    items, self.image_url
+                )
+            )
 
             yield
 
     def test_valid_matchup_data(self):
         """Test with valid matchup data and starters."""
-        self.mock_get_image_url.side_effect = lambda *args, **kwargs: {
+        self.image_url = {
             "name": "Player",
             "image_url": "http://example.com/image.jpg",
         }
@@ -247,6 +254,8 @@ class TestGetTop3ScorersFromMatchupData:
         )
 
         assert len(matchup_data) == 6  # original data and the 4 new lists
+        # Image URLs for both rosters are resolved in one batch
+        self.mock_get_image_urls.assert_called_once()
         assert len(matchup_data["manager_1_top_3_scorers"]) == 3
         assert len(matchup_data["manager_2_top_3_scorers"]) == 3
         assert matchup_data["manager_1_top_3_scorers"][0]["score"] == 25.5
@@ -376,7 +385,7 @@ class TestGetTop3ScorersFromMatchupData:
 
     def test_fewer_than_3_players(self):
         """Test with fewer than 3 starters."""
-        self.mock_get_image_url.side_effect = lambda *args, **kwargs: {
+        self.image_url = {
             "name": "Player",
             "image_url": "http://example.com/image.jpg",
         }
@@ -421,7 +430,7 @@ class TestGetTop3ScorersFromMatchupData:
 
     def test_insertion_sort_ordering(self):
         """Test that top scorers are properly sorted."""
-        self.mock_get_image_url.side_effect = lambda *args, **kwargs: {
+        self.image_url = {
             "name": "Player",
             "image_url": "http://example.com/image.jpg",
         }
@@ -490,7 +499,8 @@ class TestGetMatchupCard:
         set of values when accessed.
         - `CACHE_MANAGER.get_manager_cache`: `mock_get_manager_cache`
         - `get_top_3_scorers_from_matchup_data`: `mock_get_top_3`
-        - `get_image_url`: `mock_get_image_url`
+        - `get_image_urls`: `mock_get_image_urls`, returning
+            `self.image_url` for every item
 
         Yields:
             None
@@ -505,8 +515,8 @@ class TestGetMatchupCard:
                 ".get_top_3_scorers_from_matchup_data"
             ) as mock_get_top_3,
             patch(
-                "patriot_center_backend.utils.formatters.get_image_url"
-            ) as mock_get_image_url,
+                "patriot_center_backend.utils.formatters.get_image_urls"
+            ) as mock_get_image_urls,
         ):
             self.mock_get_manager_cache = mock_get_manager_cache
             self.mock_get_manager_cache.return_value = {}
@@ -514,13 +524,18 @@ class TestGetMatchupCard:
             self.mock_get_top_3 = mock_get_top_3
             self.mock_get_top_3.return_value = {}
 
-            self.mock_get_image_url = mock_get_image_url
+            self.image_url = "http://example.com/image.jpg"
+            self.mock_get_image_urls = mock_get_image_urls
+            self.mock_get_image_urls.side_effect = (
+                lambda items, *args, **kwargs: dict.fromkeys(
+                    items, self.image_url
+                )
+            )
 
             yield
 
     def test_valid_matchup_card_win(self):
         """Test generating matchup card for a win."""
-        self.mock_get_image_url.return_value = "http://example.com/image.jpg"
         self.mock_get_top_3.return_value = {
             "manager_1_top_3_scorers": [],
             "manager_2_top_3_scorers": [],
@@ -559,7 +574,6 @@ class TestGetMatchupCard:
 
     def test_valid_matchup_card_loss(self):
         """Test generating matchup card for a loss."""
-        self.mock_get_image_url.return_value = "http://example.com/image.jpg"
         self.mock_get_top_3.return_value = {
             "manager_1_top_3_scorers": [],
             "manager_2_top_3_scorers": [],
@@ -594,7 +608,6 @@ class TestGetMatchupCard:
 
     def test_valid_matchup_card_tie(self):
         """Test generating matchup card for a tie."""
-        self.mock_get_image_url.return_value = "http://example.com/image.jpg"
         self.mock_get_top_3.return_value = {
             "manager_1_top_3_scorers": [],
             "manager_2_top_3_scorers": [],
@@ -736,7 +749,8 @@ class TestGetTradeCard:
         The mocks are set up to return a pre-defined
         set of values when accessed.
         - `CACHE_MANAGER.get_transaction_ids_cache`: `mock_get_trans_ids`
-        - `get_image_url`: `mock_get_image_url`
+        - `get_image_urls`: `mock_get_image_urls`, returning
+            `self.image_url` for every item
 
         Yields:
             None
@@ -747,24 +761,31 @@ class TestGetTradeCard:
                 ".CACHE_MANAGER.get_transaction_ids_cache"
             ) as mock_get_trans_ids,
             patch(
-                "patriot_center_backend.utils.formatters.get_image_url"
-            ) as mock_get_image_url,
+                "patriot_center_backend.utils.formatters.get_image_urls"
+            ) as mock_get_image_urls,
         ):
             self.mock_get_trans_ids = mock_get_trans_ids
             self.mock_get_trans_ids.return_value = {}
 
-            self.mock_get_image_url = mock_get_image_url
+            self.image_url = "http://example.com/image.jpg"
+            self.mock_get_image_urls = mock_get_image_urls
+            self.mock_get_image_urls.side_effect = (
+                lambda items, *args, **kwargs: dict.fromkeys(
+                    items, self.image_url
+                )
+            )
 
             yield
 
     def test_simple_two_team_trade(self):
         """Test generating trade card for simple two-team trade."""
-        self.mock_get_image_url.side_effect = [
-            {"name": "Manager 1", "image_url": "http://example.com/m1.jpg"},
-            {"name": "Manager 2", "image_url": "http://example.com/m2.jpg"},
-            {"name": "Player A", "image_url": "http://example.com/pa.jpg"},
-            {"name": "Player B", "image_url": "http://example.com/pb.jpg"},
-        ]
+        self.mock_get_image_urls.side_effect = lambda items, **kwargs: {
+            item: {
+                "name": item,
+                "image_url": f"http://example.com/{item}.jpg",
+            }
+            for item in items
+        }
         self.mock_get_trans_ids.return_value = {
             "trade123": {
                 "year": "2023",
@@ -798,7 +819,7 @@ class TestGetTradeCard:
 
     def test_three_team_trade(self):
         """Test generating trade card for three-team trade."""
-        self.mock_get_image_url.return_value = {
+        self.image_url = {
             "name": "Test",
             "image_url": "http://example.com/test.jpg",
         }
@@ -839,7 +860,7 @@ class TestGetTradeCard:
 
     def test_uneven_trade(self):
         """Test trade where one manager sends multiple players."""
-        self.mock_get_image_url.return_value = {
+        self.image_url = {
             "name": "Test",
             "image_url": "http://example.com/test.jpg",
         }
@@ -878,7 +899,7 @@ class TestGetTradeCard:
 
     def test_manager_name_with_spaces(self):
         """Test handling manager names with spaces."""
-        self.mock_get_image_url.return_value = {
+        self.image_url = {
             "name": "Test",
             "image_url": "http://example.com/test.jpg",
         }
@@ -916,19 +937,23 @@ class TestExtractDictData:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `get_image_url`: `mock_get_image_url`
+        - `get_image_urls`: `mock_get_image_urls`, returning
+            `self.image_url` for every item
 
         Yields:
             None
         """
         with (
             patch(
-                "patriot_center_backend.utils.formatters.get_image_url"
-            ) as mock_get_image_url,
+                "patriot_center_backend.utils.formatters.get_image_urls"
+            ) as mock_get_image_urls,
         ):
-            self.mock_get_image_url = mock_get_image_url
-            self.mock_get_image_url.return_value = (
-                "http://example.com/image.jpg"
+            self.image_url = "http://example.com/image.jpg"
+            self.mock_get_image_urls = mock_get_image_urls
+            self.mock_get_image_urls.side_effect = (
+                lambda items, *args, **kwargs: dict.fromkeys(
+                    items, self.image_url
+                )
             )
 
             yield
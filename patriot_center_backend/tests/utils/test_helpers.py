@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from patriot_center_backend.cache.entity_index import EntityIndex
 from patriot_center_backend.utils.helpers import (
     get_player_id,
     get_player_name,
@@ -25,25 +26,20 @@ class TestGetPlayerId:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `CACHE_MANAGER.get_player_ids_cache`:
-            `mock_get_player_ids_cache`
+        - `get_entity_index`: `mock_get_entity_index`, built from
+            `mock_player_ids_cache`
 
         Yields:
             None
         """
-        # Clear the LRU cache before each test
-        from patriot_center_backend.utils.helpers import _get_player_name_to_id
-
-        _get_player_name_to_id.cache_clear()
-
-        with patch(
-            f"{MODULE_PATH}.CACHE_MANAGER.get_player_ids_cache"
-        ) as mock_get_player_ids_cache:
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
             self.mock_player_ids_cache: dict[str, Any] = {
                 "4046": {"full_name": "Patrick Mahomes"},
                 "6794": {"full_name": "Jayden Daniels"},
             }
-            mock_get_player_ids_cache.return_value = self.mock_player_ids_cache
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                self.mock_player_ids_cache, {}, {}
+            )
 
             yield
 
@@ -75,19 +71,19 @@ class TestGetPlayerName:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `CACHE_MANAGER.get_player_ids_cache`:
-            `mock_get_player_ids_cache`
+        - `get_entity_index`: `mock_get_entity_index`, built from
+            `mock_player_ids_cache`
 
         Yields:
             None
         """
-        with patch(
-            f"{MODULE_PATH}.CACHE_MANAGER.get_player_ids_cache"
-        ) as mock_get_player_ids_cache:
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
             self.mock_player_ids_cache: dict[str, Any] = {
                 "4046": {"full_name": "Patrick Mahomes"},
             }
-            mock_get_player_ids_cache.return_value = self.mock_player_ids_cache
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                self.mock_player_ids_cache, {}, {}
+            )
 
             yield
 
@@ -113,19 +109,19 @@ class TestGetPlayerPosition:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `CACHE_MANAGER.get_player_ids_cache`:
-            `mock_get_player_ids_cache`
+        - `get_entity_index`: `mock_get_entity_index`, built from
+            `mock_player_ids_cache`
 
         Yields:
             None
         """
-        with patch(
-            f"{MODULE_PATH}.CACHE_MANAGER.get_player_ids_cache"
-        ) as mock_get_player_ids_cache:
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
             self.mock_player_ids_cache: dict[str, Any] = {
                 "4046": {"full_name": "Patrick Mahomes", "position": "QB"},
             }
-            mock_get_player_ids_cache.return_value = self.mock_player_ids_cache
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                self.mock_player_ids_cache, {}, {}
+            )
 
             yield
 
@@ -151,21 +147,21 @@ class TestGetUserId:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `CACHE_MANAGER.get_manager_cache`:
-            `mock_get_manager_cache`
+        - `get_entity_index`: `mock_get_entity_index`, built from
+            `mock_manager_cache`
 
         Yields:
             None
         """
-        with patch(
-            f"{MODULE_PATH}.CACHE_MANAGER.get_manager_cache"
-        ) as mock_get_manager_cache:
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
             self.mock_manager_cache: dict[str, Any] = {
                 "Tommy": {
                     "summary": {"user_id": "123456789"},
                 },
             }
-            mock_get_manager_cache.return_value = self.mock_manager_cache
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                {}, {}, self.mock_manager_cache
+            )
 
             yield
 
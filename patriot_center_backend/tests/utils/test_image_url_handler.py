@@ -9,6 +9,7 @@ import pytest
 from patriot_center_backend.utils.image_url_handler import (
     _handle_if_manager,
     get_image_url,
+    get_image_urls,
 )
 
 MODULE_PATH = "patriot_center_backend.utils.image_url_handler"
@@ -26,8 +27,7 @@ class TestGetImageUrl:
         - `detect_item_type`: `mock_detect_item_type`
         - `CACHE_MANAGER.get_image_urls_cache`:
             `mock_get_image_urls_cache`
-        - `update_image_urls_cache`:
-            `mock_update_image_urls_cache`
+        - `update_image_urls`: `mock_update_image_urls`
 
         Yields:
             None
@@ -37,9 +37,7 @@ class TestGetImageUrl:
             patch(
                 f"{MODULE_PATH}.CACHE_MANAGER.get_image_urls_cache"
             ) as mock_get_image_urls_cache,
-            patch(
-                f"{MODULE_PATH}.update_image_urls_cache"
-            ) as mock_update_image_urls_cache,
+            patch(f"{MODULE_PATH}.update_image_urls") as mock_update_image_urls,
         ):
             self.mock_detect_item_type = mock_detect_item_type
             self.mock_detect_item_type.return_value = "player"
@@ -54,10 +52,13 @@ class TestGetImageUrl:
             }
             mock_get_image_urls_cache.return_value = self.mock_image_urls_cache
 
-            self.mock_update_image_urls_cache = mock_update_image_urls_cache
-            self.mock_update_image_urls_cache.return_value = {
-                "image_url": "https://example.com/new.jpg",
-                "name": "New Player",
+            self.mock_update_image_urls = mock_update_image_urls
+            self.mock_update_image_urls.side_effect = lambda item_types: {
+                item: {
+                    "image_url": "https://example.com/new.jpg",
+                    "name": "New Player",
+                }
+                for item in item_types
             }
 
             yield
@@ -97,8 +98,8 @@ class TestGetImageUrl:
         """Test fetches URL when item not in cache."""
         result = get_image_url("Jayden Daniels")
 
-        self.mock_update_image_urls_cache.assert_called_once_with(
-            "Jayden Daniels"
+        self.mock_update_image_urls.assert_called_once_with(
+            {"Jayden Daniels": "player"}
         )
         assert result == "https://example.com/new.jpg"
 
@@ -140,6 +141,124 @@ class TestGetImageUrl:
         assert "Could not find image URL" in caplog.text
 
 
+class TestGetImageUrls:
+    """Test get_image_urls function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `detect_item_type`: `mock_detect_item_type`
+        - `CACHE_MANAGER.get_image_urls_cache`:
+            `mock_get_image_urls_cache`
+        - `update_image_urls`: `mock_update_image_urls`
+        - `IMAGE_URL_REFRESHER`: `mock_refresher`
+
+        Yields:
+            None
+        """
+        with (
+            patch(f"{MODULE_PATH}.detect_item_type") as mock_detect_item_type,
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_image_urls_cache"
+            ) as mock_get_image_urls_cache,
+            patch(f"{MODULE_PATH}.update_image_urls") as mock_update_image_urls,
+            patch(f"{MODULE_PATH}.IMAGE_URL_REFRESHER") as mock_refresher,
+        ):
+            item_types = {
+                "Tommy": "manager",
+                "Patrick Mahomes": "player",
+                "Josh Allen": "player",
+                "Jayden Daniels": "player",
+                "$10 FAAB": "faab",
+            }
+            self.mock_detect_item_type = mock_detect_item_type
+            self.mock_detect_item_type.side_effect = (
+                lambda item: item_types.get(item, "unknown")
+            )
+
+            self.mock_image_urls_cache: dict[str, Any] = {
+                "Tommy": {
+                    "image_url": "https://example.com/tommy.jpg",
+                    "name": "Tommy",
+                    "timestamp": "0",
+                },
+                "Patrick Mahomes": {
+                    "image_url": "https://example.com/mahomes.jpg",
+                    "name": "Patrick Mahomes",
+                },
+            }
+            mock_get_image_urls_cache.return_value = self.mock_image_urls_cache
+
+            self.mock_update_image_urls = mock_update_image_urls
+            self.mock_update_image_urls.side_effect = lambda item_types: {
+                item: {
+                    "image_url": f"https://example.com/{item}.jpg",
+                    "name": item,
+                }
+                for item in item_types
+            }
+
+            self.mock_refresher = mock_refresher
+
+            yield
+
+    def test_resolves_each_item(self):
+        """Test cached, missing, manager and unknown items are resolved."""
+        result = get_image_urls(
+            ["Tommy", "Patrick Mahomes", "Josh Allen", "???"]
+        )
+
+        assert result == {
+            "Tommy": "https://example.com/tommy.jpg",
+            "Patrick Mahomes": "https://example.com/mahomes.jpg",
+            "Josh Allen": "https://example.com/Josh Allen.jpg",
+            "???": "",
+        }
+        self.mock_refresher.queue.assert_called_once_with("Tommy")
+
+    def test_resolves_repeated_items_once(self):
+        """Test an item repeated in the response is resolved once."""
+        result = get_image_urls(["Patrick Mahomes", "Patrick Mahomes"])
+
+        assert list(result) == ["Patrick Mahomes"]
+        self.mock_detect_item_type.assert_called_once_with("Patrick Mahomes")
+
+    def test_groups_missing_items_into_one_update(self):
+        """Test items missing from the cache are built in one update."""
+        get_image_urls(
+            ["Josh Allen", "Patrick Mahomes", "Jayden Daniels", "$10 FAAB"]
+        )
+
+        self.mock_update_image_urls.assert_called_once_with(
+            {
+                "Josh Allen": "player",
+                "Jayden Daniels": "player",
+                "$10 FAAB": "faab",
+            }
+        )
+
+    def test_skips_update_when_all_cached(self):
+        """Test nothing is built when every item is cached."""
+        get_image_urls(["Patrick Mahomes"])
+
+        self.mock_update_image_urls.assert_not_called()
+
+    def test_returns_copies_with_dictionary(self):
+        """Test dictionaries returned are copies of the cache entries."""
+        result = get_image_urls(["Patrick Mahomes", "???"], dictionary=True)
+
+        assert result["???"] == {}
+        assert result["Patrick Mahomes"] == (
+            self.mock_image_urls_cache["Patrick Mahomes"]
+        )
+        assert result["Patrick Mahomes"] is not (
+            self.mock_image_urls_cache["Patrick Mahomes"]
+        )
+
+
 class TestHandleIfManager:
     """Test _handle_if_manager function."""
 
@@ -149,21 +268,13 @@ class TestHandleIfManager:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `update_image_urls_cache`:
-            `mock_update_image_urls_cache`
+        - `IMAGE_URL_REFRESHER`: `mock_refresher`
 
         Yields:
             None
         """
-        with patch(
-            f"{MODULE_PATH}.update_image_urls_cache"
-        ) as mock_update_image_urls_cache:
-            self.mock_update_image_urls_cache = mock_update_image_urls_cache
-            self.mock_update_image_urls_cache.return_value = {
-                "image_url": "https://example.com/fresh.jpg",
-                "name": "Tommy",
-                "timestamp": "9999999999",
-            }
+        with patch(f"{MODULE_PATH}.IMAGE_URL_REFRESHER") as mock_refresher:
+            self.mock_refresher = mock_refresher
 
             yield
 
@@ -178,7 +289,7 @@ class TestHandleIfManager:
         result = _handle_if_manager(manager_entry, dictionary=False)
 
         assert result == "https://example.com/tommy.jpg"
-        self.mock_update_image_urls_cache.assert_not_called()
+        self.mock_refresher.queue.assert_not_called()
 
     def test_returns_dict_when_timestamp_fresh(self):
         """Test returns dict when timestamp is fresh with dictionary=True."""
@@ -195,8 +306,8 @@ class TestHandleIfManager:
             == "https://example.com/tommy.jpg"
         )
 
-    def test_refreshes_when_timestamp_stale(self):
-        """Test refreshes URL when timestamp is stale (> 1 hour)."""
+    def test_serves_stale_url_and_queues_refresh(self):
+        """Test serves the stale URL and queues a refresh (> 1 hour)."""
         manager_entry = {
             "image_url": "https://example.com/old.jpg",
             "name": "Tommy",
@@ -205,11 +316,11 @@ class TestHandleIfManager:
 
         result = _handle_if_manager(manager_entry, dictionary=False)
 
-        self.mock_update_image_urls_cache.assert_called_once_with("Tommy")
-        assert result == "https://example.com/fresh.jpg"
+        self.mock_refresher.queue.assert_called_once_with("Tommy")
+        assert result == "https://example.com/old.jpg"
 
-    def test_refreshes_when_no_timestamp(self):
-        """Test refreshes URL when no timestamp present."""
+    def test_queues_refresh_when_no_timestamp(self):
+        """Test queues a refresh when no timestamp present."""
         manager_entry = {
             "image_url": "https://example.com/old.jpg",
             "name": "Tommy",
@@ -217,10 +328,10 @@ class TestHandleIfManager:
 
         _handle_if_manager(manager_entry, dictionary=False)
 
-        self.mock_update_image_urls_cache.assert_called_once_with("Tommy")
+        self.mock_refresher.queue.assert_called_once_with("Tommy")
 
-    def test_removes_timestamp_from_dict_return(self):
-        """Test removes timestamp key from returned dict."""
+    def test_serves_stale_dict(self):
+        """Test serves the stale entry with dictionary=True."""
         manager_entry = {
             "image_url": "https://example.com/old.jpg",
             "name": "Tommy",
@@ -229,4 +340,7 @@ class TestHandleIfManager:
 
         result = _handle_if_manager(manager_entry, dictionary=True)
 
-        assert "timestamp" not in result
+        assert (
+            result["image_url"]  # type: ignore
+            == "https://example.com/old.jpg"
+        )
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
+from patriot_center_backend.cache.entity_index import EntityIndex
 from patriot_center_backend.utils.item_type_detector import detect_item_type
 
 
@@ -17,35 +18,35 @@ class TestDetectItemType:
         The mocks are set up to return a pre-defined
         set of values when accessed.
         - `NAME_TO_MANAGER_USERNAME`: mock manager mapping
-        - `CACHE_MANAGER.get_players_cache`: mock players cache
-        - `CACHE_MANAGER.get_player_ids_cache`: mock player IDs cache
+        - `get_entity_index`: `mock_get_entity_index`, built from the
+            mock players and player IDs caches
 
         Yields:
             None
         """
         with (
             patch(
-                "patriot_center_backend.utils.item_type_detector"
+                "patriot_center_backend.cache.entity_index"
                 ".NAME_TO_MANAGER_USERNAME",
                 {"Tommy": "tommylowry", "Jay": "Jrazzam"},
             ),
             patch(
                 "patriot_center_backend.utils.item_type_detector"
-                ".CACHE_MANAGER.get_players_cache"
-            ) as mock_get_players,
-            patch(
-                "patriot_center_backend.utils.item_type_detector"
-                ".CACHE_MANAGER.get_player_ids_cache"
-            ) as mock_get_player_ids,
+                ".get_entity_index"
+            ) as mock_get_entity_index,
         ):
             self.mock_players_cache = {
-                "Patrick Mahomes": {"player_id": "4046"},
+                "Patrick Mahomes": {
+                    "player_id": "4046",
+                    "slug": "patrick%20mahomes",
+                },
             }
             self.mock_player_ids_cache = {
                 "4046": {"full_name": "Patrick Mahomes"},
             }
-            mock_get_players.return_value = self.mock_players_cache
-            mock_get_player_ids.return_value = self.mock_player_ids_cache
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                self.mock_player_ids_cache, self.mock_players_cache, {}
+            )
 
             yield
 
@@ -87,7 +88,10 @@ class TestDetectItemType:
 
     def test_manager_check_takes_priority_over_player(self):
         """Test manager check takes priority over player cache check."""
-        self.mock_players_cache["Tommy"] = {"player_id": "9999"}
+        self.mock_players_cache["Tommy"] = {
+            "player_id": "9999",
+            "slug": "tommy",
+        }
 
         result = detect_item_type("Tommy")
 
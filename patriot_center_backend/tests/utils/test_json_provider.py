@@ -0,0 +1,63 @@
+"""Unit tests for json_provider module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, jsonify
+
+from patriot_center_backend.utils.json_provider import FastJSONProvider
+
+MODULE_PATH = "patriot_center_backend.utils.json_provider"
+
+
+class TestFastJSONProvider:
+    """Test FastJSONProvider class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a Flask app using the provider for all tests.
+
+        Yields:
+            None
+        """
+        self.app = Flask(__name__)
+        self.app.json = FastJSONProvider(self.app)
+
+        self.data = {"b": [1, 2.5, None], "a": {"name": "Amon-Ra St. Brown"}}
+
+        yield
+
+    def test_response_matches_default_provider(self):
+        """Test responses hold the same JSON as the default provider's."""
+        default_app = Flask(__name__)
+
+        with self.app.app_context():
+            result = jsonify(self.data)
+        with default_app.app_context():
+            expected = jsonify(self.data)
+
+        assert result.mimetype == "application/json"
+        assert json.loads(result.get_data()) == json.loads(expected.get_data())
+        assert result.get_data().index(b'"a"') < result.get_data().index(b'"b"')
+
+    def test_round_trips(self):
+        """Test data survives dumps and loads."""
+        provider = self.app.json
+
+        assert provider.loads(provider.dumps(self.data)) == self.data
+
+    def test_standard_library_fallback(self):
+        """Test the standard library is used when orjson isn't installed."""
+        with patch(f"{MODULE_PATH}.orjson", None), self.app.app_context():
+            result = jsonify(self.data)
+
+        assert result.get_data() == (
+            b'{"a":{"name":"Amon-Ra St. Brown"},"b":[1,2.5,null]}\n'
+        )
+
+    def test_kwargs_use_standard_library(self):
+        """Test json.dumps options are honoured."""
+        result = self.app.json.dumps({"b": 1, "a": 2}, indent=2)
+
+        assert result == '{\n  "a": 2,\n  "b": 1\n}'
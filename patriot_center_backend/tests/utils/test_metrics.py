@@ -0,0 +1,221 @@
+"""Unit tests for metrics module."""
+
+import threading
+
+import pytest
+from flask import Flask
+
+from patriot_center_backend.utils.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    record_request,
+    start_request_timer,
+)
+
+MODULE_PATH = "patriot_center_backend.utils.metrics"
+
+
+class TestCounter:
+    """Test Counter class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a counter for all tests.
+
+        Yields:
+            None
+        """
+        self.counter = Counter("lookups_total", "Lookups.", ("result",))
+
+        yield
+
+    def test_counts_by_label_values(self):
+        """Test each combination of label values is counted apart."""
+        self.counter.inc(result="hit")
+        self.counter.inc(result="hit")
+        self.counter.inc(3, result="miss")
+
+        assert self.counter.get(result="hit") == 2
+        assert self.counter.get(result="miss") == 3
+        assert self.counter.get(result="other") == 0
+
+    def test_children_are_shared(self):
+        """Test counts incremented through a child are kept by the counter."""
+        child = self.counter.labels(result="hit")
+        child.inc()
+        child.inc()
+
+        assert child is self.counter.labels(result="hit")
+        assert child.get() == 2
+        assert child.get() == 2
+        assert self.counter.get(result="hit") == 2
+
+    def test_counts_across_threads(self):
+        """Test no increment is lost when counting from several threads."""
+        child = self.counter.labels(result="hit")
+
+        def count() -> None:
+            for _ in range(10000):
+                child.inc()
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert child.get() == 80000
+
+    def test_invalid_labels(self):
+        """Test incrementing with other labels than declared fails."""
+        with pytest.raises(ValueError):
+            self.counter.inc(status="200")
+        with pytest.raises(ValueError):
+            self.counter.inc()
+
+    def test_render(self):
+        """Test samples are rendered sorted by label values."""
+        self.counter.inc(result="miss")
+        self.counter.inc(result='a "b"\n')
+
+        assert self.counter.render() == [
+            'lookups_total{result="a \\"b\\"\\n"} 1',
+            'lookups_total{result="miss"} 1',
+        ]
+
+    def test_render_without_labels(self):
+        """Test a counter without labels is rendered before any increment."""
+        counter = Counter("loads_total", "Loads.")
+
+        assert counter.render() == ["loads_total 0"]
+
+
+class TestHistogram:
+    """Test Histogram class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a histogram for all tests.
+
+        Yields:
+            None
+        """
+        self.histogram = Histogram(
+            "duration_seconds", "Durations.", ("route",), buckets=(0.1, 1.0)
+        )
+
+        yield
+
+    def test_render_cumulative_buckets(self):
+        """Test buckets are cumulative, with the sum and count."""
+        for value in (0.05, 0.1, 0.5, 3.0):
+            self.histogram.observe(value, route="/ping")
+
+        assert self.histogram.get_count(route="/ping") == 4
+        assert self.histogram.render() == [
+            'duration_seconds_bucket{route="/ping",le="0.1"} 2',
+            'duration_seconds_bucket{route="/ping",le="1"} 3',
+            'duration_seconds_bucket{route="/ping",le="+Inf"} 4',
+            'duration_seconds_sum{route="/ping"} 3.65',
+            'duration_seconds_count{route="/ping"} 4',
+        ]
+
+    def test_no_observations(self):
+        """Test nothing is rendered before the first observation."""
+        assert self.histogram.get_count(route="/ping") == 0
+        assert self.histogram.render() == []
+
+
+class TestMetricsRegistry:
+    """Test MetricsRegistry class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup an empty registry for all tests.
+
+        Yields:
+            None
+        """
+        self.registry = MetricsRegistry(prefix="test_")
+
+        yield
+
+    def test_render(self):
+        """Test every metric is rendered with its help text and type."""
+        self.registry.histogram("b_seconds", "B.", buckets=(1.0,)).observe(2)
+        self.registry.counter("a_total", "A.").inc()
+
+        assert self.registry.render() == (
+            "# HELP test_a_total A.\n"
+            "# TYPE test_a_total counter\n"
+            "test_a_total 1\n"
+            "# HELP test_b_seconds B.\n"
+            "# TYPE test_b_seconds histogram\n"
+            'test_b_seconds_bucket{le="1"} 0\n'
+            'test_b_seconds_bucket{le="+Inf"} 1\n'
+            "test_b_seconds_sum 2\n"
+            "test_b_seconds_count 1\n"
+        )
+
+    def test_duplicate_name(self):
+        """Test registering two metrics with the same name fails."""
+        self.registry.counter("a_total", "A.")
+
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.histogram("a_total", "A.")
+
+
+class TestRecordRequest:
+    """Test start_request_timer and record_request functions."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a Flask app recording its requests for all tests.
+
+        Yields:
+            None
+        """
+        self.app = Flask(__name__)
+        self.app.before_request(start_request_timer)
+        self.app.after_request(record_request)
+
+        @self.app.route("/players/<player>")
+        def player_route(player: str) -> str:
+            return player
+
+        self.client = self.app.test_client()
+
+        yield
+
+    def test_records_by_route(self, monkeypatch: pytest.MonkeyPatch):
+        """Test requests are recorded by their route's rule.
+
+        Args:
+            monkeypatch: pytest monkeypatch fixture
+        """
+        registry = MetricsRegistry()
+        counter = registry.counter(
+            "requests_total", "", ("method", "route", "status")
+        )
+        duration = registry.histogram(
+            "duration_seconds", "", ("method", "route")
+        )
+        size = registry.histogram("size_bytes", "", ("method", "route"))
+        monkeypatch.setattr(f"{MODULE_PATH}.HTTP_REQUESTS", counter)
+        monkeypatch.setattr(f"{MODULE_PATH}.HTTP_REQUEST_DURATION", duration)
+        monkeypatch.setattr(f"{MODULE_PATH}.HTTP_RESPONSE_SIZE", size)
+
+        self.client.get("/players/Amon-Ra")
+        self.client.get("/players/Josh")
+        self.client.get("/missing")
+
+        route = "/players/<player>"
+        assert counter.get(method="GET", route=route, status="200") == 2
+        assert counter.get(method="GET", route="unmatched", status="404") == 1
+        assert duration.get_count(method="GET", route=route) == 2
+        assert size.get_count(method="GET", route=route) == 2
+        assert (
+            f'patriot_center_size_bytes_sum{{method="GET",route="{route}"}} 11'
+            in size.render()
+        )
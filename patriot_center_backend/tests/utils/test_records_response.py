@@ -0,0 +1,197 @@
+"""Unit tests for records_response module."""
+
+import json
+from typing import Any
+
+import pytest
+from flask import Flask
+
+from patriot_center_backend.utils.records_response import records_response
+
+
+class TestRecordsResponse:
+    """Test records_response function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a Flask app and the data of a route for all tests.
+
+        Yields:
+            None
+        """
+        self.app = Flask(__name__)
+
+        self.data = {
+            "Tommy": {"wins": 10, "losses": 5},
+            "Anthony": {"wins": 8, "losses": 7},
+            "Cody": {"wins": 6, "losses": 9},
+        }
+
+        yield
+
+    def _get(self, query_string: str) -> Any:
+        """Build the records response for a query string.
+
+        Whether the response was streamed is kept in `self.streamed`.
+
+        Args:
+            query_string: The request's query string.
+
+        Returns:
+            The decoded body (a list of records for NDJSON).
+        """
+        with self.app.test_request_context(f"/?{query_string}"):
+            response = records_response(self.data, key_name="manager")
+            self.streamed = response.is_streamed
+            body = response.get_data(as_text=True)
+
+        if response.mimetype == "application/x-ndjson":
+            return [json.loads(line) for line in body.splitlines()]
+        return json.loads(body)
+
+    def test_full_record_list_by_default(self):
+        """Test all records are returned as a list without any arguments."""
+        body = self._get("")
+
+        assert [record["manager"] for record in body] == [
+            "Anthony",
+            "Cody",
+            "Tommy",
+        ]
+        assert body[0] == {"manager": "Anthony", "wins": 8, "losses": 7}
+
+    def test_pages(self):
+        """Test records are paginated with limit and cursor."""
+        first = self._get("limit=2")
+        second = self._get(f"limit=2&cursor={first['next_cursor']}")
+
+        assert [r["manager"] for r in first["records"]] == ["Anthony", "Cody"]
+        assert first["next_cursor"] == "2"
+        assert [r["manager"] for r in second["records"]] == ["Tommy"]
+        assert second["next_cursor"] is None
+
+    def test_fields(self):
+        """Test records are projected to the given fields."""
+        body = self._get("fields=manager,wins")
+
+        assert body[0] == {"manager": "Anthony", "wins": 8}
+
+    def test_ndjson_streams_records(self):
+        """Test NDJSON responses stream one record per line."""
+        records = self._get("format=ndjson&fields=wins&cursor=1")
+
+        assert self.streamed
+        assert records == [{"wins": 6}, {"wins": 10}]
+
+    def test_columnar(self):
+        """Test the columnar format sends each column name once."""
+        body = self._get("format=columnar")
+
+        assert body == {
+            "columns": ["manager", "wins", "losses"],
+            "rows": [["Anthony", 8, 7], ["Cody", 6, 9], ["Tommy", 10, 5]],
+        }
+
+    def test_columnar_pages_and_fields(self):
+        """Test limit, cursor and fields apply to the table's rows."""
+        body = self._get("format=columnar&fields=wins&limit=1&cursor=1")
+
+        assert body == {"columns": ["wins"], "rows": [[6]], "next_cursor": "2"}
+
+    def test_columnar_row_keys(self):
+        """Test routes choose the nesting levels that become rows."""
+        self.data = {"2024": {"1": {"Tommy": 10, "Anthony": 8}}}
+
+        with self.app.test_request_context("/?format=columnar"):
+            response = records_response(
+                self.data, row_keys=("year", "week", "manager")
+            )
+
+        assert response.get_json() == {
+            "columns": ["year", "week", "manager", "value"],
+            "rows": [["2024", "1", "Tommy", 10], ["2024", "1", "Anthony", 8]],
+        }
+
+    @pytest.mark.parametrize(
+        ("query_string", "expected"),
+        [
+            (
+                "",
+                [
+                    {
+                        "year": "2024",
+                        "1.Tommy.Josh Allen.points": 20,
+                        "1.Tommy.Bijan Robinson.points": 15,
+                    }
+                ],
+            ),
+            (
+                "limit=1",
+                {
+                    "records": [
+                        {
+                            "year": "2024",
+                            "week": "1",
+                            "manager": "Tommy",
+                            "player": "Josh Allen",
+                            "points": 20,
+                        }
+                    ],
+                    "next_cursor": "1",
+                },
+            ),
+            (
+                "fields=player,points",
+                [
+                    {"player": "Josh Allen", "points": 20},
+                    {"player": "Bijan Robinson", "points": 15},
+                ],
+            ),
+            ("format=ndjson&fields=points", [{"points": 20}, {"points": 15}]),
+        ],
+    )
+    def test_row_keys_records(self, query_string: str, expected: Any):
+        """Test records are paged, projected and streamed one row at a time.
+
+        Args:
+            query_string: The request's query string.
+            expected: The expected decoded body.
+        """
+        self.data = {
+            "2024": {
+                "1": {
+                    "Tommy": {
+                        "Josh Allen": {"points": 20},
+                        "Bijan Robinson": {"points": 15},
+                    }
+                }
+            }
+        }
+
+        with self.app.test_request_context(f"/?{query_string}"):
+            response = records_response(
+                self.data,
+                key_name="year",
+                row_keys=("year", "week", "manager", "player"),
+            )
+            body = response.get_data(as_text=True)
+
+        if response.mimetype == "application/x-ndjson":
+            body = [json.loads(line) for line in body.splitlines()]
+        else:
+            body = json.loads(body)
+        assert body == expected
+
+    @pytest.mark.parametrize(
+        "query_string", ["limit=0", "limit=ten", "cursor=-1"]
+    )
+    def test_invalid_arguments(self, query_string: str):
+        """Test invalid limit and cursor arguments raise ValueError.
+
+        Args:
+            query_string: The request's query string.
+        """
+        with pytest.raises(ValueError) as exc_info:
+            self._get(query_string)
+
+        assert "Invalid" in str(exc_info.value)
@@ -0,0 +1,60 @@
+"""Unit tests for request_memo module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from patriot_center_backend.utils.request_memo import request_memo
+
+
+class TestRequestMemo:
+    """Test request_memo decorator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a Flask app and a memoized lookup for all tests.
+
+        Yields:
+            None
+        """
+        self.app = Flask(__name__)
+
+        self.mock_lookup = MagicMock(side_effect=lambda item, **kwargs: [item])
+        self.lookup = request_memo(self.mock_lookup)
+
+        yield
+
+    def test_memoized_within_request(self):
+        """Test repeated calls in a request share one result."""
+        with self.app.test_request_context():
+            first = self.lookup("Tommy", dictionary=True)
+            second = self.lookup("Tommy", dictionary=True)
+
+        assert first is second
+        self.mock_lookup.assert_called_once_with("Tommy", dictionary=True)
+
+    def test_keyed_by_arguments(self):
+        """Test calls with other arguments aren't shared."""
+        with self.app.test_request_context():
+            self.lookup("Tommy")
+            self.lookup("Anthony")
+            self.lookup("Tommy", dictionary=True)
+
+        assert self.mock_lookup.call_count == 3
+
+    def test_not_shared_between_requests(self):
+        """Test each request computes its own result."""
+        with self.app.test_request_context():
+            self.lookup("Tommy")
+        with self.app.test_request_context():
+            self.lookup("Tommy")
+
+        assert self.mock_lookup.call_count == 2
+
+    def test_outside_request(self):
+        """Test the lookup is called every time outside of a request."""
+        self.lookup("Tommy")
+        self.lookup("Tommy")
+
+        assert self.mock_lookup.call_count == 2
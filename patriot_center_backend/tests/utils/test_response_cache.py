@@ -0,0 +1,243 @@
+"""Unit tests for response_cache module."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, Response, jsonify, request
+
+from patriot_center_backend.utils.compression import compress_all
+from patriot_center_backend.utils.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cached_response,
+)
+
+MODULE_PATH = "patriot_center_backend.utils.response_cache"
+
+
+class TestResponseCache:
+    """Test ResponseCache class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a response cache holding up to 2 entries or 10 bytes.
+
+        Yields:
+            None
+        """
+        self.response_cache = ResponseCache(max_entries=2, max_bytes=10)
+
+        yield
+
+    def test_get_stored_response(self):
+        """Test a stored response is returned at the same data version."""
+        cached = CachedResponse(b"abc", [], 1)
+        self.response_cache.put("a", cached)
+
+        assert self.response_cache.get("a", 1) is cached
+
+    def test_get_drops_other_versions(self):
+        """Test a response rendered at another data version is dropped."""
+        self.response_cache.put("a", CachedResponse(b"abc", [], 1))
+
+        assert self.response_cache.get("a", 2) is None
+        assert self.response_cache.get("a", 1) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used response is evicted when full."""
+        self.response_cache.put("a", CachedResponse(b"a", [], 1))
+        self.response_cache.put("b", CachedResponse(b"b", [], 1))
+        self.response_cache.get("a", 1)
+
+        self.response_cache.put("c", CachedResponse(b"c", [], 1))
+
+        assert self.response_cache.get("a", 1) is not None
+        assert self.response_cache.get("b", 1) is None
+        assert self.response_cache.get("c", 1) is not None
+
+    def test_evicts_by_size(self):
+        """Test responses are evicted to stay within the size limit."""
+        self.response_cache.put("a", CachedResponse(b"123456", [], 1))
+        self.response_cache.put("b", CachedResponse(b"123456", [], 1))
+
+        assert self.response_cache.get("a", 1) is None
+        assert self.response_cache.get("b", 1) is not None
+
+    def test_oversized_response_not_stored(self):
+        """Test a response larger than the whole cache is not stored."""
+        self.response_cache.put("a", CachedResponse(b"x" * 11, [], 1))
+
+        assert self.response_cache.get("a", 1) is None
+
+    def test_etag_from_body(self):
+        """Test equal bodies get equal ETags whatever their version."""
+        assert (
+            CachedResponse(b"abc", [], 1).etag
+            == CachedResponse(b"abc", [], 2).etag
+        )
+        assert (
+            CachedResponse(b"abc", [], 1).etag
+            != CachedResponse(b"abd", [], 1).etag
+        )
+
+
+class TestCachedResponse:
+    """Test cached_response decorator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER.get_data_version`: `mock_get_data_version`
+        - `RESPONSE_CACHE`: an empty `ResponseCache`
+        - `compression.brotli`: None (not installed)
+
+        A Flask app with a cached route counting its calls is created.
+
+        Yields:
+            None
+        """
+        with (
+            patch(
+                f"{MODULE_PATH}.CACHE_MANAGER.get_data_version"
+            ) as mock_get_data_version,
+            patch(f"{MODULE_PATH}.RESPONSE_CACHE", ResponseCache()),
+            patch("patriot_center_backend.utils.compression.brotli", None),
+        ):
+            self.mock_get_data_version = mock_get_data_version
+            self.mock_get_data_version.return_value = 1
+
+            self.calls = 0
+            app = Flask(__name__)
+
+            @app.route("/data")
+            @cached_response
+            def data_route():
+                self.calls += 1
+                if request.args.get("fail"):
+                    return jsonify({"error": "bad"}), 400
+                if request.args.get("big"):
+                    return jsonify(["player"] * 1000), 200
+                if request.args.get("stream"):
+                    return Response(iter(["a\n", "b\n"])), 200
+
+                response = jsonify({"calls": self.calls, **request.args})
+                response.headers["Cache-Control"] = "public, max-age=3600"
+                return response, 200
+
+            self.client = app.test_client()
+
+            yield
+
+    def test_repeated_request_served_from_cache(self):
+        """Test a repeated request is served without calling the route."""
+        first = self.client.get("/data?a=1&b=2")
+        second = self.client.get("/data?b=2&a=1")
+
+        assert self.calls == 1
+        assert second.get_json() == first.get_json()
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["Cache-Control"] == "public, max-age=3600"
+
+    def test_different_args_rendered_separately(self):
+        """Test requests with different arguments are cached separately."""
+        self.client.get("/data?format=json")
+        self.client.get("/data")
+
+        assert self.calls == 2
+
+    def test_rendered_again_after_data_version_change(self):
+        """Test a response is rendered again once the data changes."""
+        self.client.get("/data")
+        self.mock_get_data_version.return_value = 2
+
+        response = self.client.get("/data")
+
+        assert self.calls == 2
+        assert response.get_json() == {"calls": 2}
+
+    def test_not_modified(self):
+        """Test a matching If-None-Match gets a 304 without the route."""
+        etag = self.client.get("/data").headers["ETag"]
+
+        response = self.client.get("/data", headers={"If-None-Match": etag})
+
+        assert self.calls == 1
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "public, max-age=3600"
+
+    def test_stale_etag_gets_full_response(self):
+        """Test a non-matching If-None-Match gets the full response."""
+        response = self.client.get(
+            "/data", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.get_json() == {"calls": 1}
+
+    def test_errors_not_cached(self):
+        """Test error responses are rendered on every request."""
+        self.client.get("/data?fail=1")
+        response = self.client.get("/data?fail=1")
+
+        assert self.calls == 2
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+
+    def test_streams_not_cached(self):
+        """Test streamed responses are passed through and not stored."""
+        self.client.get("/data?stream=1")
+        response = self.client.get("/data?stream=1")
+
+        assert self.calls == 2
+        assert response.data == b"a\nb\n"
+        assert "ETag" not in response.headers
+
+    def test_served_precompressed(self):
+        """Test large bodies are compressed once and served compressed."""
+        headers = {"Accept-Encoding": "gzip"}
+
+        with patch(
+            f"{MODULE_PATH}.compress_all", wraps=compress_all
+        ) as mock_compress_all:
+            first = self.client.get("/data?big=1", headers=headers)
+            second = self.client.get("/data?big=1", headers=headers)
+
+        mock_compress_all.assert_called_once()
+        assert self.calls == 1
+        assert second.headers["Content-Encoding"] == "gzip"
+        assert second.data == first.data
+        assert gzip.decompress(second.data).startswith(b'["player",')
+        assert "Accept-Encoding" in second.headers["Vary"]
+
+    def test_encodings_get_different_etags(self):
+        """Test each encoding has its own ETag and is revalidated by it."""
+        plain = self.client.get("/data?big=1")
+        gzipped = self.client.get(
+            "/data?big=1", headers={"Accept-Encoding": "gzip"}
+        )
+
+        not_modified = self.client.get(
+            "/data?big=1",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": gzipped.headers["ETag"],
+            },
+        )
+        modified = self.client.get(
+            "/data?big=1",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": plain.headers["ETag"],
+            },
+        )
+
+        assert "Content-Encoding" not in plain.headers
+        assert plain.headers["ETag"] != gzipped.headers["ETag"]
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
@@ -23,7 +23,7 @@ class TestSleeperApiClientFetch:
         Yields:
             None
         """
-        with patch(f"{MODULE_PATH}.requests.get") as mock_requests_get:
+        with patch("requests.get") as mock_requests_get:
             self.mock_requests_get = mock_requests_get
             self.mock_response = MagicMock()
             self.mock_response.status_code = 200
@@ -104,7 +104,7 @@ class TestSleeperApiClientClearCache:
         Yields:
             None
         """
-        with patch(f"{MODULE_PATH}.requests.get") as mock_requests_get:
+        with patch("requests.get") as mock_requests_get:
             self.mock_requests_get = mock_requests_get
             self.mock_response = MagicMock()
             self.mock_response.status_code = 200
@@ -4,7 +4,14 @@ from unittest.mock import patch
 
 import pytest
 
-from patriot_center_backend.utils.slug_utils import slug_to_name, slugify
+from patriot_center_backend.cache.entity_index import EntityIndex
+from patriot_center_backend.utils.slug_utils import (
+    name_to_slug,
+    slug_to_name,
+    slugify,
+)
+
+MODULE_PATH = "patriot_center_backend.utils.slug_utils"
 
 
 class TestSlugify:
@@ -38,50 +45,84 @@ class TestSlugToName:
 
         The mocks are set up to return a pre-defined
         set of values when accessed.
-        - `CACHE_MANAGER.get_players_cache`: `mock_get_players_cache`
+        - `get_entity_index`: `mock_get_entity_index`, built from
+            `mock_players_cache`
 
         Yields:
             None
         """
-        with (
-            patch(
-                "patriot_center_backend.utils.slug_utils"
-                ".CACHE_MANAGER.get_players_cache"
-            ) as mock_get_players_cache,
-        ):
-            self.get_players_cache = mock_get_players_cache
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
+            self.mock_players_cache = {
+                "Ja'Marr Chase": {
+                    "slug": "ja%27marr%20chase",
+                    "full_name": "Ja'Marr Chase",
+                },
+                "Patrick Mahomes": {
+                    "slug": "patrick%20mahomes",
+                    "full_name": "Patrick Mahomes",
+                },
+            }
+            mock_get_entity_index.side_effect = lambda: EntityIndex(
+                {}, self.mock_players_cache, {}
+            )
 
             yield
 
     def test_slug_to_name_found(self):
         """Test returns the correct full name when given a slug that exists."""
-        self.get_players_cache.return_value = {
-            "Ja'Marr Chase": {
-                "slug": "ja%27marr%20chase",
-                "full_name": "Ja'Marr Chase",
-            },
-            "Patrick Mahomes": {
-                "slug": "patrick%20mahomes",
-                "full_name": "Patrick Mahomes",
-            },
-        }
         result = slug_to_name("ja%27marr%20chase")
 
         assert result == "Ja'Marr Chase"
 
     def test_slug_to_name_not_found(self):
         """Test returns the slug unchanged when a slug that does not exist."""
-        self.get_players_cache.return_value = {
-            "Ja'Marr Chase": {
-                "slug": "ja%27marr%20chase",
-                "full_name": "Ja'Marr Chase",
-            },
-            "Patrick Mahomes": {
-                "slug": "patrick%20mahomes",
-                "full_name": "Patrick Mahomes",
-            },
-        }
-
         result = slug_to_name("amon-ra%20st.%20brown")
 
         assert result == "amon-ra%20st.%20brown"
+
+    def test_slug_to_name_encodes_slug(self):
+        """Test an unencoded name is encoded before the lookup."""
+        result = slug_to_name("Ja'Marr Chase")
+
+        assert result == "Ja'Marr Chase"
+
+
+class TestNameToSlug:
+    """Unit tests for the name_to_slug function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `get_entity_index`: `mock_get_entity_index`
+
+        Yields:
+            None
+        """
+        with patch(f"{MODULE_PATH}.get_entity_index") as mock_get_entity_index:
+            mock_get_entity_index.return_value = EntityIndex(
+                {},
+                {
+                    "Amon-Ra St. Brown": {
+                        "slug": "amon-ra%20st.%20brown",
+                        "full_name": "Amon-Ra St. Brown",
+                    },
+                },
+                {},
+            )
+
+            yield
+
+    def test_name_to_slug_found(self):
+        """Test returns the cached slug for a known player."""
+        result = name_to_slug("Amon-Ra St. Brown")
+
+        assert result == "amon-ra%20st.%20brown"
+
+    def test_name_to_slug_not_found(self):
+        """Test falls back to slugify for an unknown name."""
+        result = name_to_slug("Patrick Mahomes")
+
+        assert result == "patrick%20mahomes"
@@ -0,0 +1,113 @@
+"""Unit tests for warmup module."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from patriot_center_backend.utils.warmup import Warmup
+
+MODULE_PATH = "patriot_center_backend.utils.warmup"
+
+
+class TestWarmup:
+    """Test Warmup class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """Setup common mocks for all tests.
+
+        The mocks are set up to return a pre-defined
+        set of values when accessed.
+        - `CACHE_MANAGER`: `mock_cache_manager`
+        - `build_all_indexes`: `mock_build_all_indexes`
+        - `threading.Thread.start`: `mock_thread_start`
+        - `WARMUP` environment variable: unset
+
+        Args:
+            monkeypatch: pytest monkeypatch fixture
+
+        Yields:
+            None
+        """
+        monkeypatch.delenv("WARMUP", raising=False)
+
+        with (
+            patch(f"{MODULE_PATH}.CACHE_MANAGER") as mock_cache_manager,
+            patch(f"{MODULE_PATH}.build_all_indexes") as mock_build_all_indexes,
+            patch.object(threading.Thread, "start") as mock_thread_start,
+        ):
+            self.mock_cache_manager = mock_cache_manager
+            self.mock_build_all_indexes = mock_build_all_indexes
+            self.mock_thread_start = mock_thread_start
+
+            self.app = Flask(__name__)
+            self.rendered = []
+
+            @self.app.route("/hot")
+            def hot_route() -> str:
+                self.rendered.append("/hot")
+                return "hot"
+
+            self.warmup = Warmup(paths=("/hot",), load_threads=2)
+
+            yield
+
+    def test_not_ready_before_running(self):
+        """Test the status before warming up."""
+        assert self.warmup.get_status() == {
+            "ready": False,
+            "steps": {
+                "caches": "pending",
+                "indexes": "pending",
+                "responses": "pending",
+            },
+            "elapsed_seconds": None,
+        }
+
+    def test_run(self):
+        """Test every step runs and the process becomes ready."""
+        self.warmup.run(self.app)
+
+        status = self.warmup.get_status()
+        assert status["ready"]
+        assert set(status["steps"].values()) == {"done"}
+        self.mock_cache_manager.load_all_caches.assert_called_once_with(
+            max_workers=2
+        )
+        self.mock_build_all_indexes.assert_called_once()
+        assert self.rendered == ["/hot"]
+
+    def test_failed_step_does_not_block_readiness(self):
+        """Test a failing step is reported and the next steps still run."""
+        self.mock_build_all_indexes.side_effect = KeyError("2024")
+
+        self.warmup.run(self.app)
+
+        status = self.warmup.get_status()
+        assert status["ready"]
+        assert status["steps"]["indexes"] == "failed"
+        assert status["steps"]["responses"] == "done"
+
+    def test_disabled(self, monkeypatch):
+        """Test nothing is warmed up with WARMUP=0.
+
+        Args:
+            monkeypatch: pytest monkeypatch fixture
+        """
+        monkeypatch.setenv("WARMUP", "0")
+
+        self.warmup.run(self.app)
+
+        assert self.warmup.is_ready()
+        assert set(self.warmup.get_status()["steps"].values()) == {"skipped"}
+        self.mock_cache_manager.load_all_caches.assert_not_called()
+        assert self.rendered == []
+
+    def test_start_once(self):
+        """Test the background thread is started on the first call only."""
+        self.warmup.start(self.app)
+        self.warmup.start(self.app)
+
+        self.mock_thread_start.assert_called_once()
@@ -0,0 +1,154 @@
+"""Response compression for the Flask app.
+
+Bodies are compressed with brotli when the `brotli` package is installed
+and the client accepts it, and with gzip otherwise. Small bodies and
+non-text responses are sent as they are.
+
+Usage:
+    app.after_request(compress_response)
+"""
+
+import gzip
+
+from flask import Response, request
+from werkzeug.datastructures import Accept
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed, as the saving is small
+_MIN_COMPRESS_SIZE = 1024
+
+# Favour speed, as uncached responses are compressed on the request path
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+
+_COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "text/html",
+    "text/plain",
+}
+
+
+def get_supported_encodings() -> list[str]:
+    """Get the content encodings the server can produce, preferred first.
+
+    Returns:
+        The content encodings.
+    """
+    if brotli is not None:
+        return ["br", "gzip"]
+    return ["gzip"]
+
+
+def choose_encoding(accept_encodings: Accept) -> str | None:
+    """Choose the content encoding to send a client.
+
+    Args:
+        accept_encodings: The client's `Accept-Encoding` header.
+
+    Returns:
+        The content encoding, or None to send the body as it is.
+    """
+    return accept_encodings.best_match(get_supported_encodings())
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with a content encoding.
+
+    Args:
+        body: The body to compress.
+        encoding: The content encoding ("br" or "gzip").
+
+    Returns:
+        The compressed body.
+
+    Raises:
+        ValueError: If the content encoding isn't supported.
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=_BROTLI_QUALITY)
+
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def is_compressible(body: bytes, mimetype: str | None) -> bool:
+    """Check whether a body is worth compressing.
+
+    Args:
+        body: The body.
+        mimetype: The body's mimetype.
+
+    Returns:
+        True if the body is text and above the size threshold.
+    """
+    return (
+        mimetype in _COMPRESSIBLE_MIMETYPES and len(body) >= _MIN_COMPRESS_SIZE
+    )
+
+
+def compress_all(body: bytes, mimetype: str | None) -> dict[str, bytes]:
+    """Compress a body with every supported content encoding.
+
+    Args:
+        body: The body to compress.
+        mimetype: The body's mimetype.
+
+    Returns:
+        The compressed body by content encoding, or an empty dict if the
+        body isn't worth compressing.
+    """
+    if not is_compressible(body, mimetype):
+        return {}
+
+    return {
+        encoding: compress(body, encoding)
+        for encoding in get_supported_encodings()
+    }
+
+
+def compress_response(response: Response) -> Response:
+    """Compress a response for the current request, if worth it.
+
+    Registered as an `after_request` hook. Responses already encoded (e.g.
+    served precompressed from the response cache), streamed, or not 200 are
+    left as they are.
+
+    Args:
+        response: The response to compress.
+
+    Returns:
+        The response, compressed in-place if worth it.
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    body = response.get_data()
+    if not is_compressible(body, response.mimetype):
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    response.set_data(compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+
+    # A strong ETag must differ between encodings of the same body
+    etag, weak = response.get_etag()
+    if etag is not None:
+        response.set_etag(f"{etag}-{encoding}", weak=weak)
+
+    return response
@@ -1,5 +1,6 @@
 """Utility functions for formatting and normalizing data structures."""
 
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from typing import Any
 
 
@@ -19,22 +20,10 @@ def flatten_dict(
     Returns:
         Flattened dictionary.
     """
-    out = {}
-
     if not isinstance(d, dict):
-        return out
+        return {}
 
-    # Safe iteration: handles None/non-dict inputs gracefully
-    for k, v in (d or {}).items():
-        # Build nested key path using separator
-        nk = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            # Recurse into nested dicts to flatten deeper levels
-            out.update(flatten_dict(v, nk, sep))
-        else:
-            # Leaf value: add to output with full key path
-            out[nk] = v
-    return out
+    return dict(_iter_flat_items(d, parent_key, sep))
 
 
 def to_records(data: Any, key_name: str = "key") -> list[dict[str, Any]]:
@@ -62,26 +51,7 @@ def to_records(data: Any, key_name: str = "key") -> list[dict[str, Any]]:
 
     # Handle dict inputs: convert to list of records with key field
     if isinstance(data, dict):
-        rows = []
-        for k, v in data.items():
-            if isinstance(v, list):
-                # Expand list values: create one record per list item
-                for item in v:
-                    row = {key_name: k}
-                    row.update(
-                        flatten_dict(item)
-                        if isinstance(item, dict)
-                        else {"value": item}
-                    )
-                    rows.append(row)
-            elif isinstance(v, dict):
-                # Nested dict: flatten and merge into record
-                row = {key_name: k}
-                row.update(flatten_dict(v))
-                rows.append(row)
-            else:
-                # Scalar value: simple key-value record
-                rows.append({key_name: k, "value": v})
+        rows = list(_iter_dict_records(data.items(), key_name))
 
         # Sort records alphabetically by key field for consistent ordering
         rows.sort(key=lambda item: item.get(key_name, ""), reverse=False)
@@ -90,3 +60,224 @@ def to_records(data: Any, key_name: str = "key") -> list[dict[str, Any]]:
 
     # Fallback for scalar inputs: wrap in single-item list
     return [{"value": data}]
+
+
+def iter_records(data: Any, key_name: str = "key") -> Iterator[dict[str, Any]]:
+    """Yield the records `to_records` would return, one at a time.
+
+    Dict inputs are flattened one key at a time, in key order, so only the
+    record being yielded is held in memory. Other inputs are passed to
+    `to_records`.
+
+    Args:
+        data: Input structure.
+        key_name: Field name to assign original dict keys.
+
+    Yields:
+        Normalized record dictionaries.
+    """
+    if not isinstance(data, dict):
+        yield from to_records(data, key_name=key_name)
+        return
+
+    yield from _iter_dict_records(
+        sorted(data.items(), key=lambda item: item[0]), key_name
+    )
+
+
+def project_record(
+    record: dict[str, Any], fields: Collection[str]
+) -> dict[str, Any]:
+    """Keep only the given fields of a record.
+
+    A field also keeps the fields flattened from under it, so "1.Tommy"
+    keeps "1.Tommy.Josh Allen.points".
+
+    Args:
+        record: Flattened record.
+        fields: Names of the fields to keep.
+
+    Returns:
+        The projected record.
+    """
+    return dict(select_fields(record.items(), fields))
+
+
+def select_fields(
+    items: Iterable[tuple[Any, Any]], fields: Collection[str]
+) -> Iterator[tuple[Any, Any]]:
+    """Keep only the given fields of (field, value) pairs.
+
+    A field also keeps the fields flattened from under it, as in
+    `project_record`.
+
+    Args:
+        items: The (field, value) pairs.
+        fields: Names of the fields to keep.
+
+    Yields:
+        The kept (field, value) pairs.
+    """
+    prefixes = tuple(f"{field}." for field in fields)
+
+    for k, v in items:
+        if k in fields or str(k).startswith(prefixes):
+            yield k, v
+
+
+def iter_rows(
+    data: Any, row_keys: Sequence[str]
+) -> Iterator[list[tuple[Any, Any]]]:
+    """Yield nested data as table rows of (column, value) pairs.
+
+    Each level of nesting named in `row_keys` becomes a key column, and the
+    dicts under the last level are flattened into the remaining columns.
+    For example, with `row_keys=("year", "week", "manager", "player")` the
+    starters cache has one row per starter. Like `to_records`, top-level
+    keys are sorted, list values give one row per item, and scalar values
+    go in a "value" column.
+
+    Rows are built as pairs rather than dicts, as only their values are
+    sent (see `to_columnar`).
+
+    Args:
+        data: Input structure.
+        row_keys: Column names for the dict keys at each level.
+
+    Yields:
+        One row at a time, as (column, value) pairs.
+    """
+    if not isinstance(data, dict):
+        for record in to_records(data, key_name=row_keys[0]):
+            yield list(record.items())
+        return
+
+    yield from _iter_dict_rows(
+        sorted(data.items(), key=lambda item: item[0]), row_keys, []
+    )
+
+
+def to_columnar(rows: Iterable[list[tuple[Any, Any]]]) -> dict[str, Any]:
+    """Pack table rows into a column list and rows of values.
+
+    Columns are listed in the order they are first seen, and a row holds
+    null for the columns it doesn't have.
+
+    Args:
+        rows: Rows of (column, value) pairs, e.g. from `iter_rows`.
+
+    Returns:
+        Dict with "columns" (column names) and "rows" (lists of values, in
+        column order).
+    """
+    column_ids: dict[Any, int] = {}
+    packed_rows = []
+
+    for row in rows:
+        values = [None] * len(column_ids)
+        for column, value in row:
+            column_id = column_ids.get(column)
+            if column_id is None:
+                # New columns are appended, so they go at the row's end
+                column_ids[column] = len(column_ids)
+                values.append(value)
+            else:
+                values[column_id] = value
+        packed_rows.append(values)
+
+    # Earlier rows are missing the columns first seen after them
+    for values in packed_rows:
+        values.extend([None] * (len(column_ids) - len(values)))
+
+    return {"columns": list(column_ids), "rows": packed_rows}
+
+
+def _iter_flat_items(
+    d: dict[Any, Any], parent_key: str, sep: str
+) -> Iterator[tuple[Any, Any]]:
+    """Yield the (key, value) pairs of a flattened dict.
+
+    Args:
+        d: Nested dict to flatten.
+        parent_key: Prefix carried through recursive calls.
+        sep: Separator for concatenated keys.
+
+    Yields:
+        Flattened (key, value) pairs.
+    """
+    for k, v in d.items():
+        # Build nested key path using separator
+        nk = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            # Recurse into nested dicts to flatten deeper levels
+            yield from _iter_flat_items(v, nk, sep)
+        else:
+            # Leaf value: add to output with full key path
+            yield nk, v
+
+
+def _iter_dict_rows(
+    items: Iterable[tuple[Any, Any]],
+    row_keys: Sequence[str],
+    key_columns: list[tuple[str, Any]],
+) -> Iterator[list[tuple[Any, Any]]]:
+    """Yield the rows of a dict's items at one level of nesting.
+
+    Args:
+        items: The dict's (key, value) pairs.
+        row_keys: Column names for the dict keys at each level.
+        key_columns: Key columns of the levels above.
+
+    Yields:
+        One row at a time, as (column, value) pairs.
+    """
+    level = len(key_columns)
+
+    for k, v in items:
+        row = [*key_columns, (row_keys[level], k)]
+
+        if isinstance(v, dict) and level < len(row_keys) - 1:
+            yield from _iter_dict_rows(v.items(), row_keys, row)
+        elif isinstance(v, dict):
+            yield [*row, *_iter_flat_items(v, "", ".")]
+        elif isinstance(v, list):
+            for item in v:
+                if isinstance(item, dict):
+                    yield [*row, *_iter_flat_items(item, "", ".")]
+                else:
+                    yield [*row, ("value", item)]
+        else:
+            yield [*row, ("value", v)]
+
+
+def _iter_dict_records(
+    items: Iterable[tuple[Any, Any]], key_name: str
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of a dict's items, in the order given.
+
+    Args:
+        items: The dict's (key, value) pairs.
+        key_name: Field name to assign original dict keys.
+
+    Yields:
+        Normalized record dictionaries.
+    """
+    for k, v in items:
+        if isinstance(v, list):
+            # Expand list values: create one record per list item
+            for item in v:
+                row = {key_name: k}
+                row.update(
+                    flatten_dict(item)
+                    if isinstance(item, dict)
+                    else {"value": item}
+                )
+                yield row
+        elif isinstance(v, dict):
+            # Nested dict: flatten and merge into record
+            row = {key_name: k}
+            row.update(flatten_dict(v))
+            yield row
+        else:
+            # Scalar value: simple key-value record
+            yield {key_name: k, "value": v}
@@ -1,6 +1,7 @@
 """Data formatting and presentation helpers."""
 
 import logging
+from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any, Literal
 
@@ -9,7 +10,7 @@ from patriot_center_backend.cache.updaters.image_urls_updater import (
     update_image_urls_cache,
 )
 from patriot_center_backend.constants import LEAGUE_IDS
-from patriot_center_backend.utils.image_url_handler import get_image_url
+from patriot_center_backend.utils.image_url_handler import get_image_urls
 from patriot_center_backend.utils.sleeper_helpers import fetch_sleeper_data
 
 logger = logging.getLogger(__name__)
@@ -77,7 +78,7 @@ def get_top_3_scorers_from_matchup_data(
         manager_2: Second manager name
 
     Raises:
-        ValueError: If get_image_url fails to retrieve output in dict form
+        ValueError: If get_image_urls fails to retrieve output in dict form
     """
     player_ids_cache = CACHE_MANAGER.get_player_ids_cache()
     players_cache = CACHE_MANAGER.get_players_cache()
@@ -108,12 +109,19 @@ def get_top_3_scorers_from_matchup_data(
         )
         return
 
+    player_images = get_image_urls(
+        (
+            player
+            for manager in [manager_1, manager_2]
+            for player in week_data[manager]
+            if player != "Total_Points"
+        ),
+        dictionary=True,
+    )
+
     var_map = {manager_1: "manager_1", manager_2: "manager_2"}
     for manager in [manager_1, manager_2]:
-        manager_starters = deepcopy(week_data[manager])
-        # Remove total points aggregate, we only want individual players
-        if "Total_Points" in manager_starters:
-            manager_starters.pop("Total_Points")
+        manager_starters = week_data[manager]
 
         # Initialize with high value to find minimum
         lowest_scorer = {"score": 10000.0}
@@ -121,14 +129,21 @@ def get_top_3_scorers_from_matchup_data(
         # Iterate over starters
         top_scorers = []
         for player in manager_starters:
-            player_dict = get_image_url(player, dictionary=True)
+            # Skip total points aggregate, we only want individual players
+            if player == "Total_Points":
+                continue
+
+            player_dict = player_images[player]
 
             if not isinstance(player_dict, dict):
                 raise ValueError(
-                    f"Dict expected from get_image_url for player {player}, "
+                    f"Dict expected from get_image_urls for player {player}, "
                     f"dictionary was set to True, but got {type(player_dict)}"
                 )
 
+            # Copied, as the same image dict is returned for repeated players
+            player_dict = dict(player_dict)
+
             player_id = players_cache[player]["player_id"]
             if not player_id:
                 logger.warning(
@@ -160,7 +175,7 @@ def get_top_3_scorers_from_matchup_data(
                 continue
 
             if player_score < lowest_scorer["score"]:
-                lowest_scorer = deepcopy(player_dict)
+                lowest_scorer = dict(player_dict)
 
             # Maintain sorted top 3 list using insertion sort
             if len(top_scorers) == 0:
@@ -230,16 +245,18 @@ def get_matchup_card(
     else:
         winner = "Tie"
 
+    manager_images = get_image_urls([manager_1, manager_2])
+
     matchup = {
         "year": year,
         "week": week,
         "manager_1": {
             "name": manager_1,
-            "image_url": get_image_url(manager_1),
+            "image_url": manager_images[manager_1],
         },
         "manager_2": {
             "name": manager_2,
-            "image_url": get_image_url(manager_2),
+            "image_url": manager_images[manager_2],
         },
         "manager_1_score": manager_1_score,
         "manager_2_score": manager_2_score,
@@ -248,7 +265,7 @@ def get_matchup_card(
 
     get_top_3_scorers_from_matchup_data(matchup, manager_1, manager_2)
 
-    return deepcopy(matchup)
+    return matchup
 
 
 def get_trade_card(transaction_id: str) -> dict[str, Any]:
@@ -289,6 +306,10 @@ def get_trade_card(transaction_id: str) -> dict[str, Any]:
 
     trade_item = {"year": year, "week": week, "managers_involved": []}
 
+    images = get_image_urls(
+        [*managers_involved, *trans["trade_details"]], dictionary=True
+    )
+
     # Create sent/received arrays for each manager involved
     for m in managers_involved:
         if not isinstance(m, str):
@@ -298,9 +319,7 @@ def get_trade_card(transaction_id: str) -> dict[str, Any]:
 
         trade_item[f"{m.lower().replace(' ', '_')}_received"] = []
         trade_item[f"{m.lower().replace(' ', '_')}_sent"] = []
-        trade_item["managers_involved"].append(
-            get_image_url(m, dictionary=True)
-        )
+        trade_item["managers_involved"].append(images[m])
 
     # Populate sent/received arrays with players/assets
     for player in trans["trade_details"]:
@@ -317,7 +336,7 @@ def get_trade_card(transaction_id: str) -> dict[str, Any]:
         old_manager = old_manager.lower().replace(" ", "_")
         new_manager = new_manager.lower().replace(" ", "_")
 
-        player_dict = get_image_url(player, dictionary=True)
+        player_dict = images[player]
 
         trade_item[f"{old_manager}_sent"].append(deepcopy(player_dict))
         trade_item[f"{new_manager}_received"].append(deepcopy(player_dict))
@@ -328,7 +347,7 @@ def get_trade_card(transaction_id: str) -> dict[str, Any]:
 
 
 def extract_dict_data(
-    data: dict[str, Any],
+    data: Mapping[str, Any],
     key_name: str = "name",
     value_name: str = "count",
     cutoff: int = 3,
@@ -349,13 +368,15 @@ def extract_dict_data(
         List of dictionaries with key_name, value_name, and image_url fields
     """
     # Flatten nested dictionaries by extracting "total" values
-    for key in data:
-        if not isinstance(data[key], dict):
-            break
-        data[key] = data[key]["total"]
+    values = {
+        key: value["total"] if isinstance(value, Mapping) else value
+        for key, value in data.items()
+    }
 
     # Sort items by value in descending order
-    sorted_items = sorted(data.items(), key=lambda item: item[1], reverse=True)
+    sorted_items = sorted(
+        values.items(), key=lambda item: item[1], reverse=True
+    )
 
     # If no cutoff, include all items
     if not cutoff:
@@ -373,15 +394,17 @@ def extract_dict_data(
         top_three = dict(sorted_items[:i + 1])
 
     # Build formatted output list with image URLs
+    image_urls = get_image_urls(top_three)
+
     items = []
     for item in top_three:
         long_dict = {}
         long_dict[key_name] = item
         long_dict[value_name] = top_three[item]
-        long_dict["image_url"] = get_image_url(item)
-        items.append(deepcopy(long_dict))
+        long_dict["image_url"] = image_urls[item]
+        items.append(long_dict)
 
-    return deepcopy(items)
+    return items
 
 
 def draft_pick_decipher(
@@ -1,28 +1,8 @@
 """Helper functions for the Patriot Center backend."""
 
-from functools import lru_cache
 from typing import Any
 
-from patriot_center_backend.cache import CACHE_MANAGER
-
-
-@lru_cache(maxsize=1)
-def _get_player_name_to_id() -> dict[str, str]:
-    """Return a dictionary mapping full player names to their IDs.
-
-    This function is an LRU cache with a size of 1, meaning it will only store
-        the most recent call's result.
-    This is useful for speeding up repeated calls to this function.
-
-    Returns:
-        dict[str, str]: A dictionary mapping full player names to their IDs.
-    """
-    player_ids_cache = CACHE_MANAGER.get_player_ids_cache()
-
-    return {
-        player_info["full_name"]: pid
-        for pid, player_info in player_ids_cache.items()
-    }
+from patriot_center_backend.cache.entity_index import get_entity_index
 
 
 def get_player_id(player_name: str) -> str | None:
@@ -34,7 +14,7 @@ def get_player_id(player_name: str) -> str | None:
     Returns:
         The player ID if found, otherwise None.
     """
-    return _get_player_name_to_id().get(player_name)
+    return get_entity_index().get_player_id(player_name)
 
 
 def get_player_name(player_id: str) -> str | None:
@@ -46,9 +26,8 @@ def get_player_name(player_id: str) -> str | None:
     Returns:
         The player name if found, otherwise None.
     """
-    player_ids_cache = CACHE_MANAGER.get_player_ids_cache()
+    return get_entity_index().get_player_name(player_id)
 
-    return player_ids_cache.get(player_id, {}).get("full_name")
 
 def get_player_position(player_id: str) -> str | None:
     """Retrieve the player position for a given player ID from the IDs cache.
@@ -59,9 +38,8 @@ def get_player_position(player_id: str) -> str | None:
     Returns:
         The player position if found, otherwise None.
     """
-    player_ids_cache = CACHE_MANAGER.get_player_ids_cache()
+    return get_entity_index().get_player_position(player_id)
 
-    return player_ids_cache.get(player_id, {}).get("position")
 
 def get_user_id(manager_name: str) -> str | None:
     """Retrieve the user ID for a given manager name from the manager cache.
@@ -72,9 +50,7 @@ def get_user_id(manager_name: str) -> str | None:
     Returns:
         The user ID if found, otherwise None.
     """
-    manager_cache = CACHE_MANAGER.get_manager_cache()
-
-    return manager_cache.get(manager_name, {}).get("summary", {}).get("user_id")
+    return get_entity_index().get_user_id(manager_name)
 
 
 def recursive_replace(data: Any, old_str: str, new_str: str) -> Any:
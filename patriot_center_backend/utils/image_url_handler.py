@@ -1,25 +1,35 @@
 """This module provides utility functions for handling image URLs."""
 
 import logging
-from copy import deepcopy
+from collections.abc import Iterable
 from time import time
 from typing import Any
 
 from patriot_center_backend.cache import CACHE_MANAGER
 from patriot_center_backend.cache.updaters.image_urls_updater import (
-    update_image_urls_cache,
+    IMAGE_URL_REFRESHER,
+    update_image_urls,
 )
 from patriot_center_backend.utils.item_type_detector import detect_item_type
+from patriot_center_backend.utils.metrics import METRICS
+from patriot_center_backend.utils.request_memo import request_memo
 
 logger = logging.getLogger(__name__)
 
+_IMAGE_URL_LOOKUPS = METRICS.counter(
+    "image_url_lookups_total",
+    "Image URL lookups, by whether the URL was cached, built or unknown.",
+    ("result",),
+)
+
 
+@request_memo
 def get_image_url(item: str, dictionary: bool = False) -> dict[str, str] | str:
     """Get image URL for item.
 
     If item is manager, check to see if manager image URL is already in cache
-    if it is, and its less than one hour old, return it,
-    otherwise fetch it
+    if it is, return it, queueing a background refresh when it is more than
+    one hour old, otherwise fetch it
 
     Note: If dictionary is True, and item is manager, returns dictionary
     with just image URL and name
@@ -33,24 +43,65 @@ def get_image_url(item: str, dictionary: bool = False) -> dict[str, str] | str:
         Image URL for item
             or dictionary of image URL, name, first name, and last name
     """
-    item_type = detect_item_type(item)
+    return get_image_urls([item], dictionary)[item]
 
-    if item_type == "unknown":
-        logger.warning(f"Could not find image URL for item: {item}")
-        return {} if dictionary else ""
 
-    image_urls_cache = CACHE_MANAGER.get_image_urls_cache()
+def get_image_urls(
+    items: Iterable[str], dictionary: bool = False
+) -> dict[str, dict[str, str] | str]:
+    """Get image URLs for every item in a response at once.
 
-    item_entry = image_urls_cache.get(item, {})
+    Each distinct item is resolved once, and items missing from the cache
+    are built together so the cache is saved at most once. Managers are
+    handled as in `get_image_url`.
+
+    Args:
+        items: Items to get image URLs for
+        dictionary: If True, return dictionaries with other values,
+            otherwise return strings
 
-    if not item_entry:
-        item_entry = update_image_urls_cache(item)
-        return deepcopy(item_entry) if dictionary else item_entry["image_url"]
+    Returns:
+        Image URL or dictionary for each distinct item
+    """
+    item_types = {item: detect_item_type(item) for item in dict.fromkeys(items)}
 
-    if item_type == "manager":
-        return _handle_if_manager(item_entry, dictionary)
+    image_urls_cache = CACHE_MANAGER.get_image_urls_cache()
 
-    return deepcopy(item_entry) if dictionary else item_entry["image_url"]
+    missing = {
+        item: item_type
+        for item, item_type in item_types.items()
+        if item_type != "unknown" and not image_urls_cache.get(item)
+    }
+    new_entries = update_image_urls(missing) if missing else {}
+
+    unknown = sum(item_type == "unknown" for item_type in item_types.values())
+    hits = len(item_types) - unknown - len(missing)
+    _IMAGE_URL_LOOKUPS.inc(hits, result="hit")
+    _IMAGE_URL_LOOKUPS.inc(len(missing), result="miss")
+    _IMAGE_URL_LOOKUPS.inc(unknown, result="unknown")
+
+    image_urls: dict[str, dict[str, str] | str] = {}
+    for item, item_type in item_types.items():
+        if item_type == "unknown":
+            logger.warning(f"Could not find image URL for item: {item}")
+            image_urls[item] = {} if dictionary else ""
+            continue
+
+        if item in new_entries:
+            item_entry = new_entries[item]
+        elif item_type == "manager":
+            image_urls[item] = _handle_if_manager(
+                image_urls_cache[item], dictionary
+            )
+            continue
+        else:
+            item_entry = image_urls_cache[item]
+
+        image_urls[item] = (
+            dict(item_entry) if dictionary else item_entry["image_url"]
+        )
+
+    return image_urls
 
 
 def _handle_if_manager(
@@ -58,6 +109,9 @@ def _handle_if_manager(
 ) -> dict[str, str] | str:
     """Get image URL for manager.
 
+    Entries more than one hour old are still returned, and refreshed off
+    the request path by `IMAGE_URL_REFRESHER`.
+
     Args:
         manager_entry: Manager entry
         dictionary: If True, return dictionary with other values, otherwise
@@ -68,10 +122,6 @@ def _handle_if_manager(
             or dictionary of image URL and name
     """
     if float(manager_entry.get("timestamp", 0.0)) + 3600.0 < time():
-        update_return = update_image_urls_cache(manager_entry["name"])
-        manager_entry = deepcopy(update_return)
-
-        if "timestamp" in manager_entry:
-            manager_entry.pop("timestamp")
+        IMAGE_URL_REFRESHER.queue(manager_entry["name"])
 
     return manager_entry if dictionary else manager_entry["image_url"]
@@ -0,0 +1,488 @@
+"""In-process metrics, exposed in the Prometheus text format on `/metrics`.
+
+Counters and histograms are kept in memory by each serving process, so no
+external service is needed: a Prometheus server (or `curl`) scrapes them as
+plain text. Under Gunicorn each worker keeps its own, so a scrape reports
+the worker that served it.
+
+Recorded:
+- Requests, their latency and response size, by route (`record_request`).
+- Cache loads and saves, and their durations (`CacheManager`).
+- Hits and misses of the ffWAR index, entity index, image URLs and response
+    cache, and Sleeper API calls (where each lookup is made).
+
+Usage:
+    LOOKUPS = METRICS.counter("lookups_total", "Lookups.", ("result",))
+    LOOKUPS.inc(result="hit")
+
+    DURATION = METRICS.histogram("duration_seconds", "Durations.")
+    DURATION.observe(0.2)
+"""
+
+import itertools
+import threading
+import time
+from collections.abc import Sequence
+
+from flask import Response, g, request
+
+# Latency buckets, in seconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Response size buckets, in bytes
+SIZE_BUCKETS = tuple(256 * 4**power for power in range(8))
+
+_PREFIX = "patriot_center_"
+
+LabelValues = tuple[str, ...]
+
+
+class CounterChild:
+    """The count of a counter for one combination of label values.
+
+    Incrementing by one is lock-free, as lookups on hot paths (e.g. one per
+    starter for ffWAR) are counted: `next` on an `itertools.count` is
+    atomic, and each read consumes one value of it too.
+    """
+
+    __slots__ = ("_count", "_extra", "_lock", "_reads")
+
+    def __init__(self) -> None:
+        """Initialize the count at zero."""
+        self._count = itertools.count()
+        self._reads = 0
+        self._extra = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increment the count.
+
+        Args:
+            amount: The amount to add.
+        """
+        if amount == 1:
+            next(self._count)
+            return
+
+        with self._lock:
+            self._extra += amount
+
+    def get(self) -> int:
+        """Get the count.
+
+        Returns:
+            The count.
+        """
+        with self._lock:
+            increments = next(self._count) - self._reads
+            self._reads += 1
+            return increments + self._extra
+
+
+class Counter:
+    """A count that only goes up, per combination of label values."""
+
+    def __init__(
+        self, name: str, description: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Initialize the counter at zero.
+
+        Args:
+            name: The metric name.
+            description: The help text.
+            labelnames: Names of the labels each count is kept by.
+        """
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+
+        self._lock = threading.Lock()
+        self._children: dict[LabelValues, CounterChild] = {}
+        if not self.labelnames:
+            self._children[()] = CounterChild()
+
+    def labels(self, **labels: str) -> CounterChild:
+        """Get the count for the given label values, to increment directly.
+
+        Args:
+            **labels: The value of each label.
+
+        Returns:
+            The count.
+        """
+        key = _label_values(self.labelnames, labels)
+
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, CounterChild())
+
+        return child
+
+    def inc(self, amount: int = 1, **labels: str) -> None:
+        """Increment the count for the given label values.
+
+        Args:
+            amount: The amount to add.
+            **labels: The value of each label.
+        """
+        self.labels(**labels).inc(amount)
+
+    def get(self, **labels: str) -> int:
+        """Get the count for the given label values.
+
+        Args:
+            **labels: The value of each label.
+
+        Returns:
+            The count (0 if never incremented).
+        """
+        child = self._children.get(_label_values(self.labelnames, labels))
+        return child.get() if child is not None else 0
+
+    def render(self) -> list[str]:
+        """Render the counter's samples.
+
+        Returns:
+            The samples, one per line.
+        """
+        with self._lock:
+            children = sorted(self._children.items())
+
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {child.get()}"
+            for key, child in children
+        ]
+
+
+class Histogram:
+    """Observations counted into cumulative buckets, per label values."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram with no observations.
+
+        Args:
+            name: The metric name.
+            description: The help text.
+            labelnames: Names of the labels observations are kept by.
+            buckets: Upper bounds of the buckets, in increasing order.
+        """
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+
+        self._lock = threading.Lock()
+        # Per label values: the count in each bucket (the last one is +Inf),
+        # and the sum of the observations
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for the given label values.
+
+        Args:
+            value: The observed value.
+            **labels: The value of each label.
+        """
+        key = _label_values(self.labelnames, labels)
+
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+
+            counts[index] += 1
+            self._sums[key] += value
+
+    def get_count(self, **labels: str) -> int:
+        """Get the number of observations for the given label values.
+
+        Args:
+            **labels: The value of each label.
+
+        Returns:
+            The number of observations.
+        """
+        key = _label_values(self.labelnames, labels)
+        return sum(self._counts.get(key, ()))
+
+    def render(self) -> list[str]:
+        """Render the histogram's bucket, sum and count samples.
+
+        Returns:
+            The samples, one per line.
+        """
+        with self._lock:
+            series = sorted(
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            )
+
+        bounds = [_format_number(bound) for bound in self.buckets] + ["+Inf"]
+        labelnames = (*self.labelnames, "le")
+
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(bounds, counts, strict=True):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(labelnames, (*key, bound))} {cumulative}"
+                )
+
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """The metrics of the process, rendered together for a scrape.
+
+    Usage:
+        METRICS.counter("lookups_total", "Lookups.", ("result",))
+        METRICS.render()
+    """
+
+    def __init__(self, prefix: str = _PREFIX) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            prefix: Prefix of every metric name.
+        """
+        self._prefix = prefix
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, description: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter.
+
+        Args:
+            name: The metric name, without the prefix.
+            description: The help text.
+            labelnames: Names of the labels each count is kept by.
+
+        Returns:
+            The counter.
+        """
+        counter = Counter(f"{self._prefix}{name}", description, labelnames)
+        self._register(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram.
+
+        Args:
+            name: The metric name, without the prefix.
+            description: The help text.
+            labelnames: Names of the labels observations are kept by.
+            buckets: Upper bounds of the buckets, in increasing order.
+
+        Returns:
+            The histogram.
+        """
+        histogram = Histogram(
+            f"{self._prefix}{name}", description, labelnames, buckets
+        )
+        self._register(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format.
+
+        Returns:
+            The metrics, with the help text and type of each.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        lines = []
+        for name, metric in metrics:
+            kind = "counter" if isinstance(metric, Counter) else "histogram"
+            lines.append(f"# HELP {name} {_escape(metric.description)}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Counter | Histogram) -> None:
+        """Register a metric.
+
+        Args:
+            metric: The metric to register.
+
+        Raises:
+            ValueError: If a metric with the same name is registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered.")
+            self._metrics[metric.name] = metric
+
+
+METRICS = MetricsRegistry()
+
+HTTP_REQUESTS = METRICS.counter(
+    "http_requests_total",
+    "Requests served, by method, route and status.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = METRICS.histogram(
+    "http_request_duration_seconds",
+    "Time spent serving requests (streamed bodies excluded), by route.",
+    ("method", "route"),
+)
+HTTP_RESPONSE_SIZE = METRICS.histogram(
+    "http_response_size_bytes",
+    "Size of response bodies as sent (streamed bodies excluded), by route.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+
+
+def start_request_timer() -> None:
+    """Record when the current request started (a `before_request` hook)."""
+    g._metrics_start = time.perf_counter()
+
+
+def record_request(response: Response) -> Response:
+    """Record a served request (an `after_request` hook).
+
+    Requests are kept by their route's rule rather than their path, so
+    every player or manager shares one series.
+
+    Args:
+        response: The response to the request.
+
+    Returns:
+        The response, unchanged.
+    """
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    method = request.method
+
+    HTTP_REQUESTS.inc(
+        method=method, route=route, status=str(response.status_code)
+    )
+
+    start = g.get("_metrics_start")
+    if start is not None:
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start, method=method, route=route
+        )
+
+    if response.content_length is not None:
+        HTTP_RESPONSE_SIZE.observe(
+            response.content_length, method=method, route=route
+        )
+
+    return response
+
+
+def _label_values(
+    labelnames: LabelValues, labels: dict[str, str]
+) -> LabelValues:
+    """Get the label values in the order of the label names.
+
+    Args:
+        labelnames: The metric's label names.
+        labels: The value of each label.
+
+    Returns:
+        The label values.
+
+    Raises:
+        ValueError: If the labels don't match the label names.
+    """
+    if len(labels) != len(labelnames):
+        raise ValueError(f"Expected labels {labelnames}, got {tuple(labels)}.")
+
+    try:
+        return tuple(labels[name] for name in labelnames)
+    except KeyError as e:
+        raise ValueError(f"Missing label {e}.") from e
+
+
+def _format_labels(labelnames: LabelValues, values: LabelValues) -> str:
+    """Format label values as a sample's label set.
+
+    Args:
+        labelnames: The label names.
+        values: The label values, in the same order.
+
+    Returns:
+        The label set, or an empty string without labels.
+    """
+    if not labelnames:
+        return ""
+
+    pairs = ",".join(
+        f'{name}="{_escape(value, quote=True)}"'
+        for name, value in zip(labelnames, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_number(value: float) -> str:
+    """Format a sample value, without a decimal point for whole numbers.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The formatted value.
+    """
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(text: str, quote: bool = False) -> str:
+    """Escape a help text or label value.
+
+    Args:
+        text: The text to escape.
+        quote: Whether to escape double quotes (in label values).
+
+    Returns:
+        The escaped text.
+    """
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    if quote:
+        text = text.replace('"', '\\"')
+    return text
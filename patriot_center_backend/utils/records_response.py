@@ -0,0 +1,196 @@
+"""Record list responses with pagination, projection and streaming.
+
+Routes returning flattened records read these optional query arguments:
+- `fields`: Comma-separated record fields to keep. A field also keeps the
+  fields flattened from under it (e.g. `stats` keeps `stats.points`).
+- `limit` / `cursor`: Return one page of records, wrapped as
+  `{"records": [...], "next_cursor": str | None}`. Pass `next_cursor` back
+  as `cursor` to get the next page.
+- `format=ndjson`: Stream the records one JSON document per line.
+- `format=columnar`: Return a table, `{"columns": [...], "rows": [[...]]}`,
+  so each column name is sent once instead of in every record. Routes pick
+  the nesting levels that become rows (see `iter_rows`). `fields`, `limit`
+  and `cursor` apply to its columns and rows, with `next_cursor` added to
+  the table when paginated.
+
+Routes that pick row levels also page, project and stream their records
+one row at a time (e.g. one record per starter rather than per season), so
+a record never grows with the data. Only their full record list, without
+any of the arguments, keeps its original records.
+
+Records and rows are produced by generators, so a page or a stream holds
+only what is being sent in memory.
+
+Usage:
+    response = records_response(data, key_name="manager")
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, TypeVar
+
+from flask import Response, current_app, jsonify, request, stream_with_context
+
+from patriot_center_backend.utils.data_formatters import (
+    iter_records,
+    iter_rows,
+    project_record,
+    select_fields,
+    to_columnar,
+    to_records,
+)
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+def records_response(
+    data: Any, key_name: str = "key", row_keys: Sequence[str] | None = None
+) -> Response:
+    """Build a route's records response from its data and the request args.
+
+    Without any of the optional arguments the full record list is returned,
+    as built by `to_records`.
+
+    Args:
+        data: The route's data.
+        key_name: Field name to assign original dict keys.
+        row_keys: Column names for the dict keys at each nesting level that
+            becomes a row of the columnar format, and a record of the
+            paginated, projected and streamed formats. Defaults to
+            `key_name` alone, one row per record.
+
+    Returns:
+        The JSON or NDJSON response.
+
+    Raises:
+        ValueError: If `limit` or `cursor` isn't a valid number.
+    """
+    output_format = request.args.get("format")
+    ndjson = output_format == "ndjson"
+    fields = _parse_fields(request.args.get("fields"))
+    limit = _parse_count(request.args.get("limit"), "limit", minimum=1)
+    cursor = _parse_count(request.args.get("cursor"), "cursor", minimum=0)
+
+    paginated = limit is not None or cursor is not None
+    start = cursor or 0
+
+    if output_format == "columnar":
+        rows = iter_rows(data, row_keys or (key_name,))
+        if fields:
+            rows = (list(select_fields(row, fields)) for row in rows)
+
+        row_page, next_cursor = _get_page(rows, start, limit)
+        table = to_columnar(row_page)
+        if paginated:
+            table["next_cursor"] = next_cursor
+
+        return jsonify(table)
+
+    if not (ndjson or fields or paginated):
+        return jsonify(to_records(data, key_name=key_name))
+
+    if row_keys:
+        records = (dict(row) for row in iter_rows(data, row_keys))
+    else:
+        records = iter_records(data, key_name=key_name)
+    if fields:
+        records = (project_record(record, fields) for record in records)
+
+    if ndjson:
+        stop = None if limit is None else start + limit
+        return Response(
+            stream_with_context(_to_ndjson(islice(records, start, stop))),
+            mimetype=NDJSON_MIMETYPE,
+        )
+
+    if not paginated:
+        return jsonify(list(records))
+
+    page, next_cursor = _get_page(records, start, limit)
+
+    return jsonify({"records": page, "next_cursor": next_cursor})
+
+
+def _get_page(
+    items: Iterator[T], start: int, limit: int | None
+) -> tuple[list[T], str | None]:
+    """Get one page of items.
+
+    Args:
+        items: All the items.
+        start: Position of the page's first item.
+        limit: Maximum number of items on the page, or None for all of them.
+
+    Returns:
+        The page's items, and the cursor of the next page (None if this is
+        the last one).
+    """
+    if limit is None:
+        return list(islice(items, start, None)), None
+
+    # Read one item past the page to tell whether there is another page
+    page = list(islice(items, start, start + limit + 1))
+    if len(page) <= limit:
+        return page, None
+
+    page.pop()
+    return page, str(start + limit)
+
+
+def _to_ndjson(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as NDJSON lines.
+
+    Args:
+        records: The records.
+
+    Yields:
+        One JSON document per record, newline terminated.
+    """
+    dumps = current_app.json.dumps
+
+    for record in records:
+        yield f"{dumps(record)}\n"
+
+
+def _parse_fields(value: str | None) -> frozenset[str]:
+    """Parse the `fields` argument.
+
+    Args:
+        value: Comma-separated field names, if given.
+
+    Returns:
+        The field names (empty if not given).
+    """
+    if not value:
+        return frozenset()
+
+    return frozenset(field for field in value.split(",") if field)
+
+
+def _parse_count(value: str | None, name: str, minimum: int) -> int | None:
+    """Parse a non-negative whole number argument.
+
+    Args:
+        value: The argument, if given.
+        name: The argument's name, for the error message.
+        minimum: The smallest valid value.
+
+    Returns:
+        The number, or None if not given.
+
+    Raises:
+        ValueError: If the argument isn't a whole number of at least
+            `minimum`.
+    """
+    if value is None:
+        return None
+
+    if not value.isdigit() or int(value) < minimum:
+        raise ValueError(
+            f"Invalid {name}: {value} (expected a whole number of at "
+            f"least {minimum})"
+        )
+
+    return int(value)
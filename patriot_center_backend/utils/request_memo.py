@@ -0,0 +1,57 @@
+"""Per-request memoization of lookups shared between exporters.
+
+A page load (or a batch of sub-requests, see `POST /api/batch`) asks several
+exporters for overlapping data, such as the same manager's rankings or
+image URL. Lookups decorated with `request_memo` are computed once per
+request and reused by every later call with the same arguments, which also
+keeps them consistent with each other if the caches are updated midway.
+
+Outside of a request the lookup is called as it is.
+
+Results are shared by every caller in the request, so they must be treated
+as read-only.
+
+Usage:
+    @request_memo
+    def get_ranking_details_from_cache(manager, ...):
+        ...
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from flask import g, has_request_context
+
+T = TypeVar("T")
+
+_MEMO_ATTRIBUTE = "_request_memo"
+
+
+def request_memo(func: Callable[..., T]) -> Callable[..., T]:
+    """Memoize a lookup for the duration of the current request.
+
+    Calls are keyed by the lookup and its arguments as given, so the
+    arguments must be hashable.
+
+    Args:
+        func: The lookup to memoize.
+
+    Returns:
+        The wrapped lookup.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        if not has_request_context():
+            return func(*args, **kwargs)
+
+        memo: dict[tuple[Any, ...], Any] = g.setdefault(_MEMO_ATTRIBUTE, {})
+        key = (func, args, tuple(sorted(kwargs.items())))
+
+        if key not in memo:
+            memo[key] = func(*args, **kwargs)
+
+        return memo[key]
+
+    return wrapper
@@ -0,0 +1,293 @@
+"""Server-side cache of rendered API responses.
+
+Responses are keyed by request path and query arguments (which include the
+`format` argument) and stored with the data version they were rendered at,
+so saving any cache makes every stored response stale. Each stored response
+carries a strong ETag, and clients revalidating with `If-None-Match` get a
+304 without the exporters running.
+
+Bodies worth compressing are stored precompressed with every supported
+content encoding, so repeat hits skip both serialization and compression.
+
+Usage:
+    @bp.route("/get_starters", methods=["GET"])
+    @cached_response
+    def get_starters_route():
+        ...
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any
+
+from flask import Response, make_response, request
+
+from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.utils.compression import (
+    choose_encoding,
+    compress_all,
+)
+from patriot_center_backend.utils.metrics import METRICS
+
+# Bounds on the stored responses, evicted least recently used first
+_MAX_ENTRIES = 512
+_MAX_BYTES = 64 * 1024 * 1024
+
+# Set from the body on every served response, so not stored
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "etag", "vary"}
+
+_LOOKUPS = METRICS.counter(
+    "response_cache_lookups_total",
+    "Response cache lookups, by whether a current response was stored.",
+    ("result",),
+)
+
+
+class CachedResponse:
+    """A rendered response body and headers, stored for reuse."""
+
+    __slots__ = ("body", "encoded", "etag", "headers", "size", "version")
+
+    def __init__(
+        self,
+        body: bytes,
+        headers: list[tuple[str, str]],
+        version: int,
+        encoded: dict[str, bytes] | None = None,
+    ) -> None:
+        """Store a rendered response.
+
+        Args:
+            body: The response body.
+            headers: The response headers.
+            version: The data version the response was rendered at.
+            encoded: The compressed body by content encoding.
+        """
+        self.body = body
+        self.headers = headers
+        self.version = version
+        self.encoded = encoded or {}
+        self.size = len(body) + sum(map(len, self.encoded.values()))
+
+        # Derived from the body, so equal across workers and restarts
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    @classmethod
+    def from_response(
+        cls, response: Response, version: int
+    ) -> "CachedResponse":
+        """Store a response returned by a route.
+
+        Args:
+            response: The response to store.
+            version: The data version the response was rendered at.
+
+        Returns:
+            The stored response.
+        """
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _SKIPPED_HEADERS
+        ]
+        body = response.get_data()
+
+        return cls(
+            body, headers, version, compress_all(body, response.mimetype)
+        )
+
+    def get_etag(self, encoding: str | None) -> str:
+        """Get the ETag of the body sent with a content encoding.
+
+        Args:
+            encoding: The content encoding, or None for the plain body.
+
+        Returns:
+            The ETag, unquoted.
+        """
+        if encoding is None:
+            return self.etag
+        return f"{self.etag}-{encoding}"
+
+    def to_response(
+        self, encoding: str | None = None, not_modified: bool = False
+    ) -> Response:
+        """Build a response to serve from the stored one.
+
+        Args:
+            encoding: The content encoding to send the body with, one of
+                `encoded`, or None for the plain body.
+            not_modified: Whether to build a body-less 304 response.
+
+        Returns:
+            The response.
+        """
+        if not_modified:
+            response = Response(status=304)
+            for name, value in self.headers:
+                if name.lower() != "content-type":
+                    response.headers[name] = value
+        elif encoding is None:
+            response = Response(self.body, status=200, headers=self.headers)
+        else:
+            response = Response(
+                self.encoded[encoding], status=200, headers=self.headers
+            )
+            response.headers["Content-Encoding"] = encoding
+
+        if self.encoded:
+            response.vary.add("Accept-Encoding")
+
+        response.set_etag(self.get_etag(encoding))
+        return response
+
+
+class ResponseCache:
+    """LRU cache of rendered responses, bounded by count and total size.
+
+    Usage:
+        RESPONSE_CACHE.put(key, CachedResponse(body, headers, version))
+        cached = RESPONSE_CACHE.get(key, CACHE_MANAGER.get_data_version())
+    """
+
+    def __init__(
+        self, max_entries: int = _MAX_ENTRIES, max_bytes: int = _MAX_BYTES
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of stored responses.
+            max_bytes: Maximum total size of the stored bodies.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: int) -> CachedResponse | None:
+        """Get a stored response rendered at the given data version.
+
+        Responses rendered at any other version are dropped.
+
+        Args:
+            key: The request key.
+            version: The current data version.
+
+        Returns:
+            The stored response, or None if there isn't a current one.
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+
+            if cached.version != version:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return cached
+
+    def put(self, key: Hashable, cached: CachedResponse) -> None:
+        """Store a response, evicting the least recently used ones if full.
+
+        Responses larger than the whole cache are not stored.
+
+        Args:
+            key: The request key.
+            cached: The response to store.
+        """
+        if cached.size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = cached
+            self._size += cached.size
+
+            while (
+                len(self._entries) > self._max_entries
+                or self._size > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop a stored response (the lock must be held).
+
+        Args:
+            key: The request key.
+        """
+        self._size -= self._entries.pop(key).size
+
+
+RESPONSE_CACHE = ResponseCache()
+
+
+def cached_response(
+    view: Callable[..., Any],
+) -> Callable[..., Response]:
+    """Serve a route's successful responses from the response cache.
+
+    Only 200 responses that aren't streamed are stored. The stored body is
+    sent compressed when the client accepts it, and a request whose
+    `If-None-Match` matches the ETag of the body it would be sent gets a 304
+    with no body.
+
+    Args:
+        view: The route function.
+
+    Returns:
+        The wrapped route function.
+    """
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        key = _get_request_key()
+        version = CACHE_MANAGER.get_data_version()
+
+        cached = RESPONSE_CACHE.get(key, version)
+        _LOOKUPS.inc(result="miss" if cached is None else "hit")
+        if cached is None:
+            response = make_response(view(*args, **kwargs))
+
+            # Buffering a stream to store it would defeat streaming it
+            if response.status_code != 200 or response.is_streamed:
+                return response
+
+            cached = CachedResponse.from_response(response, version)
+            RESPONSE_CACHE.put(key, cached)
+
+        encoding = None
+        if cached.encoded:
+            encoding = choose_encoding(request.accept_encodings)
+
+        not_modified = request.if_none_match.contains_weak(
+            cached.get_etag(encoding)
+        )
+        return cached.to_response(encoding, not_modified=not_modified)
+
+    return wrapper
+
+
+def _get_request_key() -> Hashable:
+    """Get the response cache key of the current request.
+
+    Query arguments are sorted, so their order in the URL doesn't matter.
+
+    Returns:
+        The request path and its sorted query arguments.
+    """
+    return request.path, tuple(sorted(request.args.items(multi=True)))
@@ -1,6 +1,6 @@
 """This module provides utility functions for creating and converting slugs."""
 
-from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.entity_index import get_entity_index
 
 
 def slugify(item: str) -> str:
@@ -30,12 +30,28 @@ def slug_to_name(slug: str) -> str:
     Returns:
         The player name if a match is found, otherwise the original slug.
     """
-    players_cache = CACHE_MANAGER.get_players_cache()
-
     # ensure consistent encoding for lookup
     ensure_slug = slugify(slug)
-    for p in players_cache:
-        if players_cache[p]["slug"] == ensure_slug:
-            return p
 
-    return slug  # Fallback to returning the original string if no match found
+    name = get_entity_index().get_name_from_slug(ensure_slug)
+    if name is None:
+        return slug  # Fallback to returning the original string
+
+    return name
+
+
+def name_to_slug(name: str) -> str:
+    """Converts a player name to its URL-friendly slug.
+
+    Args:
+        name: The player name.
+
+    Returns:
+        The player's cached slug, or a freshly created slug for names that
+        are not in the players cache.
+    """
+    slug = get_entity_index().get_slug(name)
+    if slug is None:
+        return slugify(name)
+
+    return slug
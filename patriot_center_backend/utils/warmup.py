@@ -0,0 +1,175 @@
+"""Warm-up of a serving process before it takes traffic.
+
+Otherwise the first requests after a deploy pay to load every cache they
+touch, build the indexes derived from them and render their responses.
+Warming up does all of that ahead of them, in order:
+1. `caches`: Load every cache, several at a time.
+2. `indexes`: Build every derived index.
+3. `responses`: Render the hottest responses into the response cache.
+
+Steps already done (e.g. caches preloaded by the gunicorn master) finish
+immediately. A failing step is logged and skipped, as the process can still
+serve requests, only more slowly.
+
+`/ready` reports the progress, so a load balancer only routes to warm
+processes. Set the `WARMUP` environment variable to `0` to skip warming up.
+
+Usage:
+    WARMUP.start(app)  # on a background thread
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, Literal
+
+from flask import Flask
+
+from patriot_center_backend.cache import CACHE_MANAGER
+from patriot_center_backend.cache.derived_index import build_all_indexes
+from patriot_center_backend.constants import LEAGUE_IDS
+
+logger = logging.getLogger(__name__)
+
+StepStatus = Literal["pending", "running", "done", "failed", "skipped"]
+
+# Responses rendered while warming up, the most requested first
+WARMUP_PATHS = (
+    "/get/managers/list/true",
+    "/options/list",
+    f"/get_aggregated_players/{max(LEAGUE_IDS)}",
+)
+
+# Caches loaded at the same time (loading is mostly waiting on the disk)
+_LOAD_THREADS = 4
+
+
+class Warmup:
+    """Warms up the process's caches, indexes and responses.
+
+    Usage:
+        WARMUP.start(app)
+        WARMUP.get_status()
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str] = WARMUP_PATHS,
+        load_threads: int = _LOAD_THREADS,
+    ) -> None:
+        """Initialize the warm-up (nothing runs until `start` or `run`).
+
+        Args:
+            paths: Paths of the responses to render.
+            load_threads: Caches loaded at the same time.
+        """
+        self._paths = paths
+        self._load_threads = load_threads
+
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+        self._steps: dict[str, StepStatus] = dict.fromkeys(
+            ("caches", "indexes", "responses"), "pending"
+        )
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    def start(self, app: Flask) -> None:
+        """Warm up on a background thread, unless already started.
+
+        Args:
+            app: The Flask app to render responses with.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(
+                target=self.run, args=(app,), name="warmup", daemon=True
+            )
+            self._thread.start()
+
+    def run(self, app: Flask) -> None:
+        """Warm up on the calling thread.
+
+        Args:
+            app: The Flask app to render responses with.
+        """
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+
+        enabled = os.getenv("WARMUP", "1") != "0"
+        steps: dict[str, Callable[[], Any]] = {
+            "caches": self._load_caches,
+            "indexes": build_all_indexes,
+            "responses": lambda: self._render_responses(app),
+        }
+
+        for name, step in steps.items():
+            if not enabled:
+                self._steps[name] = "skipped"
+                continue
+
+            self._steps[name] = "running"
+            try:
+                step()
+            except Exception as e:
+                logger.warning(f"Warm-up step {name} failed: {e}")
+                self._steps[name] = "failed"
+            else:
+                self._steps[name] = "done"
+
+        self._finished_at = time.perf_counter()
+        logger.info(
+            f"Warm-up finished in "
+            f"{self._finished_at - self._started_at:.2f}s: {self._steps}"
+        )
+
+    def is_ready(self) -> bool:
+        """Check whether warming up has finished.
+
+        Returns:
+            True once every step has finished (even if some failed).
+        """
+        return self._finished_at is not None
+
+    def get_status(self) -> dict[str, Any]:
+        """Get the progress of the warm-up.
+
+        Returns:
+            Whether the process is ready, the status of each step, and the
+            seconds spent warming up so far (None if not started).
+        """
+        elapsed = None
+        if self._started_at is not None:
+            end = self._finished_at or time.perf_counter()
+            elapsed = round(end - self._started_at, 3)
+
+        return {
+            "ready": self.is_ready(),
+            "steps": dict(self._steps),
+            "elapsed_seconds": elapsed,
+        }
+
+    def _load_caches(self) -> None:
+        """Load every cache not yet in memory."""
+        CACHE_MANAGER.load_all_caches(max_workers=self._load_threads)
+
+    def _render_responses(self, app: Flask) -> None:
+        """Render the hottest responses into the response cache.
+
+        Args:
+            app: The Flask app to render responses with.
+        """
+        client = app.test_client()
+
+        for path in self._paths:
+            response = client.get(path)
+            if response.status_code != 200:
+                logger.warning(f"Warm-up got {response.status_code} for {path}")
+
+
+WARMUP = Warmup()
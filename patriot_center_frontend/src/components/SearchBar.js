@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { usePlayersList } from '../hooks/usePlayersList';
+import { useOptionsSearch } from '../hooks/useOptionsSearch';
 
 export default function SearchBar() {
     const [query, setQuery] = useState('');
@@ -8,66 +8,13 @@ export default function SearchBar() {
     const [selectedIndex, setSelectedIndex] = useState(0);
     const searchRef = useRef(null);
     const navigate = useNavigate();
-    const { players, loading } = usePlayersList();
+    const { options, loading } = useOptionsSearch(query);
 
-    // Filter options (players and managers) based on query
-    const filteredOptions = React.useMemo(() => {
-        if (!query.trim() || loading) return [];
-
-        const lowerQuery = query.toLowerCase();
-
-        return players
-            .filter(option => {
-                const fullName = (option.full_name || '').toLowerCase();
-
-                // For managers (no first_name/last_name), only check full_name
-                if (option.type === 'manager') {
-                    return fullName.startsWith(lowerQuery);
-                }
-
-                // For players, check first_name, last_name, or full_name
-                const firstName = (option.first_name || '').toLowerCase();
-                const lastName = (option.last_name || '').toLowerCase();
-
-                return firstName.startsWith(lowerQuery) ||
-                       lastName.startsWith(lowerQuery) ||
-                       fullName.startsWith(lowerQuery);
-            })
-            .sort((a, b) => {
-                // FIRST PRIORITY: Managers ALWAYS come before players
-                const aIsManager = a.type === 'manager';
-                const bIsManager = b.type === 'manager';
-
-                if (aIsManager && !bIsManager) return -1;
-                if (!aIsManager && bIsManager) return 1;
-
-                // SECOND PRIORITY: Within same type, prioritize exact matches
-                const aFullName = (a.full_name || '').toLowerCase();
-                const bFullName = (b.full_name || '').toLowerCase();
-                const aFirstName = (a.first_name || '').toLowerCase();
-                const bFirstName = (b.first_name || '').toLowerCase();
-                const aLastName = (a.last_name || '').toLowerCase();
-                const bLastName = (b.last_name || '').toLowerCase();
-
-                const aStartsWithFull = aFullName.startsWith(lowerQuery);
-                const bStartsWithFull = bFullName.startsWith(lowerQuery);
-                const aStartsWithFirst = aFirstName.startsWith(lowerQuery);
-                const bStartsWithFirst = bFirstName.startsWith(lowerQuery);
-                const aStartsWithLast = aLastName.startsWith(lowerQuery);
-                const bStartsWithLast = bLastName.startsWith(lowerQuery);
-
-                if (aStartsWithFull && !bStartsWithFull) return -1;
-                if (!aStartsWithFull && bStartsWithFull) return 1;
-                if (aStartsWithFirst && !bStartsWithFirst) return -1;
-                if (!aStartsWithFirst && bStartsWithFirst) return 1;
-                if (aStartsWithLast && !bStartsWithLast) return -1;
-                if (!aStartsWithLast && bStartsWithLast) return 1;
-
-                // THIRD PRIORITY: Sort alphabetically
-                return aFullName.localeCompare(bFullName);
-            })
-            .slice(0, 10); // Limit to 10 results AFTER sorting
-    }, [query, players, loading]);
+    // Managers first, then players, each in the backend's popularity order
+    const filteredOptions = React.useMemo(() => [
+        ...options.filter(option => option.type === 'manager'),
+        ...options.filter(option => option.type !== 'manager'),
+    ], [options]);
 
     // Close dropdown when clicking outside
     useEffect(() => {
@@ -0,0 +1,58 @@
+import { useEffect, useState } from 'react';
+import { apiGet } from '../config/api';
+
+// Wait for typing to pause before searching
+const DEBOUNCE_MS = 150;
+
+/**
+ * Hook to autocomplete player and manager names as the user types.
+ *
+ * Only the matches for the current query are downloaded, ranked by the
+ * backend (most started players and managers first).
+ *
+ * @param {string} query - Text typed so far
+ * @param {number} limit - Maximum number of results
+ * @returns {Object} { options: Array, loading: boolean, error: string|null }
+ */
+export function useOptionsSearch(query, limit = 10) {
+  const [options, setOptions] = useState([]);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState(null);
+
+  useEffect(() => {
+    const trimmed = query.trim();
+    if (!trimmed) {
+      setOptions([]);
+      setLoading(false);
+      return undefined;
+    }
+
+    let active = true;
+    setLoading(true);
+
+    const timer = setTimeout(() => {
+      apiGet(`/options/search?q=${encodeURIComponent(trimmed)}&limit=${limit}`)
+        .then(data => {
+          if (!active) return;
+          setOptions(Array.isArray(data) ? data : []);
+          setError(null);
+        })
+        .catch(e => {
+          if (!active) return;
+          setError(e.message);
+          setOptions([]);
+        })
+        .finally(() => {
+          if (active) setLoading(false);
+        });
+    }, DEBOUNCE_MS);
+
+    // Drop responses to queries typed over
+    return () => {
+      active = false;
+      clearTimeout(timer);
+    };
+  }, [query, limit]);
+
+  return { options, loading, error };
+}